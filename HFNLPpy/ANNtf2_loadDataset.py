@@ -133,7 +133,6 @@ ANNtf load dataset
 
 import os
 import csv
-import tensorflow as tf
 import numpy as np
 from numpy import genfromtxt
 
@@ -142,9 +141,12 @@ import re
 from nltk import tokenize
 import spacy
 spacyWordVectorGenerator = spacy.load('en_core_web_md')	#spacy.load('en_core_web_lg')
+useWordVectorLookupTable = False	#optional	#word vector lookups are vocab vector table gathers (HFNLPpy_wordVectorTable); spacy pipeline is not executed per word (spacy tokenizer is executed once per unique word)	#default False until HFNLPpy_benchmark:benchmarkConvertArticlesWordVectors reports 0 differing features with the configured spacy model
+if(useWordVectorLookupTable):
+	import HFNLPpy_wordVectorTable
+	HFNLPpy_wordVectorTable.initialiseWordVectorTable(spacyWordVectorGenerator)
 
 import ANNtf2_globalDefs
-import ANNtf2_operations
 
 datasetFolderRelative = "datasets"
 
@@ -471,6 +473,7 @@ def loadDatasetType2(datasetFileName, classColumnFirst=True, equaliseNumberExamp
 
 
 def equaliseClassExamples(xRaw, yRaw):
+	import ANNtf2_operations	#imports tensorflow
 
 	numberOfClasses = int(np.amax(yRaw))
 	#print("numberOfClasses = ", numberOfClasses)
@@ -814,36 +817,9 @@ def loadDatasetType4(datasetFileNameX, limitSentenceLengths, limitSentenceLength
 		paragraphs = []
 		for paragraphIndex, paragraph in enumerate(paragraphsText):
 			#print("\t\tparagraphIndex = ", paragraphIndex)
-			sentencesText = tokenize.sent_tokenize(paragraph)
-			sentences = []
-			for sentenceIndex, sentence in enumerate(sentencesText):
-				#print("\t\t\tsentenceIndex = ", sentenceIndex)
-				sentence = sentence.strip()	#required to remove new lines from sent_tokenize output
-				wordsText = tokenize.word_tokenize(sentence)
-				sentenceLengthCheck = True
-				if(limitSentenceLengths):
-					if(len(wordsText) > limitSentenceLengthsSize):
-						sentenceLengthCheck = False			
-				if(sentenceLengthCheck):
-					foundValidSentences = True
-					if(NLPsequentialInputTypeTokeniseWords):
-						if(NLPsequentialInputTypeTrainWordVectors):
-							words = []
-							for wordIndex, word in enumerate(wordsText):
-								#print("\t\t\t\twordIndex = ", wordIndex)
-								charactersText = list(word)
-								characters = []
-								for characterIndex, character in enumerate(charactersText):
-									#print("\t\t\t\t\tcharacterIndex = ", characterIndex)
-									characters.append(character)	
-								words.append(characters)
-							sentence = words
-							sentences.append(sentence)
-						else:
-							sentences.append(wordsText)
-					else:
-						#print("sentence = ", sentence)
-						sentences.append(sentence)
+			sentences = loadDatasetType4Paragraph(paragraph, limitSentenceLengths, limitSentenceLengthsSize, NLPsequentialInputTypeTrainWordVectors, NLPsequentialInputTypeTokeniseWords)
+			if(len(sentences) > 0):
+				foundValidSentences = True
 			paragraphs.append(sentences)
 		articles.append(paragraphs)
 		
@@ -855,6 +831,67 @@ def loadDatasetType4(datasetFileNameX, limitSentenceLengths, limitSentenceLength
 		
 	return articles
 
+def loadDatasetType4Paragraph(paragraph, limitSentenceLengths, limitSentenceLengthsSize, NLPsequentialInputTypeTrainWordVectors, NLPsequentialInputTypeTokeniseWords):
+	sentencesText = tokenize.sent_tokenize(paragraph)
+	sentences = []
+	for sentenceIndex, sentence in enumerate(sentencesText):
+		#print("\t\t\tsentenceIndex = ", sentenceIndex)
+		sentence = sentence.strip()	#required to remove new lines from sent_tokenize output
+		wordsText = tokenize.word_tokenize(sentence)
+		sentenceLengthCheck = True
+		if(limitSentenceLengths):
+			if(len(wordsText) > limitSentenceLengthsSize):
+				sentenceLengthCheck = False			
+		if(sentenceLengthCheck):
+			if(NLPsequentialInputTypeTokeniseWords):
+				if(NLPsequentialInputTypeTrainWordVectors):
+					words = []
+					for wordIndex, word in enumerate(wordsText):
+						#print("\t\t\t\twordIndex = ", wordIndex)
+						charactersText = list(word)
+						characters = []
+						for characterIndex, character in enumerate(charactersText):
+							#print("\t\t\t\t\tcharacterIndex = ", characterIndex)
+							characters.append(character)	
+						words.append(characters)
+					sentence = words
+					sentences.append(sentence)
+				else:
+					sentences.append(wordsText)
+			else:
+				#print("sentence = ", sentence)
+				sentences.append(sentence)
+	return sentences
+
+#loadDatasetType4Stream: generator; yields sentences of loadDatasetType4 dataset (equivalent to flattenNestedListToSentences(loadDatasetType4())) without reading the whole file; file is read line by line and sentences are yielded per paragraph (memory is bounded by paragraph size irrespective of dataset size, e.g. multi-GB WikiExtractor output)
+def loadDatasetType4Stream(datasetFileNameX, limitSentenceLengths, limitSentenceLengthsSize, NLPsequentialInputTypeTrainWordVectors, NLPsequentialInputTypeTokeniseWords=True):
+
+	absFilePath = createFileAbsPath(datasetFileNameX)
+	foundValidSentences = False
+	
+	with open(absFilePath) as f:
+		paragraphLineList = []
+		for line in f:
+			if(line.startswith("<doc id") or line.startswith("</doc>") or (line.strip() == "")):
+				#article or paragraph delimiter;
+				if(len(paragraphLineList) > 0):
+					sentences = loadDatasetType4Paragraph("".join(paragraphLineList), limitSentenceLengths, limitSentenceLengthsSize, NLPsequentialInputTypeTrainWordVectors, NLPsequentialInputTypeTokeniseWords)
+					for sentence in sentences:
+						foundValidSentences = True
+						yield sentence
+					paragraphLineList = []
+			else:
+				paragraphLineList.append(line)
+		if(len(paragraphLineList) > 0):
+			sentences = loadDatasetType4Paragraph("".join(paragraphLineList), limitSentenceLengths, limitSentenceLengthsSize, NLPsequentialInputTypeTrainWordVectors, NLPsequentialInputTypeTokeniseWords)
+			for sentence in sentences:
+				foundValidSentences = True
+				yield sentence
+
+	if(not foundValidSentences):
+		print("loadDatasetType4Stream error: !foundValidSentences - require dataset with at least 2 sentences of size < limitSentenceLengthsSize; for test/train split")
+		exit(0)
+
 #code moved from AEANNtf_main.py/AEANNtf_algorithmSequentialInput.py | SPNLPpy_normalisation.py;
 #should be defined as preprocessor defs (non-variable);
 NLPsequentialInputTypeCharacters = 0
@@ -877,16 +914,19 @@ def convertArticlesTreeToSentencesWordVectors(articles, limitSentenceLengthsSize
 	#print("limitSentenceLengthsSize = ", limitSentenceLengthsSize)
 		
 	articles = flattenNestedListToSentences(articles)
-	sentenceListWordVectors = []
-	for sentenceIndex, sentence in enumerate(articles):	#sentence: is a list of words (strings)
-		#print("sentenceIndex = ", sentenceIndex)
-		inputVectorList = generateWordVectorInputList(sentence, wordVectorLibraryNumDimensions)	#numberSequentialInputs x inputVecDimensions	#inputVectorList: is a list of numpy vectors
-		inputVectorList = cropAndPadWordVectorInputList(inputVectorList, maximumSentenceLength, paddingTagIndex, numberOfFeaturesPerWord, dataType)
-		inputVectorNP = np.asarray(inputVectorList)
-		inputVectorNP = inputVectorNP.flatten()	#default data format used by *ANNtf 
-		#print("inputVectorNP.shape = ", inputVectorNP.shape)
-		sentenceListWordVectors.append(inputVectorNP)
-	all_Xnormalised = np.asarray(sentenceListWordVectors)
+	if(useWordVectorLookupTable):
+		all_Xnormalised = generateWordVectorInputArray(articles, maximumSentenceLength, paddingTagIndex, numberOfFeaturesPerWord, dataType)
+	else:
+		sentenceListWordVectors = []
+		for sentenceIndex, sentence in enumerate(articles):	#sentence: is a list of words (strings)
+			#print("sentenceIndex = ", sentenceIndex)
+			inputVectorList = generateWordVectorInputList(sentence, wordVectorLibraryNumDimensions)	#numberSequentialInputs x inputVecDimensions	#inputVectorList: is a list of numpy vectors
+			inputVectorList = cropAndPadWordVectorInputList(inputVectorList, maximumSentenceLength, paddingTagIndex, numberOfFeaturesPerWord, dataType)
+			inputVectorNP = np.asarray(inputVectorList)
+			inputVectorNP = inputVectorNP.flatten()	#default data format used by *ANNtf 
+			#print("inputVectorNP.shape = ", inputVectorNP.shape)
+			sentenceListWordVectors.append(inputVectorNP)
+		all_Xnormalised = np.asarray(sentenceListWordVectors)
 	#print("all_Xnormalised = ", all_Xnormalised)
 	print("all_Xnormalised.shape = ", all_Xnormalised.shape)
 	
@@ -928,15 +968,35 @@ def flattenNestedListToSentences(articles):
 			
 def generateWordVectorInputList(textContentList, NLPsequentialInputDimensions):
 	inputVectorList = []
-	for word in textContentList:
-		#print("word = ", word)
-		wordVectorList = getWordVector(word)
-		wordVector = np.array(wordVectorList)
-		#print("word = ", word, " wordVector = ", wordVector)
-		#print("wordVector.shape = ", wordVector.shape)
-		inputVectorList.append(wordVector)
+	if(useWordVectorLookupTable):
+		inputVectorArray = HFNLPpy_wordVectorTable.getWordVectors(HFNLPpy_wordVectorTable.getWordVectorIndices(textContentList))	#single gather
+		inputVectorList = list(inputVectorArray)
+	else:
+		for word in textContentList:
+			#print("word = ", word)
+			wordVectorList = getWordVector(word)
+			wordVector = np.array(wordVectorList)
+			#print("word = ", word, " wordVector = ", wordVector)
+			#print("wordVector.shape = ", wordVector.shape)
+			inputVectorList.append(wordVector)
 	return inputVectorList
 
+def generateWordVectorInputArray(sentenceList, maximumSentenceLength, paddingTagIndex, numberOfFeaturesPerWord, dataType):
+	#equivalent to generateWordVectorInputList/cropAndPadWordVectorInputList/flatten for all sentences; single word vector table gather into preallocated array (padded in place)
+	numberOfSentences = len(sentenceList)
+	inputVectorArray = np.empty((numberOfSentences, maximumSentenceLength, numberOfFeaturesPerWord), dtype=dataType)
+	sentenceLengthArray = np.zeros((numberOfSentences), dtype=np.int64)
+	wordList = []
+	for sentenceIndex, sentence in enumerate(sentenceList):
+		sentenceCropped = sentence[0:maximumSentenceLength]
+		wordList.extend(sentenceCropped)
+		sentenceLengthArray[sentenceIndex] = len(sentenceCropped)
+	wordMask = np.arange(maximumSentenceLength)[np.newaxis, :] < sentenceLengthArray[:, np.newaxis]	#row major order of wordMask matches wordList
+	inputVectorArray[wordMask] = HFNLPpy_wordVectorTable.getWordVectors(HFNLPpy_wordVectorTable.getWordVectorIndices(wordList))
+	inputVectorArray[np.logical_not(wordMask)] = paddingTagIndex
+	inputVectorArray = np.reshape(inputVectorArray, (numberOfSentences, maximumSentenceLength*numberOfFeaturesPerWord))	#default data format used by *ANNtf
+	return inputVectorArray
+
 def cropAndPadWordVectorInputList(inputVectorList, maximumSentenceLength, paddingTagIndex, numberOfFeaturesPerWord, dataType):
 	inputVectorListCroppedPadded = []
 	
@@ -966,7 +1026,11 @@ def generateRandomisedIndexArray(indexFirst, indexLast, arraySize=None):
 	return fileIndexRandomArray
 	
 def getWordVector(word):
-	return getWordVectorInContext(word, 0)
+	if(useWordVectorLookupTable):
+		wordVector = np.array(HFNLPpy_wordVectorTable.getWordVector(HFNLPpy_wordVectorTable.getWordVectorIndex(word)))
+	else:
+		wordVector = getWordVectorInContext(word, 0)
+	return wordVector
 
 def getWordVectorInContext(sentence, wordIndex):
 	doc = spacyWordVectorGenerator(sentence)
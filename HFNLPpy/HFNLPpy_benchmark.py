@@ -0,0 +1,929 @@
+"""HFNLPpy_benchmark.py
+
+# Author:
+Richard Bruce Baxter - Copyright (c) 2022 Baxter AI (baxterai.com)
+
+# License:
+MIT License
+
+# Installation:
+see HFNLPpy_main.py
+
+# Usage:
+python3 HFNLPpy_benchmark.py
+
+# Description:
+HFNLP Benchmark - performance benchmarks for HFNLP optimisations
+
+"""
+
+import time
+import sys
+import os
+import subprocess
+import traceback
+import numpy as np
+
+from HFNLPpy_hopfieldNodeClass import *
+from HFNLPpy_hopfieldConnectionClass import *
+
+runBenchmarkConnectionStoreMemory = True
+runBenchmarkConceptNodeLookup = True
+runBenchmarkNetworkMemory = True
+runBenchmarkConvertArticlesWordVectors = True
+runBenchmarkResetDendriticTree = True
+runBenchmarkBufferPool = True
+runBenchmarkScatterSynapticInputs = True
+runBenchmarkVectorisedNumpy = True
+runBenchmarkCompiled = True
+runBenchmarkSparseKernel = True
+runBenchmarkSequentialSegmentInputSourceIndex = True
+runBenchmarkTrainSentencesBatch = True
+runBenchmarkPropagationBackendSnapshot = True
+runBenchmarkNetworkSnapshotLoad = True
+
+benchmarkNumberOfRepeats = 3	#report minimum time over repeats
+
+benchmarkConnectionStoreMemoryResultName = "benchmarkConnectionStoreMemoryResult"
+benchmarkConnectionStoreMemoryVocabularySize = 20000
+benchmarkConnectionStoreMemoryNumberOfConnections = 500000
+benchmarkConnectionStoreMemoryFanOut = 16	#number of connection targets per source neuron (connections are distributed over the source neuron targets)
+
+benchmarkConceptNodeLookupResultName = "benchmarkConceptNodeLookupResult"	#network is synthetic (large vocabulary; independent of HFNLPpy_main dataset/spacy models)
+benchmarkConceptNodeLookupVocabularySize = 500000
+benchmarkConceptNodeLookupNumberOfSourceNeurons = 32	#number of propagation steps (one source neuron per step; e.g. words of a long sentence)
+benchmarkConceptNodeLookupFanOut = 64	#number of connection targets per source neuron (random over vocabulary)
+benchmarkConceptNodeLookupNumberOfLookupPasses = 100	#lookup path is repeated over all propagation steps (measurable duration)
+
+benchmarkNetworkMemoryResultName = "benchmarkNetworkMemoryResult"	#network is generated from HFNLPpy_main dataset (debugUseSmallSequentialInputDataset: Xdataset4PartSmall0000.xml)
+
+benchmarkConvertArticlesWordVectorsDatasetFileName = "Xdataset4PartSmall0000.xml"	#wiki xml dataset (not replicated; word vector table row cache is cleared before each repeat)
+benchmarkConvertArticlesWordVectorsNumberOfDifferingWordsPrinted = 20
+
+benchmarkResetDendriticTreeSentenceLength = 100	#long sentence
+benchmarkResetDendriticTreeFanOut = 32	#number of connection targets per source neuron
+benchmarkResetDendriticTreeVocabularySize = benchmarkResetDendriticTreeSentenceLength*benchmarkResetDendriticTreeFanOut
+benchmarkResetDendriticTreeNumberOfActivations = 4	#number of sequential segments activated per connection target per propagation step
+
+benchmarkBufferPoolFanOut = 2000	#number of connection targets of hub source neuron
+benchmarkBufferPoolNumberOfSteps = 10	#number of propagation steps per repeat
+
+benchmarkScatterSynapticInputsNumberOfSynapsesPerTarget = 4	#synapses of hub source neuron per connection target (may share sequential segments)
+
+benchmarkVectorisedNumpyResultName = "benchmarkVectorisedNumpyResult"
+benchmarkVectorisedNumpyFanOut = 200	#number of connection targets of hub source neuron
+benchmarkVectorisedNumpyNumberOfSteps = 10	#number of propagation steps per repeat
+
+benchmarkSparseKernelNumberOfSynapsesPerTargetList = [1, 4, 16, 64]	#network activity (number of synapses of hub source neuron per connection target; synapses are placed on random sequential segments of the 31 branch default dendritic tree)
+
+benchmarkSequentialSegmentInputSourceIndexNumberOfSources = 20000	#number of source neurons with a synapse on the connection target (inputs per sequential segment ~= numberOfSources/numberOfBranches)
+
+benchmarkTrainSentencesBatchResultName = "benchmarkTrainSentencesBatchResult"	#network is trained on HFNLPpy_main dataset (debugUseSmallSequentialInputDataset: Xdataset4PartSmall0000.xml; natural text)
+benchmarkTrainSentencesBatchSizeMax = 32	#vectoriseComputationBatchSentencesSizeMax
+
+benchmarkPropagationBackendSnapshotResultName = "benchmarkPropagationBackendSnapshotResult"
+benchmarkPropagationBackendSnapshotVocabularySize = 25
+benchmarkPropagationBackendSnapshotNumberOfSentences = 24
+benchmarkPropagationBackendSnapshotSentenceLengthMin = 7
+benchmarkPropagationBackendSnapshotSentenceLengthMax = 12
+benchmarkPropagationBackendSnapshotNumberOfRepeatedSentences = 6	#every second sentence repeats one of these sentences (trained sequences activate connection target somas; the generated synapses depend on soma activations)
+benchmarkPropagationBackendSnapshotConfigurationList = []	#[backendName, reference engine GlobalDefs settings, backend GlobalDefs settings]
+benchmarkPropagationBackendSnapshotConfigurationList.append(["vectoriseComputationScatterSynapticInputs", {}, {"vectoriseComputationScatterSynapticInputs": True}])
+benchmarkPropagationBackendSnapshotConfigurationList.append(["vectoriseComputationNumpy", {}, {"vectoriseComputationNumpy": True}])
+benchmarkPropagationBackendSnapshotStandardComputationSettings = {"vectoriseComputation": False, "vectoriseComputationCurrentDendriticInput": False, "updateNeuronObjectActivationLevels": True, "emulateVectorisedComputationOrder": True, "emulateVectorisedComputationOrderVerifyTargetConnectionFound": True, "emulateVectorisedComputationOrderPreactivateAxonsAndTargetInputs": True, "emulateVectorisedComputationOrderActivateSomaAfterFinishingPropagation": True, "reversePropagationOrder": True, "emulateVectorisedComputationOrderReversed": True, "resetConnectionTargetNeuronDendriteDuringActivation": False, "standardComputationOptimised": False, "storeDendriticTreeFlattened": False}	#GlobalDefs dependent vars of !vectoriseComputation (biologicalSimulationTestHarness); standardComputationNumba requires !standardComputationOptimised (!resetConnectionTargetNeuronDendriteDuringActivation); reference engine stores activations in dendritic tree objects
+benchmarkPropagationBackendSnapshotConfigurationList.append(["standardComputationNumba", benchmarkPropagationBackendSnapshotStandardComputationSettings, {"standardComputationNumba": True, "storeDendriticTreeFlattened": True}])	#requires numba
+
+benchmarkNetworkSnapshotLoadResultName = "benchmarkNetworkSnapshotLoadResult"
+benchmarkNetworkSnapshotLoadNumberOfNodes = 100000	#vocabulary size
+benchmarkNetworkSnapshotLoadNumberOfTargetNodes = 10000	#number of neurons with synapses (dendritic trees are only allocated for these neurons)
+benchmarkNetworkSnapshotLoadNumberOfSynapsesPerTargetNode = 100	#number of synapses = numberOfTargetNodes*numberOfSynapsesPerTargetNode (1M)
+
+benchmarkModuleImportTimeResultName = "benchmarkModuleImportTimeResult"
+benchmarkProcessOutputTailLength = 20	#number of final stdout lines of a failed benchmark process that are reported
+
+numberOfBenchmarkFailures = 0
+
+
+class BenchmarkProcessError(Exception):
+	pass
+
+def runBenchmarkProcess(benchmarkCode, resultName):
+	#execute benchmarkCode in an independent interpreter (settings that are applied on module import); returns the fields following resultName of every result line printed by the process, and the process stdout
+	benchmarkProcess = subprocess.run([sys.executable, "-c", benchmarkCode], capture_output=True, text=True)
+	resultFieldsList = []
+	for line in benchmarkProcess.stdout.splitlines():
+		if(line.startswith(resultName)):
+			resultFieldsList.append(line.split()[1:])
+	if((benchmarkProcess.returncode != 0) or (len(resultFieldsList) == 0)):
+		benchmarkOutputTail = "\n".join(benchmarkProcess.stdout.splitlines()[-benchmarkProcessOutputTailLength:])
+		raise BenchmarkProcessError(resultName + " process failed (returncode = " + str(benchmarkProcess.returncode) + ", no result line = " + str(len(resultFieldsList) == 0) + ")\nbenchmarkCode: " + benchmarkCode + "\nstdout (tail):\n" + benchmarkOutputTail + "\nstderr:\n" + benchmarkProcess.stderr)
+	return resultFieldsList, benchmarkProcess.stdout
+
+def runBenchmark(benchmark):
+	#benchmark failures are reported (and counted for the exit code); remaining benchmarks are executed
+	global numberOfBenchmarkFailures
+	try:
+		benchmark()
+	except Exception:
+		print(benchmark.__name__, " error:")
+		traceback.print_exc()
+		numberOfBenchmarkFailures += 1
+
+def measureTime(function, *args):
+	timeMin = None
+	for repeatIndex in range(benchmarkNumberOfRepeats):
+		timeStart = time.perf_counter()
+		function(*args)
+		timeElapsed = time.perf_counter()-timeStart
+		if((timeMin is None) or (timeElapsed < timeMin)):
+			timeMin = timeElapsed
+	return timeMin
+
+def printBenchmarkResult(benchmarkName, resultName, timeBaseline, timeOptimised):
+	print(benchmarkName, ": ", resultName, " baseline = ", round(timeBaseline, 4), "s, optimised = ", round(timeOptimised, 4), "s, speedup = ", round(timeBaseline/timeOptimised, 2), "x")
+
+
+#columnar synapse store (useHopfieldConnectionStore);
+
+def benchmarkConnectionStoreMemory():
+	#useHopfieldConnectionStore is applied on module import; generate each network in an independent interpreter
+	print("benchmarkConnectionStoreMemory: vocabularySize = ", benchmarkConnectionStoreMemoryVocabularySize, ", numberOfConnections = ", benchmarkConnectionStoreMemoryNumberOfConnections, ", fanOut = ", benchmarkConnectionStoreMemoryFanOut)
+	bytesPerConnectionBaseline, _, _ = measureConnectionStoreMemoryProcess(False)
+	bytesPerConnectionStore, bytesPerConnectionStoreArrays, bytesPerConnectionStoreMinimum = measureConnectionStoreMemoryProcess(True)
+	print("benchmarkConnectionStoreMemory: bytes per connection HopfieldConnection objects = ", round(bytesPerConnectionBaseline, 1), ", connection store = ", round(bytesPerConnectionStore, 1), ", reduction = ", round(bytesPerConnectionBaseline/bytesPerConnectionStore, 2), "x")
+	print("benchmarkConnectionStoreMemory: bytes per connection connection store arrays = ", round(bytesPerConnectionStoreArrays, 1), ", connection store design minimum (columns without capacity slack + indices) = ", round(bytesPerConnectionStoreMinimum, 1))
+
+def measureConnectionStoreMemoryProcess(useHopfieldConnectionStore):
+	benchmarkCode = "import HFNLPpy_hopfieldConnectionClass; HFNLPpy_hopfieldConnectionClass.useHopfieldConnectionStore = " + str(useHopfieldConnectionStore) + "; import HFNLPpy_benchmark; HFNLPpy_benchmark.measureConnectionStoreMemory()"
+	resultFieldsList, _ = runBenchmarkProcess(benchmarkCode, benchmarkConnectionStoreMemoryResultName)
+	numberOfConnections, connectionMemory, connectionMemoryPeak, connectionStoreMemory, connectionStoreMemoryMinimum = resultFieldsList[-1]
+	bytesPerConnection = int(connectionMemory)/int(numberOfConnections)
+	bytesPerConnectionStoreArrays = int(connectionStoreMemory)/int(numberOfConnections)
+	bytesPerConnectionStoreMinimum = int(connectionStoreMemoryMinimum)/int(numberOfConnections)
+	print("measureConnectionStoreMemoryProcess: useHopfieldConnectionStore = ", useHopfieldConnectionStore, ", numberOfConnections = ", numberOfConnections, ", connectionMemory = ", connectionMemory, ", connectionMemoryPeak = ", connectionMemoryPeak, ", connectionStoreMemory = ", connectionStoreMemory, ", connectionStoreMemoryMinimum = ", connectionStoreMemoryMinimum)
+	return bytesPerConnection, bytesPerConnectionStoreArrays, bytesPerConnectionStoreMinimum
+
+def measureConnectionStoreMemory():
+	#python/numpy heap allocated by addConnectionToNode (concept nodes are generated before tracing; dendritic trees are not generated); connection store memory is measured in steady state (indices rebuilt, cached connection lists discarded)
+	import tracemalloc
+	import HFNLPpy_hopfieldOperations
+	conceptNodeList = []
+	for networkIndex in range(benchmarkConnectionStoreMemoryVocabularySize):
+		conceptNode = HopfieldNode(networkIndex, "lemma" + str(networkIndex), None, graphNodeTypeConcept, 0, False, 0, 0)
+		conceptNodeList.append(conceptNode)
+		if(storeConnectionsByConceptNodeId):
+			internConceptNode(conceptNode)
+	np.random.seed(0)
+	connectionSourceIds = np.random.randint(0, benchmarkConnectionStoreMemoryVocabularySize, size=benchmarkConnectionStoreMemoryNumberOfConnections).tolist()
+	connectionTargetIds = ((np.array(connectionSourceIds) + np.random.randint(1, benchmarkConnectionStoreMemoryFanOut+1, size=benchmarkConnectionStoreMemoryNumberOfConnections)) % benchmarkConnectionStoreMemoryVocabularySize).tolist()
+	tracemalloc.start()
+	for connectionSourceId, connectionTargetId in zip(connectionSourceIds, connectionTargetIds):
+		HFNLPpy_hopfieldOperations.addConnectionToNode(conceptNodeList[connectionSourceId], conceptNodeList[connectionTargetId], 0, 0, biologicalSimulation=True)
+	connectionStoreMemory = 0
+	connectionStoreMemoryMinimum = 0
+	if(useHopfieldConnectionStore):
+		import HFNLPpy_hopfieldConnectionStore
+		HFNLPpy_hopfieldConnectionStore.networkConnectionStore.rebuildIndices()
+		connectionStoreMemory = HFNLPpy_hopfieldConnectionStore.networkConnectionStore.calculateMemoryUsage()
+		connectionStoreMemoryMinimum = HFNLPpy_hopfieldConnectionStore.networkConnectionStore.calculateMemoryUsageMinimum()
+	connectionMemory, connectionMemoryPeak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	print(benchmarkConnectionStoreMemoryResultName, benchmarkConnectionStoreMemoryNumberOfConnections, connectionMemory, connectionMemoryPeak, connectionStoreMemory, connectionStoreMemoryMinimum)
+
+
+#concept node id interning (storeConnectionsByConceptNodeId);
+
+def benchmarkConceptNodeLookup():
+	#storeConnectionsByConceptNodeId is applied on module import; generate each network in an independent interpreter
+	print("benchmarkConceptNodeLookup: vocabularySize = ", benchmarkConceptNodeLookupVocabularySize, ", numberOfSourceNeurons = ", benchmarkConceptNodeLookupNumberOfSourceNeurons, ", fanOut = ", benchmarkConceptNodeLookupFanOut)
+	timeLookupName, timeBatchName = measureConceptNodeLookupProcess(False)
+	timeLookupId, timeBatchId = measureConceptNodeLookupProcess(True)
+	printBenchmarkResult("benchmarkConceptNodeLookup", "connection lookup path (" + str(benchmarkConceptNodeLookupNumberOfLookupPasses) + " passes)", timeLookupName, timeLookupId)
+	printBenchmarkResult("benchmarkConceptNodeLookup", "addConnectionTargetNeuronsToBatch (" + str(benchmarkConceptNodeLookupNumberOfSourceNeurons) + " propagation steps)", timeBatchName, timeBatchId)
+
+def measureConceptNodeLookupProcess(storeConnectionsByConceptNodeId):
+	benchmarkCode = "import HFNLPpy_hopfieldConnectionClass; HFNLPpy_hopfieldConnectionClass.storeConnectionsByConceptNodeId = " + str(storeConnectionsByConceptNodeId) + "; import HFNLPpy_benchmark; HFNLPpy_benchmark.measureConceptNodeLookup()"
+	resultFieldsList, _ = runBenchmarkProcess(benchmarkCode, benchmarkConceptNodeLookupResultName)
+	numberOfPropagations, numberOfLookups, timeLookup, timeBatch = resultFieldsList[-1]
+	timeLookup = float(timeLookup)
+	timeBatch = float(timeBatch)
+	print("measureConceptNodeLookupProcess: storeConnectionsByConceptNodeId = ", storeConnectionsByConceptNodeId, ", numberOfPropagations = ", numberOfPropagations, ", numberOfLookups = ", numberOfLookups, ", timeLookup = ", round(timeLookup, 4), "s, timeBatch = ", round(timeBatch, 4), "s")
+	return timeLookup, timeBatch
+
+def measureConceptNodeLookup():
+	#connection lookup path and addConnectionTargetNeuronsToBatch (lookup path + batch buffer allocation) on a large vocabulary network; concept nodes are looked up in the container used by propagation (getConceptNodeLookup)
+	import HFNLPpy_biologicalSimulationNode
+	import HFNLPpy_biologicalSimulationPropagateVectorised
+	conceptNodeLookup, conceptNeuronSourceList = generateLargeVocabularyNetwork(benchmarkConceptNodeLookupVocabularySize, benchmarkConceptNodeLookupNumberOfSourceNeurons, benchmarkConceptNodeLookupFanOut)
+	timeLookup = measureTime(lookupConnectionTargetsPasses, conceptNodeLookup, conceptNeuronSourceList)
+	numberOfLookups = lookupConnectionTargetsPasses(conceptNodeLookup, conceptNeuronSourceList)
+	def addConnectionTargetNeuronsToBatchSteps():
+		connectionTargetNeuronSet = set()
+		for activationTime, conceptNeuronSource in enumerate(conceptNeuronSourceList, 1):
+			if(HFNLPpy_biologicalSimulationNode.vectoriseComputationScatterSynapticInputs):
+				HFNLPpy_biologicalSimulationNode.resetSynapticInputScatter()
+			elif(HFNLPpy_biologicalSimulationNode.vectoriseComputationBufferPool):
+				HFNLPpy_biologicalSimulationNode.resetBufferPool()
+			batchNeuronsList = []
+			HFNLPpy_biologicalSimulationPropagateVectorised.addConnectionTargetNeuronsToBatch(conceptNodeLookup, 0, activationTime, 0, [conceptNeuronSource], 1, None, connectionTargetNeuronSet, batchNeuronsList)
+		HFNLPpy_biologicalSimulationNode.resetConnectionTargetNeurons(connectionTargetNeuronSet, False)
+	timeBatch = measureTime(addConnectionTargetNeuronsToBatchSteps)
+	print(benchmarkConceptNodeLookupResultName, len(conceptNeuronSourceList), numberOfLookups, timeLookup, timeBatch)
+
+def generateLargeVocabularyNetwork(vocabularySize, numberOfSourceNeurons, fanOut):
+	#generate interned concept network (local equivalent of HFNLPpy_hopfieldGraph.networkConceptNodeDict); dendritic trees are only allocated for connection targets of the source neurons
+	import HFNLPpy_biologicalSimulationNode
+	np.random.seed(0)
+	conceptNodeList = []	#index: networkIndex
+	networkConceptNodeDict = {}
+	for networkIndex in range(vocabularySize):
+		conceptNode = HopfieldNode(networkIndex, "lemma" + str(networkIndex), None, graphNodeTypeConcept, 0, True, 0, 0, deferDendriticTreeAllocation=True)
+		conceptNodeList.append(conceptNode)
+		if(storeConnectionsByConceptNodeId):
+			internConceptNode(conceptNode)
+		networkConceptNodeDict[conceptNode.nodeName] = conceptNode
+	conceptNeuronSourceList = []
+	for networkIndex in np.random.choice(vocabularySize, numberOfSourceNeurons, replace=False):
+		conceptNeuronSource = conceptNodeList[networkIndex]
+		conceptNeuronSourceList.append(conceptNeuronSource)
+		for targetNetworkIndex in np.random.choice(vocabularySize, fanOut, replace=False):
+			conceptNeuronTarget = conceptNodeList[targetNetworkIndex]
+			if(conceptNeuronTarget.dendriticTree is None):
+				HFNLPpy_biologicalSimulationNode.initialiseDendriticTree(conceptNeuronTarget)
+			addRandomSequentialSegmentSynapse(conceptNeuronSource, conceptNeuronTarget, conceptNeuronTarget.dendriticTree)
+	conceptNodeLookup = getConceptNodeLookup(networkConceptNodeDict)
+	return conceptNodeLookup, conceptNeuronSourceList
+
+def lookupConnectionTargetsPasses(conceptNodeLookup, conceptNeuronSourceList):
+	numberOfLookups = 0
+	for passIndex in range(benchmarkConceptNodeLookupNumberOfLookupPasses):
+		for conceptNeuronSource in conceptNeuronSourceList:
+			numberOfLookups += lookupConnectionTargets(conceptNodeLookup, [conceptNeuronSource], None)
+	return numberOfLookups
+
+def lookupConnectionTargets(conceptNodeLookup, conceptNeuronSourceList, conceptNeuronTarget):
+	numberOfLookups = 0
+	conceptNeuronTargetConnectionKey = None
+	if(conceptNeuronTarget is not None):
+		conceptNeuronTargetConnectionKey = getConnectionKey(conceptNeuronTarget)
+	for conceptNeuronSource in conceptNeuronSourceList:
+		for targetConnectionConceptName in conceptNeuronSource.targetConnectionDict.keys():
+			conceptNeuronConnectionTarget = conceptNodeLookup[targetConnectionConceptName]
+			targetConnectionFound = (targetConnectionConceptName == conceptNeuronTargetConnectionKey)
+			numberOfLookups += 1
+	return numberOfLookups
+
+
+#compact object model (useCompactObjectModel);
+
+def benchmarkNetworkMemory():
+	#useCompactObjectModel is applied on class definition (module import); generate each network in an independent interpreter
+	bytesPerSynapseBaseline = measureNetworkMemoryProcess(False)
+	bytesPerSynapseCompact = measureNetworkMemoryProcess(True)
+	print("benchmarkNetworkMemory: bytes per synapse baseline = ", round(bytesPerSynapseBaseline, 1), ", compact = ", round(bytesPerSynapseCompact, 1), ", reduction = ", round(bytesPerSynapseBaseline/bytesPerSynapseCompact, 2), "x")
+
+def measureNetworkMemoryProcess(compactObjectModel):
+	benchmarkCode = "import HFNLPpy_hopfieldConnectionClass; HFNLPpy_hopfieldConnectionClass.useCompactObjectModel = " + str(compactObjectModel) + "; import HFNLPpy_benchmark; HFNLPpy_benchmark.measureNetworkMemory()"
+	resultFieldsList, _ = runBenchmarkProcess(benchmarkCode, benchmarkNetworkMemoryResultName)
+	numberOfSynapses, networkMemory = resultFieldsList[-1]
+	bytesPerSynapse = int(networkMemory)/int(numberOfSynapses)
+	print("measureNetworkMemoryProcess: compactObjectModel = ", compactObjectModel, ", numberOfSynapses = ", numberOfSynapses, ", networkMemory = ", networkMemory)
+	return bytesPerSynapse
+
+def measureNetworkMemory():
+	#python heap allocated during network generation (excludes tensorflow tensor buffers)
+	import tracemalloc
+	import HFNLPpy_main
+	import HFNLPpy_hopfieldGraph
+	tracemalloc.start()
+	HFNLPpy_main.trainSequentialInput(trainMultipleFiles=False)
+	networkMemory = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	numberOfSynapses = 0
+	for conceptNode in HFNLPpy_hopfieldGraph.networkConceptNodeDict.values():
+		for connectionList in conceptNode.targetConnectionDict.values():
+			numberOfSynapses += len(connectionList)
+	print(benchmarkNetworkMemoryResultName, numberOfSynapses, networkMemory)
+
+
+#vocab vector table lookup (ANNtf2_loadDataset.useWordVectorLookupTable);
+
+def benchmarkConvertArticlesWordVectors():
+	import ANNtf2_loadDataset
+	import HFNLPpy_wordVectorTable
+	HFNLPpy_wordVectorTable.initialiseWordVectorTable(ANNtf2_loadDataset.spacyWordVectorGenerator)
+	articles = ANNtf2_loadDataset.loadDatasetType4(benchmarkConvertArticlesWordVectorsDatasetFileName, False, None, False, NLPsequentialInputTypeTokeniseWords=True)
+	sentenceList = ANNtf2_loadDataset.flattenNestedListToSentences(articles)
+	numberOfSentences = len(sentenceList)
+	numberOfWords = sum([len(sentence) for sentence in sentenceList])
+	maximumSentenceLength = max([len(sentence) for sentence in sentenceList])
+	spacyModelMeta = ANNtf2_loadDataset.spacyWordVectorGenerator.meta
+	print("benchmarkConvertArticlesWordVectors: spacy model = ", spacyModelMeta["lang"] + "_" + spacyModelMeta["name"], spacyModelMeta["version"], ", pipeline = ", ANNtf2_loadDataset.spacyWordVectorGenerator.pipe_names)	#baseline executes the spacy pipeline per word; throughput depends on the model
+	print("benchmarkConvertArticlesWordVectors: numberOfSentences = ", numberOfSentences, ", numberOfWords = ", numberOfWords, ", maximumSentenceLength = ", maximumSentenceLength)
+
+	useWordVectorLookupTable = ANNtf2_loadDataset.useWordVectorLookupTable
+	ANNtf2_loadDataset.useWordVectorLookupTable = False
+	timeBaseline = measureTime(ANNtf2_loadDataset.convertArticlesTreeToSentencesWordVectors, articles, maximumSentenceLength)
+	trainXbaseline = ANNtf2_loadDataset.convertArticlesTreeToSentencesWordVectors(articles, maximumSentenceLength)[5]
+	ANNtf2_loadDataset.useWordVectorLookupTable = True
+	timeOptimised = measureTime(convertArticlesWordVectorsUncached, articles, maximumSentenceLength)
+	trainXoptimised = convertArticlesWordVectorsUncached(articles, maximumSentenceLength)[5]
+	ANNtf2_loadDataset.useWordVectorLookupTable = useWordVectorLookupTable
+
+	printBenchmarkResult("benchmarkConvertArticlesWordVectors", "convertArticlesTreeToSentencesWordVectors", timeBaseline, timeOptimised)
+	print("benchmarkConvertArticlesWordVectors: throughput baseline = ", round(numberOfWords/timeBaseline), " words/s, optimised = ", round(numberOfWords/timeOptimised), " words/s, number of differing features = ", np.count_nonzero(trainXbaseline != trainXoptimised))
+	differingWordList = findDifferingWords(sentenceList, trainXbaseline.reshape((trainXbaseline.shape[0], maximumSentenceLength, -1)), trainXoptimised.reshape((trainXoptimised.shape[0], maximumSentenceLength, -1)))
+	print("benchmarkConvertArticlesWordVectors: number of differing unique words = ", len(differingWordList), ", differing words (first ", benchmarkConvertArticlesWordVectorsNumberOfDifferingWordsPrinted, ") = ", differingWordList[0:benchmarkConvertArticlesWordVectorsNumberOfDifferingWordsPrinted])
+
+def findDifferingWords(sentenceList, wordVectorsBaseline, wordVectorsOptimised):
+	#wordVectors: [numberOfSentences, maximumSentenceLength, numberOfFeaturesPerWord] (sentences are in sentenceList order); returns unique words with a differing word vector
+	differingWordList = []
+	for sentenceIndex, wordIndex in np.argwhere(np.any(wordVectorsBaseline != wordVectorsOptimised, axis=2)):
+		word = None	#padding
+		if(wordIndex < len(sentenceList[sentenceIndex])):
+			word = sentenceList[sentenceIndex][wordIndex]
+		if(word not in differingWordList):
+			differingWordList.append(word)
+	return differingWordList
+
+def convertArticlesWordVectorsUncached(articles, maximumSentenceLength):
+	#word vector table rows are looked up (spacy tokenizer) once per unique word; clear row cache such that repeats do not reuse previous lookups
+	import ANNtf2_loadDataset
+	import HFNLPpy_wordVectorTable
+	HFNLPpy_wordVectorTable.clearWordVectorIndexCache()
+	return ANNtf2_loadDataset.convertArticlesTreeToSentencesWordVectors(articles, maximumSentenceLength)
+
+
+#incremental dendritic tree reset (resetDendriticTreeActivationIncremental);
+
+def benchmarkResetDendriticTree():
+	import HFNLPpy_biologicalSimulationGlobalDefs
+	import HFNLPpy_biologicalSimulationNode
+	import HFNLPpy_biologicalSimulationPropagateVectorised
+	if(not HFNLPpy_biologicalSimulationGlobalDefs.vectoriseComputationCurrentDendriticInput or HFNLPpy_biologicalSimulationGlobalDefs.vectoriseComputationNetworkActivationStore or HFNLPpy_biologicalSimulationGlobalDefs.vectoriseComputationSparseActivationStore):
+		print("benchmarkResetDendriticTree: requires per neuron vectorised tensors (vectoriseComputationCurrentDendriticInput, !vectoriseComputationNetworkActivationStore, !vectoriseComputationSparseActivationStore)")
+		return
+	sentenceLength = benchmarkResetDendriticTreeSentenceLength
+	fanOut = benchmarkResetDendriticTreeFanOut
+	print("benchmarkResetDendriticTree: sentenceLength = ", sentenceLength, ", fanOut = ", fanOut, ", vocabularySize = ", benchmarkResetDendriticTreeVocabularySize, ", numberOfActivations = ", benchmarkResetDendriticTreeNumberOfActivations)
+
+	conceptNodeList = []
+	for networkIndex in range(benchmarkResetDendriticTreeVocabularySize):
+		conceptNode = HopfieldNode(networkIndex, "lemma" + str(networkIndex), None, graphNodeTypeConcept, 0, True, 0, 0)
+		HFNLPpy_biologicalSimulationNode.initialiseDendriticTree(conceptNode)
+		conceptNodeList.append(conceptNode)
+
+	resetDendriticTreeActivationIncremental = HFNLPpy_biologicalSimulationNode.resetDendriticTreeActivationIncremental
+	timeResetBaseline, timeSentenceBaseline, numberOfActiveEntriesBaseline = measureResetDendriticTreeTime(conceptNodeList, False)
+	timeResetOptimised, timeSentenceOptimised, numberOfActiveEntriesOptimised = measureResetDendriticTreeTime(conceptNodeList, True)
+	setResetDendriticTreeActivationIncremental(resetDendriticTreeActivationIncremental)
+
+	printBenchmarkResult("benchmarkResetDendriticTree", "resetConnectionTargetNeurons (after sentence)", timeResetBaseline, timeResetOptimised)
+	printBenchmarkResult("benchmarkResetDendriticTree", "saveVectorisedBranchActivationBatch + resetConnectionTargetNeurons (sentence)", timeSentenceBaseline, timeSentenceOptimised)
+	print("benchmarkResetDendriticTree: number of active entries after reset baseline = ", numberOfActiveEntriesBaseline, ", optimised = ", numberOfActiveEntriesOptimised)
+
+def setResetDendriticTreeActivationIncremental(resetDendriticTreeActivationIncremental):
+	import HFNLPpy_biologicalSimulationNode
+	import HFNLPpy_biologicalSimulationPropagateVectorised
+	HFNLPpy_biologicalSimulationNode.resetDendriticTreeActivationIncremental = resetDendriticTreeActivationIncremental
+	HFNLPpy_biologicalSimulationPropagateVectorised.resetDendriticTreeActivationIncremental = resetDendriticTreeActivationIncremental
+
+def measureResetDendriticTreeTime(conceptNodeList, resetDendriticTreeActivationIncremental):
+	import HFNLPpy_biologicalSimulationNode
+	setResetDendriticTreeActivationIncremental(resetDendriticTreeActivationIncremental)
+	timeResetMin = None
+	timeSentenceMin = None
+	for repeatIndex in range(benchmarkNumberOfRepeats):
+		np.random.seed(repeatIndex)
+		connectionTargetNeuronSet = set()
+		timeSave = activateConnectionTargetNeurons(conceptNodeList, connectionTargetNeuronSet)
+		timeStart = time.perf_counter()
+		HFNLPpy_biologicalSimulationNode.resetConnectionTargetNeurons(connectionTargetNeuronSet, False)
+		timeReset = time.perf_counter()-timeStart
+		if((timeResetMin is None) or (timeReset < timeResetMin)):
+			timeResetMin = timeReset
+			timeSentenceMin = timeSave+timeReset
+	numberOfActiveEntries = 0
+	for conceptNode in conceptNodeList:
+		for vectorisedBranchActivationLevel in conceptNode.vectorisedBranchActivationLevelList:
+			numberOfActiveEntries += np.count_nonzero(vectorisedBranchActivationLevel.numpy())
+	return timeResetMin, timeSentenceMin, numberOfActiveEntries
+
+def activateConnectionTargetNeurons(conceptNodeList, connectionTargetNeuronSet):
+	#emulate sentence propagation; activate random sequential segments of fanOut connection targets per word (wSource) and save batch rows to connection target neurons
+	from HFNLPpy_biologicalSimulationGlobalDefs import tf
+	import HFNLPpy_biologicalSimulationNode
+	import HFNLPpy_biologicalSimulationPropagateVectorised
+	numberOfVerticalBranches = HFNLPpy_biologicalSimulationNode.calculateNumberOfVerticalBranches(HFNLPpy_biologicalSimulationNode.numberOfBranches1)
+	timeSave = 0.0
+	for wSource in range(benchmarkResetDendriticTreeSentenceLength):
+		batchNeuronsList = [conceptNodeList[networkIndex] for networkIndex in np.random.choice(len(conceptNodeList), benchmarkResetDendriticTreeFanOut, replace=False).tolist()]
+		connectionTargetNeuronSet.update(batchNeuronsList)
+		vectorisedBranchActivationLevelBatchList = []
+		vectorisedBranchActivationTimeBatchList = []
+		vectorisedBranchActivationFlagBatchList = []
+		for branchIndex1 in range(numberOfVerticalBranches):
+			batchShape = [len(batchNeuronsList)] + list(batchNeuronsList[0].vectorisedBranchActivationLevelList[branchIndex1].shape)
+			vectorisedBranchActivationLevelBatch = np.zeros(batchShape, dtype=np.float32)
+			vectorisedBranchActivationTimeBatch = np.zeros(batchShape, dtype=np.float32)
+			vectorisedBranchActivationLevelBatch.reshape(len(batchNeuronsList), -1)[:, np.random.randint(0, np.prod(batchShape[1:]), size=benchmarkResetDendriticTreeNumberOfActivations)] = HFNLPpy_biologicalSimulationNode.vectorisedActivationLevelOn
+			vectorisedBranchActivationTimeBatch[vectorisedBranchActivationLevelBatch != 0] = wSource
+			vectorisedBranchActivationLevelBatchList.append(tf.Variable(vectorisedBranchActivationLevelBatch))
+			vectorisedBranchActivationTimeBatchList.append(tf.Variable(vectorisedBranchActivationTimeBatch))
+			vectorisedBranchActivationFlagBatchList.append(tf.Variable(np.zeros(batchShape, dtype=np.float32)))
+		timeStart = time.perf_counter()
+		HFNLPpy_biologicalSimulationPropagateVectorised.saveVectorisedBranchActivationBatch(batchNeuronsList, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList)
+		timeSave += time.perf_counter()-timeStart
+	return timeSave
+
+
+#vectorised branch activation buffer pool (vectoriseComputationBufferPool);
+
+def benchmarkBufferPool():
+	import HFNLPpy_biologicalSimulationGlobalDefs
+	if(not HFNLPpy_biologicalSimulationGlobalDefs.vectoriseComputationCurrentDendriticInput or HFNLPpy_biologicalSimulationGlobalDefs.vectoriseComputationActivationContext):
+		print("benchmarkBufferPool: requires vectoriseComputationCurrentDendriticInput, !vectoriseComputationActivationContext")
+		return
+	print("benchmarkBufferPool: fanOut = ", benchmarkBufferPoolFanOut, ", numberOfSteps = ", benchmarkBufferPoolNumberOfSteps)
+	conceptNodeLookup, conceptNeuronSource = generateHubNetwork(benchmarkBufferPoolFanOut, 1)
+
+	vectoriseComputationBufferPool, vectoriseComputationScatterSynapticInputs = getVectorisedBranchActivationBatchBufferMode()
+	timeBaseline, vectorisedBranchActivationBatchListBufferBaseline = measureVectorisedBranchActivationBatchBufferTime(conceptNodeLookup, conceptNeuronSource, False, False)
+	timeOptimised, vectorisedBranchActivationBatchListBufferOptimised = measureVectorisedBranchActivationBatchBufferTime(conceptNodeLookup, conceptNeuronSource, True, False)
+	setVectorisedBranchActivationBatchBufferMode(vectoriseComputationBufferPool, vectoriseComputationScatterSynapticInputs)
+
+	printBenchmarkResult("benchmarkBufferPool", "addConnectionTargetNeuronsToBatch + createVectorisedBranchActivationBatch (" + str(benchmarkBufferPoolNumberOfSteps) + " steps)", timeBaseline, timeOptimised)
+	print("benchmarkBufferPool: number of differing batch buffer entries = ", countDifferingVectorisedBranchActivationBatchBufferEntries(vectorisedBranchActivationBatchListBufferBaseline, vectorisedBranchActivationBatchListBufferOptimised))
+
+def generateHubNetwork(fanOut, numberOfSynapsesPerTarget):
+	#generate hub source neuron with synapses on random sequential segments of every connection target;
+	import HFNLPpy_biologicalSimulationNode
+	np.random.seed(0)
+	conceptNodeList = []	#index: networkIndex
+	conceptNeuronSource = HopfieldNode(0, "lemma0", None, graphNodeTypeConcept, 0, True, 0, 0)
+	conceptNodeList.append(conceptNeuronSource)
+	for networkIndex in range(1, fanOut+1):
+		conceptNeuronTarget = HopfieldNode(networkIndex, "lemma" + str(networkIndex), None, graphNodeTypeConcept, 0, True, 0, 0)
+		conceptNodeList.append(conceptNeuronTarget)
+		dendriticTree = HFNLPpy_biologicalSimulationNode.initialiseDendriticTree(conceptNeuronTarget)
+		for synapseIndex in range(numberOfSynapsesPerTarget):
+			addRandomSequentialSegmentSynapse(conceptNeuronSource, conceptNeuronTarget, dendriticTree)
+	if(storeConnectionsByConceptNodeId):
+		conceptNodeLookup = conceptNodeList	#local equivalent of conceptNodeIdList (benchmark network is not interned)
+	else:
+		conceptNodeLookup = {conceptNode.nodeName: conceptNode for conceptNode in conceptNodeList}
+	return conceptNodeLookup, conceptNeuronSource
+
+def addRandomSequentialSegmentSynapse(conceptNeuronSource, conceptNeuronTarget, dendriticTree):
+	#add synapse of conceptNeuronSource on a random sequential segment of conceptNeuronTarget;
+	import HFNLPpy_biologicalSimulationNode
+	import HFNLPpy_biologicalSimulationGenerate
+	dendriticBranch = dendriticTree
+	for branchIndex1 in range(np.random.randint(HFNLPpy_biologicalSimulationNode.calculateNumberOfVerticalBranches(HFNLPpy_biologicalSimulationNode.numberOfBranches1))):
+		dendriticBranch = dendriticBranch.subbranches[np.random.randint(len(dendriticBranch.subbranches))]
+	sequentialSegment = dendriticBranch.sequentialSegments[np.random.randint(len(dendriticBranch.sequentialSegments))]
+	sequentialSegmentInputIndex = HFNLPpy_biologicalSimulationGenerate.calculateNewSequentialSegmentInputIndex(sequentialSegment)
+	sequentialSegmentInput = HFNLPpy_biologicalSimulationNode.SequentialSegmentInput(conceptNeuronTarget, sequentialSegment, sequentialSegmentInputIndex, conceptNeuronSource)
+	sequentialSegmentInput.firstInputInSequence = bool(np.random.randint(2))
+	sequentialSegment.inputs[sequentialSegmentInputIndex] = sequentialSegmentInput	#!preventGenerationOfDuplicateConnections (multiple synapses per source)
+	if(HFNLPpy_biologicalSimulationNode.indexSequentialSegmentInputsBySourceNode):
+		HFNLPpy_biologicalSimulationNode.addSequentialSegmentInputSourceIndex(sequentialSegment, sequentialSegmentInputIndex, conceptNeuronSource)
+	HFNLPpy_biologicalSimulationGenerate.addPredictiveSynapseToNeuron(conceptNeuronSource, conceptNeuronTarget, 0, 0, biologicalPrototype=False, weight=HFNLPpy_biologicalSimulationNode.sequentialSegmentMinActivationLevel, biologicalSimulation=True, nodeTargetSequentialSegmentInput=sequentialSegmentInput)
+
+def getVectorisedBranchActivationBatchBufferMode():
+	import HFNLPpy_biologicalSimulationNode
+	return HFNLPpy_biologicalSimulationNode.vectoriseComputationBufferPool, HFNLPpy_biologicalSimulationNode.vectoriseComputationScatterSynapticInputs
+
+def setVectorisedBranchActivationBatchBufferMode(vectoriseComputationBufferPool, vectoriseComputationScatterSynapticInputs):
+	import HFNLPpy_biologicalSimulationNode
+	import HFNLPpy_biologicalSimulationPropagateVectorised
+	if(not hasattr(HFNLPpy_biologicalSimulationNode, "bufferPoolCapacityInitial")):
+		HFNLPpy_biologicalSimulationNode.bufferPoolCapacityInitial = benchmarkBufferPoolFanOut	#bufferPoolCapacityInitial is only defined if vectoriseComputationBufferPool
+	for module in [HFNLPpy_biologicalSimulationNode, HFNLPpy_biologicalSimulationPropagateVectorised]:
+		module.vectoriseComputationBufferPool = vectoriseComputationBufferPool
+		module.vectoriseComputationScatterSynapticInputs = vectoriseComputationScatterSynapticInputs
+
+def measureVectorisedBranchActivationBatchBufferTime(conceptNodeLookup, conceptNeuronSource, vectoriseComputationBufferPool, vectoriseComputationScatterSynapticInputs):
+	import HFNLPpy_biologicalSimulationNode
+	import HFNLPpy_biologicalSimulationPropagateVectorised
+	setVectorisedBranchActivationBatchBufferMode(vectoriseComputationBufferPool, vectoriseComputationScatterSynapticInputs)
+	def propagateSteps():
+		for activationTime in range(1, benchmarkBufferPoolNumberOfSteps+1):
+			if(vectoriseComputationScatterSynapticInputs):
+				HFNLPpy_biologicalSimulationNode.resetSynapticInputScatter()
+			elif(vectoriseComputationBufferPool):
+				HFNLPpy_biologicalSimulationNode.resetBufferPool()
+			batchNeuronsList = []
+			HFNLPpy_biologicalSimulationPropagateVectorised.addConnectionTargetNeuronsToBatch(conceptNodeLookup, 0, activationTime, 0, [conceptNeuronSource], 1, None, set(), batchNeuronsList)
+			vectorisedBranchActivationBatch = HFNLPpy_biologicalSimulationPropagateVectorised.createVectorisedBranchActivationBatch(batchNeuronsList)
+		return vectorisedBranchActivationBatch[3:6]	#vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer
+	timeMin = measureTime(propagateSteps)
+	vectorisedBranchActivationBatchListBuffer = propagateSteps()
+	return timeMin, vectorisedBranchActivationBatchListBuffer
+
+def countDifferingVectorisedBranchActivationBatchBufferEntries(vectorisedBranchActivationBatchListBufferBaseline, vectorisedBranchActivationBatchListBufferOptimised):
+	numberOfDifferingEntries = 0
+	for vectorisedBranchActivationBatchListBaseline, vectorisedBranchActivationBatchListOptimised in zip(vectorisedBranchActivationBatchListBufferBaseline, vectorisedBranchActivationBatchListBufferOptimised):
+		for vectorisedBranchActivationBatchBaseline, vectorisedBranchActivationBatchOptimised in zip(vectorisedBranchActivationBatchListBaseline, vectorisedBranchActivationBatchListOptimised):
+			numberOfDifferingEntries += np.count_nonzero(vectorisedBranchActivationBatchBaseline.numpy() != vectorisedBranchActivationBatchOptimised.numpy())
+	return numberOfDifferingEntries
+
+
+#vectorised synaptic input scatter (vectoriseComputationScatterSynapticInputs);
+
+def benchmarkScatterSynapticInputs():
+	import HFNLPpy_biologicalSimulationGlobalDefs
+	import HFNLPpy_biologicalSimulationNode
+	import HFNLPpy_biologicalSimulationPropagateVectorised
+	if(not HFNLPpy_biologicalSimulationGlobalDefs.vectoriseComputationCurrentDendriticInput or HFNLPpy_biologicalSimulationGlobalDefs.vectoriseComputationActivationContext):
+		print("benchmarkScatterSynapticInputs: requires vectoriseComputationCurrentDendriticInput, !vectoriseComputationActivationContext")
+		return
+	print("benchmarkScatterSynapticInputs: fanOut = ", benchmarkBufferPoolFanOut, ", numberOfSynapsesPerTarget = ", benchmarkScatterSynapticInputsNumberOfSynapsesPerTarget, ", numberOfSteps = ", benchmarkBufferPoolNumberOfSteps)
+	conceptNodeLookup, conceptNeuronSource = generateHubNetwork(benchmarkBufferPoolFanOut, benchmarkScatterSynapticInputsNumberOfSynapsesPerTarget)
+
+	vectoriseComputationBufferPool, vectoriseComputationScatterSynapticInputs = getVectorisedBranchActivationBatchBufferMode()
+	performSummationOfSequentialSegmentInputs = HFNLPpy_biologicalSimulationNode.performSummationOfSequentialSegmentInputs
+	for performSummationOfSequentialSegmentInputsBenchmark in [False, True]:
+		for module in [HFNLPpy_biologicalSimulationNode, HFNLPpy_biologicalSimulationPropagateVectorised]:
+			module.performSummationOfSequentialSegmentInputs = performSummationOfSequentialSegmentInputsBenchmark
+		timeBaseline, vectorisedBranchActivationBatchListBufferBaseline = measureVectorisedBranchActivationBatchBufferTime(conceptNodeLookup, conceptNeuronSource, True, False)	#buffer pool (per synapse assignment)
+		timeOptimised, vectorisedBranchActivationBatchListBufferOptimised = measureVectorisedBranchActivationBatchBufferTime(conceptNodeLookup, conceptNeuronSource, False, True)
+		printBenchmarkResult("benchmarkScatterSynapticInputs", "addConnectionTargetNeuronsToBatch + createVectorisedBranchActivationBatch (performSummationOfSequentialSegmentInputs = " + str(performSummationOfSequentialSegmentInputsBenchmark) + ")", timeBaseline, timeOptimised)
+		print("benchmarkScatterSynapticInputs: number of differing batch buffer entries = ", countDifferingVectorisedBranchActivationBatchBufferEntries(vectorisedBranchActivationBatchListBufferBaseline, vectorisedBranchActivationBatchListBufferOptimised))
+	for module in [HFNLPpy_biologicalSimulationNode, HFNLPpy_biologicalSimulationPropagateVectorised]:
+		module.performSummationOfSequentialSegmentInputs = performSummationOfSequentialSegmentInputs
+	setVectorisedBranchActivationBatchBufferMode(vectoriseComputationBufferPool, vectoriseComputationScatterSynapticInputs)
+
+
+#vectorised computation NumPy backend (vectoriseComputationNumpy);
+
+def benchmarkVectorisedNumpy():
+	#vectoriseComputationNumpy selects the tf module on HFNLPpy_biologicalSimulationGlobalDefs import; execute each backend in an independent interpreter
+	print("benchmarkVectorisedNumpy: fanOut = ", benchmarkVectorisedNumpyFanOut, ", numberOfSynapsesPerTarget = ", benchmarkScatterSynapticInputsNumberOfSynapsesPerTarget, ", numberOfSteps = ", benchmarkVectorisedNumpyNumberOfSteps)
+	timeImportBaseline = measureModuleImportTimeProcess("tensorflow")
+	timeImportOptimised = measureModuleImportTimeProcess("HFNLPpy_biologicalSimulationVectorisedNumpy")
+	printBenchmarkResult("benchmarkVectorisedNumpy", "vectorised backend import", timeImportBaseline, timeImportOptimised)
+	timeBaseline, somaActivationsBaseline = measureVectorisedNumpyProcess(False)
+	timeOptimised, somaActivationsOptimised = measureVectorisedNumpyProcess(True)
+	printBenchmarkResult("benchmarkVectorisedNumpy", "addConnectionTargetNeuronsToBatch + createVectorisedBranchActivationBatch + calculateNeuronActivationParallel + saveVectorisedBranchActivationBatch (" + str(benchmarkVectorisedNumpyNumberOfSteps) + " steps)", timeBaseline, timeOptimised)
+	print("benchmarkVectorisedNumpy: soma activations baseline = ", len(somaActivationsBaseline), ", optimised = ", len(somaActivationsOptimised), ", identical = ", (somaActivationsBaseline == somaActivationsOptimised))
+
+def measureModuleImportTimeProcess(moduleName):
+	benchmarkCode = "import time; timeStart = time.perf_counter(); import " + moduleName + "; print(" + repr(benchmarkModuleImportTimeResultName) + ", time.perf_counter()-timeStart)"
+	resultFieldsList, _ = runBenchmarkProcess(benchmarkCode, benchmarkModuleImportTimeResultName)
+	return float(resultFieldsList[-1][0])
+
+def measureVectorisedNumpyProcess(vectoriseComputationNumpy):
+	benchmarkCode = "import HFNLPpy_biologicalSimulationGlobalDefs; HFNLPpy_biologicalSimulationGlobalDefs.vectoriseComputationNumpy = " + str(vectoriseComputationNumpy) + "; "
+	if(vectoriseComputationNumpy):
+		benchmarkCode += "import HFNLPpy_biologicalSimulationVectorisedNumpy; HFNLPpy_biologicalSimulationGlobalDefs.tf = HFNLPpy_biologicalSimulationVectorisedNumpy; "
+	benchmarkCode += "import HFNLPpy_benchmark; HFNLPpy_benchmark.measureVectorisedNumpy()"
+	resultFieldsList, _ = runBenchmarkProcess(benchmarkCode, benchmarkVectorisedNumpyResultName)
+	timeMin, somaActivations = resultFieldsList[-1]
+	timeMin = float(timeMin)
+	somaActivations = somaActivations.split(",")
+	return timeMin, somaActivations
+
+def measureVectorisedNumpy():
+	conceptNodeLookup, conceptNeuronSource = generateHubNetwork(benchmarkVectorisedNumpyFanOut, benchmarkScatterSynapticInputsNumberOfSynapsesPerTarget)
+	timeMin = measureTime(propagateHubNetworkSteps, conceptNodeLookup, conceptNeuronSource)
+	somaActivations = propagateHubNetworkSteps(conceptNodeLookup, conceptNeuronSource)
+	print(benchmarkVectorisedNumpyResultName, timeMin, ",".join(somaActivations))
+
+def propagateHubNetworkSteps(conceptNodeLookup, conceptNeuronSource):
+	#propagate hub source neuron for benchmarkVectorisedNumpyNumberOfSteps steps; soma activations are recorded as activationTime:networkIndex
+	import HFNLPpy_biologicalSimulationNode
+	import HFNLPpy_biologicalSimulationPropagateVectorised
+	somaActivations = []
+	connectionTargetNeuronSet = set()
+	for activationTime in range(1, benchmarkVectorisedNumpyNumberOfSteps+1):
+		if(HFNLPpy_biologicalSimulationNode.vectoriseComputationScatterSynapticInputs):	#buffer mode may be set by setVectorisedBranchActivationBatchBufferMode
+			HFNLPpy_biologicalSimulationNode.resetSynapticInputScatter()
+		elif(HFNLPpy_biologicalSimulationNode.vectoriseComputationBufferPool):
+			HFNLPpy_biologicalSimulationNode.resetBufferPool()
+		batchNeuronsList = []
+		somaActivationFoundNeuronSet = set()
+		HFNLPpy_biologicalSimulationPropagateVectorised.addConnectionTargetNeuronsToBatch(conceptNodeLookup, 0, activationTime, 0, [conceptNeuronSource], 1, None, connectionTargetNeuronSet, batchNeuronsList)
+		vectorisedBranchActivationBatch = HFNLPpy_biologicalSimulationPropagateVectorised.createVectorisedBranchActivationBatch(batchNeuronsList)
+		HFNLPpy_biologicalSimulationPropagateVectorised.calculateNeuronActivationParallel(*vectorisedBranchActivationBatch, activationTime, 1, None, None, batchNeuronsList, somaActivationFoundNeuronSet=somaActivationFoundNeuronSet)
+		HFNLPpy_biologicalSimulationPropagateVectorised.saveVectorisedBranchActivationBatch(batchNeuronsList, *vectorisedBranchActivationBatch[0:3])
+		somaActivations.extend(sorted([str(activationTime) + ":" + str(batchNeuron.networkIndex) for batchNeuron in somaActivationFoundNeuronSet]))
+	HFNLPpy_biologicalSimulationNode.resetConnectionTargetNeurons(connectionTargetNeuronSet, False)
+	return somaActivations
+
+
+#compiled propagation kernel (vectoriseComputationCompiled);
+
+def benchmarkCompiled():
+	import HFNLPpy_biologicalSimulationGlobalDefs
+	if(not HFNLPpy_biologicalSimulationGlobalDefs.vectoriseComputationCurrentDendriticInput or HFNLPpy_biologicalSimulationGlobalDefs.vectoriseComputationNumpy or HFNLPpy_biologicalSimulationGlobalDefs.updateNeuronObjectActivationLevels or not HFNLPpy_biologicalSimulationGlobalDefs.vectorisedComputationActivateSomaAfterFinishingPropagation):
+		print("benchmarkCompiled: requires vectoriseComputationCurrentDendriticInput, !vectoriseComputationNumpy, !updateNeuronObjectActivationLevels, vectorisedComputationActivateSomaAfterFinishingPropagation")
+		return
+	print("benchmarkCompiled: fanOut = ", benchmarkVectorisedNumpyFanOut, ", numberOfSynapsesPerTarget = ", benchmarkScatterSynapticInputsNumberOfSynapsesPerTarget, ", numberOfSteps = ", benchmarkVectorisedNumpyNumberOfSteps, ", device = CPU")
+	conceptNodeLookup, conceptNeuronSource = generateHubNetwork(benchmarkVectorisedNumpyFanOut, benchmarkScatterSynapticInputsNumberOfSynapsesPerTarget)
+
+	vectoriseComputationCompiled, vectoriseComputationCompiledXLA = getCompiledMode()
+	with HFNLPpy_biologicalSimulationGlobalDefs.tf.device("/CPU:0"):
+		timeEager, somaActivationsEager = measureCompiledTime(conceptNodeLookup, conceptNeuronSource, False, False)
+		for vectoriseComputationCompiledXLABenchmark in [False, True]:
+			timeCompiled, somaActivationsCompiled = measureCompiledTime(conceptNodeLookup, conceptNeuronSource, True, vectoriseComputationCompiledXLABenchmark)
+			printBenchmarkResult("benchmarkCompiled", "propagation step latency (eager vs tf.function, jit_compile = " + str(vectoriseComputationCompiledXLABenchmark) + ")", timeEager/benchmarkVectorisedNumpyNumberOfSteps, timeCompiled/benchmarkVectorisedNumpyNumberOfSteps)
+			print("benchmarkCompiled: soma activations eager = ", len(somaActivationsEager), ", compiled = ", len(somaActivationsCompiled), ", identical = ", (somaActivationsEager == somaActivationsCompiled))
+	setCompiledMode(vectoriseComputationCompiled, vectoriseComputationCompiledXLA)
+
+def getCompiledMode():
+	import HFNLPpy_biologicalSimulationPropagateVectorised
+	return HFNLPpy_biologicalSimulationPropagateVectorised.vectoriseComputationCompiled, getattr(HFNLPpy_biologicalSimulationPropagateVectorised, "vectoriseComputationCompiledXLA", True)
+
+def setCompiledMode(vectoriseComputationCompiled, vectoriseComputationCompiledXLA):
+	import HFNLPpy_biologicalSimulationPropagateVectorised
+	if(not hasattr(HFNLPpy_biologicalSimulationPropagateVectorised, "vectoriseComputationCompiledBatchSizeMin")):
+		HFNLPpy_biologicalSimulationPropagateVectorised.vectoriseComputationCompiledBatchSizeMin = 16	#vectoriseComputationCompiledBatchSizeMin is only defined if vectoriseComputationCompiled
+		HFNLPpy_biologicalSimulationPropagateVectorised.vectoriseComputationCompiledKernelCacheSize = 8	#vectoriseComputationCompiledKernelCacheSize is only defined if vectoriseComputationCompiled
+	HFNLPpy_biologicalSimulationPropagateVectorised.vectoriseComputationCompiled = vectoriseComputationCompiled
+	HFNLPpy_biologicalSimulationPropagateVectorised.vectoriseComputationCompiledXLA = vectoriseComputationCompiledXLA
+	HFNLPpy_biologicalSimulationPropagateVectorised.compiledNeuronActivationParallelKernelDict.clear()	#retrace (jit_compile is applied on kernel creation)
+
+def measureCompiledTime(conceptNodeLookup, conceptNeuronSource, vectoriseComputationCompiled, vectoriseComputationCompiledXLA):
+	#first repeat includes tracing/compilation (minimum over repeats is reported)
+	setCompiledMode(vectoriseComputationCompiled, vectoriseComputationCompiledXLA)
+	timeMin = measureTime(propagateHubNetworkSteps, conceptNodeLookup, conceptNeuronSource)
+	somaActivations = propagateHubNetworkSteps(conceptNodeLookup, conceptNeuronSource)
+	return timeMin, somaActivations
+
+
+#sparse propagation kernel (vectoriseComputationSparseKernel);
+
+def benchmarkSparseKernel():
+	import HFNLPpy_biologicalSimulationGlobalDefs
+	if(not HFNLPpy_biologicalSimulationGlobalDefs.vectoriseComputationSparseKernel):
+		print("benchmarkSparseKernel: requires vectoriseComputationSparseActivationStore (vectoriseComputationSparseKernel configuration)")
+		return
+	print("benchmarkSparseKernel: fanOut = ", benchmarkVectorisedNumpyFanOut, ", numberOfSteps = ", benchmarkVectorisedNumpyNumberOfSteps)
+	vectoriseComputationBufferPool, vectoriseComputationScatterSynapticInputs = getVectorisedBranchActivationBatchBufferMode()
+	if(not HFNLPpy_biologicalSimulationGlobalDefs.vectoriseComputationActivationContext):
+		setVectorisedBranchActivationBatchBufferMode(False, True)	#per neuron synaptic input buffer assignment otherwise dominates propagation step time
+	for numberOfSynapsesPerTarget in benchmarkSparseKernelNumberOfSynapsesPerTargetList:
+		conceptNodeLookup, conceptNeuronSource = generateHubNetwork(benchmarkVectorisedNumpyFanOut, numberOfSynapsesPerTarget)
+		timeBaseline, somaActivationsBaseline = measureSparseKernelTime(conceptNodeLookup, conceptNeuronSource, False)	#densify batch (calculateNeuronActivationParallelBranches)
+		timeOptimised, somaActivationsOptimised = measureSparseKernelTime(conceptNodeLookup, conceptNeuronSource, True)
+		printBenchmarkResult("benchmarkSparseKernel", "addConnectionTargetNeuronsToBatch + createVectorisedBranchActivationBatch + calculateNeuronActivationParallel + saveVectorisedBranchActivationBatch (numberOfSynapsesPerTarget = " + str(numberOfSynapsesPerTarget) + ")", timeBaseline, timeOptimised)
+		print("benchmarkSparseKernel: soma activations baseline = ", len(somaActivationsBaseline), ", optimised = ", len(somaActivationsOptimised), ", identical = ", (somaActivationsBaseline == somaActivationsOptimised))
+	setSparseKernelMode(True)
+	setVectorisedBranchActivationBatchBufferMode(vectoriseComputationBufferPool, vectoriseComputationScatterSynapticInputs)
+
+def setSparseKernelMode(vectoriseComputationSparseKernel):
+	import HFNLPpy_biologicalSimulationNode
+	import HFNLPpy_biologicalSimulationPropagateVectorised
+	for module in [HFNLPpy_biologicalSimulationNode, HFNLPpy_biologicalSimulationPropagateVectorised]:
+		module.vectoriseComputationSparseKernel = vectoriseComputationSparseKernel
+
+def measureSparseKernelTime(conceptNodeLookup, conceptNeuronSource, vectoriseComputationSparseKernel):
+	setSparseKernelMode(vectoriseComputationSparseKernel)
+	timeMin = measureTime(propagateHubNetworkSteps, conceptNodeLookup, conceptNeuronSource)
+	somaActivations = propagateHubNetworkSteps(conceptNodeLookup, conceptNeuronSource)
+	return timeMin, somaActivations
+
+
+#sequential segment input source index (indexSequentialSegmentInputsBySourceNode);
+
+def benchmarkSequentialSegmentInputSourceIndex():
+	print("benchmarkSequentialSegmentInputSourceIndex: numberOfSources = ", benchmarkSequentialSegmentInputSourceIndexNumberOfSources)
+	connectionList = generateConvergentNetwork(benchmarkSequentialSegmentInputSourceIndexNumberOfSources)
+
+	preventGenerationOfDuplicateConnections, indexSequentialSegmentInputsBySourceNode = getSequentialSegmentInputSourceIndexMode()
+	timeBaseline, numberOfSynapsesFoundBaseline = measureSequentialSegmentInputSourceIndexTime(connectionList, False)
+	timeOptimised, numberOfSynapsesFoundOptimised = measureSequentialSegmentInputSourceIndexTime(connectionList, True)
+	setSequentialSegmentInputSourceIndexMode(preventGenerationOfDuplicateConnections, indexSequentialSegmentInputsBySourceNode)
+
+	printBenchmarkResult("benchmarkSequentialSegmentInputSourceIndex", "findConnectionSynapseInSequentialSegment (" + str(len(connectionList)) + " connections)", timeBaseline, timeOptimised)
+	print("benchmarkSequentialSegmentInputSourceIndex: number of synapses found baseline = ", numberOfSynapsesFoundBaseline, ", optimised = ", numberOfSynapsesFoundOptimised)
+
+def generateConvergentNetwork(numberOfSources):
+	#generate connection target neuron with a synapse from every source neuron on a random sequential segment (!preventGenerationOfDuplicateConnections: sequential segment inputs are indexed by sequentialSegmentInputIndex);
+	import HFNLPpy_biologicalSimulationNode
+	import HFNLPpy_biologicalSimulationGenerate
+	np.random.seed(0)
+	conceptNeuronTarget = HopfieldNode(0, "lemma0", None, graphNodeTypeConcept, 0, True, 0, 0)
+	dendriticTree = HFNLPpy_biologicalSimulationNode.initialiseDendriticTree(conceptNeuronTarget)
+	connectionList = []
+	for networkIndex in range(1, numberOfSources+1):
+		conceptNeuronSource = HopfieldNode(networkIndex, "lemma" + str(networkIndex), None, graphNodeTypeConcept, 0, True, 0, 0)
+		dendriticBranch = dendriticTree
+		for branchIndex1 in range(np.random.randint(HFNLPpy_biologicalSimulationNode.calculateNumberOfVerticalBranches(HFNLPpy_biologicalSimulationNode.numberOfBranches1))):
+			dendriticBranch = dendriticBranch.subbranches[np.random.randint(len(dendriticBranch.subbranches))]
+		sequentialSegment = dendriticBranch.sequentialSegments[np.random.randint(len(dendriticBranch.sequentialSegments))]
+		sequentialSegmentInputIndex = HFNLPpy_biologicalSimulationGenerate.calculateNewSequentialSegmentInputIndex(sequentialSegment)
+		sequentialSegmentInput = HFNLPpy_biologicalSimulationNode.SequentialSegmentInput(conceptNeuronTarget, sequentialSegment, sequentialSegmentInputIndex, conceptNeuronSource)
+		sequentialSegment.inputs[sequentialSegmentInputIndex] = sequentialSegmentInput
+		HFNLPpy_biologicalSimulationNode.addSequentialSegmentInputSourceIndex(sequentialSegment, sequentialSegmentInputIndex, conceptNeuronSource)	#index is generated irrespective of indexSequentialSegmentInputsBySourceNode (baseline and optimised lookups are compared)
+		HFNLPpy_biologicalSimulationGenerate.addPredictiveSynapseToNeuron(conceptNeuronSource, conceptNeuronTarget, 0, 0, biologicalPrototype=False, weight=HFNLPpy_biologicalSimulationNode.sequentialSegmentMinActivationLevel, biologicalSimulation=True, nodeTargetSequentialSegmentInput=sequentialSegmentInput)
+		for targetConnectionList in conceptNeuronSource.targetConnectionDict.values():
+			connectionList.extend(targetConnectionList)
+	return connectionList
+
+def getSequentialSegmentInputSourceIndexMode():
+	import HFNLPpy_biologicalSimulationPropagateStandard
+	return HFNLPpy_biologicalSimulationPropagateStandard.preventGenerationOfDuplicateConnections, HFNLPpy_biologicalSimulationPropagateStandard.indexSequentialSegmentInputsBySourceNode
+
+def setSequentialSegmentInputSourceIndexMode(preventGenerationOfDuplicateConnections, indexSequentialSegmentInputsBySourceNode):
+	import HFNLPpy_biologicalSimulationPropagateStandard
+	HFNLPpy_biologicalSimulationPropagateStandard.preventGenerationOfDuplicateConnections = preventGenerationOfDuplicateConnections
+	HFNLPpy_biologicalSimulationPropagateStandard.indexSequentialSegmentInputsBySourceNode = indexSequentialSegmentInputsBySourceNode
+
+def measureSequentialSegmentInputSourceIndexTime(connectionList, indexSequentialSegmentInputsBySourceNode):
+	setSequentialSegmentInputSourceIndexMode(False, indexSequentialSegmentInputsBySourceNode)
+	timeMin = measureTime(findConnectionSynapses, connectionList)
+	numberOfSynapsesFound = findConnectionSynapses(connectionList)
+	return timeMin, numberOfSynapsesFound
+
+def findConnectionSynapses(connectionList):
+	import HFNLPpy_biologicalSimulationPropagateStandard
+	numberOfSynapsesFound = 0
+	for connection in connectionList:
+		foundConnectionSynapse, _ = HFNLPpy_biologicalSimulationPropagateStandard.findConnectionSynapseInSequentialSegment(connection.nodeTargetSequentialSegmentInput.sequentialSegment, connection)
+		if(foundConnectionSynapse):
+			numberOfSynapsesFound += 1
+	return numberOfSynapsesFound
+
+def benchmarkTrainSentencesBatch():
+	#vectoriseComputationBatchSentences is applied on module import; train each network in an independent interpreter
+	_, timeTrainSequential = measureTrainSentencesBatchProcess(False)
+	averageBatchFill, timeTrainBatch = measureTrainSentencesBatchProcess(True)
+	print("benchmarkTrainSentencesBatch: average batch fill (sentences per batch) = ", round(averageBatchFill, 2))
+	printBenchmarkResult("benchmarkTrainSentencesBatch", "training", timeTrainSequential, timeTrainBatch)
+
+def measureTrainSentencesBatchProcess(vectoriseComputationBatchSentences):
+	benchmarkCode = "import HFNLPpy_biologicalSimulationGlobalDefs; HFNLPpy_biologicalSimulationGlobalDefs.vectoriseComputationBatchSentences = " + str(vectoriseComputationBatchSentences) + "; HFNLPpy_biologicalSimulationGlobalDefs.vectoriseComputationBatchSentencesSizeMax = " + str(benchmarkTrainSentencesBatchSizeMax) + "; import HFNLPpy_benchmark; HFNLPpy_benchmark.measureTrainSentencesBatch()"
+	resultFieldsList, _ = runBenchmarkProcess(benchmarkCode, benchmarkTrainSentencesBatchResultName)
+	numberOfBatches, numberOfBatchSentences, timeTrain = resultFieldsList[-1]
+	averageBatchFill = int(numberOfBatchSentences)/max(int(numberOfBatches), 1)
+	timeTrain = float(timeTrain)
+	print("measureTrainSentencesBatchProcess: vectoriseComputationBatchSentences = ", vectoriseComputationBatchSentences, ", numberOfBatches = ", numberOfBatches, ", numberOfBatchSentences = ", numberOfBatchSentences, ", timeTrain = ", round(timeTrain, 4), "s")
+	return averageBatchFill, timeTrain
+
+def measureTrainSentencesBatch():
+	#sentence batches generated by training on the HFNLPpy_main dataset (debugUseSmallSequentialInputDataset: Xdataset4PartSmall0000.xml)
+	import HFNLPpy_main
+	import HFNLPpy_hopfieldGraph
+	batchSizeList = []
+	generateHopfieldGraphSentenceBatch = HFNLPpy_hopfieldGraph.generateHopfieldGraphSentenceBatch
+	def generateHopfieldGraphSentenceBatchInstrumented(sentenceIndexBatchList, *args):
+		if(len(sentenceIndexBatchList) > 0):
+			batchSizeList.append(len(sentenceIndexBatchList))
+		generateHopfieldGraphSentenceBatch(sentenceIndexBatchList, *args)
+	HFNLPpy_hopfieldGraph.generateHopfieldGraphSentenceBatch = generateHopfieldGraphSentenceBatchInstrumented
+	timeStart = time.perf_counter()
+	HFNLPpy_main.trainSequentialInput(trainMultipleFiles=False)
+	timeTrain = time.perf_counter()-timeStart
+	print(benchmarkTrainSentencesBatchResultName, len(batchSizeList), sum(batchSizeList), timeTrain)
+
+
+#propagation backend snapshot check (deterministic; reference engine vs backend);
+
+def benchmarkPropagationBackendSnapshot():
+	#GlobalDefs settings are applied on module import; train each network in an independent interpreter and compare the saved snapshots
+	import tempfile
+	import HFNLPpy_biologicalSimulationSnapshot
+	with tempfile.TemporaryDirectory() as snapshotFolderName:
+		for backendName, referenceSettings, backendSettings in benchmarkPropagationBackendSnapshotConfigurationList:
+			referenceFileName = os.path.join(snapshotFolderName, backendName + "Reference.npz")
+			backendFileName = os.path.join(snapshotFolderName, backendName + ".npz")
+			numberOfSomaActivationsReference, numberOfInputsReference = trainPropagationBackendSnapshotProcess(referenceSettings, referenceFileName)
+			numberOfSomaActivationsBackend, numberOfInputsBackend = trainPropagationBackendSnapshotProcess(dict(referenceSettings, **backendSettings), backendFileName)
+			differingArrayNameList = HFNLPpy_biologicalSimulationSnapshot.compareNetworkSnapshots(referenceFileName, backendFileName)
+			print("benchmarkPropagationBackendSnapshot: ", backendName, ": soma activations reference = ", numberOfSomaActivationsReference, ", backend = ", numberOfSomaActivationsBackend, "; numberOfInputs reference = ", numberOfInputsReference, ", backend = ", numberOfInputsBackend, "; identical snapshots = ", (len(differingArrayNameList) == 0), ", differing arrays = ", differingArrayNameList)
+
+def trainPropagationBackendSnapshotProcess(globalDefsSettings, snapshotFileName):
+	benchmarkCode = "import HFNLPpy_biologicalSimulationGlobalDefs; "
+	for globalDefsName, globalDefsValue in globalDefsSettings.items():
+		benchmarkCode += "HFNLPpy_biologicalSimulationGlobalDefs." + globalDefsName + " = " + repr(globalDefsValue) + "; "
+	if(globalDefsSettings.get("vectoriseComputationNumpy", False)):
+		benchmarkCode += "import HFNLPpy_biologicalSimulationVectorisedNumpy; HFNLPpy_biologicalSimulationGlobalDefs.tf = HFNLPpy_biologicalSimulationVectorisedNumpy; "
+	benchmarkCode += "import HFNLPpy_benchmark; HFNLPpy_benchmark.trainPropagationBackendSnapshot(" + repr(snapshotFileName) + ")"
+	resultFieldsList, benchmarkOutput = runBenchmarkProcess(benchmarkCode, benchmarkPropagationBackendSnapshotResultName)
+	numberOfInputs = int(resultFieldsList[-1][0])
+	numberOfSomaActivations = benchmarkOutput.splitlines().count("somaActivationFound")	#HFNLPpy_biologicalSimulation:simulateBiologicalHFnetworkSequenceTrainTarget	#generated synapses depend on the soma activations of the trained sentences
+	return numberOfSomaActivations, numberOfInputs
+
+def trainPropagationBackendSnapshot(snapshotFileName):
+	#train synthetic sentences (deterministic) with HFNLPpy_biologicalSimulation and save network snapshot
+	import HFNLPpy_biologicalSimulation
+	import HFNLPpy_biologicalSimulationSnapshot
+	np.random.seed(0)
+	sentenceList = [np.random.randint(benchmarkPropagationBackendSnapshotVocabularySize, size=np.random.randint(benchmarkPropagationBackendSnapshotSentenceLengthMin, benchmarkPropagationBackendSnapshotSentenceLengthMax+1)).tolist() for _ in range(benchmarkPropagationBackendSnapshotNumberOfRepeatedSentences)]
+	for sentenceIndex in range(benchmarkPropagationBackendSnapshotNumberOfRepeatedSentences, benchmarkPropagationBackendSnapshotNumberOfSentences):
+		if(sentenceIndex % 2 == 0):
+			sentenceList.append(sentenceList[sentenceIndex % benchmarkPropagationBackendSnapshotNumberOfRepeatedSentences])
+		else:
+			sentenceList.append(np.random.randint(benchmarkPropagationBackendSnapshotVocabularySize, size=np.random.randint(benchmarkPropagationBackendSnapshotSentenceLengthMin, benchmarkPropagationBackendSnapshotSentenceLengthMax+1)).tolist())
+	networkConceptNodeDict = {}
+	for networkIndex in range(benchmarkPropagationBackendSnapshotVocabularySize):
+		conceptNode = HopfieldNode(networkIndex, "lemma" + str(networkIndex), None, graphNodeTypeConcept, 0, True, 0, 0)
+		if(storeConnectionsByConceptNodeId):
+			internConceptNode(conceptNode)
+		networkConceptNodeDict[conceptNode.nodeName] = conceptNode
+	conceptNodeList = list(networkConceptNodeDict.values())
+	for sentenceIndex, sentence in enumerate(sentenceList):
+		sentenceConceptNodeList = []
+		for w, networkIndex in enumerate(sentence):
+			conceptNode = conceptNodeList[networkIndex]
+			conceptNode.w = w
+			conceptNode.sentenceIndex = sentenceIndex
+			sentenceConceptNodeList.append(conceptNode)
+		HFNLPpy_biologicalSimulation.trainBiologicalHFnetwork(networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList, len(sentenceList))
+	HFNLPpy_biologicalSimulationSnapshot.saveNetworkSnapshot(networkConceptNodeDict, snapshotFileName)
+	numberOfInputs = len(np.load(snapshotFileName)["inputTargetNodeId"])
+	print(benchmarkPropagationBackendSnapshotResultName, numberOfInputs)
+
+
+#network snapshot load (HFNLPpy_biologicalSimulationSnapshot:loadNetworkSnapshot);
+
+def benchmarkNetworkSnapshotLoad():
+	#snapshot is loaded in an independent interpreter (empty network)
+	import tempfile
+	with tempfile.TemporaryDirectory() as snapshotFolderName:
+		snapshotFileName = os.path.join(snapshotFolderName, "networkSnapshotLoad.npz")
+		generateNetworkSnapshot(snapshotFileName, benchmarkNetworkSnapshotLoadNumberOfNodes, benchmarkNetworkSnapshotLoadNumberOfTargetNodes, benchmarkNetworkSnapshotLoadNumberOfSynapsesPerTargetNode)
+		benchmarkCode = "import HFNLPpy_benchmark; HFNLPpy_benchmark.measureNetworkSnapshotLoad(" + repr(snapshotFileName) + ")"
+		resultFieldsList, _ = runBenchmarkProcess(benchmarkCode, benchmarkNetworkSnapshotLoadResultName)
+	numberOfNodes, numberOfSynapses, numberOfDendriticTrees, timeLoad = resultFieldsList[-1]
+	timeLoad = float(timeLoad)
+	print("benchmarkNetworkSnapshotLoad: numberOfNodes = ", numberOfNodes, ", numberOfSynapses = ", numberOfSynapses, ", numberOfDendriticTrees = ", numberOfDendriticTrees, ", timeLoad = ", round(timeLoad, 2), "s, synapses/s = ", round(int(numberOfSynapses)/timeLoad))
+
+def measureNetworkSnapshotLoad(snapshotFileName):
+	import HFNLPpy_biologicalSimulationSnapshot
+	networkConceptNodeDict = {}
+	timeStart = time.perf_counter()
+	HFNLPpy_biologicalSimulationSnapshot.loadNetworkSnapshot(networkConceptNodeDict, snapshotFileName)
+	timeLoad = time.perf_counter()-timeStart
+	numberOfDendriticTrees = sum([(conceptNode.dendriticTree is not None) for conceptNode in networkConceptNodeDict.values()])
+	numberOfSynapses = len(np.load(snapshotFileName)["inputTargetNodeId"])
+	print(benchmarkNetworkSnapshotLoadResultName, len(networkConceptNodeDict), numberOfSynapses, numberOfDendriticTrees, timeLoad)
+
+def generateNetworkSnapshot(snapshotFileName, numberOfNodes, numberOfTargetNodes, numberOfSynapsesPerTargetNode):
+	#synthetic snapshot (array format of HFNLPpy_biologicalSimulationSnapshot:saveNetworkSnapshot); target neurons are spread over the vocabulary, each synapse has a distinct source neuron per target neuron (valid for preventGenerationOfDuplicateConnections) and one connection
+	import HFNLPpy_biologicalSimulationGlobalDefs
+	import HFNLPpy_biologicalSimulationNode
+	import HFNLPpy_biologicalSimulationSnapshot
+	numberOfSegments = HFNLPpy_biologicalSimulationNode.calculateNumberOfBranches()*HFNLPpy_biologicalSimulationGlobalDefs.numberOfBranchSequentialSegments
+	numberOfSynapses = numberOfTargetNodes*numberOfSynapsesPerTargetNode
+	targetNodeIdArray = np.repeat(np.arange(numberOfTargetNodes, dtype=np.int64)*(numberOfNodes//numberOfTargetNodes), numberOfSynapsesPerTargetNode)
+	targetSynapseIndexArray = np.tile(np.arange(numberOfSynapsesPerTargetNode, dtype=np.int64), numberOfTargetNodes)
+	sourceNodeIdArray = (targetNodeIdArray + 1 + targetSynapseIndexArray) % numberOfNodes
+	segmentIdArray = targetSynapseIndexArray % numberOfSegments
+	np.savez(snapshotFileName,
+		snapshotFormatVersion=np.array(HFNLPpy_biologicalSimulationSnapshot.snapshotFormatVersion),
+		numberOfBranches1=np.array(HFNLPpy_biologicalSimulationGlobalDefs.numberOfBranches1),
+		numberOfBranches2=np.array(HFNLPpy_biologicalSimulationGlobalDefs.numberOfBranches2),
+		numberOfBranchSequentialSegments=np.array(HFNLPpy_biologicalSimulationGlobalDefs.numberOfBranchSequentialSegments),
+		preventGenerationOfDuplicateConnections=np.array(HFNLPpy_biologicalSimulationGlobalDefs.preventGenerationOfDuplicateConnections),
+		nodeName=np.array(["lemma" + str(nodeId) for nodeId in range(numberOfNodes)], dtype=np.str_),
+		nodeWordVector=np.zeros((numberOfNodes, 1), dtype=np.float32),
+		nodeGraphType=np.full(numberOfNodes, graphNodeTypeConcept, dtype=np.int64),
+		nodeActivationTime=np.zeros(numberOfNodes, dtype=np.int64),
+		nodeW=np.zeros(numberOfNodes, dtype=np.int64),
+		nodeSentenceIndex=np.zeros(numberOfNodes, dtype=np.int64),
+		inputTargetNodeId=targetNodeIdArray,
+		inputSegmentId=segmentIdArray,
+		inputSourceNodeId=sourceNodeIdArray,
+		inputFirstInputInSequence=(targetSynapseIndexArray == 0),
+		connectionSourceNodeId=sourceNodeIdArray,
+		connectionTargetNodeId=targetNodeIdArray,
+		connectionInputId=np.arange(numberOfSynapses, dtype=np.int64),
+		connectionWeight=np.ones(numberOfSynapses, dtype=np.float64),
+		connectionActivationTime=np.zeros(numberOfSynapses, dtype=np.int64),
+		connectionSpatioTemporalIndex=np.zeros(numberOfSynapses, dtype=np.int64))
+
+if __name__ == "__main__":
+	if(runBenchmarkConnectionStoreMemory):
+		runBenchmark(benchmarkConnectionStoreMemory)
+	if(runBenchmarkConceptNodeLookup):
+		runBenchmark(benchmarkConceptNodeLookup)
+	if(runBenchmarkNetworkMemory):
+		runBenchmark(benchmarkNetworkMemory)
+	if(runBenchmarkConvertArticlesWordVectors):
+		runBenchmark(benchmarkConvertArticlesWordVectors)
+	if(runBenchmarkResetDendriticTree):
+		runBenchmark(benchmarkResetDendriticTree)
+	if(runBenchmarkBufferPool):
+		runBenchmark(benchmarkBufferPool)
+	if(runBenchmarkScatterSynapticInputs):
+		runBenchmark(benchmarkScatterSynapticInputs)
+	if(runBenchmarkVectorisedNumpy):
+		runBenchmark(benchmarkVectorisedNumpy)
+	if(runBenchmarkCompiled):
+		runBenchmark(benchmarkCompiled)
+	if(runBenchmarkSparseKernel):
+		runBenchmark(benchmarkSparseKernel)
+	if(runBenchmarkSequentialSegmentInputSourceIndex):
+		runBenchmark(benchmarkSequentialSegmentInputSourceIndex)
+	if(runBenchmarkTrainSentencesBatch):
+		runBenchmark(benchmarkTrainSentencesBatch)
+	if(runBenchmarkPropagationBackendSnapshot):
+		runBenchmark(benchmarkPropagationBackendSnapshot)
+	if(runBenchmarkNetworkSnapshotLoad):
+		runBenchmark(benchmarkNetworkSnapshotLoad)
+	if(numberOfBenchmarkFailures > 0):
+		print("HFNLPpy_benchmark: numberOfBenchmarkFailures = ", numberOfBenchmarkFailures)
+		sys.exit(1)
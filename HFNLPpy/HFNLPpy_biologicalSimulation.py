@@ -61,6 +61,7 @@ printVerbose = False
 def seedBiologicalHFnetwork(networkConceptNodeDict, sentenceIndex, targetSentenceConceptNodeList, numberOfSentences):
 	
 	connectionTargetNeuronSet = set()	#for posthoc network deactivation
+	activationContextPrevious = beginSequenceActivation()
 	if(not seedHFnetworkSubsequenceBasic):
 		conceptNeuronSourceList = []
 
@@ -83,7 +84,7 @@ def seedBiologicalHFnetwork(networkConceptNodeDict, sentenceIndex, targetSentenc
 			
 			conceptNeuronSourceList.clear()
 			for connectionTargetNeuron in connectionTargetNeuronSetLocal:
-				if(connectionTargetNeuron.activationLevel):
+				if(getNeuronActivationLevel(connectionTargetNeuron)):
 					#print("conceptNeuronSourceList.append connectionTargetNeuron = ", connectionTargetNeuron.nodeName)
 					conceptNeuronSourceList.append(connectionTargetNeuron)
 			connectionTargetNeuronSet = connectionTargetNeuronSet.union(connectionTargetNeuronSetLocal)
@@ -105,7 +106,7 @@ def seedBiologicalHFnetwork(networkConceptNodeDict, sentenceIndex, targetSentenc
 		else:
 			print("!expectPredictiveSequenceToBeFound: wSource < minimumEncodedSequenceLength-1")
 			
-	resetConnectionTargetNeurons(connectionTargetNeuronSet, False)
+	endSequenceActivation(connectionTargetNeuronSet, activationContextPrevious)
 
 	HFNLPpy_biologicalSimulationDraw.drawBiologicalSimulationStatic(networkConceptNodeDict, sentenceIndex, targetSentenceConceptNodeList, numberOfSentences)
 
@@ -132,11 +133,95 @@ def compareSentenceStrings(sentence1, sentence2):
 	else:
 		result = False	
 	return result
-	
+
+
+#prediction (inference): propagate context concepts (prefix) through network and rank candidate next concepts by soma activation;
+#trained state is not modified (no dendritic synapse generation; neuron activations are reset after prediction, including if propagation raises an exception)
+#contextConceptNodeList: None entries are context concepts not found in network (not propagated; the positions/activation times of subsequent context concepts are preserved)
+
+def predictBiologicalHFnetwork(networkConceptNodeDict, sentenceIndex, contextConceptNodeList, topK):
+	predictionCandidateList = []
+	contextLength = len(contextConceptNodeList)
+
+	connectionTargetNeuronSet = set()	#for posthoc network deactivation
+	activationContextPrevious = beginSequenceActivation()
+
+	try:
+		for wSource in range(contextLength):
+			wTarget = wSource+1
+			conceptNeuronSource = contextConceptNodeList[wSource]
+			conceptNeuronTarget = None	#next concept is unknown
+			if(wTarget < contextLength):
+				conceptNeuronTarget = contextConceptNodeList[wTarget]
+			activationTime = calculateActivationTimeSequence(wSource)
+
+			if(conceptNeuronSource is not None):
+				connectionTargetNeuronSetLocal = set()
+				simulateBiologicalHFnetworkSequenceNodesPropagateForward(networkConceptNodeDict, sentenceIndex, contextConceptNodeList, wTarget, conceptNeuronTarget, activationTime, wSource, [conceptNeuronSource], connectionTargetNeuronSetLocal)
+
+				connectionTargetNeuronSet = connectionTargetNeuronSet.union(connectionTargetNeuronSetLocal)
+				if(wTarget == contextLength):
+					predictionCandidateList = calculatePredictionCandidates(conceptNeuronSource, connectionTargetNeuronSetLocal, topK)
+				else:
+					resetConnectionTargetNeurons(connectionTargetNeuronSetLocal, True, conceptNeuronTarget)
+	finally:
+		#reset dendritic trees
+		endSequenceActivation(connectionTargetNeuronSet, activationContextPrevious)
+
+	return predictionCandidateList
+
+#vectoriseComputationCurrentDendriticInput: predict multiple independent contexts (disjoint context/connection target neurons) in parallel; context propagation is executed in lockstep (one batch per wSource)
+def predictBiologicalHFnetworkBatch(networkConceptNodeDict, sentenceIndexList, contextConceptNodeListList, topK):
+	if(not vectoriseComputationCurrentDendriticInput):
+		print("predictBiologicalHFnetworkBatch error: requires vectoriseComputation:vectoriseComputationCurrentDendriticInput (HFNLPpy_biologicalSimulationPropagateVectorised); use predictBiologicalHFnetwork")
+		exit()
+	numberOfContextsBatch = len(contextConceptNodeListList)
+	contextLengthMax = max([len(contextConceptNodeList) for contextConceptNodeList in contextConceptNodeListList])
+
+	predictionCandidateListList = [[] for _ in range(numberOfContextsBatch)]
+	connectionTargetNeuronSetList = [set() for _ in range(numberOfContextsBatch)]	#for posthoc network deactivation
+	activationContextPrevious = beginSequenceActivation()
+
+	try:
+		for wSource in range(contextLengthMax):
+			wTarget = wSource+1
+			contextBatchIndexList = [contextBatchIndex for contextBatchIndex in range(numberOfContextsBatch) if ((wSource < len(contextConceptNodeListList[contextBatchIndex])) and (contextConceptNodeListList[contextBatchIndex][wSource] is not None))]
+			activationTime = calculateActivationTimeSequence(wSource)
+
+			connectionTargetNeuronSetLocalList = [set() for _ in contextBatchIndexList]
+			HFNLPpy_biologicalSimulationPropagateVectorised.simulateBiologicalHFnetworkSequencesNodePropagateParallel(networkConceptNodeDict, [sentenceIndexList[contextBatchIndex] for contextBatchIndex in contextBatchIndexList], [contextConceptNodeListList[contextBatchIndex] for contextBatchIndex in contextBatchIndexList], activationTime, wSource, wTarget, connectionTargetNeuronSetLocalList)
+
+			for localIndex, contextBatchIndex in enumerate(contextBatchIndexList):
+				contextConceptNodeList = contextConceptNodeListList[contextBatchIndex]
+				connectionTargetNeuronSetLocal = connectionTargetNeuronSetLocalList[localIndex]
+				connectionTargetNeuronSetList[contextBatchIndex] = connectionTargetNeuronSetList[contextBatchIndex].union(connectionTargetNeuronSetLocal)
+				if(wTarget == len(contextConceptNodeList)):
+					predictionCandidateListList[contextBatchIndex] = calculatePredictionCandidates(contextConceptNodeList[wSource], connectionTargetNeuronSetLocal, topK)
+				else:
+					resetConnectionTargetNeurons(connectionTargetNeuronSetLocal, True, contextConceptNodeList[wTarget])
+	finally:
+		#reset dendritic trees
+		endSequenceActivation(set().union(*connectionTargetNeuronSetList), activationContextPrevious)
+
+	return predictionCandidateListList
+
+def calculatePredictionCandidates(conceptNeuronSource, connectionTargetNeuronSet, topK):
+	#returns list of (nodeName, somaActivationFound, numberOfConnections) for connection targets of last context concept; ranked by soma activation, then by number of connections from last context concept
+	predictionCandidateList = []
+	for conceptNeuronConnectionTarget in connectionTargetNeuronSet:
+		somaActivationFound = bool(getNeuronActivationLevel(conceptNeuronConnectionTarget))
+		numberOfConnections = len(conceptNeuronSource.targetConnectionDict[getConnectionKey(conceptNeuronConnectionTarget)])
+		predictionCandidateList.append((conceptNeuronConnectionTarget.nodeName, somaActivationFound, numberOfConnections))
+	predictionCandidateList.sort(key=lambda predictionCandidate: (not predictionCandidate[1], -predictionCandidate[2], predictionCandidate[0]))
+	return predictionCandidateList[0:topK]
+
 
 def trainBiologicalHFnetwork(networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList, numberOfSentences):
 	simulateBiologicalHFnetworkSequenceTrain(networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList, numberOfSentences)	
 
+def trainBiologicalHFnetworkBatch(networkConceptNodeDict, sentenceIndexList, sentenceConceptNodeListList, numberOfSentences):
+	simulateBiologicalHFnetworkSequencesTrain(networkConceptNodeDict, sentenceIndexList, sentenceConceptNodeListList, numberOfSentences)
+
 
 #if (!biologicalSimulation:useDependencyParseTree):
 
@@ -147,6 +232,7 @@ def simulateBiologicalHFnetworkSequenceTrain(networkConceptNodeDict, sentenceInd
 	sentenceLength = len(sentenceConceptNodeList)
 	
 	connectionTargetNeuronSet = set()	#for posthoc network deactivation
+	activationContextPrevious = beginSequenceActivation()
 	
 	for wTarget in range(1, sentenceLength):	#wTarget>=1: do not create (recursive) connection from conceptNode to conceptNode branchIndex1=0
 		conceptNeuronTarget = sentenceConceptNodeList[wTarget]
@@ -157,36 +243,80 @@ def simulateBiologicalHFnetworkSequenceTrain(networkConceptNodeDict, sentenceInd
 		connectionTargetNeuronSet = connectionTargetNeuronSet.union(connectionTargetNeuronSetLocal)
 		resetConnectionTargetNeurons(connectionTargetNeuronSetLocal, True, conceptNeuronTarget)	
 						
-		if(somaActivationFound):
-			#if(printVerbose):
-			print("somaActivationFound")
-		else:
-			#if(printVerbose):
-			print("!somaActivationFound: ", end='')
-			predictiveSequenceLength = wTarget	#wSource+1
-			dendriticBranchMaxW = wTarget-1
-			expectFurtherSubbranches = True
-			if(wTarget == 1):
-				expectFurtherSubbranches = False
-			
-			addPredictiveSequenceToNeuron = False
-			if(enforceMinimumEncodedSequenceLength):
-				if(dendriticBranchMaxW+1 >= minimumEncodedSequenceLength):
-					addPredictiveSequenceToNeuron = True
-			else:
-				addPredictiveSequenceToNeuron = True
-			if(addPredictiveSequenceToNeuron):
-				print("addPredictiveSequenceToNeuron")
-				HFNLPpy_biologicalSimulationGenerate.addPredictiveSequenceToNeuron(conceptNeuronTarget, sentenceIndex, sentenceConceptNodeList, conceptNeuronTarget.dendriticTree, predictiveSequenceLength, dendriticBranchMaxW, 0, 0, expectFurtherSubbranches)
-			else:
-				print("")	#add new line
+		simulateBiologicalHFnetworkSequenceTrainTarget(sentenceIndex, sentenceConceptNodeList, wTarget, conceptNeuronTarget, somaActivationFound)
 				
 	#reset dendritic trees
-	resetConnectionTargetNeurons(connectionTargetNeuronSet, False)
+	endSequenceActivation(connectionTargetNeuronSet, activationContextPrevious)
 
 	HFNLPpy_biologicalSimulationDraw.drawBiologicalSimulationStatic(networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList, numberOfSentences)
 
 			
+def simulateBiologicalHFnetworkSequenceTrainTarget(sentenceIndex, sentenceConceptNodeList, wTarget, conceptNeuronTarget, somaActivationFound):
+	if(somaActivationFound):
+		#if(printVerbose):
+		print("somaActivationFound")
+	else:
+		#if(printVerbose):
+		print("!somaActivationFound: ", end='')
+		predictiveSequenceLength = wTarget	#wSource+1
+		dendriticBranchMaxW = wTarget-1
+		expectFurtherSubbranches = True
+		if(wTarget == 1):
+			expectFurtherSubbranches = False
+		
+		addPredictiveSequenceToNeuron = False
+		if(enforceMinimumEncodedSequenceLength):
+			if(dendriticBranchMaxW+1 >= minimumEncodedSequenceLength):
+				addPredictiveSequenceToNeuron = True
+		else:
+			addPredictiveSequenceToNeuron = True
+		if(addPredictiveSequenceToNeuron):
+			print("addPredictiveSequenceToNeuron")
+			HFNLPpy_biologicalSimulationGenerate.addPredictiveSequenceToNeuron(conceptNeuronTarget, sentenceIndex, sentenceConceptNodeList, initialiseDendriticTree(conceptNeuronTarget), predictiveSequenceLength, dendriticBranchMaxW, 0, 0, expectFurtherSubbranches)
+		else:
+			print("")	#add new line
+
+#vectoriseComputationBatchSentences: train multiple independent sentences (disjoint sentence/connection target neurons) in parallel;
+#sentence propagation is executed in lockstep (one batch per wTarget), and dendritic synapse generation is deferred until propagation is complete then executed in sentence order (preserving the random number sequence of sequential training)
+def simulateBiologicalHFnetworkSequencesTrain(networkConceptNodeDict, sentenceIndexList, sentenceConceptNodeListList, numberOfSentences):
+
+	numberOfSentencesBatch = len(sentenceConceptNodeListList)
+	sentenceLengthMax = max([len(sentenceConceptNodeList) for sentenceConceptNodeList in sentenceConceptNodeListList])
+	
+	connectionTargetNeuronSetList = [set() for _ in range(numberOfSentencesBatch)]	#for posthoc network deactivation
+	activationContextPrevious = beginSequenceActivation()
+	somaActivationFoundListList = [[] for _ in range(numberOfSentencesBatch)]
+	
+	for wTarget in range(1, sentenceLengthMax):
+		sentenceBatchIndexList = [sentenceBatchIndex for sentenceBatchIndex in range(numberOfSentencesBatch) if wTarget < len(sentenceConceptNodeListList[sentenceBatchIndex])]
+		wSource = wTarget-1
+		activationTime = calculateActivationTimeSequence(wSource)
+		print("simulateBiologicalHFnetworkSequencesTrain: wSource = ", wSource, ", wTarget = ", wTarget, ", numberOfSentencesBatch = ", len(sentenceBatchIndexList))
+		
+		connectionTargetNeuronSetLocalList = [set() for _ in sentenceBatchIndexList]
+		somaActivationFoundList = HFNLPpy_biologicalSimulationPropagateVectorised.simulateBiologicalHFnetworkSequencesNodePropagateParallel(networkConceptNodeDict, [sentenceIndexList[sentenceBatchIndex] for sentenceBatchIndex in sentenceBatchIndexList], [sentenceConceptNodeListList[sentenceBatchIndex] for sentenceBatchIndex in sentenceBatchIndexList], activationTime, wSource, wTarget, connectionTargetNeuronSetLocalList)
+		
+		for localIndex, sentenceBatchIndex in enumerate(sentenceBatchIndexList):
+			connectionTargetNeuronSetLocal = connectionTargetNeuronSetLocalList[localIndex]
+			connectionTargetNeuronSetList[sentenceBatchIndex] = connectionTargetNeuronSetList[sentenceBatchIndex].union(connectionTargetNeuronSetLocal)
+			resetConnectionTargetNeurons(connectionTargetNeuronSetLocal, True, sentenceConceptNodeListList[sentenceBatchIndex][wTarget])
+			somaActivationFoundListList[sentenceBatchIndex].append(somaActivationFoundList[localIndex])
+			
+	for sentenceBatchIndex in range(numberOfSentencesBatch):
+		sentenceIndex = sentenceIndexList[sentenceBatchIndex]
+		sentenceConceptNodeList = sentenceConceptNodeListList[sentenceBatchIndex]
+		for wTarget in range(1, len(sentenceConceptNodeList)):
+			simulateBiologicalHFnetworkSequenceTrainTarget(sentenceIndex, sentenceConceptNodeList, wTarget, sentenceConceptNodeList[wTarget], somaActivationFoundListList[sentenceBatchIndex][wTarget-1])
+		
+		#reset dendritic trees
+		if(not vectoriseComputationActivationContext):
+			resetConnectionTargetNeurons(connectionTargetNeuronSetList[sentenceBatchIndex], False)
+
+		HFNLPpy_biologicalSimulationDraw.drawBiologicalSimulationStatic(networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList, numberOfSentences)
+		
+	if(vectoriseComputationActivationContext):
+		releaseActivationContext(activationContextPrevious)	#discard batch activation context
+
 def simulateBiologicalHFnetworkSequenceNodePropagateWrapper(networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList, wTarget, connectionTargetNeuronSet):
 	somaActivationFound = False
 	if(biologicalSimulationForward):
@@ -231,6 +361,7 @@ def simulateBiologicalHFnetworkSequenceNodePropagateReverseLookup(networkConcept
 def simulateBiologicalHFnetworkSequenceNodePropagateForwardFull(networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList, wTarget, conceptNeuronTarget):
 	somaActivationFound = False
 	connectionTargetNeuronSet = set()	#for posthoc network deactivation
+	activationContextPrevious = beginSequenceActivation()
 	
 	for wSource, conceptNeuronSource in enumerate(sentenceConceptNodeList):	#support for simulateBiologicalHFnetworkSequenceSyntacticalBranchDPTrain:!biologicalSimulationEncodeSyntaxInDendriticBranchStructureFormat
 	#orig for wSource in range(0, wTarget):
@@ -247,7 +378,7 @@ def simulateBiologicalHFnetworkSequenceNodePropagateForwardFull(networkConceptNo
 		connectionTargetNeuronSet = connectionTargetNeuronSet.union(connectionTargetNeuronSetLocal)
 		resetConnectionTargetNeurons(connectionTargetNeuronSetLocal, True, conceptNeuronTarget)
 	
-	resetConnectionTargetNeurons(connectionTargetNeuronSet, False)
+	endSequenceActivation(connectionTargetNeuronSet, activationContextPrevious)
 		
 	return somaActivationFound
 
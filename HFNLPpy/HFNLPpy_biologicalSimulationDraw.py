@@ -214,9 +214,10 @@ def drawHopfieldGraphNode(conceptNode, drawGraphNetwork, activationTime):
 	hopfieldGraphConceptNodesList.append(conceptNode.nodeName)
 
 	#if(biologicalSimulation) exclusive code:
-	posYdendriticTreeBranchHead = posY+branchIndex1Separation	#position of first branching within dendritic tree
-	currentBranchIndex1 = 0
-	drawHopfieldGraphNodeDendriticBranch(conceptNode, posX, posYdendriticTreeBranchHead, conceptNode.dendriticTree, currentBranchIndex1, conceptNode, posX, posY, activationTime, drawOrthogonalBranchNode=False)
+	if(conceptNode.dendriticTree is not None):	#lazyDendriticTreeAllocation: neurons without synapses do not have a dendritic tree
+		posYdendriticTreeBranchHead = posY+branchIndex1Separation	#position of first branching within dendritic tree
+		currentBranchIndex1 = 0
+		drawHopfieldGraphNodeDendriticBranch(conceptNode, posX, posYdendriticTreeBranchHead, conceptNode.dendriticTree, currentBranchIndex1, conceptNode, posX, posY, activationTime, drawOrthogonalBranchNode=False)
 
 #if(biologicalSimulation) exclusive code:
 	
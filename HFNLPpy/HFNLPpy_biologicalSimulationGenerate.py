@@ -51,10 +51,12 @@ def addPredictiveSequenceToNeuron(conceptNeuron, sentenceIndex, sentenceConceptN
 			currentSequentialSegmentInput = SequentialSegmentInput(conceptNeuron, currentSequentialSegment, newSequentialSegmentSegmentInputIndex, previousContextConceptNode)
 			#currentSequentialSegment.inputs.append(currentSequentialSegmentInput)
 			if(preventGenerationOfDuplicateConnections):
-				currentSequentialSegment.inputs[previousContextConceptNode.nodeName] = currentSequentialSegmentInput			
+				currentSequentialSegment.inputs[getConnectionKey(previousContextConceptNode)] = currentSequentialSegmentInput			
 			else:
 				#print("newSequentialSegmentSegmentInputIndex = ", newSequentialSegmentSegmentInputIndex)
 				currentSequentialSegment.inputs[newSequentialSegmentSegmentInputIndex] = currentSequentialSegmentInput
+				if(indexSequentialSegmentInputsBySourceNode):
+					addSequentialSegmentInputSourceIndex(currentSequentialSegment, newSequentialSegmentSegmentInputIndex, previousContextConceptNode)
 			addPredictiveSynapseToNeuron(previousContextConceptNode, conceptNeuron, activationTime, spatioTemporalIndex, biologicalPrototype=False, weight=weight, subsequenceConnection=False, contextConnection=False, contextConnectionSANIindex=0, biologicalSimulation=True, nodeTargetSequentialSegmentInput=currentSequentialSegmentInput)
 		else:
 			currentSequentialSegmentInput = existingSequentialSegmentInput
@@ -166,6 +166,9 @@ if(enforceMinimumEncodedSequenceLength):
 	minimumEncodedSequenceLength = 4	#should be high enough to fill a significant proportion of dendrite vertical branch length (numberOfBranches1)	#~seedHFnetworkSubsequenceLength
 	
 preventGenerationOfDuplicateConnections = True	#note sequentialSegment inputs will be stored as a dictionary indexed by source node name (else indexed by sequentialSegmentInputIndex)
+indexSequentialSegmentInputsBySourceNode = False	#initialise (dependent var)
+if(not preventGenerationOfDuplicateConnections):
+	indexSequentialSegmentInputsBySourceNode = False	#optional	#maintain a network reverse index of sequential segment inputs (key: (source conceptNode.networkIndex, target conceptNode.networkIndex), value: list of (sequentialSegmentId, sequentialSegmentInputIndex)); findSequentialSegmentInputBySourceNode/findConnectionSynapseInSequentialSegment are constant time lookups rather than scans of sequentialSegment.inputs (indexed by sequentialSegmentInputIndex)
 	
 
 #### encode syntax in dendritic branch structure ####
@@ -213,12 +216,52 @@ if(not vectoriseComputation):
 
 #### vectorised computation ####
 
+vectoriseComputationNetworkActivationStore = False	#initialise (dependent var)
+vectoriseComputationSparseActivationStore = False	#initialise (dependent var)
+vectoriseComputationActivationContext = False	#initialise (dependent var)
+vectoriseComputationBatchSentences = False	#initialise (dependent var)
+vectoriseComputationBufferPool = False	#initialise (dependent var)
+vectoriseComputationScatterSynapticInputs = False	#initialise (dependent var)
+vectoriseComputationNumpy = False	#initialise (dependent var)
+vectoriseComputationCompiled = False	#initialise (dependent var)
 if(vectoriseComputation):
-	import tensorflow as tf
+	vectoriseComputationNumpy = False	#optional	#execute vectorised computation with the NumPy backend (HFNLPpy_biologicalSimulationVectorisedNumpy: TensorFlow API subset on numpy arrays) rather than TensorFlow; avoids TensorFlow eager per operation dispatch overhead on small dendritic tree tensors, and does not import TensorFlow
+	if(vectoriseComputationNumpy):
+		import HFNLPpy_biologicalSimulationVectorisedNumpy as tf
+	else:
+		import tensorflow as tf
+		if(not updateNeuronObjectActivationLevels and vectorisedComputationActivateSomaAfterFinishingPropagation):
+			vectoriseComputationCompiled = False	#optional	#execute the calculateNeuronActivationParallel dendritic tree recurrence (branchIndex1/sequentialSegmentIndex loops) as a traced tf.function graph, rather than dispatching every TensorFlow operation eagerly; batch tensors are padded such that the graph is only traced once per padded batch size	#requires !updateNeuronObjectActivationLevels (neuron objects are not updated during the recurrence), vectorisedComputationActivateSomaAfterFinishingPropagation
+			if(vectoriseComputationCompiled):
+				vectoriseComputationCompiledXLA = True	#optional	#compile traced graph with XLA (tf.function jit_compile)
+				vectoriseComputationCompiledBatchSizeMin = 16	#batch tensors are padded to the smallest power of 2 multiple of vectoriseComputationCompiledBatchSizeMin >= batchSize
+				vectoriseComputationCompiledKernelCacheSize = 8	#maximum number of padded batch sizes with a compiled kernel (traced graph and persistent padded batch tf.Variables)
 	vectoriseComputationCurrentDendriticInput = True	#mandatory - default behaviour
 	if(vectoriseComputationCurrentDendriticInput):
 		vectoriseComputationIndependentBranches = True	#mandatory - default behaviour
-	batchSizeDefault = 100	#high batch size allowed since parallel processing simple/small scalar operations (on effective boolean synaptic inputs), lowered proportional to max (most distal) numberOfHorizontalBranches	#not used (createDendriticTreeVectorised is never called with batched=True)
+		vectoriseComputationSparseActivationStore = False	#optional	#store only active (non-zero) dendritic tree activation coordinates of each neuron (dict of keys: conceptNode.networkIndex - COO coordinates [horizontalBranchIndex, branchIndex2, sequentialSegmentIndex] and level/time/flag values per branchIndex1); memory scales with network activity rather than vocabulary size * dendritic tree size (large numberOfBranches1/numberOfBranches2); see vectoriseComputationSparseKernel for propagation
+		if(not updateNeuronObjectActivationLevels):
+			vectoriseComputationActivationContext = False	#optional	#store transient activation state (neuron soma activations, sparse dendritic tree activations, dendritic input buffers) in a per sequence/query activation context (HFNLPpy_biologicalSimulationNode.ActivationContext) rather than in network objects; the network is read-only during propagation (concurrent propagations in independent threads) and the activation context is discarded after each sequence (no reset of connection target neurons)
+			if(vectoriseComputationActivationContext):
+				vectoriseComputationSparseActivationStore = True	#mandatory	#activation context stores sparse dendritic tree activations
+		if(not vectoriseComputationSparseActivationStore):
+			vectoriseComputationNetworkActivationStore = False	#optional	#store dendritic tree activations of all neurons in network wide tensors per branchIndex1 (shape [networkActivationStoreCapacity, numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments], row: conceptNode.networkIndex); propagation gathers/scatters batch rows in place rather than generating per neuron tf.Variables
+			if(vectoriseComputationNetworkActivationStore):
+				networkActivationStoreCapacityInitial = 1024	#number of neuron rows allocated initially (capacity is doubled when exceeded)
+				networkActivationStoreBatchCacheSize = 16	#maximum number of batchSizes with persistent batch tf.Variables (gathered rows of connection target neurons)
+		if(not vectoriseComputationActivationContext):
+			vectoriseComputationScatterSynapticInputs = False	#optional	#record the fired synaptic inputs of all connection target neurons of a propagation step ([horizontalBranchIndex, branchIndex2, sequentialSegmentIndex, {sequentialSegmentInputIndex}] coordinates, activation levels/times, firstInputInSequence per branchIndex1) and apply them to zeroed batch buffers with a single tf.tensor_scatter_nd_update per branchIndex1 (per buffer tensor), rather than assigning every synaptic input to per neuron buffers (and reading back existing buffer values for performSummationOfSequentialSegmentInputs); duplicate coordinates are resolved in order of firing (summation or last input)	#vectoriseComputationActivationContext not supported (synaptic input record is shared by all propagations)
+			vectoriseComputationBufferPool = False	#optional	#store the temporary dendritic input buffers of all connection target neurons of a propagation step in preallocated batch shaped tensors per branchIndex1 (shape [bufferPoolCapacity, numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments, {numberOfSequentialSegmentInputs}], row: batchIndex) that are reused across propagation steps and zeroed in place, rather than generating per neuron buffer tf.Variables for every connection target neuron of every propagation step; synaptic inputs of a propagation step are collected and scattered into the buffer pool with a single scatter_nd_update per buffer tensor	#vectoriseComputationActivationContext not supported (buffer pool is shared by all propagations)
+			if(vectoriseComputationScatterSynapticInputs):
+				vectoriseComputationBufferPool = False	#not required (vectoriseComputationScatterSynapticInputs does not generate per neuron buffers)
+			if(vectoriseComputationBufferPool):
+				bufferPoolCapacityInitial = 1024	#number of batch rows allocated initially (capacity is doubled when exceeded)
+	batchSizeDefault = 100	#high batch size allowed since parallel processing simple/small scalar operations (on effective boolean synaptic inputs), lowered proportional to max (most distal) numberOfHorizontalBranches	#used by vectoriseComputationBatchSentences (createDendriticTreeVectorised is never called with batched=True)
+	if(vectoriseComputationCurrentDendriticInput):
+		vectoriseComputationBatchSentences = False	#optional	#train independent sentences in parallel; group consecutive sentences with disjoint sentence/connection target neurons (up to batchSizeDefault neurons), propagate each wTarget of the group in a single batch, and defer dendritic synapse generation until group propagation is complete (executed in sentence order; equivalent to sequential training)
+		if(vectoriseComputationBatchSentences):
+			if(drawBiologicalSimulationDynamic or biologicalSimulationEncodeSyntaxInDendriticBranchStructure):
+				vectoriseComputationBatchSentences = False	#mandatory	#vectoriseComputationBatchSentences does not support drawBiologicalSimulationDynamic (dynamic draw of single sentence) or HFNLPpy_biologicalSimulationSyntacticalGraph
 	
 	if(updateNeuronObjectActivationLevels):
 		recordVectorisedBranchObjectList = True	#vectorisedBranchObjectList is required to convert vectorised activations back to denditicTree object structure (DendriticBranch/SequentialSegment/SequentialSegmentInput) for drawBiologicalSimulationDynamic:updateNeuronObjectActivationLevels (as HFNLPpy_biologicalSimulationDraw currently only supports drawing of denditicTree object structure activations)  
@@ -231,6 +274,9 @@ onlyPropagateIfConceptNeuronTargetActivatedByConceptNeuronSourceVectorised = Fal
 if(vectoriseComputation):
 	if(enforceMinimumEncodedSequenceLength):
 		onlyPropagateIfConceptNeuronTargetActivatedByConceptNeuronSourceVectorised = False	#mandatory
+
+if(vectoriseComputationBatchSentences):
+	vectoriseComputationBatchSentencesSizeMax = 32	#maximum number of sentences per batch
 	
 	
 #### dendritic branch/sequential segment activation level cache ####
@@ -279,6 +325,8 @@ else:
 
 resetSourceNeuronAxonAfterActivation = True	#mandatory
 
+resetDendriticTreeActivationIncremental = False	#optional	#track activated (dirty) dendritic tree entries of each neuron (vectorised: [horizontalBranchIndex, branchIndex2, sequentialSegmentIndex] coordinates per branchIndex1; objects: DendriticBranch) and only rezero these entries in place upon reset (rather than regenerating all vectorised tensors/recursing the entire dendritic tree object structure); neurons without activated entries are not reset	#vectorised: applies to per neuron tensors only (vectoriseComputationNetworkActivationStore/vectoriseComputationSparseActivationStore already reset in place)
+
 if(biologicalSimulationForward):
 	#dendrite activations reset mode selection (typically select one only):
 	resetConnectionTargetNeuronDendriteAfterSequence = False	#optional	#does not reset sequential segment activations during sequence propagation (overwrites them)
@@ -368,6 +416,10 @@ else:
 	numberOfBranches2 = 2	#number of new horizontal branches created at each vertical branch
 	#[1,2,4,8]	#number of new horizontal branches created at each vertical branch
 numberOfBranchSequentialSegments = 1	#1+	#sequential inputs (FUTURE: if > 1: each branch segment may require sequential inputs)
+lazyDendriticTreeAllocation = False	#optional	#allocate dendritic tree (DendriticBranch/SequentialSegment objects and vectorised activations) on first addPredictiveSequenceToNeuron; concept neurons that never receive a synapse (e.g. large/Zipf-tailed vocabularies) do not store a dendritic tree
+storeDendriticTreeFlattened = True	#optional	#default: True	#False: orig implementation (activation attributes stored in DendriticBranch/SequentialSegment objects)	#store dendritic tree activation levels/times/frozen states in heap ordered arrays per neuron (FlattenedDendriticTree: index calculateBranchId/calculateSequentialSegmentId); DendriticBranch/SequentialSegment activation attributes are views onto these arrays (read by propagation, xml and draw)	#vectorised per neuron tf.Variables remain the working state of vectorised propagation (tf.Variables cannot share memory with numpy arrays)
+if(storeDendriticTreeFlattened):
+	recordVectorisedBranchObjectList = False	#mandatory	#updateNeuronObjectActivationLevels: vectorised activations are written directly to the FlattenedDendriticTree arrays (vectorisedBranchObjectList is not required)
 #numberOfBranchSequentialSegmentInputs = 1	#1+	#nonSequentialInputs	#in current implementation (non-parallel generative network) number of inputs at sequential segment is dynamically increased on demand #not used; currently encode infinite number of
 
 sequentialSegmentIndexMostProximal = 0
@@ -402,3 +454,20 @@ verifyPropagationTime = False	#default: False	#early activation of sequential se
 if(verifyPropagationTime):
 	activationPropagationTimeMax = 3	#max propagation time between sequential segments
 
+
+#### standard computation (compiled) ####
+
+standardComputationNumba = False	#initialise (dependent var)
+if(not vectoriseComputation and not standardComputationOptimised):
+	if(not drawBiologicalSimulationDynamic and not requireSubbranchOrSequentialSegmentForActivation):
+		standardComputationNumba = False	#optional	#execute calculateNeuronActivationStandard (propagation of entire dendritic tree for every activated connection) in a Numba compiled loop on the flattened dendritic tree (HFNLPpy_biologicalSimulationPropagateStandardNumba: heap ordered branch/sequential segment activation level/time/frozen arrays) rather than recursing through dendritic tree objects	#requires numba	#drawBiologicalSimulationDynamic not supported (sequential segment activations are not drawn during propagation)
+if(standardComputationNumba):
+	storeDendriticTreeFlattened = True	#mandatory	#standardComputationNumba propagates on the FlattenedDendriticTree arrays
+
+
+#### vectorised computation (sparse) ####
+
+vectoriseComputationSparseKernel = False	#initialise (dependent var)
+if(vectoriseComputation and vectoriseComputationSparseActivationStore):
+	if(not reversePropagationOrder and (numberOfBranchSequentialSegments == 1) and expectFirstBranchSequentialSegmentConnection and not deactivateSequentialSegmentsIfAllConnectionInputsOff and not performSummationOfSequentialSegmentInputsAcrossBranch and not requireSubbranchOrSequentialSegmentForActivation and not overwriteSequentialSegments and not resetConnectionTargetNeuronDendriteAfterSequence and not updateNeuronObjectActivationLevels and vectorisedComputationActivateSomaAfterFinishingPropagation and not vectoriseComputionUseSequentialSegmentInputActivationLevels and (minimumActivationTime == 0)):
+		vectoriseComputationSparseKernel = True	#optional	#propagate the sparse activation store on active coordinates only (heap ordered row keys per branchIndex1: (batchIndex*numberOfHorizontalBranches + horizontalBranchIndex)*horizontalBranchWidth + branchIndex2); sequential segments with new buffer activations are computed and subbranch activations are reduced with segment sum/max over their parent row keys, rather than densifying the batch and executing calculateNeuronActivationParallelBranches; propagation cost scales with the number of active coordinates rather than batchSize * dendritic tree size	#other configurations densify the batch
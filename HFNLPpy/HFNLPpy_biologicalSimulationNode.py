@@ -23,8 +23,11 @@ os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 
 import numpy as np
 import random
+import threading
+from collections import OrderedDict
 
 from HFNLPpy_biologicalSimulationGlobalDefs import *
+from HFNLPpy_hopfieldConnectionClass import getConnectionKey, useCompactObjectModel
 
 #currently used for HFNLPpy_biologicalSimulationDraw:getActivationColor only;
 objectTypeConceptNeuron = 1
@@ -32,7 +35,8 @@ objectTypeDendriticBranch = 2
 objectTypeSequentialSegment = 3
 objectTypeSequentialSegmentInput = 4
 		
-def biologicalSimulationNodePropertiesInitialisation(conceptNode):
+def biologicalSimulationNodePropertiesInitialisation(conceptNode, deferDendriticTreeAllocation=False):
+	#deferDendriticTreeAllocation: dendritic tree is allocated by initialiseDendriticTree (e.g. HFNLPpy_biologicalSimulationSnapshot:loadNetworkSnapshot only allocates the dendritic trees of neurons with synapses)
 
 	conceptNode.objectType = objectTypeConceptNeuron
 	
@@ -46,8 +50,25 @@ def biologicalSimulationNodePropertiesInitialisation(conceptNode):
 	conceptNode.currentSequentialSegmentIndexNeuron = 0
 	conceptNode.currentSequentialSegmentInputIndexNeuron = 0 
 
+	conceptNode.dendriticTree = None	#initialise (dependent var)
+	if(not (lazyDendriticTreeAllocation or deferDendriticTreeAllocation)):
+		allocateDendriticTree(conceptNode)
+
+def initialiseDendriticTree(conceptNode):
+	#lazyDendriticTreeAllocation: allocate dendritic tree before first synapse is added to neuron
+	if(conceptNode.dendriticTree is None):
+		allocateDendriticTree(conceptNode)
+	return conceptNode.dendriticTree
+
+def allocateDendriticTree(conceptNode):
 	if(vectoriseComputationCurrentDendriticInput):
-		if(recordVectorisedBranchObjectList):
+		if(vectoriseComputationNetworkActivationStore or vectoriseComputationSparseActivationStore):
+			if(vectoriseComputationNetworkActivationStore):
+				allocateNetworkVectorisedBranchActivation(conceptNode)	#vectorised branch activations are stored in rows of networkVectorisedBranchActivationLevelList/networkVectorisedBranchActivationTimeList/networkVectorisedBranchActivationFlagList
+			#vectoriseComputationSparseActivationStore: no allocation required (neurons without entries in networkSparseBranchActivationDict are inactive)
+			if(recordVectorisedBranchObjectList):
+				_, _, _, conceptNode.vectorisedBranchObjectList = createDendriticTreeVectorised(batched=False, createVectorisedBranchObjectList=recordVectorisedBranchObjectList, storeSequentialSegmentInputActivationLevels=False)
+		elif(recordVectorisedBranchObjectList):
 			conceptNode.vectorisedBranchActivationLevelList, conceptNode.vectorisedBranchActivationTimeList, conceptNode.vectorisedBranchActivationFlagList, conceptNode.vectorisedBranchObjectList = createDendriticTreeVectorised(batched=False, createVectorisedBranchObjectList=recordVectorisedBranchObjectList, storeSequentialSegmentInputActivationLevels=False)	#shape [numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments]
 			#!performSummationOfSequentialSegmentInputsAcrossBranch: vectorisedBranchActivationLevelList stores effective boolean 1/0 values (since their activations are calculated across all wSource of same activationTime simultaneously); could be converted to dtype=tf.bool
 			#weightedSequentialSegmentInputs:vectorisedBranchActivationLevelListBuffer will store numeric values of the synaptic input activation levels being accumulated prior to batch processing			
@@ -55,21 +76,87 @@ def biologicalSimulationNodePropertiesInitialisation(conceptNode):
 			conceptNode.vectorisedBranchActivationLevelList, conceptNode.vectorisedBranchActivationTimeList, conceptNode.vectorisedBranchActivationFlagList = createDendriticTreeVectorised(batched=False, createVectorisedBranchObjectList=recordVectorisedBranchObjectList, storeSequentialSegmentInputActivationLevels=False)	#shape [numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments]
 		#vectorisedBranchObjectList required for drawBiologicalSimulationDynamic only
 
+	if(storeDendriticTreeFlattened):
+		networkFlattenedDendriticTreeDict[conceptNode.networkIndex] = FlattenedDendriticTree()	#dendritic tree objects are views onto its arrays
 	conceptNode.dendriticTree = createDendriticTree(conceptNode, numberOfBranches1, numberOfBranches2, numberOfBranchSequentialSegments)
 
+#dendritic object names (draw/xml only);
+storeDendriticObjectNames = True	#initialise (dependent var)
+if(useCompactObjectModel):
+	storeDendriticObjectNames = (drawBiologicalSimulation or writeBiologicalSimulation or writeBiologicalSimulationDynamic)	#only generate dendritic object names if required by HFNLPpy_biologicalSimulationDraw/HFNLPpy_biologicalSimulationXML
+dendriticObjectNameSlots = ()	#initialise (dependent var)
+if(storeDendriticObjectNames):
+	dendriticObjectNameSlots = ('nodeName',)	#useCompactObjectModel: dendritic object names are stored in a slot only if required (no per object side table)
+
+def setDendriticObjectName(dendriticObject, nodeName):
+	dendriticObject.nodeName = nodeName
+
+#dendritic object activations (storeDendriticTreeFlattened: views onto FlattenedDendriticTree arrays);
+def getBranchActivationLevelFlattened(dendriticBranch):
+	activationLevel = dendriticBranch.flattenedDendriticTree.branchActivationLevel[dendriticBranch.branchId]
+	if(storeBranchActivationState):
+		activationLevel = bool(activationLevel)
+	else:
+		activationLevel = convertSequentialSegmentActivationLevelFromFlattened(activationLevel)
+	return activationLevel
+
+def setBranchActivationLevelFlattened(dendriticBranch, activationLevel):
+	dendriticBranch.flattenedDendriticTree.branchActivationLevel[dendriticBranch.branchId] = activationLevel
+
+def getBranchActivationTimeFlattened(dendriticBranch):
+	return convertActivationTimeFromFlattened(dendriticBranch.flattenedDendriticTree.branchActivationTime[dendriticBranch.branchId])
+
+def setBranchActivationTimeFlattened(dendriticBranch, activationTime):
+	dendriticBranch.flattenedDendriticTree.branchActivationTime[dendriticBranch.branchId] = convertActivationTimeToFlattened(activationTime)
+
+def getSequentialSegmentActivationLevelFlattened(sequentialSegment):
+	return convertSequentialSegmentActivationLevelFromFlattened(sequentialSegment.flattenedDendriticTree.sequentialSegmentActivationLevel[sequentialSegment.sequentialSegmentId])
+
+def setSequentialSegmentActivationLevelFlattened(sequentialSegment, activationLevel):
+	sequentialSegment.flattenedDendriticTree.sequentialSegmentActivationLevel[sequentialSegment.sequentialSegmentId] = activationLevel
+
+def getSequentialSegmentActivationTimeFlattened(sequentialSegment):
+	return convertActivationTimeFromFlattened(sequentialSegment.flattenedDendriticTree.sequentialSegmentActivationTime[sequentialSegment.sequentialSegmentId])
+
+def setSequentialSegmentActivationTimeFlattened(sequentialSegment, activationTime):
+	sequentialSegment.flattenedDendriticTree.sequentialSegmentActivationTime[sequentialSegment.sequentialSegmentId] = convertActivationTimeToFlattened(activationTime)
+
+def getSequentialSegmentFrozenFlattened(sequentialSegment):
+	return bool(sequentialSegment.flattenedDendriticTree.sequentialSegmentFrozen[sequentialSegment.sequentialSegmentId])
+
+def setSequentialSegmentFrozenFlattened(sequentialSegment, frozen):
+	sequentialSegment.flattenedDendriticTree.sequentialSegmentFrozen[sequentialSegment.sequentialSegmentId] = frozen
+
 class DendriticBranch:
+	if(useCompactObjectModel):
+		__slots__ = ('objectType', 'parentBranch', 'subbranches', 'branchIndex1', 'branchIndex2', 'horizontalBranchIndex', 'conceptNode', 'sequentialSegments', 'activationStateNew')
+		if(storeDendriticTreeFlattened):
+			__slots__ = __slots__ + ('flattenedDendriticTree', 'branchId')
+		else:
+			__slots__ = __slots__ + ('activationLevel', 'activationTime')
+		__slots__ = __slots__ + dendriticObjectNameSlots
+		if(not storeDendriticObjectNames):
+			nodeName = None	#dendritic object names are not generated
+	if(storeDendriticTreeFlattened):
+		activationLevel = property(getBranchActivationLevelFlattened, setBranchActivationLevelFlattened)
+		activationTime = property(getBranchActivationTimeFlattened, setBranchActivationTimeFlattened)
 	def __init__(self, conceptNode, parentBranch, numberOfBranchSequentialSegments, branchIndex1, branchIndex2, horizontalBranchIndex):
 		self.objectType = objectTypeDendriticBranch
 		self.parentBranch = parentBranch
 		self.subbranches = []
 		
 		#if(biologicalSimulationDraw):
-		self.nodeName = generateDendriticBranchName(conceptNode)
+		if(storeDendriticObjectNames):
+			setDendriticObjectName(self, generateDendriticBranchName(conceptNode))
 		self.branchIndex1 = branchIndex1
 		self.branchIndex2 = branchIndex2	#local horizontalBranchIndex (wrt horizontalBranchWidth)
 		#print("horizontalBranchIndex = ", horizontalBranchIndex)
 		self.horizontalBranchIndex = horizontalBranchIndex	#absolute horizontalBranchIndex	#required by vectoriseComputationCurrentDendriticInput only
 		self.conceptNode = conceptNode
+		if(storeDendriticTreeFlattened):
+			self.flattenedDendriticTree = networkFlattenedDendriticTreeDict[conceptNode.networkIndex]
+			self.branchId = calculateBranchId(branchIndex1, horizontalBranchIndex, branchIndex2)
+			self.flattenedDendriticTree.branchList[self.branchId] = self
 
 		self.sequentialSegments = [SequentialSegment(conceptNode, self, i) for i in range(numberOfBranchSequentialSegments)]	#[SequentialSegment(conceptNode, self, i)]*numberOfBranchSequentialSegments	#indexed from most proximal to most distal
 		self.activationLevel = objectAreaActivationLevelOff
@@ -78,9 +165,25 @@ class DendriticBranch:
 			self.activationStateNew = False
 						
 class SequentialSegment:
+	if(useCompactObjectModel):
+		__slots__ = ('objectType', 'inputs', 'activationStateNew', 'branch', 'sequentialSegmentIndex', 'conceptNode')
+		if(storeDendriticTreeFlattened):
+			__slots__ = __slots__ + ('flattenedDendriticTree', 'sequentialSegmentId')
+		else:
+			__slots__ = __slots__ + ('activationLevel', 'activationTime', 'frozen')
+		__slots__ = __slots__ + dendriticObjectNameSlots
+		if(not storeDendriticObjectNames):
+			nodeName = None	#dendritic object names are not generated
+	if(storeDendriticTreeFlattened):
+		activationLevel = property(getSequentialSegmentActivationLevelFlattened, setSequentialSegmentActivationLevelFlattened)
+		activationTime = property(getSequentialSegmentActivationTimeFlattened, setSequentialSegmentActivationTimeFlattened)
+		frozen = property(getSequentialSegmentFrozenFlattened, setSequentialSegmentFrozenFlattened)
 	def __init__(self, conceptNode, branch, sequentialSegmentIndex):
 		#self.inputs = []
 		self.objectType = objectTypeSequentialSegment
+		if(storeDendriticTreeFlattened):
+			self.flattenedDendriticTree = branch.flattenedDendriticTree
+			self.sequentialSegmentId = branch.branchId*numberOfBranchSequentialSegments + sequentialSegmentIndex
 		self.inputs = {}
 		self.activationLevel = objectLocalActivationLevelOff	#only consider depolarised if activationLevel passes threshold
 		self.activationTime = None	#within sequence/sentence activation time
@@ -90,7 +193,8 @@ class SequentialSegment:
 		self.sequentialSegmentIndex = sequentialSegmentIndex 
 
 		#if(biologicalSimulationDraw):
-		self.nodeName = generateSequentialSegmentName(conceptNode)
+		if(storeDendriticObjectNames):
+			setDendriticObjectName(self, generateSequentialSegmentName(conceptNode))
 		self.conceptNode = conceptNode	#not required (as can lookup SequentialSegment.branch.conceptNode) 
 			
 		if(vectoriseComputation):
@@ -102,6 +206,11 @@ class SequentialSegment:
 			self.frozen = False
 				
 class SequentialSegmentInput:
+	if(useCompactObjectModel):
+		__slots__ = ('objectType', 'input', 'sequentialSegment', 'firstInputInSequence', 'activationLevel', 'activationTime', 'sequentialSegmentInputIndex', 'activationStateNew', 'nodeSource', 'conceptNode')
+		__slots__ = __slots__ + dendriticObjectNameSlots
+		if(not storeDendriticObjectNames):
+			nodeName = None	#dendritic object names are not generated
 	def __init__(self, conceptNode, SequentialSegment, sequentialSegmentInputIndex, nodeSource):
 		self.objectType = objectTypeSequentialSegmentInput
 		self.input = None
@@ -119,7 +228,8 @@ class SequentialSegmentInput:
 		self.nodeSource = nodeSource
 			
 		#if(biologicalSimulationDraw):
-		self.nodeName = generateSequentialSegmentInputName(conceptNode)
+		if(storeDendriticObjectNames):
+			setDendriticObjectName(self, generateSequentialSegmentInputName(conceptNode))
 		if(storeSequentialSegmentInputIndexValues):
 			self.sequentialSegmentInputIndex = sequentialSegmentInputIndex	#not required	#index record value not robust if inputs are removed (synaptic atrophy)
 		else:
@@ -178,6 +288,622 @@ def createDendriticTreeVectorised(batched, createVectorisedBranchObjectList, sto
 	else:
 		return vectorisedBranchActivationLevelList, vectorisedBranchActivationTimeList, vectorisedBranchActivationFlagList
 
+#network vectorised activation store (vectoriseComputationNetworkActivationStore);
+networkVectorisedBranchActivationLevelList = []	#tf.Variable for every branchIndex1 - shape [networkActivationStoreCapacity, numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments] (row: conceptNode.networkIndex)
+networkVectorisedBranchActivationTimeList = []
+networkVectorisedBranchActivationFlagList = []
+networkActivationStoreCapacity = 0
+networkVectorisedBranchActivationBatchDict = OrderedDict()	#key: batchSize, value: (level, time, flag) tf.Variable lists for every branchIndex1 - shape [batchSize, numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments] (row: batchIndex); gathered rows of connection target neurons of a propagation step
+
+def allocateNetworkVectorisedBranchActivation(conceptNode):
+	allocateNetworkVectorisedBranchActivationRows(conceptNode.networkIndex+1)
+
+def allocateNetworkVectorisedBranchActivationRows(numberOfRows):
+	global networkActivationStoreCapacity
+	if(numberOfRows > networkActivationStoreCapacity):
+		networkActivationStoreCapacityNew = max(networkActivationStoreCapacityInitial, networkActivationStoreCapacity*2, numberOfRows)
+		for currentBranchIndex1 in range(calculateNumberOfVerticalBranches(numberOfBranches1)):
+			numberOfHorizontalBranches, horizontalBranchWidth = calculateNumberOfHorizontalBranches(currentBranchIndex1, numberOfBranches2)
+			networkVectorisedBranchActivationRowsNew = tf.zeros([networkActivationStoreCapacityNew-networkActivationStoreCapacity, numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments])
+			if(networkActivationStoreCapacity == 0):
+				networkVectorisedBranchActivationLevelList.append(tf.Variable(networkVectorisedBranchActivationRowsNew))
+				networkVectorisedBranchActivationTimeList.append(tf.Variable(networkVectorisedBranchActivationRowsNew))
+				networkVectorisedBranchActivationFlagList.append(tf.Variable(networkVectorisedBranchActivationRowsNew))
+			else:
+				networkVectorisedBranchActivationLevelList[currentBranchIndex1] = tf.Variable(tf.concat([networkVectorisedBranchActivationLevelList[currentBranchIndex1], networkVectorisedBranchActivationRowsNew], axis=0))
+				networkVectorisedBranchActivationTimeList[currentBranchIndex1] = tf.Variable(tf.concat([networkVectorisedBranchActivationTimeList[currentBranchIndex1], networkVectorisedBranchActivationRowsNew], axis=0))
+				networkVectorisedBranchActivationFlagList[currentBranchIndex1] = tf.Variable(tf.concat([networkVectorisedBranchActivationFlagList[currentBranchIndex1], networkVectorisedBranchActivationRowsNew], axis=0))
+		networkActivationStoreCapacity = networkActivationStoreCapacityNew
+
+def calculateNetworkVectorisedBranchActivationIndices(batchNeuronsList):
+	networkIndices = tf.constant([[batchNeuron.networkIndex] for batchNeuron in batchNeuronsList], dtype=tf.int64, shape=[len(batchNeuronsList), 1])
+	return networkIndices
+
+def allocateNetworkVectorisedBranchActivationBatch(batchSize):
+	#batch tf.Variables are reused by propagation steps of equal batchSize (least recently used batchSize is evicted when networkActivationStoreBatchCacheSize is exceeded)
+	if(batchSize in networkVectorisedBranchActivationBatchDict):
+		networkVectorisedBranchActivationBatchDict.move_to_end(batchSize)
+	else:
+		if(len(networkVectorisedBranchActivationBatchDict) >= networkActivationStoreBatchCacheSize):
+			networkVectorisedBranchActivationBatchDict.popitem(last=False)
+		vectorisedBranchActivationLevelBatchList = []
+		vectorisedBranchActivationTimeBatchList = []
+		vectorisedBranchActivationFlagBatchList = []
+		for currentBranchIndex1 in range(calculateNumberOfVerticalBranches(numberOfBranches1)):
+			numberOfHorizontalBranches, horizontalBranchWidth = calculateNumberOfHorizontalBranches(currentBranchIndex1, numberOfBranches2)
+			networkVectorisedBranchActivationBatchRows = tf.zeros([batchSize, numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments])
+			vectorisedBranchActivationLevelBatchList.append(tf.Variable(networkVectorisedBranchActivationBatchRows))
+			vectorisedBranchActivationTimeBatchList.append(tf.Variable(networkVectorisedBranchActivationBatchRows))
+			vectorisedBranchActivationFlagBatchList.append(tf.Variable(networkVectorisedBranchActivationBatchRows))
+		networkVectorisedBranchActivationBatchDict[batchSize] = (vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList)
+	return networkVectorisedBranchActivationBatchDict[batchSize]
+
+def gatherNetworkVectorisedBranchActivationBatch(batchNeuronsList):
+	allocateNetworkVectorisedBranchActivationRows(1)	#lazyDendriticTreeAllocation: network tensors may not yet be allocated
+	networkIndices = calculateNetworkVectorisedBranchActivationIndices(batchNeuronsList)
+	if(vectoriseComputationNumpy):
+		#numpy gather_nd returns independent (assignable) arrays
+		vectorisedBranchActivationLevelBatchList = []
+		vectorisedBranchActivationTimeBatchList = []
+		vectorisedBranchActivationFlagBatchList = []
+		for currentBranchIndex1 in range(calculateNumberOfVerticalBranches(numberOfBranches1)):
+			vectorisedBranchActivationLevelBatchList.append(tf.gather_nd(networkVectorisedBranchActivationLevelList[currentBranchIndex1], networkIndices))
+			vectorisedBranchActivationTimeBatchList.append(tf.gather_nd(networkVectorisedBranchActivationTimeList[currentBranchIndex1], networkIndices))
+			vectorisedBranchActivationFlagBatchList.append(tf.gather_nd(networkVectorisedBranchActivationFlagList[currentBranchIndex1], networkIndices))
+	else:
+		#tf.Variable designation is required for assign() operations; batch rows are gathered into persistent batch tf.Variables (rather than generating tf.Variables every propagation step)
+		vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList = allocateNetworkVectorisedBranchActivationBatch(len(batchNeuronsList))
+		for currentBranchIndex1 in range(calculateNumberOfVerticalBranches(numberOfBranches1)):
+			vectorisedBranchActivationLevelBatchList[currentBranchIndex1].assign(tf.gather_nd(networkVectorisedBranchActivationLevelList[currentBranchIndex1], networkIndices))
+			vectorisedBranchActivationTimeBatchList[currentBranchIndex1].assign(tf.gather_nd(networkVectorisedBranchActivationTimeList[currentBranchIndex1], networkIndices))
+			vectorisedBranchActivationFlagBatchList[currentBranchIndex1].assign(tf.gather_nd(networkVectorisedBranchActivationFlagList[currentBranchIndex1], networkIndices))
+	return vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList
+
+def scatterNetworkVectorisedBranchActivationBatch(batchNeuronsList, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList):
+	networkIndices = calculateNetworkVectorisedBranchActivationIndices(batchNeuronsList)
+	for currentBranchIndex1 in range(calculateNumberOfVerticalBranches(numberOfBranches1)):
+		networkVectorisedBranchActivationLevelList[currentBranchIndex1].scatter_nd_update(networkIndices, vectorisedBranchActivationLevelBatchList[currentBranchIndex1])
+		networkVectorisedBranchActivationTimeList[currentBranchIndex1].scatter_nd_update(networkIndices, vectorisedBranchActivationTimeBatchList[currentBranchIndex1])
+		networkVectorisedBranchActivationFlagList[currentBranchIndex1].scatter_nd_update(networkIndices, vectorisedBranchActivationFlagBatchList[currentBranchIndex1])
+
+def resetNetworkVectorisedBranchActivation(conceptNeuron):
+	networkIndices = calculateNetworkVectorisedBranchActivationIndices([conceptNeuron])
+	for currentBranchIndex1 in range(calculateNumberOfVerticalBranches(numberOfBranches1)):
+		numberOfHorizontalBranches, horizontalBranchWidth = calculateNumberOfHorizontalBranches(currentBranchIndex1, numberOfBranches2)
+		networkVectorisedBranchActivationRowOff = tf.zeros([1, numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments])
+		networkVectorisedBranchActivationLevelList[currentBranchIndex1].scatter_nd_update(networkIndices, networkVectorisedBranchActivationRowOff)
+		networkVectorisedBranchActivationTimeList[currentBranchIndex1].scatter_nd_update(networkIndices, networkVectorisedBranchActivationRowOff)
+		networkVectorisedBranchActivationFlagList[currentBranchIndex1].scatter_nd_update(networkIndices, networkVectorisedBranchActivationRowOff)
+
+#vectorised branch activation buffer pool (vectoriseComputationBufferPool);
+bufferPoolVectorisedBranchActivationLevelList = []	#tf.Variable for every branchIndex1 - shape [bufferPoolCapacity, numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments, {numberOfSequentialSegmentInputs}] (row: batchIndex)
+bufferPoolVectorisedBranchActivationTimeList = []
+bufferPoolVectorisedBranchActivationFlagList = []
+bufferPoolCapacity = 0
+bufferPoolBatchIndexDict = {}	#key: conceptNode.networkIndex, value: batchIndex (buffer pool row) of connection target neuron in current propagation step
+bufferPoolScatterList = []	#dict for every branchIndex1 (key: bufferPoolIndex tuple, value: (activationLevel, activationTime, activationFlag)) of buffer pool entries assigned in current propagation step that are not yet scattered into the buffer pool
+
+def calculateBufferPoolShape(currentBranchIndex1, numberOfRows):
+	numberOfHorizontalBranches, horizontalBranchWidth = calculateNumberOfHorizontalBranches(currentBranchIndex1, numberOfBranches2)
+	if(vectoriseComputionUseSequentialSegmentInputActivationLevels):
+		bufferPoolShape = [numberOfRows, numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments, numberOfSequentialSegmentInputs]
+	else:
+		bufferPoolShape = [numberOfRows, numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments]
+	return bufferPoolShape
+
+def allocateBufferPoolRows(numberOfRows):
+	global bufferPoolCapacity
+	if(numberOfRows > bufferPoolCapacity):
+		bufferPoolCapacityNew = max(bufferPoolCapacityInitial, bufferPoolCapacity*2, numberOfRows)
+		for currentBranchIndex1 in range(calculateNumberOfVerticalBranches(numberOfBranches1)):
+			bufferPoolRowsNew = tf.zeros(calculateBufferPoolShape(currentBranchIndex1, bufferPoolCapacityNew-bufferPoolCapacity))
+			if(bufferPoolCapacity == 0):
+				bufferPoolVectorisedBranchActivationLevelList.append(tf.Variable(bufferPoolRowsNew))
+				bufferPoolVectorisedBranchActivationTimeList.append(tf.Variable(bufferPoolRowsNew))
+				bufferPoolVectorisedBranchActivationFlagList.append(tf.Variable(bufferPoolRowsNew))
+			else:
+				bufferPoolVectorisedBranchActivationLevelList[currentBranchIndex1] = tf.Variable(tf.concat([bufferPoolVectorisedBranchActivationLevelList[currentBranchIndex1], bufferPoolRowsNew], axis=0))
+				bufferPoolVectorisedBranchActivationTimeList[currentBranchIndex1] = tf.Variable(tf.concat([bufferPoolVectorisedBranchActivationTimeList[currentBranchIndex1], bufferPoolRowsNew], axis=0))
+				bufferPoolVectorisedBranchActivationFlagList[currentBranchIndex1] = tf.Variable(tf.concat([bufferPoolVectorisedBranchActivationFlagList[currentBranchIndex1], bufferPoolRowsNew], axis=0))
+		bufferPoolCapacity = bufferPoolCapacityNew
+
+def allocateBufferPoolRow(conceptNeuron):
+	#assign next buffer pool row to connection target neuron for current propagation step
+	batchIndex = len(bufferPoolBatchIndexDict)
+	allocateBufferPoolRows(batchIndex+1)
+	bufferPoolBatchIndexDict[conceptNeuron.networkIndex] = batchIndex
+
+def getBufferPoolBatchIndex(conceptNeuron):
+	return bufferPoolBatchIndexDict[conceptNeuron.networkIndex]
+
+def resetBufferPool():
+	#rezero buffer pool rows used by previous propagation step in place (single operation per tensor)
+	numberOfRows = len(bufferPoolBatchIndexDict)
+	if(numberOfRows > 0):
+		for currentBranchIndex1 in range(calculateNumberOfVerticalBranches(numberOfBranches1)):
+			bufferPoolRowsOff = tf.zeros(calculateBufferPoolShape(currentBranchIndex1, numberOfRows))
+			bufferPoolVectorisedBranchActivationLevelList[currentBranchIndex1][0:numberOfRows].assign(bufferPoolRowsOff)
+			bufferPoolVectorisedBranchActivationTimeList[currentBranchIndex1][0:numberOfRows].assign(bufferPoolRowsOff)
+			bufferPoolVectorisedBranchActivationFlagList[currentBranchIndex1][0:numberOfRows].assign(bufferPoolRowsOff)
+		bufferPoolBatchIndexDict.clear()
+	for bufferPoolScatterDict in bufferPoolScatterList:
+		bufferPoolScatterDict.clear()	#unscattered entries of previous propagation step are discarded
+
+def getBufferPoolScatterDict(branchIndex1):
+	if(len(bufferPoolScatterList) == 0):
+		for currentBranchIndex1 in range(calculateNumberOfVerticalBranches(numberOfBranches1)):
+			bufferPoolScatterList.append({})
+	return bufferPoolScatterList[branchIndex1]
+
+def scatterBufferPoolVectorisedBranchActivation(branchIndex1, bufferPoolIndex, activationLevel, activationTime, activationFlag):
+	#bufferPoolIndex: [batchIndex, horizontalBranchIndex, branchIndex2, sequentialSegmentIndex, {sequentialSegmentInputIndex}]; entries of the propagation step are scattered into the buffer pool by flushBufferPoolScatter (a later assignment of the same entry overwrites an earlier one)
+	getBufferPoolScatterDict(branchIndex1)[tuple(bufferPoolIndex)] = (np.float32(activationLevel), np.float32(activationTime), np.float32(activationFlag))
+
+def flushBufferPoolScatter():
+	#single scatter_nd_update per buffer pool tensor of every branchIndex1
+	for currentBranchIndex1, bufferPoolScatterDict in enumerate(bufferPoolScatterList):
+		if(len(bufferPoolScatterDict) > 0):
+			bufferPoolIndices = tf.constant(list(bufferPoolScatterDict.keys()), dtype=tf.int64)
+			bufferPoolValues = np.array(list(bufferPoolScatterDict.values()), dtype=np.float32)	#[numberOfEntries, 3] (activationLevel, activationTime, activationFlag)
+			bufferPoolVectorisedBranchActivationLevelList[currentBranchIndex1].scatter_nd_update(bufferPoolIndices, bufferPoolValues[:, 0])
+			bufferPoolVectorisedBranchActivationTimeList[currentBranchIndex1].scatter_nd_update(bufferPoolIndices, bufferPoolValues[:, 1])
+			bufferPoolVectorisedBranchActivationFlagList[currentBranchIndex1].scatter_nd_update(bufferPoolIndices, bufferPoolValues[:, 2])
+			bufferPoolScatterDict.clear()
+
+def getBufferPoolVectorisedBranchActivation(branchIndex1, bufferPoolIndex):
+	#returns activationLevel, activationTime of a single buffer pool entry (including entries not yet scattered)
+	bufferPoolIndex = tuple(bufferPoolIndex)
+	bufferPoolScatterDict = getBufferPoolScatterDict(branchIndex1)
+	if(bufferPoolIndex in bufferPoolScatterDict):
+		activationLevel, activationTime, _ = bufferPoolScatterDict[bufferPoolIndex]
+	else:
+		activationLevel = bufferPoolVectorisedBranchActivationLevelList[branchIndex1][bufferPoolIndex].numpy()
+		activationTime = bufferPoolVectorisedBranchActivationTimeList[branchIndex1][bufferPoolIndex].numpy()
+	return activationLevel, activationTime
+
+def gatherBufferPoolVectorisedBranchActivationBatch(batchNeuronsList):
+	#returns batch dendritic input buffers (equivalent to tf.stack of per neuron buffers)
+	allocateBufferPoolRows(1)	#buffer pool may not yet be allocated (empty batch)
+	flushBufferPoolScatter()
+	bufferPoolIndices = tf.constant([getBufferPoolBatchIndex(batchNeuron) for batchNeuron in batchNeuronsList], dtype=tf.int64)
+	vectorisedBranchActivationLevelBatchListBuffer = []
+	vectorisedBranchActivationTimeBatchListBuffer = []
+	vectorisedBranchActivationFlagBatchListBuffer = []
+	for currentBranchIndex1 in range(calculateNumberOfVerticalBranches(numberOfBranches1)):
+		vectorisedBranchActivationLevelBatchListBuffer.append(tf.gather(bufferPoolVectorisedBranchActivationLevelList[currentBranchIndex1], bufferPoolIndices))
+		vectorisedBranchActivationTimeBatchListBuffer.append(tf.gather(bufferPoolVectorisedBranchActivationTimeList[currentBranchIndex1], bufferPoolIndices))
+		vectorisedBranchActivationFlagBatchListBuffer.append(tf.gather(bufferPoolVectorisedBranchActivationFlagList[currentBranchIndex1], bufferPoolIndices))
+	return vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer
+
+#vectorised synaptic input scatter (vectoriseComputationScatterSynapticInputs);
+synapticInputScatterList = []	#list for every branchIndex1 of fired synaptic inputs of current propagation step (networkIndexList, coordinatesList, activationLevelList, activationTimeList, firstInputInSequenceList) - in order of firing
+
+def resetSynapticInputScatter():
+	synapticInputScatterList.clear()
+	for currentBranchIndex1 in range(calculateNumberOfVerticalBranches(numberOfBranches1)):
+		synapticInputScatterList.append(([], [], [], [], []))
+
+def recordSynapticInputScatter(conceptNeuron, branchIndex1, coordinates, activationLevel, activationTime, firstInputInSequence):
+	#coordinates: [horizontalBranchIndex, branchIndex2, sequentialSegmentIndex, {sequentialSegmentInputIndex}]
+	networkIndexList, coordinatesList, activationLevelList, activationTimeList, firstInputInSequenceList = synapticInputScatterList[branchIndex1]
+	networkIndexList.append(conceptNeuron.networkIndex)
+	coordinatesList.append(coordinates)
+	activationLevelList.append(activationLevel)
+	activationTimeList.append(activationTime)
+	firstInputInSequenceList.append(firstInputInSequence)
+
+def scatterSynapticInputBatch(batchNeuronsList):
+	#returns batch dendritic input buffers (equivalent to assigning every fired synaptic input to per neuron buffers and tf.stack)
+	batchIndexDict = {batchNeuron.networkIndex: batchIndex for batchIndex, batchNeuron in enumerate(batchNeuronsList)}
+	vectorisedBranchActivationLevelBatchListBuffer = []
+	vectorisedBranchActivationTimeBatchListBuffer = []
+	vectorisedBranchActivationFlagBatchListBuffer = []
+	for currentBranchIndex1 in range(calculateNumberOfVerticalBranches(numberOfBranches1)):
+		numberOfHorizontalBranches, horizontalBranchWidth = calculateNumberOfHorizontalBranches(currentBranchIndex1, numberOfBranches2)
+		if(vectoriseComputionUseSequentialSegmentInputActivationLevels):
+			batchShape = [len(batchNeuronsList), numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments, numberOfSequentialSegmentInputs]
+		else:
+			batchShape = [len(batchNeuronsList), numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments]
+		vectorisedBranchActivationLevelBatchBuffer = tf.zeros(batchShape)
+		vectorisedBranchActivationTimeBatchBuffer = tf.zeros(batchShape)
+		vectorisedBranchActivationFlagBatchBuffer = tf.zeros(batchShape)
+		indicesUnique, activationLevelsUnique, activationTimesUnique, activationFlagsUnique = calculateSynapticInputBatchCoordinates(batchIndexDict, currentBranchIndex1)
+		if(indicesUnique.shape[0] > 0):
+			vectorisedBranchActivationLevelBatchBuffer = tf.tensor_scatter_nd_update(vectorisedBranchActivationLevelBatchBuffer, indicesUnique, activationLevelsUnique)
+			vectorisedBranchActivationTimeBatchBuffer = tf.tensor_scatter_nd_update(vectorisedBranchActivationTimeBatchBuffer, indicesUnique, activationTimesUnique)
+			vectorisedBranchActivationFlagBatchBuffer = tf.tensor_scatter_nd_update(vectorisedBranchActivationFlagBatchBuffer, indicesUnique, activationFlagsUnique)
+		vectorisedBranchActivationLevelBatchListBuffer.append(vectorisedBranchActivationLevelBatchBuffer)
+		vectorisedBranchActivationTimeBatchListBuffer.append(vectorisedBranchActivationTimeBatchBuffer)
+		vectorisedBranchActivationFlagBatchListBuffer.append(vectorisedBranchActivationFlagBatchBuffer)
+	return vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer
+
+def calculateSynapticInputBatchCoordinates(batchIndexDict, currentBranchIndex1):
+	#returns unique batch buffer coordinates [batchIndex, horizontalBranchIndex, branchIndex2, sequentialSegmentIndex, {sequentialSegmentInputIndex}] of fired synaptic inputs (sorted) and their buffer activation levels/times/flags
+	networkIndexList, coordinatesList, activationLevelList, activationTimeList, firstInputInSequenceList = synapticInputScatterList[currentBranchIndex1]
+	#ignore synaptic inputs of connection target neurons excluded from batch (vectoriseComputationBatchSentences);
+	inputIndices = [inputIndex for inputIndex, networkIndex in enumerate(networkIndexList) if networkIndex in batchIndexDict]
+	if(len(inputIndices) == 0):
+		numberOfCoordinates = 5 if vectoriseComputionUseSequentialSegmentInputActivationLevels else 4
+		return np.zeros([0, numberOfCoordinates], dtype=np.int64), np.zeros([0], dtype=np.float32), np.zeros([0], dtype=np.float32), np.zeros([0], dtype=np.float32)
+	indices = np.array([[batchIndexDict[networkIndexList[inputIndex]]] + coordinatesList[inputIndex] for inputIndex in inputIndices], dtype=np.int64)
+	activationLevels = np.array([activationLevelList[inputIndex] for inputIndex in inputIndices], dtype=np.float32)
+	activationTimes = np.array([activationTimeList[inputIndex] for inputIndex in inputIndices], dtype=np.float32)
+	firstInputInSequences = np.array([firstInputInSequenceList[inputIndex] for inputIndex in inputIndices], dtype=bool)
+	#resolve duplicate coordinates in order of firing;
+	indicesUnique, inverseIndices, numberOfInputs = np.unique(indices, axis=0, return_inverse=True, return_counts=True)
+	inverseIndices = inverseIndices.reshape(-1)
+	lastInputIndices = np.zeros(indicesUnique.shape[0], dtype=np.int64)
+	np.maximum.at(lastInputIndices, inverseIndices, np.arange(indices.shape[0]))
+	activationTimesUnique = activationTimes[lastInputIndices]
+	firstInputInSequencesUnique = firstInputInSequences[lastInputIndices]
+	if(performSummationOfSequentialSegmentInputs and not vectoriseComputionUseSequentialSegmentInputActivationLevels):
+		activationLevelsUnique = np.zeros(indicesUnique.shape[0], dtype=np.float32)
+		np.add.at(activationLevelsUnique, inverseIndices, activationLevels)	#sequential summation in order of firing
+		activationTimeExisting = np.where(numberOfInputs > 1, activationTimes[lastInputIndices], 0)	#existing buffer activation time (read by firstInputInSequenceExisting)
+		firstInputInSequencesUnique = np.logical_or(firstInputInSequencesUnique, activationTimeExisting != 0)
+	else:
+		activationLevelsUnique = activationLevels[lastInputIndices]	#last input overwrites buffer
+	activationFlagsUnique = np.where(firstInputInSequencesUnique, vectorisedActivationTimeFlagFirstInputInSequence, vectorisedActivationTimeFlagDefault).astype(np.float32)
+	return indicesUnique, activationLevelsUnique, activationTimesUnique, activationFlagsUnique
+
+#network sparse activation store (vectoriseComputationSparseActivationStore);
+networkSparseBranchActivationDict = {}	#key: conceptNode.networkIndex, value: list for every branchIndex1 of (coordinates [numberOfActiveSequentialSegments, 3], levels, times, flags) - only neurons with active (non-zero) sequential segments are stored
+
+def getSparseBranchActivationDict():
+	if(vectoriseComputationActivationContext):
+		sparseBranchActivationDict = getActivationContext().sparseBranchActivationDict
+	else:
+		sparseBranchActivationDict = networkSparseBranchActivationDict
+	return sparseBranchActivationDict
+
+def gatherSparseVectorisedBranchActivationBatch(batchNeuronsList):
+	#densify batch rows (equivalent to tf.stack of dense neuron tensors);
+	vectorisedBranchActivationLevelBatchList = []
+	vectorisedBranchActivationTimeBatchList = []
+	vectorisedBranchActivationFlagBatchList = []
+	batchSize = len(batchNeuronsList)
+	for currentBranchIndex1 in range(calculateNumberOfVerticalBranches(numberOfBranches1)):
+		numberOfHorizontalBranches, horizontalBranchWidth = calculateNumberOfHorizontalBranches(currentBranchIndex1, numberOfBranches2)
+		vectorisedBranchActivationLevelBatch = np.zeros([batchSize, numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments], dtype=np.float32)
+		vectorisedBranchActivationTimeBatch = np.zeros([batchSize, numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments], dtype=np.float32)
+		vectorisedBranchActivationFlagBatch = np.zeros([batchSize, numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments], dtype=np.float32)
+		for batchIndex, batchNeuron in enumerate(batchNeuronsList):
+			if(batchNeuron.networkIndex in getSparseBranchActivationDict()):
+				coordinates, levels, times, flags = getSparseBranchActivationDict()[batchNeuron.networkIndex][currentBranchIndex1]
+				vectorisedBranchActivationLevelBatch[batchIndex][coordinates[:, 0], coordinates[:, 1], coordinates[:, 2]] = levels
+				vectorisedBranchActivationTimeBatch[batchIndex][coordinates[:, 0], coordinates[:, 1], coordinates[:, 2]] = times
+				vectorisedBranchActivationFlagBatch[batchIndex][coordinates[:, 0], coordinates[:, 1], coordinates[:, 2]] = flags
+		#tf.Variable designation is required for assign() operations
+		vectorisedBranchActivationLevelBatchList.append(tf.Variable(vectorisedBranchActivationLevelBatch))
+		vectorisedBranchActivationTimeBatchList.append(tf.Variable(vectorisedBranchActivationTimeBatch))
+		vectorisedBranchActivationFlagBatchList.append(tf.Variable(vectorisedBranchActivationFlagBatch))
+	return vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList
+
+def scatterSparseVectorisedBranchActivationBatch(batchNeuronsList, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList):
+	batchSparseBranchActivationList, batchNeuronActiveList = extractActiveVectorisedBranchActivationBatch(len(batchNeuronsList), vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList)
+	for batchIndex, batchNeuron in enumerate(batchNeuronsList):
+		if(batchNeuronActiveList[batchIndex]):
+			getSparseBranchActivationDict()[batchNeuron.networkIndex] = batchSparseBranchActivationList[batchIndex]
+		else:
+			getSparseBranchActivationDict().pop(batchNeuron.networkIndex, None)
+
+def extractActiveVectorisedBranchActivationBatch(batchSize, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList):
+	#extract active coordinates of batch rows;
+	numberOfVerticalBranches = calculateNumberOfVerticalBranches(numberOfBranches1)
+	batchSparseBranchActivationList = [[None]*numberOfVerticalBranches for _ in range(batchSize)]
+	batchNeuronActiveList = [False]*batchSize
+	if(batchSize == 0):
+		return batchSparseBranchActivationList, batchNeuronActiveList	#empty batch tensors are not batch shaped
+	for currentBranchIndex1 in range(numberOfVerticalBranches):
+		vectorisedBranchActivationLevelBatch = vectorisedBranchActivationLevelBatchList[currentBranchIndex1].numpy()
+		vectorisedBranchActivationTimeBatch = vectorisedBranchActivationTimeBatchList[currentBranchIndex1].numpy()
+		vectorisedBranchActivationFlagBatch = vectorisedBranchActivationFlagBatchList[currentBranchIndex1].numpy()
+		activeMask = np.logical_or(np.logical_or(vectorisedBranchActivationLevelBatch != vectorisedActivationLevelOff, vectorisedBranchActivationTimeBatch != 0), vectorisedBranchActivationFlagBatch != 0)
+		batchIndices, horizontalBranchIndices, branchIndices2, sequentialSegmentIndices = np.nonzero(activeMask)	#C order; batchIndices are sorted
+		coordinatesBatch = np.stack([horizontalBranchIndices, branchIndices2, sequentialSegmentIndices], axis=1)
+		levelsBatch = vectorisedBranchActivationLevelBatch[activeMask]
+		timesBatch = vectorisedBranchActivationTimeBatch[activeMask]
+		flagsBatch = vectorisedBranchActivationFlagBatch[activeMask]
+		splitSparseVectorisedBranchActivationBatch(batchSize, currentBranchIndex1, batchIndices, coordinatesBatch, levelsBatch, timesBatch, flagsBatch, batchSparseBranchActivationList, batchNeuronActiveList)
+	return batchSparseBranchActivationList, batchNeuronActiveList
+
+def splitSparseVectorisedBranchActivationBatch(batchSize, currentBranchIndex1, batchIndices, coordinatesBatch, levelsBatch, timesBatch, flagsBatch, batchSparseBranchActivationList, batchNeuronActiveList):
+	#split active coordinates of batch rows (batchIndices are sorted) into per neuron sparse activations;
+	batchOffsets = np.searchsorted(batchIndices, np.arange(batchSize+1))
+	for batchIndex in range(batchSize):
+		batchStart = batchOffsets[batchIndex]
+		batchEnd = batchOffsets[batchIndex+1]
+		batchSparseBranchActivationList[batchIndex][currentBranchIndex1] = (coordinatesBatch[batchStart:batchEnd], levelsBatch[batchStart:batchEnd], timesBatch[batchStart:batchEnd], flagsBatch[batchStart:batchEnd])
+		if(batchEnd > batchStart):
+			batchNeuronActiveList[batchIndex] = True
+
+#sparse propagation kernel (vectoriseComputationSparseKernel);
+#sparse branch activation batch: list for every branchIndex1 of (keys, levels, times, flags) - keys are sorted unique heap ordered row keys (batchIndex*numberOfHorizontalBranches + horizontalBranchIndex)*horizontalBranchWidth + branchIndex2 (numberOfBranchSequentialSegments == 1); subbranch row keys // horizontalBranchWidth = parent branch row key
+
+def calculateSparseBranchActivationBatchKeys(batchIndices, horizontalBranchIndices, branchIndices2, numberOfHorizontalBranches, horizontalBranchWidth):
+	return (batchIndices.astype(np.int64)*numberOfHorizontalBranches + horizontalBranchIndices)*horizontalBranchWidth + branchIndices2
+
+def sortSparseBranchActivationBatch(keys, levels, times, flags):
+	order = np.argsort(keys, kind='stable')
+	return keys[order], levels[order].astype(np.float32), times[order].astype(np.float32), flags[order].astype(np.float32)
+
+def gatherSparseBranchActivationBatch(batchNeuronsList):
+	#concatenate active coordinates of batch rows (batch is not densified);
+	sparseBranchActivationBatchList = []
+	for currentBranchIndex1 in range(calculateNumberOfVerticalBranches(numberOfBranches1)):
+		numberOfHorizontalBranches, horizontalBranchWidth = calculateNumberOfHorizontalBranches(currentBranchIndex1, numberOfBranches2)
+		keysList = [np.zeros([0], dtype=np.int64)]
+		levelsList = [np.zeros([0], dtype=np.float32)]
+		timesList = [np.zeros([0], dtype=np.float32)]
+		flagsList = [np.zeros([0], dtype=np.float32)]
+		for batchIndex, batchNeuron in enumerate(batchNeuronsList):
+			if(batchNeuron.networkIndex in getSparseBranchActivationDict()):
+				coordinates, levels, times, flags = getSparseBranchActivationDict()[batchNeuron.networkIndex][currentBranchIndex1]
+				keysList.append(calculateSparseBranchActivationBatchKeys(np.full(coordinates.shape[0], batchIndex), coordinates[:, 0], coordinates[:, 1], numberOfHorizontalBranches, horizontalBranchWidth))
+				levelsList.append(levels)
+				timesList.append(times)
+				flagsList.append(flags)
+		sparseBranchActivationBatchList.append(sortSparseBranchActivationBatch(np.concatenate(keysList), np.concatenate(levelsList), np.concatenate(timesList), np.concatenate(flagsList)))
+	return sparseBranchActivationBatchList
+
+def gatherSparseSynapticInputBatch(batchNeuronsList):
+	#returns sparse batch dendritic input buffers (equivalent to extractSparseBranchActivationBatch(scatterSynapticInputBatch(batchNeuronsList)))
+	batchIndexDict = {batchNeuron.networkIndex: batchIndex for batchIndex, batchNeuron in enumerate(batchNeuronsList)}
+	sparseBranchActivationBatchListBuffer = []
+	for currentBranchIndex1 in range(calculateNumberOfVerticalBranches(numberOfBranches1)):
+		numberOfHorizontalBranches, horizontalBranchWidth = calculateNumberOfHorizontalBranches(currentBranchIndex1, numberOfBranches2)
+		indicesUnique, activationLevelsUnique, activationTimesUnique, activationFlagsUnique = calculateSynapticInputBatchCoordinates(batchIndexDict, currentBranchIndex1)
+		keys = calculateSparseBranchActivationBatchKeys(indicesUnique[:, 0], indicesUnique[:, 1], indicesUnique[:, 2], numberOfHorizontalBranches, horizontalBranchWidth)
+		sparseBranchActivationBatchListBuffer.append(sortSparseBranchActivationBatch(keys, activationLevelsUnique, activationTimesUnique, activationFlagsUnique))
+	return sparseBranchActivationBatchListBuffer
+
+def extractSparseBranchActivationBatch(vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList):
+	#returns active coordinates of dense batch tensors (shape [batchSize, numberOfHorizontalBranches, horizontalBranchWidth, 1]; C order index = row key)
+	sparseBranchActivationBatchList = []
+	for currentBranchIndex1 in range(calculateNumberOfVerticalBranches(numberOfBranches1)):
+		levels = np.asarray(vectorisedBranchActivationLevelBatchList[currentBranchIndex1]).reshape(-1)
+		times = np.asarray(vectorisedBranchActivationTimeBatchList[currentBranchIndex1]).reshape(-1)
+		flags = np.asarray(vectorisedBranchActivationFlagBatchList[currentBranchIndex1]).reshape(-1)
+		keys = np.nonzero(np.logical_or(np.logical_or(levels != vectorisedActivationLevelOff, times != 0), flags != 0))[0].astype(np.int64)
+		sparseBranchActivationBatchList.append((keys, levels[keys].astype(np.float32), times[keys].astype(np.float32), flags[keys].astype(np.float32)))
+	return sparseBranchActivationBatchList
+
+def scatterSparseBranchActivationBatch(batchNeuronsList, sparseBranchActivationBatchList):
+	#write active coordinates of sparse batch back to network sparse store;
+	batchSize = len(batchNeuronsList)
+	numberOfVerticalBranches = calculateNumberOfVerticalBranches(numberOfBranches1)
+	batchSparseBranchActivationList = [[None]*numberOfVerticalBranches for _ in range(batchSize)]
+	batchNeuronActiveList = [False]*batchSize
+	for currentBranchIndex1 in range(numberOfVerticalBranches):
+		numberOfHorizontalBranches, horizontalBranchWidth = calculateNumberOfHorizontalBranches(currentBranchIndex1, numberOfBranches2)
+		keys, levels, times, flags = sparseBranchActivationBatchList[currentBranchIndex1]
+		activeMask = np.logical_or(np.logical_or(levels != vectorisedActivationLevelOff, times != 0), flags != 0)
+		keys = keys[activeMask]
+		batchIndices = keys // (numberOfHorizontalBranches*horizontalBranchWidth)
+		coordinatesBatch = np.stack([(keys // horizontalBranchWidth) % numberOfHorizontalBranches, keys % horizontalBranchWidth, np.zeros(keys.shape[0], dtype=np.int64)], axis=1)	#[horizontalBranchIndex, branchIndex2, sequentialSegmentIndex]
+		splitSparseVectorisedBranchActivationBatch(batchSize, currentBranchIndex1, batchIndices, coordinatesBatch, levels[activeMask], times[activeMask], flags[activeMask], batchSparseBranchActivationList, batchNeuronActiveList)
+	for batchIndex, batchNeuron in enumerate(batchNeuronsList):
+		if(batchNeuronActiveList[batchIndex]):
+			getSparseBranchActivationDict()[batchNeuron.networkIndex] = batchSparseBranchActivationList[batchIndex]
+		else:
+			getSparseBranchActivationDict().pop(batchNeuron.networkIndex, None)
+
+def lookupSparseBranchActivationBatchKeys(keys, keysQuery):
+	#returns indices of keysQuery in sorted keys, and whether they are found
+	if(keys.shape[0] == 0):
+		return np.zeros(keysQuery.shape[0], dtype=np.int64), np.zeros(keysQuery.shape[0], dtype=bool)
+	indices = np.minimum(np.searchsorted(keys, keysQuery), keys.shape[0]-1)
+	return indices, (keys[indices] == keysQuery)
+
+def gatherSparseBranchActivationBatchValues(values, indices, found, valueDefault):
+	valuesQuery = np.full(indices.shape[0], valueDefault, dtype=np.float32)
+	valuesQuery[found] = values[indices[found]]
+	return valuesQuery
+
+def updateSparseBranchActivationBatch(sparseBranchActivationBatch, keysUpdated, levelsUpdated, timesUpdated, flagsUpdated):
+	#overwrite existing keys and insert new keys (keys remain sorted);
+	keys, levels, times, flags = sparseBranchActivationBatch
+	indices, found = lookupSparseBranchActivationBatchKeys(keys, keysUpdated)
+	levels = levels.copy()
+	times = times.copy()
+	flags = flags.copy()
+	levels[indices[found]] = levelsUpdated[found]
+	times[indices[found]] = timesUpdated[found]
+	flags[indices[found]] = flagsUpdated[found]
+	inserted = np.logical_not(found)
+	if(np.any(inserted)):
+		return sortSparseBranchActivationBatch(np.concatenate([keys, keysUpdated[inserted]]), np.concatenate([levels, levelsUpdated[inserted]]), np.concatenate([times, timesUpdated[inserted]]), np.concatenate([flags, flagsUpdated[inserted]]))
+	return keys, levels, times, flags
+
+def resetSparseVectorisedBranchActivation(conceptNeuron):
+	getSparseBranchActivationDict().pop(conceptNeuron.networkIndex, None)
+
+def resetSparseVectorisedBranchActivationLevel(conceptNeuron, branchIndex1, horizontalBranchIndex, branchIndex2, sequentialSegmentIndex):
+	if(conceptNeuron.networkIndex in getSparseBranchActivationDict()):
+		sparseBranchActivationList = getSparseBranchActivationDict()[conceptNeuron.networkIndex]
+		coordinates, levels, times, flags = sparseBranchActivationList[branchIndex1]
+		levels = np.where(np.all(coordinates == [horizontalBranchIndex, branchIndex2, sequentialSegmentIndex], axis=1), vectorisedActivationLevelOff, levels).astype(np.float32)
+		activeMask = np.logical_or(np.logical_or(levels != vectorisedActivationLevelOff, times != 0), flags != 0)
+		sparseBranchActivationList[branchIndex1] = (coordinates[activeMask], levels[activeMask], times[activeMask], flags[activeMask])
+		if(calculateNumberOfSparseVectorisedBranchActivations(conceptNeuron) == 0):
+			resetSparseVectorisedBranchActivation(conceptNeuron)
+
+def calculateNumberOfSparseVectorisedBranchActivations(conceptNeuron):
+	numberOfActiveSequentialSegments = 0
+	if(conceptNeuron.networkIndex in getSparseBranchActivationDict()):
+		for coordinates, levels, times, flags in getSparseBranchActivationDict()[conceptNeuron.networkIndex]:
+			numberOfActiveSequentialSegments += coordinates.shape[0]
+	return numberOfActiveSequentialSegments
+
+#incremental dendritic tree reset (resetDendriticTreeActivationIncremental);
+networkDirtyVectorisedBranchActivationDict = {}	#key: conceptNode.networkIndex, value: list for every branchIndex1 of coordinates [numberOfActiveSequentialSegments, 3] of activated entries of conceptNode.vectorisedBranchActivation*List - only neurons with activated entries are stored
+networkDirtyDendriticBranchDict = {}	#key: conceptNode.networkIndex, value: set of activated DendriticBranch objects (sequential segment/input activations are reset with their branch)
+
+def recordDirtyVectorisedBranchActivationBatch(batchNeuronsList, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList):
+	#batch rows are saved to conceptNode.vectorisedBranchActivation*List; their active coordinates are the entries to rezero upon reset
+	batchSparseBranchActivationList, batchNeuronActiveList = extractActiveVectorisedBranchActivationBatch(len(batchNeuronsList), vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList)
+	for batchIndex, batchNeuron in enumerate(batchNeuronsList):
+		if(batchNeuronActiveList[batchIndex]):
+			networkDirtyVectorisedBranchActivationDict[batchNeuron.networkIndex] = [coordinates for coordinates, levels, times, flags in batchSparseBranchActivationList[batchIndex]]
+		else:
+			networkDirtyVectorisedBranchActivationDict.pop(batchNeuron.networkIndex, None)
+
+def resetDirtyVectorisedBranchActivation(conceptNeuron):
+	#rezero activated entries of neuron tensors in place
+	if(conceptNeuron.networkIndex in networkDirtyVectorisedBranchActivationDict):
+		for currentBranchIndex1, coordinates in enumerate(networkDirtyVectorisedBranchActivationDict.pop(conceptNeuron.networkIndex)):
+			if(coordinates.shape[0] > 0):
+				vectorisedBranchActivationOff = tf.zeros([coordinates.shape[0]])
+				conceptNeuron.vectorisedBranchActivationLevelList[currentBranchIndex1].scatter_nd_update(coordinates, vectorisedBranchActivationOff)
+				conceptNeuron.vectorisedBranchActivationTimeList[currentBranchIndex1].scatter_nd_update(coordinates, vectorisedBranchActivationOff)
+				conceptNeuron.vectorisedBranchActivationFlagList[currentBranchIndex1].scatter_nd_update(coordinates, vectorisedBranchActivationOff)
+
+def recordDendriticBranchActivation(dendriticBranch):
+	networkIndex = dendriticBranch.conceptNode.networkIndex
+	if(networkIndex not in networkDirtyDendriticBranchDict):
+		networkDirtyDendriticBranchDict[networkIndex] = set()
+	networkDirtyDendriticBranchDict[networkIndex].add(dendriticBranch)
+
+def resetDirtyDendriticBranchActivation(conceptNeuron):
+	for dendriticBranch in networkDirtyDendriticBranchDict.pop(conceptNeuron.networkIndex, ()):
+		resetBranchActivation(dendriticBranch)
+
+#flattened dendritic tree (storeDendriticTreeFlattened);
+flattenedActivationTimeNone = np.iinfo(np.int64).min	#activation time None (activation time arrays are int64)
+networkFlattenedDendriticTreeDict = {}	#key: conceptNode.networkIndex, value: FlattenedDendriticTree	#allocated with dendritic tree
+
+class FlattenedDendriticTree():
+	#dendritic tree activations stored in heap ordered arrays (index: calculateBranchId/calculateSequentialSegmentId); subbranches of a branch are contiguous, such that the parent/subbranch relation is arithmetic (see calculateBranchIndexOffset)
+	__slots__ = ("branchList", "branchActivationLevel", "branchActivationTime", "sequentialSegmentActivationLevel", "sequentialSegmentActivationTime", "sequentialSegmentFrozen")
+	def __init__(self):
+		numberOfBranches = calculateNumberOfBranches()
+		self.branchList = [None]*numberOfBranches	#dendritic tree objects (index: branchId)
+		self.branchActivationLevel = np.zeros(numberOfBranches, dtype=np.float64)
+		self.branchActivationTime = np.full(numberOfBranches, flattenedActivationTimeNone, dtype=np.int64)
+		self.sequentialSegmentActivationLevel = np.zeros(numberOfBranches*numberOfBranchSequentialSegments, dtype=np.float64)
+		self.sequentialSegmentActivationTime = np.full(numberOfBranches*numberOfBranchSequentialSegments, flattenedActivationTimeNone, dtype=np.int64)
+		self.sequentialSegmentFrozen = np.zeros(numberOfBranches*numberOfBranchSequentialSegments, dtype=np.bool_)
+
+def getFlattenedDendriticTree(conceptNeuron):
+	return networkFlattenedDendriticTreeDict[conceptNeuron.networkIndex]
+
+def getFlattenedDendriticTreeBranchIndex1(flattenedArray, branchIndex1, sequentialSegmentArray):
+	#returns view of the branchIndex1 entries of a flattened branch/sequential segment array in vectorised layout (shape [numberOfHorizontalBranches, horizontalBranchWidth{, numberOfBranchSequentialSegments}])
+	numberOfHorizontalBranches, horizontalBranchWidth = calculateNumberOfHorizontalBranches(branchIndex1, numberOfBranches2)
+	branchIndexOffset = calculateBranchIndexOffset(branchIndex1)
+	if(sequentialSegmentArray):
+		flattenedArrayBranchIndex1 = flattenedArray[branchIndexOffset*numberOfBranchSequentialSegments:(branchIndexOffset+numberOfHorizontalBranches*horizontalBranchWidth)*numberOfBranchSequentialSegments].reshape(numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments)
+	else:
+		flattenedArrayBranchIndex1 = flattenedArray[branchIndexOffset:branchIndexOffset+numberOfHorizontalBranches*horizontalBranchWidth].reshape(numberOfHorizontalBranches, horizontalBranchWidth)
+	return flattenedArrayBranchIndex1
+
+def convertActivationTimeToFlattened(activationTime):
+	if(activationTime is None):
+		activationTime = flattenedActivationTimeNone
+	return activationTime
+
+def convertActivationTimeFromFlattened(activationTime):
+	if(activationTime == flattenedActivationTimeNone):
+		activationTime = None
+	else:
+		activationTime = int(activationTime)
+	return activationTime
+
+def convertSequentialSegmentActivationLevelFromFlattened(activationLevel):
+	if(weightedSequentialSegmentInputs):
+		activationLevel = float(activationLevel)
+	else:
+		activationLevel = bool(activationLevel)
+	return activationLevel
+
+def resetFlattenedDendriticTreeActivation(conceptNeuron):
+	#sync with resetBranchActivationRecurse (activation times are not reset)
+	flattenedDendriticTree = getFlattenedDendriticTree(conceptNeuron)
+	flattenedDendriticTree.branchActivationLevel.fill(0.0)
+	flattenedDendriticTree.sequentialSegmentActivationLevel.fill(0.0)
+	if(recordSequentialSegmentInputActivationLevels):
+		for currentBranch in flattenedDendriticTree.branchList:
+			for sequentialSegment in currentBranch.sequentialSegments:
+				for sequentialSegmentInput in sequentialSegment.inputs.values():
+					resetSequentialSegmentInputActivation(sequentialSegmentInput)
+
+def unfreezeFlattenedDendriticTreeActivation(conceptNeuron):
+	#sync with unfreezeDendriticTreeActivation
+	getFlattenedDendriticTree(conceptNeuron).sequentialSegmentFrozen.fill(False)
+
+#activation context (vectoriseComputationActivationContext);
+class ActivationContext():
+	#transient activation state of a sequence/query propagation; network objects (concept nodes, dendritic trees, connections) are not modified during propagation
+	__slots__ = ("neuronActivationLevelDict", "sparseBranchActivationDict", "branchActivationBufferDict")
+	def __init__(self):
+		self.neuronActivationLevelDict = {}	#key: conceptNode.networkIndex, value: soma activation level (only active neurons are stored)
+		self.sparseBranchActivationDict = {}	#key: conceptNode.networkIndex, value: see networkSparseBranchActivationDict
+		self.branchActivationBufferDict = {}	#key: conceptNode.networkIndex, value: (vectorisedBranchActivationLevelListBuffer, vectorisedBranchActivationTimeListBuffer, vectorisedBranchActivationFlagListBuffer)
+
+activationContextThreadLocal = threading.local()	#current activation context of each thread (concurrent propagations share the network)
+
+def getActivationContext():
+	activationContext = getattr(activationContextThreadLocal, "activationContext", None)
+	if(activationContext is None):
+		activationContext = ActivationContext()
+		activationContextThreadLocal.activationContext = activationContext
+	return activationContext
+
+def createActivationContext():
+	#assign a new (inactive) activation context to current thread; returns previous activation context (restored by releaseActivationContext)
+	activationContextPrevious = getActivationContext()
+	activationContextThreadLocal.activationContext = ActivationContext()
+	return activationContextPrevious
+
+def releaseActivationContext(activationContextPrevious):
+	activationContextThreadLocal.activationContext = activationContextPrevious	#current activation context is discarded
+
+def beginSequenceActivation():
+	#returns previous activation context (vectoriseComputationActivationContext)
+	activationContextPrevious = None
+	if(vectoriseComputationActivationContext):
+		activationContextPrevious = createActivationContext()
+	return activationContextPrevious
+
+def endSequenceActivation(connectionTargetNeuronSet, activationContextPrevious):
+	if(vectoriseComputationActivationContext):
+		releaseActivationContext(activationContextPrevious)	#discard sequence activation context (no reset of connection target neurons required)
+		connectionTargetNeuronSet.clear()
+	else:
+		resetConnectionTargetNeurons(connectionTargetNeuronSet, False)
+
+def getNeuronActivationLevel(conceptNeuron):
+	if(vectoriseComputationActivationContext):
+		activationLevel = getActivationContext().neuronActivationLevelDict.get(conceptNeuron.networkIndex, objectAreaActivationLevelOff)
+	else:
+		activationLevel = conceptNeuron.activationLevel
+	return activationLevel
+
+def setNeuronActivationLevel(conceptNeuron, activationLevel):
+	if(vectoriseComputationActivationContext):
+		if(activationLevel):
+			getActivationContext().neuronActivationLevelDict[conceptNeuron.networkIndex] = activationLevel
+		else:
+			getActivationContext().neuronActivationLevelDict.pop(conceptNeuron.networkIndex, None)
+	else:
+		conceptNeuron.activationLevel = activationLevel
+
+def getVectorisedBranchActivationBuffer(conceptNeuron):
+	#returns vectorisedBranchActivationLevelListBuffer, vectorisedBranchActivationTimeListBuffer, vectorisedBranchActivationFlagListBuffer
+	if(vectoriseComputationActivationContext):
+		vectorisedBranchActivationBuffer = getActivationContext().branchActivationBufferDict[conceptNeuron.networkIndex]
+	else:
+		vectorisedBranchActivationBuffer = (conceptNeuron.vectorisedBranchActivationLevelListBuffer, conceptNeuron.vectorisedBranchActivationTimeListBuffer, conceptNeuron.vectorisedBranchActivationFlagListBuffer)
+	return vectorisedBranchActivationBuffer
+
+def setVectorisedBranchActivationBuffer(conceptNeuron, vectorisedBranchActivationLevelListBuffer, vectorisedBranchActivationTimeListBuffer, vectorisedBranchActivationFlagListBuffer):
+	if(vectoriseComputationActivationContext):
+		getActivationContext().branchActivationBufferDict[conceptNeuron.networkIndex] = (vectorisedBranchActivationLevelListBuffer, vectorisedBranchActivationTimeListBuffer, vectorisedBranchActivationFlagListBuffer)
+	else:
+		conceptNeuron.vectorisedBranchActivationLevelListBuffer = vectorisedBranchActivationLevelListBuffer
+		conceptNeuron.vectorisedBranchActivationTimeListBuffer = vectorisedBranchActivationTimeListBuffer
+		conceptNeuron.vectorisedBranchActivationFlagListBuffer = vectorisedBranchActivationFlagListBuffer
+
 def printVectorisedBranchObjectList(conceptNode):
 	print("printVectorisedBranchObjectList: conceptNode = ", conceptNode.nodeName)
 	numberOfVerticalBranches = calculateNumberOfVerticalBranches(numberOfBranches1)
@@ -209,6 +935,49 @@ def calculateNumberOfVerticalBranches(numberOfBranches1):
 	numberOfVerticalBranches = numberOfBranches1+1
 	return numberOfVerticalBranches
 		
+#dendritic tree is a complete numberOfBranches2-ary tree; branch/sequential segment ids are heap ordered (branchIndex1 major);
+def calculateBranchIndexOffset(branchIndex1):
+	branchIndexOffset = 0
+	for currentBranchIndex1 in range(branchIndex1):
+		numberOfHorizontalBranches, horizontalBranchWidth = calculateNumberOfHorizontalBranches(currentBranchIndex1, numberOfBranches2)
+		branchIndexOffset += numberOfHorizontalBranches*horizontalBranchWidth
+	return branchIndexOffset
+
+def calculateBranchId(branchIndex1, horizontalBranchIndex, branchIndex2):
+	numberOfHorizontalBranches, horizontalBranchWidth = calculateNumberOfHorizontalBranches(branchIndex1, numberOfBranches2)
+	branchId = calculateBranchIndexOffset(branchIndex1) + horizontalBranchIndex*horizontalBranchWidth + branchIndex2
+	return branchId
+
+def calculateSequentialSegmentId(branchIndex1, horizontalBranchIndex, branchIndex2, sequentialSegmentIndex):
+	branchId = calculateBranchId(branchIndex1, horizontalBranchIndex, branchIndex2)
+	segmentId = branchId*numberOfBranchSequentialSegments + sequentialSegmentIndex
+	return segmentId
+
+def calculateNumberOfBranches():
+	numberOfVerticalBranches = calculateNumberOfVerticalBranches(numberOfBranches1)
+	numberOfBranches = calculateBranchIndexOffset(numberOfVerticalBranches)
+	return numberOfBranches
+
+def getSequentialSegmentOfSequentialSegmentId(conceptNode, segmentId):
+	#inverse of calculateSequentialSegmentId
+	branchId, sequentialSegmentIndex = divmod(segmentId, numberOfBranchSequentialSegments)
+	if(storeDendriticTreeFlattened):
+		dendriticBranch = getFlattenedDendriticTree(conceptNode).branchList[branchId]
+	else:
+		branchIndex1 = 0
+		while(calculateBranchIndexOffset(branchIndex1+1) <= branchId):
+			branchIndex1 += 1
+		#the branch index within branchIndex1 (horizontalBranchIndex*horizontalBranchWidth + branchIndex2) lists the subbranch indices of the path from the most proximal branch as base numberOfBranches2 digits;
+		branchIndexWithinBranchIndex1 = branchId - calculateBranchIndexOffset(branchIndex1)
+		subbranchIndexList = []
+		for currentBranchIndex1 in range(branchIndex1):
+			branchIndexWithinBranchIndex1, subbranchIndex = divmod(branchIndexWithinBranchIndex1, numberOfBranches2)
+			subbranchIndexList.append(subbranchIndex)
+		dendriticBranch = conceptNode.dendriticTree
+		for subbranchIndex in reversed(subbranchIndexList):
+			dendriticBranch = dendriticBranch.subbranches[subbranchIndex]
+	return dendriticBranch.sequentialSegments[sequentialSegmentIndex]
+
 def createDendriticTree(conceptNode, numberOfBranches1, numberOfBranches2, numberOfBranchSequentialSegments):	
 	currentBranchIndex1, currentBranchIndex2, horizontalBranchIndex = (0, 0, 0)
 	dendriticTreeHeadBranch = DendriticBranch(conceptNode, None, numberOfBranchSequentialSegments, currentBranchIndex1, currentBranchIndex2, horizontalBranchIndex)
@@ -248,7 +1017,7 @@ def resetConnectionTargetNeurons(connectionTargetNeuronSet, duringSourcePropagat
 				resetConnectionTargetNeuronsBasic(connectionTargetNeuronSet, duringSourcePropagation)
 			if(resetConnectionTargetNeuronDendriteAfterActivation):
 				resetConnectionTargetNeuronsBasic(connectionTargetNeuronSet, duringSourcePropagation)
-			if(resetTargetNeuronDendriteAfterActivation):
+			if(resetTargetNeuronDendriteAfterActivation and (conceptNeuronTarget is not None)):	#conceptNeuronTarget is None during prediction if next context concept is not found in network
 				resetDendriticTreeActivation(conceptNeuronTarget)
 		else:
 			#if(not resetConnectionTargetNeuronDendriteAfterActivation):
@@ -257,18 +1026,24 @@ def resetConnectionTargetNeurons(connectionTargetNeuronSet, duringSourcePropagat
 def resetConnectionTargetNeuronsBasic(connectionTargetNeuronSet, duringSourcePropagation):
 	for connectionTargetNeuron in connectionTargetNeuronSet:
 		if(duringSourcePropagation):
-			if(connectionTargetNeuron.activationLevel):
+			if(getNeuronActivationLevel(connectionTargetNeuron)):
 				#print("resetConnectionTargetNeuronsBasic: connectionTargetNeuron.activationLevel = ", connectionTargetNeuron.nodeName)
 				if(resetConnectionTargetNeuronDendriteDuringActivation):
 					resetDendriticTreeLastSequentialSegmentActivation(connectionTargetNeuron)
 					if(resetConnectionTargetNeuronDendriteDuringActivationFreezeUntilRoundCompletion):
-						unfreezeDendriticTreeActivation(connectionTargetNeuron.dendriticTree)
+						if(storeDendriticTreeFlattened):
+							unfreezeFlattenedDendriticTreeActivation(connectionTargetNeuron)
+						else:
+							unfreezeDendriticTreeActivation(connectionTargetNeuron.dendriticTree)
 				else:
 					resetDendriticTreeActivation(connectionTargetNeuron)
 		else:
 			resetDendriticTreeActivation(connectionTargetNeuron)
 			if(overwriteSequentialSegmentsAfterPropagatingSignal):
-				unfreezeDendriticTreeActivation(connectionTargetNeuron.dendriticTree)
+				if(storeDendriticTreeFlattened):
+					unfreezeFlattenedDendriticTreeActivation(connectionTargetNeuron)
+				else:
+					unfreezeDendriticTreeActivation(connectionTargetNeuron.dendriticTree)
 	connectionTargetNeuronSet.clear()
 		
 def resetSourceNeuronAfterActivation(conceptNeuronSource):
@@ -278,20 +1053,34 @@ def resetSourceNeuronAfterActivation(conceptNeuronSource):
 		resetDendriticTreeActivation(conceptNeuronSource, updateDendriticTreeObjects=updateNeuronObjectActivationLevels)
 
 def resetDendriticTreeActivation(conceptNeuron, updateDendriticTreeObjects=True):
-	conceptNeuron.activationLevel = objectAreaActivationLevelOff
-	if(updateDendriticTreeObjects):
-		resetBranchActivationRecurse(conceptNeuron.dendriticTree)
-	if(vectoriseComputationCurrentDendriticInput):
-		resetDendriticTreeActivationVectorised(conceptNeuron)
+	setNeuronActivationLevel(conceptNeuron, objectAreaActivationLevelOff)
+	if(conceptNeuron.dendriticTree is not None):	#lazyDendriticTreeAllocation: neurons without synapses do not have a dendritic tree
+		if(updateDendriticTreeObjects and not vectoriseComputationActivationContext):	#vectoriseComputationActivationContext: dendritic tree objects are not activated
+			if(resetDendriticTreeActivationIncremental):
+				resetDirtyDendriticBranchActivation(conceptNeuron)
+			elif(storeDendriticTreeFlattened):
+				resetFlattenedDendriticTreeActivation(conceptNeuron)	#rezero flattened arrays in place
+			else:
+				resetBranchActivationRecurse(conceptNeuron.dendriticTree)
+		if(vectoriseComputationCurrentDendriticInput):
+			resetDendriticTreeActivationVectorised(conceptNeuron)
 	
 def resetDendriticTreeActivationVectorised(conceptNeuron):
-	conceptNeuron.activationLevel = objectAreaActivationLevelOff
-	conceptNeuron.vectorisedBranchActivationLevelList, conceptNeuron.vectorisedBranchActivationTimeList,  conceptNeuron.vectorisedBranchActivationFlagList = createDendriticTreeVectorised(batched=False, createVectorisedBranchObjectList=False, storeSequentialSegmentInputActivationLevels=False)	#rezero tensors by regenerating them 	#do not overwrite conceptNeuron.vectorisedBranchObjectList
+	setNeuronActivationLevel(conceptNeuron, objectAreaActivationLevelOff)
+	if(vectoriseComputationNetworkActivationStore):
+		resetNetworkVectorisedBranchActivation(conceptNeuron)	#rezero network tensor rows in place
+	elif(vectoriseComputationSparseActivationStore):
+		resetSparseVectorisedBranchActivation(conceptNeuron)	#remove active coordinates
+	elif(resetDendriticTreeActivationIncremental):
+		resetDirtyVectorisedBranchActivation(conceptNeuron)	#rezero activated coordinates in place
+	else:
+		conceptNeuron.vectorisedBranchActivationLevelList, conceptNeuron.vectorisedBranchActivationTimeList,  conceptNeuron.vectorisedBranchActivationFlagList = createDendriticTreeVectorised(batched=False, createVectorisedBranchObjectList=False, storeSequentialSegmentInputActivationLevels=False)	#rezero tensors by regenerating them 	#do not overwrite conceptNeuron.vectorisedBranchObjectList
 
 def resetAxonsActivation(conceptNeuron):
-	conceptNeuron.activationLevel = objectAreaActivationLevelOff
-	for targetConnectionConceptName, connectionList in conceptNeuron.targetConnectionDict.items():
-		resetAxonsActivationConnectionList(connectionList)
+	setNeuronActivationLevel(conceptNeuron, objectAreaActivationLevelOff)
+	if(not vectoriseComputationActivationContext):	#vectoriseComputationActivationContext: connections are not activated
+		for targetConnectionConceptName, connectionList in conceptNeuron.targetConnectionDict.items():
+			resetAxonsActivationConnectionList(connectionList)
 
 def resetAxonsActivationConnectionList(connectionList):
 	for connection in connectionList:
@@ -471,20 +1260,53 @@ def findSequentialSegmentInputBySourceNode(sequentialSegment, sourceConceptNode)
 	foundSequentialSegmentInput = False
 	sequentialSegmentInput = None
 	if(preventGenerationOfDuplicateConnections):
-		if(sourceConceptNode.nodeName in sequentialSegment.inputs):		
+		sourceConceptNodeConnectionKey = getConnectionKey(sourceConceptNode)
+		if(sourceConceptNodeConnectionKey in sequentialSegment.inputs):		
 			foundSequentialSegmentInput = True	
-			sequentialSegmentInput = sequentialSegment.inputs[sourceConceptNode.nodeName]
+			sequentialSegmentInput = sequentialSegment.inputs[sourceConceptNodeConnectionKey]
+	elif(indexSequentialSegmentInputsBySourceNode):
+		sequentialSegmentInputList = findSequentialSegmentInputListBySourceNode(sequentialSegment, sourceConceptNode)
+		if(len(sequentialSegmentInputList) > 0):
+			foundSequentialSegmentInput = True
+			sequentialSegmentInput = sequentialSegmentInputList[0]	#first generated input of sourceConceptNode
 	else:
-		print("findSequentialSegmentInputBySourceNode error: currently requires preventGenerationOfDuplicateConnections")
+		print("findSequentialSegmentInputBySourceNode error: currently requires preventGenerationOfDuplicateConnections or indexSequentialSegmentInputsBySourceNode")
 		exit()
 	return foundSequentialSegmentInput, sequentialSegmentInput
 
+#sequential segment input source index (indexSequentialSegmentInputsBySourceNode);
+networkSequentialSegmentInputSourceIndexDict = {}	#key: (source conceptNode.networkIndex, target conceptNode.networkIndex), value: list of (sequentialSegmentId, sequentialSegmentInputIndex) - in order of generation
+
+def calculateSequentialSegmentIdOfObject(sequentialSegment):
+	if(storeDendriticTreeFlattened):
+		segmentId = sequentialSegment.sequentialSegmentId
+	else:
+		segmentId = calculateSequentialSegmentId(sequentialSegment.branch.branchIndex1, sequentialSegment.branch.horizontalBranchIndex, sequentialSegment.branch.branchIndex2, sequentialSegment.sequentialSegmentIndex)
+	return segmentId
+
+def addSequentialSegmentInputSourceIndex(sequentialSegment, sequentialSegmentInputIndex, sourceConceptNode):
+	sourceIndexKey = (sourceConceptNode.networkIndex, sequentialSegment.conceptNode.networkIndex)
+	if(sourceIndexKey not in networkSequentialSegmentInputSourceIndexDict):
+		networkSequentialSegmentInputSourceIndexDict[sourceIndexKey] = []
+	networkSequentialSegmentInputSourceIndexDict[sourceIndexKey].append((calculateSequentialSegmentIdOfObject(sequentialSegment), sequentialSegmentInputIndex))
+
+def findSequentialSegmentInputListBySourceNode(sequentialSegment, sourceConceptNode):
+	#returns all inputs of sequentialSegment from sourceConceptNode; only the synapses between sourceConceptNode and the target neuron are searched
+	sequentialSegmentInputList = []
+	sourceIndexKey = (sourceConceptNode.networkIndex, sequentialSegment.conceptNode.networkIndex)
+	if(sourceIndexKey in networkSequentialSegmentInputSourceIndexDict):
+		segmentId = calculateSequentialSegmentIdOfObject(sequentialSegment)
+		for inputSegmentId, sequentialSegmentInputIndex in networkSequentialSegmentInputSourceIndexDict[sourceIndexKey]:
+			if(inputSegmentId == segmentId):
+				sequentialSegmentInputList.append(sequentialSegment.inputs[sequentialSegmentInputIndex])
+	return sequentialSegmentInputList
+
 def applySomaActivation(conceptNeuronConnectionTarget, conceptNeuronTarget, somaActivationFoundCurrent, deactivateConnectionTarget, connectionTargetActivationFoundSet=None):
 	if(deactivateConnectionTarget):
-		conceptNeuronConnectionTarget.activationLevel = somaActivationFoundCurrent	
+		setNeuronActivationLevel(conceptNeuronConnectionTarget, somaActivationFoundCurrent)
 	if(somaActivationFoundCurrent):
 		if(not deactivateConnectionTarget):
-			conceptNeuronConnectionTarget.activationLevel = somaActivationFoundCurrent
+			setNeuronActivationLevel(conceptNeuronConnectionTarget, somaActivationFoundCurrent)
 			if(biologicalSimulationTestHarness):
 				if(emulateVectorisedComputationOrder):
 					if(conceptNeuronConnectionTarget not in(connectionTargetActivationFoundSet)):
@@ -528,19 +1350,26 @@ def deactivatePreviousSequentialSegmentOrSubbranch(currentSequentialSegment):
 			#print("freeze")
 
 def resetDendriticTreeLastSequentialSegmentActivation(conceptNeuron):
-	conceptNeuron.activationLevel = objectAreaActivationLevelOff
+	setNeuronActivationLevel(conceptNeuron, objectAreaActivationLevelOff)
 	
-	dendriticTreeLastBranch = conceptNeuron.dendriticTree
-	dendriticTreeLastBranch.activationLevel = objectAreaActivationLevelOff
-	dendriticTreeLastSequentialSegment = dendriticTreeLastBranch.sequentialSegments[sequentialSegmentIndexMostProximal]
-	resetSequentialSegmentActivation(dendriticTreeLastSequentialSegment)
+	if(conceptNeuron.dendriticTree is not None):	#lazyDendriticTreeAllocation: neurons without synapses do not have a dendritic tree
+		if(not vectoriseComputationActivationContext):	#vectoriseComputationActivationContext: dendritic tree objects are not activated
+			dendriticTreeLastBranch = conceptNeuron.dendriticTree
+			dendriticTreeLastBranch.activationLevel = objectAreaActivationLevelOff
+			dendriticTreeLastSequentialSegment = dendriticTreeLastBranch.sequentialSegments[sequentialSegmentIndexMostProximal]
+			resetSequentialSegmentActivation(dendriticTreeLastSequentialSegment)
 
-	if(vectoriseComputationCurrentDendriticInput):
-		resetDendriticTreeLastSequentialSegmentActivationVectorised(conceptNeuron)
+		if(vectoriseComputationCurrentDendriticInput):
+			resetDendriticTreeLastSequentialSegmentActivationVectorised(conceptNeuron)
 
 def resetDendriticTreeLastSequentialSegmentActivationVectorised(conceptNeuron):
 	#print(conceptNeuron.vectorisedBranchActivationLevelList[branchIndex1MostProximal][0, 0, sequentialSegmentIndexMostProximal])
-	conceptNeuron.vectorisedBranchActivationLevelList[branchIndex1MostProximal][0, 0, sequentialSegmentIndexMostProximal].assign(vectorisedActivationLevelOff)
+	if(vectoriseComputationNetworkActivationStore):
+		networkVectorisedBranchActivationLevelList[branchIndex1MostProximal].scatter_nd_update([[conceptNeuron.networkIndex, 0, 0, sequentialSegmentIndexMostProximal]], [vectorisedActivationLevelOff])
+	elif(vectoriseComputationSparseActivationStore):
+		resetSparseVectorisedBranchActivationLevel(conceptNeuron, branchIndex1MostProximal, 0, 0, sequentialSegmentIndexMostProximal)
+	else:
+		conceptNeuron.vectorisedBranchActivationLevelList[branchIndex1MostProximal][0, 0, sequentialSegmentIndexMostProximal].assign(vectorisedActivationLevelOff)
 	
 def unfreezeDendriticTreeActivation(currentBranch):
 	for sequentialSegment in currentBranch.sequentialSegments:
@@ -25,6 +25,8 @@ from HFNLPpy_hopfieldConnectionClass import *
 from HFNLPpy_biologicalSimulationGlobalDefs import *
 from HFNLPpy_biologicalSimulationNode import *
 import HFNLPpy_biologicalSimulationDraw
+if(standardComputationNumba):
+	import HFNLPpy_biologicalSimulationPropagateStandardNumba
 
 printVerbose = False
 printConnectionTargetActivations = False
@@ -111,9 +113,10 @@ def verifyFindTargetConnection(conceptNeuronSourceList):
 def activateTargetConnectionSomas(conceptNeuronSourceList, networkConceptNodeDict, conceptNeuronTarget, connectionTargetActivationFoundSet):
 	somaActivationFound = False
 	if(emulateVectorisedComputationOrderActivateSomaAfterFinishingPropagation):
+		conceptNodeLookup = getConceptNodeLookup(networkConceptNodeDict)
 		for conceptNeuronSource in conceptNeuronSourceList:
 			for targetConnectionConceptName in conceptNeuronSource.targetConnectionDict.keys():
-				conceptNeuronConnectionTarget = networkConceptNodeDict[targetConnectionConceptName]
+				conceptNeuronConnectionTarget = conceptNodeLookup[targetConnectionConceptName]
 				firstBranchActivationState = conceptNeuronConnectionTarget.dendriticTree.activationLevel	#requires storeBranchActivationState
 				somaActivationFoundCurrent = firstBranchActivationState
 				if(applySomaActivation(conceptNeuronConnectionTarget, conceptNeuronTarget, somaActivationFoundCurrent, deactivateConnectionTargetIfSomaActivationNotFound, connectionTargetActivationFoundSet)):
@@ -146,13 +149,16 @@ def simulateBiologicalHFnetworkSequenceNodePropagateStandard(networkConceptNodeD
 	somaActivationFound = False	#is conceptNeuronTarget activated by its prior context?
 	conceptNeuronSource.activationLevel = objectAreaActivationLevelOn
 	
+	conceptNodeLookup = getConceptNodeLookup(networkConceptNodeDict)
 	for targetConnectionConceptName, connectionList in conceptNeuronSource.targetConnectionDict.items():
-		conceptNeuronConnectionTarget = networkConceptNodeDict[targetConnectionConceptName] #or connectionList[ANY].nodeTarget
+		conceptNeuronConnectionTarget = conceptNodeLookup[targetConnectionConceptName] #or connectionList[ANY].nodeTarget
 		connectionTargetNeuronSet.add(conceptNeuronConnectionTarget)
 		for connection in connectionList:
 			if(emulateVectorisedComputationOrderPreactivateAxonsAndTargetInputs):
 				connection.activationLevel = objectAreaActivationLevelOn
 				connection.nodeTargetSequentialSegmentInput.activationLevel = calculateInputActivationLevel(connection)
+				if(resetDendriticTreeActivationIncremental):
+					recordDendriticBranchActivation(connection.nodeTargetSequentialSegmentInput.sequentialSegment.branch)
 			if(emulateVectorisedComputationOrderConnectionActivationTest(connection, branchIndex1Target, sequentialSegmentIndexTarget)):
 				if(not emulateVectorisedComputationOrderPreactivateAxonsAndTargetInputs):
 					connection.activationLevel = objectAreaActivationLevelOn
@@ -203,9 +209,10 @@ def simulateBiologicalHFnetworkSequenceNodeTrainPropagateSpecificTarget(networkC
 	#if(printVerbose):
 	#print("simulateBiologicalHFnetworkSequenceNodeTrainPropagateSpecificTarget: wTarget = ", wTarget, ", conceptNeuronTarget = ", conceptNeuronTarget.nodeName)
 
-	if(conceptNeuronTarget.nodeName in conceptNeuronSource.targetConnectionDict):
+	conceptNeuronTargetConnectionKey = getConnectionKey(conceptNeuronTarget)
+	if(conceptNeuronTargetConnectionKey in conceptNeuronSource.targetConnectionDict):
 		conceptNeuronSource.activationLevel = objectAreaActivationLevelOn
-		connectionList = conceptNeuronSource.targetConnectionDict[conceptNeuronTarget.nodeName]	#only trace connections between source neuron and target neuron
+		connectionList = conceptNeuronSource.targetConnectionDict[conceptNeuronTargetConnectionKey]	#only trace connections between source neuron and target neuron
 		for connection in connectionList:
 			connection.activationLevel = objectAreaActivationLevelOn
 			conceptNeuronConnectionTarget = connection.nodeTarget	#conceptNeuronConnectionTarget will be the same for all connection in connectionList (if targetConnectionConceptName == conceptNeuronTarget)
@@ -260,7 +267,11 @@ def calculateNeuronActivationStandardWrapper(connection, currentBranchIndex1, cu
 		else:
 			branchActivationFound = False
 	else:
-		branchActivationFound, branchActivationLevel, branchActivationTime = calculateNeuronActivationStandard(connection, currentBranchIndex1, currentBranch, activationTime, wSource, networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList)
+		currentSequentialSegmentIndex = sequentialSegmentIndexMostProximal	#calculateNeuronActivationStandard propagates to the most proximal sequential segment of currentBranch
+		if(standardComputationNumba):
+			branchActivationFound, branchActivationLevel, branchActivationTime = calculateNeuronActivationStandardFlattened(connection, currentBranch, activationTime)
+		else:
+			branchActivationFound, branchActivationLevel, branchActivationTime = calculateNeuronActivationStandard(connection, currentBranchIndex1, currentBranch, activationTime, wSource, networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList)
 	
 	if(branchActivationFound):
 		if((currentBranchIndex1 == branchIndex1MostProximal) and (currentSequentialSegmentIndex == sequentialSegmentIndexMostProximal)):
@@ -283,6 +294,54 @@ def calculateNeuronActivationStandard(connection, currentBranchIndex1, currentBr
 		
 	return branchActivationFound, branchActivationLevel, branchActivationTime
 	
+#standardComputationNumba;
+def calculateNeuronActivationStandardFlattened(connection, currentBranch, activationTime):
+	#equivalent to calculateNeuronActivationStandard for dendritic tree head branch currentBranch; propagation is executed on the flattened dendritic tree of the target neuron (storeDendriticTreeFlattened)
+	flattenedDendriticTree = getFlattenedDendriticTree(currentBranch.conceptNode)
+	currentSequentialSegmentInput = connection.nodeTargetSequentialSegmentInput
+	currentSequentialSegment = currentSequentialSegmentInput.sequentialSegment
+	connectionSequentialSegmentId = -1
+	foundConnectionSynapse, _ = findConnectionSynapseInSequentialSegment(currentSequentialSegment, connection)
+	if(foundConnectionSynapse):
+		connectionBranch = currentSequentialSegment.branch
+		connectionSequentialSegmentId = calculateSequentialSegmentId(connectionBranch.branchIndex1, connectionBranch.horizontalBranchIndex, connectionBranch.branchIndex2, currentSequentialSegment.sequentialSegmentIndex)
+	inputActivationLevel = calculateInputActivationLevel(connection)
+	
+	branchActivationFound, branchActivationLevel, branchActivationTime, inputActivationFound, inputActivationReset = HFNLPpy_biologicalSimulationPropagateStandardNumba.calculateNeuronActivationStandardFlattened(flattenedDendriticTree, connectionSequentialSegmentId, currentSequentialSegmentInput.firstInputInSequence, float(inputActivationLevel), activationTime)
+	
+	updateFlattenedDendriticTreeObjects(flattenedDendriticTree)
+	if(inputActivationFound):
+		if(recordSequentialSegmentInputActivationLevels):
+			currentSequentialSegmentInput.activationLevel = inputActivationLevel
+			currentSequentialSegmentInput.activationTime = activationTime
+			if(drawBiologicalSimulationDynamicHighlightNewActivations):
+				currentSequentialSegmentInput.activationStateNew = True
+			if(inputActivationReset):
+				resetSequentialSegmentInputActivation(currentSequentialSegmentInput)	#deactivatePreviousSequentialSegmentOrSubbranch (after input activation)
+			if(resetDendriticTreeActivationIncremental):
+				recordDendriticBranchActivation(currentSequentialSegment.branch)
+	
+	return bool(branchActivationFound), convertSequentialSegmentActivationLevelFromFlattened(branchActivationLevel), convertActivationTimeFromFlattened(branchActivationTime)
+
+def updateFlattenedDendriticTreeObjects(flattenedDendriticTree):
+	#dendritic tree object activation levels/times/frozen states are views onto the flattened dendritic tree; update the remaining object state (sequential segment inputs, new activation highlights, dirty branches) for the activations changed by the last propagation
+	propagateStandardNumba = HFNLPpy_biologicalSimulationPropagateStandardNumba
+	if(resetDendriticTreeActivationIncremental):
+		for branchId in np.flatnonzero(propagateStandardNumba.branchActivationUpdatedArray):
+			recordDendriticBranchActivation(flattenedDendriticTree.branchList[branchId])
+	for segmentId in np.flatnonzero(propagateStandardNumba.sequentialSegmentActivationUpdatedArray):
+		currentBranch = flattenedDendriticTree.branchList[segmentId//numberOfBranchSequentialSegments]
+		currentSequentialSegment = currentBranch.sequentialSegments[segmentId%numberOfBranchSequentialSegments]
+		if(recordSequentialSegmentInputActivationLevels):
+			if(propagateStandardNumba.sequentialSegmentActivationResetArray[segmentId]):
+				for sequentialSegmentInput in currentSequentialSegment.inputs.values():
+					resetSequentialSegmentInputActivation(sequentialSegmentInput)	#deactivatePreviousSequentialSegmentOrSubbranch
+		if(drawBiologicalSimulationDynamicHighlightNewActivations):
+			if(propagateStandardNumba.sequentialSegmentActivationStateNewArray[segmentId]):
+				currentSequentialSegment.activationStateNew = True
+		if(resetDendriticTreeActivationIncremental):
+			recordDendriticBranchActivation(currentBranch)
+	
 def calculateSubbranchActivations(recurse, connection, currentBranchIndex1, currentBranch, activationTime, wSource=None, networkConceptNodeDict=None, sentenceIndex=None, sentenceConceptNodeList=None):
 	subbranchesActive = objectAreaActivationLevelOff
 	subbranchesActivationTimeMax = minimumActivationTime
@@ -413,6 +472,8 @@ def calculateNeuronActivationSequentialSegment(connection, currentBranchIndex1,
 					currentSequentialSegmentInput.activationTime = activationTime
 					if(drawBiologicalSimulationDynamicHighlightNewActivations):
 						currentSequentialSegmentInput.activationStateNew = True
+					if(resetDendriticTreeActivationIncremental):
+						recordDendriticBranchActivation(currentBranch)
 				if(printVerbose):
 					printIndentation(currentBranchIndex1+1)
 					print("activate currentSequentialSegmentInput, connection.nodeSource = ", connection.nodeSource.nodeName, ", connection.nodeTarget = ", connection.nodeTarget.nodeName)
@@ -441,6 +502,8 @@ def calculateNeuronActivationSequentialSegment(connection, currentBranchIndex1,
 						sequentialSegmentActivationState = objectAreaActivationLevelOn
 					currentSequentialSegment.activationLevel = sequentialSegmentActivationLevel
 					currentSequentialSegment.activationTime = sequentialSegmentActivationTime
+					if(resetDendriticTreeActivationIncremental):
+						recordDendriticBranchActivation(currentBranch)
 
 					#if(resetConnectionTargetNeuronDendriteAfterSequence):
 					if(sequentialSegmentActivationState):
@@ -478,6 +541,9 @@ def calculateNeuronActivationSequentialSegment(connection, currentBranchIndex1,
 		sequentialSegmentActivationTime = sequentialSegmentActivationTimePrior
 		currentSequentialSegment.activationLevel = sequentialSegmentActivationLevel
 		currentSequentialSegment.activationTime = sequentialSegmentActivationTime
+		if(resetDendriticTreeActivationIncremental):
+			if(sequentialSegmentActivationLevel):
+				recordDendriticBranchActivation(currentBranch)
 
 		if(resetConnectionTargetNeuronDendriteDuringActivation):
 			if(sequentialSegmentActivationState):
@@ -506,6 +572,9 @@ def calculateBranchActivation(connection, currentBranchIndex1, currentBranch, se
 	else:
 		currentBranch.activationLevel = branchActivationLevel
 	currentBranch.activationTime = branchActivationTime
+	if(resetDendriticTreeActivationIncremental):
+		if(currentBranch.activationLevel):
+			recordDendriticBranchActivation(currentBranch)
 
 	branchActivationFound = branchActivationState
 	if(resetConnectionTargetNeuronDendriteAfterSequence):
@@ -530,6 +599,10 @@ def findConnectionSynapseInSequentialSegment(currentSequentialSegment, connectio
 		if(foundSequentialSegmentInput):
 			if(connection.nodeTargetSequentialSegmentInput == currentSequentialSegmentInput):
 				foundConnectionSynapse = True
+	elif(indexSequentialSegmentInputsBySourceNode):
+		if(connection.nodeTargetSequentialSegmentInput in findSequentialSegmentInputListBySourceNode(currentSequentialSegment, connection.nodeSource)):
+			foundConnectionSynapse = True
+			currentSequentialSegmentInput = connection.nodeTargetSequentialSegmentInput
 	else:
 		for currentSequentialSegmentInputTest in currentSequentialSegment.inputs.values():
 			if(connection.nodeTargetSequentialSegmentInput == currentSequentialSegmentInputTest):
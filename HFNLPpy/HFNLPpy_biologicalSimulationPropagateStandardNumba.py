@@ -0,0 +1,338 @@
+"""HFNLPpy_biologicalSimulationPropagateStandardNumba.py
+
+# Author:
+Richard Bruce Baxter - Copyright (c) 2022 Baxter AI (baxterai.com)
+
+# License:
+MIT License
+
+# Installation:
+see HFNLPpy_main.py
+pip install numba
+
+# Usage:
+see HFNLPpy_main.py
+
+# Description:
+HFNLP Biological Simulation Propagate Standard Numba - Numba compiled calculateNeuronActivationStandard (standardComputationNumba)
+
+executes HFNLPpy_biologicalSimulationPropagateStandard:calculateNeuronActivationStandard on a flattened dendritic tree (HFNLPpy_biologicalSimulationNode:FlattenedDendriticTree);
+the dendritic tree is a complete numberOfBranches2-ary tree, so its branches are stored in heap order (branchIndex1 major, see calculateBranchId) and the subbranches of every branch are contiguous;
+branches are processed one branchIndex1 at a time (most distal first if reversePropagationOrder, else most proximal first), which is equivalent to the calculateNeuronActivationStandard recursion (post-order/pre-order) as the propagation of a branch only modifies the branch and its subbranches
+
+"""
+
+import numpy as np
+from numba import njit
+
+from HFNLPpy_biologicalSimulationGlobalDefs import *
+from HFNLPpy_biologicalSimulationNode import calculateNumberOfVerticalBranches, calculateBranchIndexOffset, calculateNumberOfBranches, flattenedActivationTimeNone
+
+if(not verifyRepolarisationTime):
+	activationRepolarisationTime = 0	#initialise (dependent var)	#referenced by compiled verifyReactivationTimeFlattened
+if(not verifyPropagationTime):
+	activationPropagationTimeMax = 0	#initialise (dependent var)	#referenced by compiled verifySequentialActivationTimeFlattened
+
+
+#flattened dendritic tree structure (shared by all neurons);
+
+def createBranchIndexOffsetArray():
+	numberOfVerticalBranches = calculateNumberOfVerticalBranches(numberOfBranches1)
+	branchIndexOffsetArray = np.array([calculateBranchIndexOffset(branchIndex1) for branchIndex1 in range(numberOfVerticalBranches+1)], dtype=np.int64)	#branch ids of branchIndex1: [branchIndexOffsetArray[branchIndex1], branchIndexOffsetArray[branchIndex1+1])
+	return branchIndexOffsetArray
+
+def createSubbranchIndexFirstArray(branchIndexOffsetArray):
+	numberOfVerticalBranches = calculateNumberOfVerticalBranches(numberOfBranches1)
+	subbranchIndexFirstArray = np.full(calculateNumberOfBranches(), -1, dtype=np.int64)	#branch id of first subbranch (-1: no subbranches)
+	for branchIndex1 in range(numberOfVerticalBranches-1):
+		for horizontalBranchIndexAbsolute in range(branchIndexOffsetArray[branchIndex1+1]-branchIndexOffsetArray[branchIndex1]):
+			subbranchIndexFirstArray[branchIndexOffsetArray[branchIndex1]+horizontalBranchIndexAbsolute] = branchIndexOffsetArray[branchIndex1+1] + horizontalBranchIndexAbsolute*numberOfBranches2	#see createDendriticTreeBranch (horizontalBranchIndex*numberOfBranches2+subBranchIndex2)
+	return subbranchIndexFirstArray
+
+branchIndexOffsetArray = createBranchIndexOffsetArray()
+subbranchIndexFirstArray = createSubbranchIndexFirstArray(branchIndexOffsetArray)
+
+#propagation results (reused by every propagation);
+branchActivationUpdatedArray = np.zeros(calculateNumberOfBranches(), dtype=np.bool_)
+sequentialSegmentActivationUpdatedArray = np.zeros(calculateNumberOfBranches()*numberOfBranchSequentialSegments, dtype=np.bool_)
+sequentialSegmentActivationResetArray = np.zeros(calculateNumberOfBranches()*numberOfBranchSequentialSegments, dtype=np.bool_)	#deactivatePreviousSequentialSegmentOrSubbranch
+sequentialSegmentActivationStateNewArray = np.zeros(calculateNumberOfBranches()*numberOfBranchSequentialSegments, dtype=np.bool_)
+branchActivationFoundArray = np.zeros(calculateNumberOfBranches(), dtype=np.bool_)	#calculateNeuronActivationStandard return values of every branch (reversePropagationOrder: calculateSubbranchActivations recurse)
+branchActivationLevelArray = np.zeros(calculateNumberOfBranches(), dtype=np.float64)
+branchActivationTimeArray = np.zeros(calculateNumberOfBranches(), dtype=np.int64)
+
+
+def calculateNeuronActivationStandardFlattened(flattenedDendriticTree, connectionSequentialSegmentId, firstInputInSequence, inputActivationLevel, activationTime):
+	#connectionSequentialSegmentId: sequential segment id of connection synapse (-1: synapse not found)
+	#returns calculateNeuronActivationStandard results of dendritic tree head branch, and whether the connection synapse was activated/subsequently reset
+	connectionInputState = np.zeros(2, dtype=np.bool_)	#[connection synapse activated, connection synapse reset after activation]
+	branchActivationFound = calculateNeuronActivationStandardKernel(flattenedDendriticTree.branchActivationLevel, flattenedDendriticTree.branchActivationTime, flattenedDendriticTree.sequentialSegmentActivationLevel, flattenedDendriticTree.sequentialSegmentActivationTime, flattenedDendriticTree.sequentialSegmentFrozen, connectionSequentialSegmentId, firstInputInSequence, inputActivationLevel, activationTime, branchActivationUpdatedArray, sequentialSegmentActivationUpdatedArray, sequentialSegmentActivationResetArray, sequentialSegmentActivationStateNewArray, branchActivationFoundArray, branchActivationLevelArray, branchActivationTimeArray, connectionInputState)
+	branchActivationLevel = branchActivationLevelArray[0]
+	branchActivationTime = branchActivationTimeArray[0]
+	return branchActivationFound, branchActivationLevel, branchActivationTime, connectionInputState[0], connectionInputState[1]
+
+@njit
+def calculateNeuronActivationStandardKernel(branchActivationLevel, branchActivationTime, sequentialSegmentActivationLevel, sequentialSegmentActivationTime, sequentialSegmentFrozen, connectionSequentialSegmentId, firstInputInSequence, inputActivationLevel, activationTime, branchActivationUpdated, sequentialSegmentActivationUpdated, sequentialSegmentActivationReset, sequentialSegmentActivationStateNew, branchActivationFoundResult, branchActivationLevelResult, branchActivationTimeResult, connectionInputState):
+	branchActivationUpdated[:] = False
+	sequentialSegmentActivationUpdated[:] = False
+	sequentialSegmentActivationReset[:] = False
+	sequentialSegmentActivationStateNew[:] = False
+	numberOfVerticalBranches = numberOfBranches1+1
+	for branchIndex1Sequence in range(numberOfVerticalBranches):
+		if(reversePropagationOrder):
+			currentBranchIndex1 = numberOfVerticalBranches-1-branchIndex1Sequence
+		else:
+			currentBranchIndex1 = branchIndex1Sequence
+		for branchId in range(branchIndexOffsetArray[currentBranchIndex1], branchIndexOffsetArray[currentBranchIndex1+1]):
+			calculateNeuronActivationBranchFlattened(branchId, currentBranchIndex1, branchActivationLevel, branchActivationTime, sequentialSegmentActivationLevel, sequentialSegmentActivationTime, sequentialSegmentFrozen, connectionSequentialSegmentId, firstInputInSequence, inputActivationLevel, activationTime, branchActivationUpdated, sequentialSegmentActivationUpdated, sequentialSegmentActivationReset, sequentialSegmentActivationStateNew, branchActivationFoundResult, branchActivationLevelResult, branchActivationTimeResult, connectionInputState)
+	return branchActivationFoundResult[0]
+
+@njit
+def calculateNeuronActivationBranchFlattened(branchId, currentBranchIndex1, branchActivationLevel, branchActivationTime, sequentialSegmentActivationLevel, sequentialSegmentActivationTime, sequentialSegmentFrozen, connectionSequentialSegmentId, firstInputInSequence, inputActivationLevel, activationTime, branchActivationUpdated, sequentialSegmentActivationUpdated, sequentialSegmentActivationReset, sequentialSegmentActivationStateNew, branchActivationFoundResult, branchActivationLevelResult, branchActivationTimeResult, connectionInputState):
+
+	#sync with calculateSubbranchActivations;
+	subbranchesActive = False
+	subbranchesActivationTimeMax = minimumActivationTime
+	branch2activationSum = 0.0
+	numberOfBranch2active = 0
+	subbranchIndexFirst = subbranchIndexFirstArray[branchId]
+	if(subbranchIndexFirst >= 0):
+		for subbranchId in range(subbranchIndexFirst, subbranchIndexFirst+numberOfBranches2):
+			if(reversePropagationOrder):
+				#recurse: subbranch has already been propagated
+				subbranchActivationFound = branchActivationFoundResult[subbranchId]
+				subbranchActiveLevel = branchActivationLevelResult[subbranchId]
+				subbranchActivationTime = branchActivationTimeResult[subbranchId]
+			else:
+				subbranchActivationFound = calculateSequentialSegmentActivationStateFlattened(branchActivationLevel[subbranchId])
+				subbranchActiveLevel = branchActivationLevel[subbranchId]
+				subbranchActivationTime = branchActivationTime[subbranchId]
+			subbranchActive = False
+			if(performSummationOfSequentialSegmentInputsAcrossBranch):
+				if(subbranchActiveLevel > 0.0):
+					subbranchActive = True
+					branch2activationSum = branch2activationSum + subbranchActiveLevel
+			else:
+				if(subbranchActivationFound):
+					subbranchActive = True
+					numberOfBranch2active += 1
+			if(subbranchActive):
+				if(subbranchActivationTime > subbranchesActivationTimeMax):
+					subbranchesActivationTimeMax = subbranchActivationTime
+		if(performSummationOfSequentialSegmentInputsAcrossBranch):
+			if(branch2activationSum >= numberOfHorizontalSubBranchesRequiredForActivation):
+				subbranchesActive = True
+		else:
+			if(numberOfBranch2active >= numberOfHorizontalSubBranchesRequiredForActivation):
+				subbranchesActive = True
+	else:
+		subbranchesActive = True
+
+	#sync with calculateNeuronActivationSequentialSegments;
+	sequentialSegmentActivationStateLastNew = False
+	sequentialSegmentActivationStateLast = False
+	sequentialSegmentActivationLevelLast = 0.0
+	sequentialSegmentActivationTimeLast = flattenedActivationTimeNone
+	sequentialSegmentActivationStatePrior = subbranchesActive
+	sequentialSegmentActivationLevelPrior = 0.0
+	sequentialSegmentActivationTimePrior = subbranchesActivationTimeMax
+	for sequentialSegmentSequence in range(numberOfBranchSequentialSegments):
+		if(reversePropagationOrder):
+			currentSequentialSegmentIndex = numberOfBranchSequentialSegments-1-sequentialSegmentSequence
+		else:
+			currentSequentialSegmentIndex = sequentialSegmentSequence
+		segmentId = branchId*numberOfBranchSequentialSegments + currentSequentialSegmentIndex
+		if(currentSequentialSegmentIndex < numberOfBranchSequentialSegments-1):
+			if(not reversePropagationOrder):
+				sequentialSegmentActivationStatePrior = calculateSequentialSegmentActivationStateFlattened(sequentialSegmentActivationLevel[segmentId+1])
+				sequentialSegmentActivationLevelPrior = sequentialSegmentActivationLevel[segmentId+1]
+				sequentialSegmentActivationTimePrior = sequentialSegmentActivationTime[segmentId+1]
+		else:
+			sequentialSegmentActivationStatePrior = subbranchesActive
+			sequentialSegmentActivationLevelPrior = 0.0
+			sequentialSegmentActivationTimePrior = subbranchesActivationTimeMax
+
+		sequentialSegmentActivationState, sequentialSegmentActivationLevelCurrent, sequentialSegmentActivationTimeCurrent, sequentialSegmentActivationStateNewCurrent = calculateNeuronActivationSequentialSegmentFlattened(branchId, currentBranchIndex1, currentSequentialSegmentIndex, segmentId, sequentialSegmentActivationStatePrior, sequentialSegmentActivationLevelPrior, sequentialSegmentActivationTimePrior, branchActivationLevel, branchActivationTime, sequentialSegmentActivationLevel, sequentialSegmentActivationTime, sequentialSegmentFrozen, connectionSequentialSegmentId, firstInputInSequence, inputActivationLevel, activationTime, branchActivationUpdated, sequentialSegmentActivationUpdated, sequentialSegmentActivationReset, sequentialSegmentActivationStateNew, connectionInputState)
+
+		if(reversePropagationOrder):
+			sequentialSegmentActivationStatePrior = sequentialSegmentActivationState
+			sequentialSegmentActivationLevelPrior = sequentialSegmentActivationLevelCurrent
+			sequentialSegmentActivationTimePrior = sequentialSegmentActivationTimeCurrent
+
+		if(currentSequentialSegmentIndex == sequentialSegmentIndexMostProximal):
+			if(sequentialSegmentActivationStateNewCurrent):
+				sequentialSegmentActivationStateLastNew = True
+			sequentialSegmentActivationStateLast = sequentialSegmentActivationState
+			sequentialSegmentActivationLevelLast = sequentialSegmentActivationLevelCurrent
+			sequentialSegmentActivationTimeLast = sequentialSegmentActivationTimeCurrent
+
+	#sync with calculateBranchActivation;
+	if(storeBranchActivationState):
+		if(sequentialSegmentActivationStateLast):
+			branchActivationLevel[branchId] = 1.0
+		else:
+			branchActivationLevel[branchId] = 0.0
+	else:
+		branchActivationLevel[branchId] = sequentialSegmentActivationLevelLast
+	branchActivationTime[branchId] = sequentialSegmentActivationTimeLast
+	branchActivationUpdated[branchId] = True
+	branchActivationFound = sequentialSegmentActivationStateLast
+	if(resetConnectionTargetNeuronDendriteAfterSequence):
+		if(currentBranchIndex1 == branchIndex1MostProximal):
+			branchActivationFound = sequentialSegmentActivationStateLastNew
+	branchActivationFoundResult[branchId] = branchActivationFound
+	branchActivationLevelResult[branchId] = sequentialSegmentActivationLevelLast
+	branchActivationTimeResult[branchId] = sequentialSegmentActivationTimeLast
+
+@njit
+def calculateNeuronActivationSequentialSegmentFlattened(branchId, currentBranchIndex1, currentSequentialSegmentIndex, segmentId, sequentialSegmentActivationStatePrior, sequentialSegmentActivationLevelPrior, sequentialSegmentActivationTimePrior, branchActivationLevel, branchActivationTime, sequentialSegmentActivationLevel, sequentialSegmentActivationTime, sequentialSegmentFrozen, connectionSequentialSegmentId, firstInputInSequence, inputActivationLevel, activationTime, branchActivationUpdated, sequentialSegmentActivationUpdated, sequentialSegmentActivationReset, sequentialSegmentActivationStateNew, connectionInputState):
+	#sync with calculateNeuronActivationSequentialSegment
+	sequentialSegmentActivationStateNewCurrent = False
+	if((currentBranchIndex1 > 0) or expectFirstBranchSequentialSegmentConnection):
+		sequentialSegmentActivationState = False
+		sequentialSegmentActivationLevelCurrent = 0.0
+		sequentialSegmentActivationTimeCurrent = flattenedActivationTimeNone
+
+		sequentialSegmentAlreadyActive = False
+		if(sequentialSegmentActivationLevelAboveZeroFlattened(sequentialSegmentActivationLevel[segmentId])):
+			if(calculateSequentialSegmentActivationStateFlattened(sequentialSegmentActivationLevel[segmentId])):
+				sequentialSegmentAlreadyActive = True
+				sequentialSegmentActivationState = True
+			sequentialSegmentActivationLevelCurrent = sequentialSegmentActivationLevel[segmentId]
+			sequentialSegmentActivationTimeCurrent = sequentialSegmentActivationTime[segmentId]
+
+		passSegmentActivationOverwriteTests = True
+		if(overwriteSequentialSegments):
+			if(sequentialSegmentFrozen[segmentId]):
+				passSegmentActivationOverwriteTests = False
+		if(sequentialSegmentAlreadyActive and not overwriteSequentialSegments):
+			passSegmentActivationOverwriteTests = False
+
+		if(passSegmentActivationOverwriteTests):
+			if(segmentId == connectionSequentialSegmentId):
+				#foundConnectionSynapse
+				connectionInputState[0] = True
+				connectionInputState[1] = False
+
+				passSegmentActivationTimeTests = False
+				if(firstInputInSequence):
+					if(verifyReactivationTimeFlattened(sequentialSegmentActivationLevel[segmentId], sequentialSegmentActivationTime[segmentId], activationTime)):
+						passSegmentActivationTimeTests = True
+				else:
+					if(sequentialSegmentActivationStatePrior):
+						if(verifySequentialActivationTimeFlattened(activationTime, sequentialSegmentActivationTimePrior)):
+							if(verifyReactivationTimeFlattened(sequentialSegmentActivationLevel[segmentId], sequentialSegmentActivationTime[segmentId], activationTime)):
+								passSegmentActivationTimeTests = True
+
+				if(passSegmentActivationTimeTests):
+					if(performSummationOfSequentialSegmentInputs):
+						sequentialSegmentActivationLevelCurrent = sequentialSegmentActivationLevelCurrent + inputActivationLevel
+						sequentialSegmentActivationTimeCurrent = activationTime
+						sequentialSegmentActivationState = calculateSequentialSegmentActivationStateFlattened(sequentialSegmentActivationLevelCurrent)
+					else:
+						sequentialSegmentActivationLevelCurrent = inputActivationLevel
+						sequentialSegmentActivationTimeCurrent = activationTime
+						sequentialSegmentActivationState = True
+					sequentialSegmentActivationLevel[segmentId] = sequentialSegmentActivationLevelCurrent
+					sequentialSegmentActivationTime[segmentId] = sequentialSegmentActivationTimeCurrent
+					sequentialSegmentActivationUpdated[segmentId] = True
+
+					if(sequentialSegmentActivationState):
+						if(resetConnectionTargetNeuronDendriteDuringActivation):
+							deactivatePreviousSequentialSegmentOrSubbranchFlattened(branchId, currentSequentialSegmentIndex, branchActivationLevel, sequentialSegmentActivationLevel, sequentialSegmentFrozen, connectionSequentialSegmentId, branchActivationUpdated, sequentialSegmentActivationUpdated, sequentialSegmentActivationReset, connectionInputState)
+						sequentialSegmentActivationStateNewCurrent = True
+						sequentialSegmentActivationStateNew[segmentId] = True
+						if(overwriteSequentialSegmentsAfterPropagatingSignal):
+							if(not ((currentBranchIndex1 == branchIndex1MostProximal) and (currentSequentialSegmentIndex == sequentialSegmentIndexMostProximal))):
+								sequentialSegmentFrozen[segmentId] = True
+							subbranchIndexFirst = subbranchIndexFirstArray[branchId]
+							if(subbranchIndexFirst >= 0):
+								for subbranchId in range(subbranchIndexFirst, subbranchIndexFirst+numberOfBranches2):
+									previousSegmentId = subbranchId*numberOfBranchSequentialSegments + sequentialSegmentIndexMostProximal
+									sequentialSegmentFrozen[previousSegmentId] = False
+									sequentialSegmentActivationUpdated[previousSegmentId] = True
+				else:
+					if(deactivateSequentialSegmentsIfTimeTestsFail):
+						sequentialSegmentActivationLevelCurrent = 0.0
+						sequentialSegmentActivationTimeCurrent = sequentialSegmentActivationTime[segmentId]	#no change in last activation time
+						sequentialSegmentActivationState = False
+						sequentialSegmentActivationLevel[segmentId] = sequentialSegmentActivationLevelCurrent
+						sequentialSegmentActivationUpdated[segmentId] = True
+	else:
+		sequentialSegmentActivationState = sequentialSegmentActivationStatePrior
+		sequentialSegmentActivationLevelCurrent = sequentialSegmentActivationLevelPrior
+		sequentialSegmentActivationTimeCurrent = sequentialSegmentActivationTimePrior
+		sequentialSegmentActivationLevel[segmentId] = sequentialSegmentActivationLevelCurrent
+		sequentialSegmentActivationTime[segmentId] = sequentialSegmentActivationTimeCurrent
+		sequentialSegmentActivationUpdated[segmentId] = True
+		if(resetConnectionTargetNeuronDendriteDuringActivation):
+			if(sequentialSegmentActivationState):
+				deactivatePreviousSequentialSegmentOrSubbranchFlattened(branchId, currentSequentialSegmentIndex, branchActivationLevel, sequentialSegmentActivationLevel, sequentialSegmentFrozen, connectionSequentialSegmentId, branchActivationUpdated, sequentialSegmentActivationUpdated, sequentialSegmentActivationReset, connectionInputState)
+
+	return sequentialSegmentActivationState, sequentialSegmentActivationLevelCurrent, sequentialSegmentActivationTimeCurrent, sequentialSegmentActivationStateNewCurrent
+
+@njit
+def deactivatePreviousSequentialSegmentOrSubbranchFlattened(branchId, currentSequentialSegmentIndex, branchActivationLevel, sequentialSegmentActivationLevel, sequentialSegmentFrozen, connectionSequentialSegmentId, branchActivationUpdated, sequentialSegmentActivationUpdated, sequentialSegmentActivationReset, connectionInputState):
+	#sync with deactivatePreviousSequentialSegmentOrSubbranch
+	if(currentSequentialSegmentIndex == numberOfBranchSequentialSegments-1):
+		subbranchIndexFirst = subbranchIndexFirstArray[branchId]
+		if(subbranchIndexFirst >= 0):
+			for subbranchId in range(subbranchIndexFirst, subbranchIndexFirst+numberOfBranches2):
+				branchActivationLevel[subbranchId] = 0.0
+				branchActivationUpdated[subbranchId] = True
+				resetSequentialSegmentActivationFlattened(subbranchId*numberOfBranchSequentialSegments + sequentialSegmentIndexMostProximal, sequentialSegmentActivationLevel, sequentialSegmentFrozen, connectionSequentialSegmentId, sequentialSegmentActivationUpdated, sequentialSegmentActivationReset, connectionInputState)
+	else:
+		resetSequentialSegmentActivationFlattened(branchId*numberOfBranchSequentialSegments + currentSequentialSegmentIndex+1, sequentialSegmentActivationLevel, sequentialSegmentFrozen, connectionSequentialSegmentId, sequentialSegmentActivationUpdated, sequentialSegmentActivationReset, connectionInputState)
+
+@njit
+def resetSequentialSegmentActivationFlattened(previousSegmentId, sequentialSegmentActivationLevel, sequentialSegmentFrozen, connectionSequentialSegmentId, sequentialSegmentActivationUpdated, sequentialSegmentActivationReset, connectionInputState):
+	sequentialSegmentActivationLevel[previousSegmentId] = 0.0
+	sequentialSegmentActivationUpdated[previousSegmentId] = True
+	sequentialSegmentActivationReset[previousSegmentId] = True	#sequential segment inputs are reset
+	if(previousSegmentId == connectionSequentialSegmentId):
+		if(connectionInputState[0]):
+			connectionInputState[1] = True
+	if(resetConnectionTargetNeuronDendriteDuringActivationFreezeUntilRoundCompletion):
+		sequentialSegmentFrozen[previousSegmentId] = True
+
+@njit
+def calculateSequentialSegmentActivationStateFlattened(activationLevel):
+	#sync with calculateSequentialSegmentActivationState
+	if(weightedSequentialSegmentInputs):
+		if(performSummationOfSequentialSegmentInputs):
+			activationState = (activationLevel >= sequentialSegmentMinActivationLevel)
+		else:
+			activationState = (activationLevel > 0)
+	else:
+		activationState = (activationLevel != 0.0)
+	return activationState
+
+@njit
+def sequentialSegmentActivationLevelAboveZeroFlattened(activationLevel):
+	#sync with sequentialSegmentActivationLevelAboveZero
+	if(weightedSequentialSegmentInputs):
+		result = (activationLevel > 0)
+	else:
+		result = (activationLevel != 0.0)
+	return result
+
+@njit
+def verifyReactivationTimeFlattened(sequentialSegmentActivationLevelCurrent, sequentialSegmentActivationTimeCurrent, activationTime):
+	#sync with verifyReactivationTime
+	repolarised = True
+	if(calculateSequentialSegmentActivationStateFlattened(sequentialSegmentActivationLevelCurrent)):
+		if(verifyRepolarisationTime):
+			repolarised = (activationTime >= sequentialSegmentActivationTimeCurrent+activationRepolarisationTime)
+	return repolarised
+
+@njit
+def verifySequentialActivationTimeFlattened(activationTime, previousSequentialSegmentActivationTime):
+	#sync with verifySequentialActivationTime
+	if(algorithmTimingWorkaround1):
+		sequentiality = (activationTime >= previousSequentialSegmentActivationTime)
+	else:
+		sequentiality = (activationTime > previousSequentialSegmentActivationTime)
+	propagate = True
+	if(verifyPropagationTime):
+		propagate = (activationTime <= previousSequentialSegmentActivationTime+activationPropagationTimeMax)
+	return sequentiality and propagate
@@ -20,6 +20,7 @@ HFNLP Biological Simulation Propagate Vectorised
 
 
 import numpy as np
+from collections import OrderedDict
 
 from HFNLPpy_hopfieldNodeClass import *
 from HFNLPpy_hopfieldConnectionClass import *
@@ -30,6 +31,8 @@ import HFNLPpy_biologicalSimulationDraw
 printVerbose = False
 printConnectionTargetActivations = False
 
+compiledNeuronActivationParallelKernelDict = OrderedDict()	#key: batchSizePadded, value: (compiled calculateNeuronActivationParallelBranches, padded batch tf.Variables per branchIndex1)	#vectoriseComputationCompiled
+
 #parameters only used for drawBiologicalSimulationDynamic: sentenceIndex, sentenceConceptNodeList
 def simulateBiologicalHFnetworkSequenceNodePropagateParallel(networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList, activationTime, wSource, conceptNeuronSource, wTarget, conceptNeuronTarget, connectionTargetNeuronSet):
 	conceptNeuronSourceList = []
@@ -41,33 +44,93 @@ def simulateBiologicalHFnetworkSequenceNodesPropagateParallel(networkConceptNode
 	
 	somaActivationFound = False	#is conceptNeuronTarget activated by its prior context?
 
+	batchNeuronsList = []	#preserve insertion order	#alternatively in recordVectorisedBranchObjectList; can lookup batchNeurons from vectorisedBranchObjectBatchList instead
+	if(vectoriseComputationScatterSynapticInputs):
+		resetSynapticInputScatter()
+	elif(vectoriseComputationBufferPool):
+		resetBufferPool()
+	conceptNodeLookup = getConceptNodeLookup(networkConceptNodeDict)
+	targetConnectionFound, conceptNeuronBatchIndexFound, conceptNeuronBatchIndex = addConnectionTargetNeuronsToBatch(conceptNodeLookup, sentenceIndex, activationTime, wSource, conceptNeuronSourceList, wTarget, conceptNeuronTarget, connectionTargetNeuronSet, batchNeuronsList)
+
 	#construct batch dendritic tree templates for parallel processing;
-	numberOfVerticalBranches = calculateNumberOfVerticalBranches(numberOfBranches1)
-	vectorisedBranchActivationLevelBatchListList = [[] for _ in range(numberOfVerticalBranches)]	#temporary list before being coverted to tensor for parallel processing
-	vectorisedBranchActivationTimeBatchListList = [[] for _ in range(numberOfVerticalBranches)]	#temporary list before being coverted to tensor for parallel processing
-	vectorisedBranchActivationFlagBatchListList = [[] for _ in range(numberOfVerticalBranches)]	#temporary list before being coverted to tensor for parallel processing
-	vectorisedBranchActivationLevelBatchListListBuffer = [[] for _ in range(numberOfVerticalBranches)]	#temporary list before being coverted to tensor for parallel processing
-	vectorisedBranchActivationTimeBatchListListBuffer = [[] for _ in range(numberOfVerticalBranches)]	#temporary list before being coverted to tensor for parallel processing	
-	vectorisedBranchActivationFlagBatchListListBuffer = [[] for _ in range(numberOfVerticalBranches)]	#temporary list before being coverted to tensor for parallel processing	
-	if(recordVectorisedBranchObjectList):
-		vectorisedBranchObjectBatchListList = [[] for _ in range(numberOfVerticalBranches)]	#temporary list before being coverted to tensor for parallel processing
-	vectorisedBranchActivationLevelBatchList = [None for _ in range(numberOfVerticalBranches)]	#[]*(numberOfVerticalBranches)
-	vectorisedBranchActivationTimeBatchList = [None for _ in range(numberOfVerticalBranches)]	#[]*(numberOfVerticalBranches)
-	vectorisedBranchActivationFlagBatchList = [None for _ in range(numberOfVerticalBranches)]	#[]*(numberOfVerticalBranches)
-	vectorisedBranchActivationLevelBatchListBuffer = [None for _ in range(numberOfVerticalBranches)]	#[]*(numberOfVerticalBranches)
-	vectorisedBranchActivationTimeBatchListBuffer = [None for _ in range(numberOfVerticalBranches)]	#[]*(numberOfVerticalBranches)
-	vectorisedBranchActivationFlagBatchListBuffer = [None for _ in range(numberOfVerticalBranches)]	#[]*(numberOfVerticalBranches)
-	if(recordVectorisedBranchObjectList):
-		vectorisedBranchObjectBatchList = [None for _ in range(numberOfVerticalBranches)]	#[]*(numberOfVerticalBranches)
-	else:
-		vectorisedBranchObjectBatchList = None
+	vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer, vectorisedBranchObjectBatchList = createVectorisedBranchActivationBatch(batchNeuronsList)
 		
-	batchNeuronsList = []	#preserve insertion order	#alternatively in recordVectorisedBranchObjectList; can lookup batchNeurons from vectorisedBranchObjectBatchList instead
-	batchIndex = 0	#batchSampleIndex
+	#if(debugCalculateNeuronActivation):	
+	#	if(wSource==wSourceDebug and wTarget==wTargetDebug):
+	#		for branchIndex1 in range(numberOfVerticalBranches):
+	#			print("\t(wSource==wSourceDebug and wTarget==wTargetDebug): branchIndex1 = ", branchIndex1)
+	#			print("\tvectorisedBranchActivationLevelBatchList[branchIndex1] = ", vectorisedBranchActivationLevelBatchList[branchIndex1])
+
+	if(targetConnectionFound):
+		if(conceptNeuronBatchIndexFound or (conceptNeuronTarget is None) or not onlyPropagateIfConceptNeuronTargetActivatedByConceptNeuronSourceVectorised):	#orig optimisation; only execute calculateNeuronActivationParallel if conceptNeuronTarget input(s) are activated by conceptNeuronSource
+			if(calculateNeuronActivationParallel(vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer, vectorisedBranchObjectBatchList, activationTime, wTarget, conceptNeuronTarget, conceptNeuronBatchIndex, batchNeuronsList, wSource, networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList)):
+				somaActivationFound = True
+		else:
+			print("warning !conceptNeuronBatchIndexFound")
+	#else:
+	#	print("warning !targetConnectionFound")
+	
+	#save updated activations (ideally these should be able to be dynamically updated by calculateNeuronActivationParallel; store tensors (memory/reference) in a bulk/stacked tensor, write to the bulk tensor and have the individual tensors updated)
+	saveVectorisedBranchActivationBatch(batchNeuronsList, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList)
+			
+	for conceptNeuronSource in conceptNeuronSourceList:
+		resetSourceNeuronAfterActivation(conceptNeuronSource)
+
+	return somaActivationFound
+
+#vectoriseComputationBatchSentences: propagate wSource of multiple independent sentences (disjoint sentence/connection target neurons) in a single batch; all sentences share wSource/wTarget (and therefore activationTime)
+#parameters only used for drawBiologicalSimulationDynamic (not supported): sentenceIndexList, sentenceConceptNodeListList
+def simulateBiologicalHFnetworkSequencesNodePropagateParallel(networkConceptNodeDict, sentenceIndexList, sentenceConceptNodeListList, activationTime, wSource, wTarget, connectionTargetNeuronSetList):
+
+	somaActivationFoundList = [False for _ in range(len(sentenceConceptNodeListList))]	#is conceptNeuronTarget of each sentence activated by its prior context?
+	
+	batchNeuronsList = []	#preserve insertion order
+	conceptNeuronSourceList = []
+	conceptNeuronTargetList = []
+	if(vectoriseComputationScatterSynapticInputs):
+		resetSynapticInputScatter()
+	elif(vectoriseComputationBufferPool):
+		resetBufferPool()
+	conceptNodeLookup = getConceptNodeLookup(networkConceptNodeDict)
+	for sentenceBatchIndex, sentenceConceptNodeList in enumerate(sentenceConceptNodeListList):
+		conceptNeuronSource = sentenceConceptNodeList[wSource]
+		conceptNeuronTarget = None	#prediction: wTarget is beyond end of context (conceptNeuronTarget is unknown)
+		if(wTarget < len(sentenceConceptNodeList)):
+			conceptNeuronTarget = sentenceConceptNodeList[wTarget]
+		conceptNeuronSourceList.append(conceptNeuronSource)
+		conceptNeuronTargetList.append(conceptNeuronTarget)
+		sentenceBatchNeuronsList = []
+		targetConnectionFound, conceptNeuronBatchIndexFound, _ = addConnectionTargetNeuronsToBatch(conceptNodeLookup, sentenceIndexList[sentenceBatchIndex], activationTime, wSource, [conceptNeuronSource], wTarget, conceptNeuronTarget, connectionTargetNeuronSetList[sentenceBatchIndex], sentenceBatchNeuronsList)
+		if(targetConnectionFound):
+			if(conceptNeuronBatchIndexFound or (conceptNeuronTarget is None) or not onlyPropagateIfConceptNeuronTargetActivatedByConceptNeuronSourceVectorised):
+				batchNeuronsList.extend(sentenceBatchNeuronsList)	#sentence connection target neurons are disjoint
+			else:
+				print("warning !conceptNeuronBatchIndexFound")
+	
+	if(not emptyList(batchNeuronsList)):
+		vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer, vectorisedBranchObjectBatchList = createVectorisedBranchActivationBatch(batchNeuronsList)
+		somaActivationFoundNeuronSet = set()
+		calculateNeuronActivationParallel(vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer, vectorisedBranchObjectBatchList, activationTime, wTarget, None, None, batchNeuronsList, wSource, networkConceptNodeDict, sentenceIndexList[0], sentenceConceptNodeListList[0], somaActivationFoundNeuronSet)
+		for sentenceBatchIndex, conceptNeuronTarget in enumerate(conceptNeuronTargetList):
+			if(conceptNeuronTarget in somaActivationFoundNeuronSet):
+				somaActivationFoundList[sentenceBatchIndex] = True
+		saveVectorisedBranchActivationBatch(batchNeuronsList, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList)
+
+	for conceptNeuronSource in conceptNeuronSourceList:
+		resetSourceNeuronAfterActivation(conceptNeuronSource)
+
+	return somaActivationFoundList
+
+def addConnectionTargetNeuronsToBatch(conceptNodeLookup, sentenceIndex, activationTime, wSource, conceptNeuronSourceList, wTarget, conceptNeuronTarget, connectionTargetNeuronSet, batchNeuronsList):
+	batchIndex = len(batchNeuronsList)	#batchSampleIndex
 	conceptNeuronBatchIndex = None
 	conceptNeuronBatchIndexFound = False
 	targetConnectionFound = False
 	
+	conceptNeuronTargetConnectionKey = None
+	if(conceptNeuronTarget is not None):	#conceptNeuronTarget is None during prediction (next concept is unknown)
+		conceptNeuronTargetConnectionKey = getConnectionKey(conceptNeuronTarget)
+	
 	for conceptNeuronSource in conceptNeuronSourceList:
 
 		if(printVerbose):
@@ -80,7 +143,7 @@ def simulateBiologicalHFnetworkSequenceNodesPropagateParallel(networkConceptNode
 
 			#add target neuron to batch processing tensor
 			#if(vectoriseComputationIndependentBranches):	#only coded algorithm
-			conceptNeuronConnectionTarget = networkConceptNodeDict[targetConnectionConceptName] #or connectionList[ANY].nodeTarget
+			conceptNeuronConnectionTarget = conceptNodeLookup[targetConnectionConceptName] #or connectionList[ANY].nodeTarget
 			if(conceptNeuronConnectionTarget not in batchNeuronsList):
 			
 				connectionTargetNeuronSet.add(conceptNeuronConnectionTarget)
@@ -94,7 +157,7 @@ def simulateBiologicalHFnetworkSequenceNodesPropagateParallel(networkConceptNode
 							print("batchIndex of wTargetDebug = ", batchIndex)
 
 				targetConnectionFound = True
-				if(targetConnectionConceptName == conceptNeuronTarget.nodeName):
+				if(targetConnectionConceptName == conceptNeuronTargetConnectionKey):
 					conceptNeuronBatchIndex = batchIndex
 					conceptNeuronBatchIndexFound = True
 					#print("conceptNeuronTarget.nodeName = ", conceptNeuronTarget.nodeName)
@@ -102,7 +165,13 @@ def simulateBiologicalHFnetworkSequenceNodesPropagateParallel(networkConceptNode
 				batchIndex += 1
 				
 				#create temporary vectorised buffers for conceptNeuronSource connection target input sequentialSegment candidate application;
-				conceptNeuronConnectionTarget.vectorisedBranchActivationLevelListBuffer, conceptNeuronConnectionTarget.vectorisedBranchActivationTimeListBuffer, conceptNeuronConnectionTarget.vectorisedBranchActivationFlagListBuffer = createDendriticTreeVectorised(batched=False, createVectorisedBranchObjectList=False, storeSequentialSegmentInputActivationLevels=vectoriseComputionUseSequentialSegmentInputActivationLevels)	#shape [numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments, {numberOfSequentialSegmentInputs}]
+				if(vectoriseComputationScatterSynapticInputs):
+					pass	#batch buffers are generated by createVectorisedBranchActivationBatch
+				elif(vectoriseComputationBufferPool):
+					allocateBufferPoolRow(conceptNeuronConnectionTarget)	#reuse (zeroed) buffer pool row
+				else:
+					vectorisedBranchActivationLevelListBuffer, vectorisedBranchActivationTimeListBuffer, vectorisedBranchActivationFlagListBuffer = createDendriticTreeVectorised(batched=False, createVectorisedBranchObjectList=False, storeSequentialSegmentInputActivationLevels=vectoriseComputionUseSequentialSegmentInputActivationLevels)	#shape [numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments, {numberOfSequentialSegmentInputs}]
+					setVectorisedBranchActivationBuffer(conceptNeuronConnectionTarget, vectorisedBranchActivationLevelListBuffer, vectorisedBranchActivationTimeListBuffer, vectorisedBranchActivationFlagListBuffer)
 				
 			#trigger all target synaptic inputs before parallel processing	
 			for connection in connectionList:
@@ -110,62 +179,97 @@ def simulateBiologicalHFnetworkSequenceNodesPropagateParallel(networkConceptNode
 					connection.activationLevel = objectAreaActivationLevelOn
 				setVectorisedBranchActivation(conceptNeuronConnectionTarget, connection, activationTime)
 
-	batchNeuronsList2 = []
-	for conceptNeuronSource in conceptNeuronSourceList:
-		for targetConnectionConceptName, connectionList in conceptNeuronSource.targetConnectionDict.items():
-			conceptNeuronConnectionTarget = networkConceptNodeDict[targetConnectionConceptName] #or connectionList[ANY].nodeTarget
-			if(conceptNeuronConnectionTarget not in batchNeuronsList2):
-				batchNeuronsList2.append(conceptNeuronConnectionTarget)
-				for branchIndex1 in range(numberOfVerticalBranches):
-					vectorisedBranchActivationLevelBatchListList[branchIndex1].append(conceptNeuronConnectionTarget.vectorisedBranchActivationLevelList[branchIndex1])
-					vectorisedBranchActivationTimeBatchListList[branchIndex1].append(conceptNeuronConnectionTarget.vectorisedBranchActivationTimeList[branchIndex1])
-					vectorisedBranchActivationFlagBatchListList[branchIndex1].append(conceptNeuronConnectionTarget.vectorisedBranchActivationFlagList[branchIndex1])
-					vectorisedBranchActivationLevelBatchListListBuffer[branchIndex1].append(conceptNeuronConnectionTarget.vectorisedBranchActivationLevelListBuffer[branchIndex1])
-					vectorisedBranchActivationTimeBatchListListBuffer[branchIndex1].append(conceptNeuronConnectionTarget.vectorisedBranchActivationTimeListBuffer[branchIndex1])
-					vectorisedBranchActivationFlagBatchListListBuffer[branchIndex1].append(conceptNeuronConnectionTarget.vectorisedBranchActivationFlagListBuffer[branchIndex1])
-					if(recordVectorisedBranchObjectList):
-						vectorisedBranchObjectBatchListList[branchIndex1].append(conceptNeuronConnectionTarget.vectorisedBranchObjectList[branchIndex1])			
+	return targetConnectionFound, conceptNeuronBatchIndexFound, conceptNeuronBatchIndex
+
+def createVectorisedBranchActivationBatch(batchNeuronsList):
+	numberOfVerticalBranches = calculateNumberOfVerticalBranches(numberOfBranches1)
+	vectorisedBranchActivationLevelBatchListList = [[] for _ in range(numberOfVerticalBranches)]	#temporary list before being coverted to tensor for parallel processing
+	vectorisedBranchActivationTimeBatchListList = [[] for _ in range(numberOfVerticalBranches)]	#temporary list before being coverted to tensor for parallel processing
+	vectorisedBranchActivationFlagBatchListList = [[] for _ in range(numberOfVerticalBranches)]	#temporary list before being coverted to tensor for parallel processing
+	vectorisedBranchActivationLevelBatchListListBuffer = [[] for _ in range(numberOfVerticalBranches)]	#temporary list before being coverted to tensor for parallel processing
+	vectorisedBranchActivationTimeBatchListListBuffer = [[] for _ in range(numberOfVerticalBranches)]	#temporary list before being coverted to tensor for parallel processing	
+	vectorisedBranchActivationFlagBatchListListBuffer = [[] for _ in range(numberOfVerticalBranches)]	#temporary list before being coverted to tensor for parallel processing	
+	if(recordVectorisedBranchObjectList):
+		vectorisedBranchObjectBatchListList = [[] for _ in range(numberOfVerticalBranches)]	#temporary list before being coverted to tensor for parallel processing
+	vectorisedBranchActivationLevelBatchList = [None for _ in range(numberOfVerticalBranches)]	#[]*(numberOfVerticalBranches)
+	vectorisedBranchActivationTimeBatchList = [None for _ in range(numberOfVerticalBranches)]	#[]*(numberOfVerticalBranches)
+	vectorisedBranchActivationFlagBatchList = [None for _ in range(numberOfVerticalBranches)]	#[]*(numberOfVerticalBranches)
+	vectorisedBranchActivationLevelBatchListBuffer = [None for _ in range(numberOfVerticalBranches)]	#[]*(numberOfVerticalBranches)
+	vectorisedBranchActivationTimeBatchListBuffer = [None for _ in range(numberOfVerticalBranches)]	#[]*(numberOfVerticalBranches)
+	vectorisedBranchActivationFlagBatchListBuffer = [None for _ in range(numberOfVerticalBranches)]	#[]*(numberOfVerticalBranches)
+	if(recordVectorisedBranchObjectList):
+		vectorisedBranchObjectBatchList = [None for _ in range(numberOfVerticalBranches)]	#[]*(numberOfVerticalBranches)
+	else:
+		vectorisedBranchObjectBatchList = None
+
+	for conceptNeuronConnectionTarget in batchNeuronsList:
+		if(not (vectoriseComputationScatterSynapticInputs or vectoriseComputationBufferPool)):
+			vectorisedBranchActivationLevelListBuffer, vectorisedBranchActivationTimeListBuffer, vectorisedBranchActivationFlagListBuffer = getVectorisedBranchActivationBuffer(conceptNeuronConnectionTarget)
+		for branchIndex1 in range(numberOfVerticalBranches):
+			if(not (vectoriseComputationNetworkActivationStore or vectoriseComputationSparseActivationStore)):
+				vectorisedBranchActivationLevelBatchListList[branchIndex1].append(conceptNeuronConnectionTarget.vectorisedBranchActivationLevelList[branchIndex1])
+				vectorisedBranchActivationTimeBatchListList[branchIndex1].append(conceptNeuronConnectionTarget.vectorisedBranchActivationTimeList[branchIndex1])
+				vectorisedBranchActivationFlagBatchListList[branchIndex1].append(conceptNeuronConnectionTarget.vectorisedBranchActivationFlagList[branchIndex1])
+			if(not (vectoriseComputationScatterSynapticInputs or vectoriseComputationBufferPool)):
+				vectorisedBranchActivationLevelBatchListListBuffer[branchIndex1].append(vectorisedBranchActivationLevelListBuffer[branchIndex1])
+				vectorisedBranchActivationTimeBatchListListBuffer[branchIndex1].append(vectorisedBranchActivationTimeListBuffer[branchIndex1])
+				vectorisedBranchActivationFlagBatchListListBuffer[branchIndex1].append(vectorisedBranchActivationFlagListBuffer[branchIndex1])
+			if(recordVectorisedBranchObjectList):
+				vectorisedBranchObjectBatchListList[branchIndex1].append(conceptNeuronConnectionTarget.vectorisedBranchObjectList[branchIndex1])			
 
+	if(vectoriseComputationNetworkActivationStore):
+		vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList = gatherNetworkVectorisedBranchActivationBatch(batchNeuronsList)
+	elif(vectoriseComputationSparseActivationStore):
+		if(vectoriseComputationSparseKernel):
+			vectorisedBranchActivationLevelBatchList = gatherSparseBranchActivationBatch(batchNeuronsList)	#sparse branch activation batch (time/flag are stored in the level list tuples)
+			vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList = (None, None)
+		else:
+			vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList = gatherSparseVectorisedBranchActivationBatch(batchNeuronsList)
+	if(vectoriseComputationScatterSynapticInputs):
+		if(vectoriseComputationSparseKernel):
+			vectorisedBranchActivationLevelBatchListBuffer = gatherSparseSynapticInputBatch(batchNeuronsList)	#sparse branch activation batch (time/flag are stored in the level list tuples)
+			vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer = (None, None)
+		else:
+			vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer = scatterSynapticInputBatch(batchNeuronsList)
+	elif(vectoriseComputationBufferPool):
+		vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer = gatherBufferPoolVectorisedBranchActivationBatch(batchNeuronsList)
 	for branchIndex1 in range(numberOfVerticalBranches):
-		vectorisedBranchActivationLevelBatchList[branchIndex1] = tf.Variable(tf.stack(vectorisedBranchActivationLevelBatchListList[branchIndex1]))
-		vectorisedBranchActivationTimeBatchList[branchIndex1] = tf.Variable(tf.stack(vectorisedBranchActivationTimeBatchListList[branchIndex1]))	
-		vectorisedBranchActivationFlagBatchList[branchIndex1] = tf.Variable(tf.stack(vectorisedBranchActivationFlagBatchListList[branchIndex1]))	
-		vectorisedBranchActivationLevelBatchListBuffer[branchIndex1] = tf.stack(vectorisedBranchActivationLevelBatchListListBuffer[branchIndex1])
-		vectorisedBranchActivationTimeBatchListBuffer[branchIndex1] = tf.stack(vectorisedBranchActivationTimeBatchListListBuffer[branchIndex1])		
-		vectorisedBranchActivationFlagBatchListBuffer[branchIndex1] = tf.stack(vectorisedBranchActivationFlagBatchListListBuffer[branchIndex1])				
+		if(not (vectoriseComputationNetworkActivationStore or vectoriseComputationSparseActivationStore)):
+			vectorisedBranchActivationLevelBatchList[branchIndex1] = tf.Variable(tf.stack(vectorisedBranchActivationLevelBatchListList[branchIndex1]))
+			vectorisedBranchActivationTimeBatchList[branchIndex1] = tf.Variable(tf.stack(vectorisedBranchActivationTimeBatchListList[branchIndex1]))	
+			vectorisedBranchActivationFlagBatchList[branchIndex1] = tf.Variable(tf.stack(vectorisedBranchActivationFlagBatchListList[branchIndex1]))	
+		if(not (vectoriseComputationScatterSynapticInputs or vectoriseComputationBufferPool)):
+			vectorisedBranchActivationLevelBatchListBuffer[branchIndex1] = tf.stack(vectorisedBranchActivationLevelBatchListListBuffer[branchIndex1])
+			vectorisedBranchActivationTimeBatchListBuffer[branchIndex1] = tf.stack(vectorisedBranchActivationTimeBatchListListBuffer[branchIndex1])		
+			vectorisedBranchActivationFlagBatchListBuffer[branchIndex1] = tf.stack(vectorisedBranchActivationFlagBatchListListBuffer[branchIndex1])				
 		#print("vectorisedBranchActivationLevelBatchListListBuffer[branchIndex1] = ", vectorisedBranchActivationLevelBatchListListBuffer[branchIndex1])
 		if(recordVectorisedBranchObjectList):
 			if(not emptyList(vectorisedBranchObjectBatchListList[branchIndex1])):
 				vectorisedBranchObjectBatchList[branchIndex1] = np.stack(vectorisedBranchObjectBatchListList[branchIndex1])
-				#print("vectorisedBranchObjectBatchList[branchIndex1] = ", vectorisedBranchObjectBatchList[branchIndex1])	
-		
-	#if(debugCalculateNeuronActivation):	
-	#	if(wSource==wSourceDebug and wTarget==wTargetDebug):
-	#		for branchIndex1 in range(numberOfVerticalBranches):
-	#			print("\t(wSource==wSourceDebug and wTarget==wTargetDebug): branchIndex1 = ", branchIndex1)
-	#			print("\tvectorisedBranchActivationLevelBatchList[branchIndex1] = ", vectorisedBranchActivationLevelBatchList[branchIndex1])
+				#print("vectorisedBranchObjectBatchList[branchIndex1] = ", vectorisedBranchObjectBatchList[branchIndex1])
+	if(vectoriseComputationSparseKernel and not vectoriseComputationScatterSynapticInputs):
+		vectorisedBranchActivationLevelBatchListBuffer = extractSparseBranchActivationBatch(vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer)	#sparse branch activation batch (time/flag are stored in the level list tuples)
+		vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer = (None, None)
 
-	if(targetConnectionFound):
-		if(conceptNeuronBatchIndexFound or not onlyPropagateIfConceptNeuronTargetActivatedByConceptNeuronSourceVectorised):	#orig optimisation; only execute calculateNeuronActivationParallel if conceptNeuronTarget input(s) are activated by conceptNeuronSource
-			if(calculateNeuronActivationParallel(vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer, vectorisedBranchObjectBatchList, activationTime, wTarget, conceptNeuronTarget, conceptNeuronBatchIndex, batchNeuronsList, wSource, networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList)):
-				somaActivationFound = True
-		else:
-			print("warning !conceptNeuronBatchIndexFound")
-	#else:
-	#	print("warning !targetConnectionFound")
-	
-	#save updated activations (ideally these should be able to be dynamically updated by calculateNeuronActivationParallel; store tensors (memory/reference) in a bulk/stacked tensor, write to the bulk tensor and have the individual tensors updated)
-	for batchIndex, batchNeuron in enumerate(batchNeuronsList):
-		for branchIndex1 in range(numberOfVerticalBranches):
-			#iterating over batchSize to save tensors is slow and may require optimisation
-			batchNeuron.vectorisedBranchActivationLevelList[branchIndex1] = tf.Variable(vectorisedBranchActivationLevelBatchList[branchIndex1][batchIndex])
-			batchNeuron.vectorisedBranchActivationTimeList[branchIndex1] = tf.Variable(vectorisedBranchActivationTimeBatchList[branchIndex1][batchIndex])
-			batchNeuron.vectorisedBranchActivationFlagList[branchIndex1] = tf.Variable(vectorisedBranchActivationFlagBatchList[branchIndex1][batchIndex])
-			
-	for conceptNeuronSource in conceptNeuronSourceList:
-		resetSourceNeuronAfterActivation(conceptNeuronSource)
+	return vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer, vectorisedBranchObjectBatchList
 
-	return somaActivationFound
+def saveVectorisedBranchActivationBatch(batchNeuronsList, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList):
+	numberOfVerticalBranches = calculateNumberOfVerticalBranches(numberOfBranches1)
+	if(vectoriseComputationNetworkActivationStore):
+		scatterNetworkVectorisedBranchActivationBatch(batchNeuronsList, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList)	#write batch rows back to network tensors in place
+	elif(vectoriseComputationSparseKernel):
+		scatterSparseBranchActivationBatch(batchNeuronsList, vectorisedBranchActivationLevelBatchList)	#write active coordinates of sparse branch activation batch back to network sparse store
+	elif(vectoriseComputationSparseActivationStore):
+		scatterSparseVectorisedBranchActivationBatch(batchNeuronsList, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList)	#write active coordinates of batch rows back to network sparse store
+	else:
+		if(resetDendriticTreeActivationIncremental):
+			recordDirtyVectorisedBranchActivationBatch(batchNeuronsList, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList)	#record activated coordinates of batch rows for resetDendriticTreeActivationVectorised
+		for batchIndex, batchNeuron in enumerate(batchNeuronsList):
+			for branchIndex1 in range(numberOfVerticalBranches):
+				#iterating over batchSize to save tensors is slow and may require optimisation
+				batchNeuron.vectorisedBranchActivationLevelList[branchIndex1] = tf.Variable(vectorisedBranchActivationLevelBatchList[branchIndex1][batchIndex])
+				batchNeuron.vectorisedBranchActivationTimeList[branchIndex1] = tf.Variable(vectorisedBranchActivationTimeBatchList[branchIndex1][batchIndex])
+				batchNeuron.vectorisedBranchActivationFlagList[branchIndex1] = tf.Variable(vectorisedBranchActivationFlagBatchList[branchIndex1][batchIndex])
 	
 def emptyList(lst):
 	result = False
@@ -186,6 +290,13 @@ def setVectorisedBranchActivation(conceptNeuronConnectionTarget, connection, act
 	if(vectoriseComputionUseSequentialSegmentInputActivationLevels):
 		currentSequentialSegmentInputIndex = currentSequentialSegmentInput.sequentialSegmentInputIndex
 			
+	if(vectoriseComputationScatterSynapticInputs):
+		pass	#synaptic inputs are recorded and scattered into the batch buffers by createVectorisedBranchActivationBatch
+	elif(vectoriseComputationBufferPool):
+		bufferPoolBatchIndex = getBufferPoolBatchIndex(conceptNeuronConnectionTarget)
+	else:
+		vectorisedBranchActivationLevelListBuffer, vectorisedBranchActivationTimeListBuffer, vectorisedBranchActivationFlagListBuffer = getVectorisedBranchActivationBuffer(conceptNeuronConnectionTarget)
+			
 	activationValue = calculateVectorisedSequentialSegmentInputActivation(connection)
 	#print("activationValue = ", activationValue)
 	#print("activationTime = ", activationTime)
@@ -204,9 +315,14 @@ def setVectorisedBranchActivation(conceptNeuronConnectionTarget, connection, act
 		activationFlags = vectorisedActivationTimeFlagDefault
 		if(currentSequentialSegmentInput.firstInputInSequence):
 			activationFlags = vectorisedActivationTimeFlagFirstInputInSequence
-		conceptNeuronConnectionTarget.vectorisedBranchActivationLevelListBuffer[branchIndex1][horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex, currentSequentialSegmentInputIndex].assign(activationValue)
-		conceptNeuronConnectionTarget.vectorisedBranchActivationTimeListBuffer[branchIndex1][horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex, currentSequentialSegmentInputIndex].assign(activationTime)	#not used (all inputs should have same activation time)
-		conceptNeuronConnectionTarget.vectorisedBranchActivationFlagListBuffer[branchIndex1][horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex, currentSequentialSegmentInputIndex].assign(activationFlags)	
+		if(vectoriseComputationScatterSynapticInputs):
+			recordSynapticInputScatter(conceptNeuronConnectionTarget, branchIndex1, [horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex, currentSequentialSegmentInputIndex], activationValue, activationTime, currentSequentialSegmentInput.firstInputInSequence)
+		elif(vectoriseComputationBufferPool):
+			scatterBufferPoolVectorisedBranchActivation(branchIndex1, [bufferPoolBatchIndex, horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex, currentSequentialSegmentInputIndex], activationValue, activationTime, activationFlags)
+		else:
+			vectorisedBranchActivationLevelListBuffer[branchIndex1][horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex, currentSequentialSegmentInputIndex].assign(activationValue)
+			vectorisedBranchActivationTimeListBuffer[branchIndex1][horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex, currentSequentialSegmentInputIndex].assign(activationTime)	#not used (all inputs should have same activation time)
+			vectorisedBranchActivationFlagListBuffer[branchIndex1][horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex, currentSequentialSegmentInputIndex].assign(activationFlags)	
 	else:
 		if(updateNeuronObjectActivationLevels):
 			if(weightedSequentialSegmentInputs):
@@ -216,21 +332,32 @@ def setVectorisedBranchActivation(conceptNeuronConnectionTarget, connection, act
 			if(drawBiologicalSimulationDynamicHighlightNewActivations):
 				currentSequentialSegmentInput.activationStateNew = True
 			currentSequentialSegmentInput.activationTime = activationTime
+			if(resetDendriticTreeActivationIncremental):
+				recordDendriticBranchActivation(currentBranch)
+		if(vectoriseComputationScatterSynapticInputs):
+			recordSynapticInputScatter(conceptNeuronConnectionTarget, branchIndex1, [horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex], activationValue, activationTime, currentSequentialSegmentInput.firstInputInSequence)	#performSummationOfSequentialSegmentInputs/activationFlags are calculated upon scatter
+			return
 		activationFlags = vectorisedActivationTimeFlagDefault
 		if(performSummationOfSequentialSegmentInputs):
-			summationOfSequentialSegmentInputs = conceptNeuronConnectionTarget.vectorisedBranchActivationLevelListBuffer[branchIndex1][horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex].numpy()
+			if(vectoriseComputationBufferPool):
+				summationOfSequentialSegmentInputs, firstInputInSequenceExisting = getBufferPoolVectorisedBranchActivation(branchIndex1, [bufferPoolBatchIndex, horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex])
+			else:
+				summationOfSequentialSegmentInputs = vectorisedBranchActivationLevelListBuffer[branchIndex1][horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex].numpy()
+				firstInputInSequenceExisting = vectorisedBranchActivationTimeListBuffer[branchIndex1][horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex].numpy()
 			summationOfSequentialSegmentInputs = summationOfSequentialSegmentInputs + activationValue
 			activationValue = summationOfSequentialSegmentInputs
-			firstInputInSequenceExisting = conceptNeuronConnectionTarget.vectorisedBranchActivationTimeListBuffer[branchIndex1][horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex].numpy()
 			if(bool(firstInputInSequenceExisting)):
 				activationFlags = vectorisedActivationTimeFlagFirstInputInSequence
 		if(currentSequentialSegmentInput.firstInputInSequence):
 			activationFlags = vectorisedActivationTimeFlagFirstInputInSequence
 		#if(verifyRepolarised(currentSequentialSegment, activationTime)):	#do not perform this test for buffer (all inputs should have same activation time)
 		#print("activationValue = ", activationValue)
-		conceptNeuronConnectionTarget.vectorisedBranchActivationLevelListBuffer[branchIndex1][horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex].assign(activationValue)
-		conceptNeuronConnectionTarget.vectorisedBranchActivationTimeListBuffer[branchIndex1][horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex].assign(activationTime)	#not used (all inputs should have same activation time)
-		conceptNeuronConnectionTarget.vectorisedBranchActivationFlagListBuffer[branchIndex1][horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex].assign(activationFlags)
+		if(vectoriseComputationBufferPool):
+			scatterBufferPoolVectorisedBranchActivation(branchIndex1, [bufferPoolBatchIndex, horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex], activationValue, activationTime, activationFlags)
+		else:
+			vectorisedBranchActivationLevelListBuffer[branchIndex1][horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex].assign(activationValue)
+			vectorisedBranchActivationTimeListBuffer[branchIndex1][horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex].assign(activationTime)	#not used (all inputs should have same activation time)
+			vectorisedBranchActivationFlagListBuffer[branchIndex1][horizontalBranchIndex, branchIndex2, currentSequentialSegmentIndex].assign(activationFlags)
 
 def calculateVectorisedSequentialSegmentInputActivation(connection):
 	activationValue = calculateInputActivationLevelVectorised(connection)	
@@ -256,12 +383,36 @@ def generateVectorisedSequentialSegmentInputActivationBias(currentSequentialSegm
 
 #parameters only used for drawBiologicalSimulationDynamic: wSource, networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList
 #does not currently support vectoriseComputionUseSequentialSegmentInputActivationLevels;
-def calculateNeuronActivationParallel(vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer, vectorisedBranchObjectBatchList, activationTime, wTarget, conceptNeuronTarget, conceptNeuronBatchIndex, batchNeuronsList, wSource=None, networkConceptNodeDict=None, sentenceIndex=None, sentenceConceptNodeList=None):
+def calculateNeuronActivationParallel(vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer, vectorisedBranchObjectBatchList, activationTime, wTarget, conceptNeuronTarget, conceptNeuronBatchIndex, batchNeuronsList, wSource=None, networkConceptNodeDict=None, sentenceIndex=None, sentenceConceptNodeList=None, somaActivationFoundNeuronSet=None):
 	
 	somaActivationFound = False
 	
 	#print("calculateNeuronActivationParallel:")
+	
+	if(vectoriseComputationSparseKernel):
+		return calculateNeuronActivationSparse(vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationLevelBatchListBuffer, activationTime, wTarget, conceptNeuronTarget, conceptNeuronBatchIndex, batchNeuronsList, somaActivationFoundNeuronSet)	#sparse branch activation batches are stored in the level list arguments
 		
+	if(vectoriseComputationCompiled):
+		vectorisedBranchActivationLevelBatchSequentialSegmentPrevious, vectorisedBranchActivationTimeBatchSequentialSegmentPrevious, vectorisedBranchActivationStateBatchSequentialSegmentFinalNew = calculateNeuronActivationParallelCompiled(vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer, activationTime)
+	else:
+		somaActivationFoundBranches, vectorisedBranchActivationLevelBatchSequentialSegmentPrevious, vectorisedBranchActivationTimeBatchSequentialSegmentPrevious, vectorisedBranchActivationStateBatchSequentialSegmentFinalNew = calculateNeuronActivationParallelBranches(vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer, vectorisedBranchObjectBatchList, activationTime, wTarget, conceptNeuronTarget, conceptNeuronBatchIndex, batchNeuronsList, wSource, networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList, somaActivationFoundNeuronSet)
+		if(somaActivationFoundBranches):
+			somaActivationFound = True
+	
+	if(vectorisedComputationActivateSomaAfterFinishingPropagation):
+		if(calculateNeuronActivationParallelSoma(vectorisedBranchActivationLevelBatchSequentialSegmentPrevious, vectorisedBranchActivationTimeBatchSequentialSegmentPrevious, vectorisedBranchActivationStateBatchSequentialSegmentFinalNew, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchObjectBatchList, activationTime, wTarget, conceptNeuronTarget, conceptNeuronBatchIndex, batchNeuronsList, wSource, networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList, somaActivationFoundNeuronSet)):
+			somaActivationFound = True			
+		
+	#print("somaActivationFound = ", somaActivationFound)
+	
+	HFNLPpy_biologicalSimulationDraw.drawBiologicalSimulationDynamicNeuronActivation(wSource, networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList, activationTime, wTarget=wTarget)
+						
+	return somaActivationFound
+
+def calculateNeuronActivationParallelBranches(vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer, vectorisedBranchObjectBatchList, activationTime, wTarget, conceptNeuronTarget, conceptNeuronBatchIndex, batchNeuronsList, wSource=None, networkConceptNodeDict=None, sentenceIndex=None, sentenceConceptNodeList=None, somaActivationFoundNeuronSet=None):
+	#dendritic tree recurrence; returns soma activation inputs (most proximal sequential segment activations)
+	somaActivationFound = False	#!vectorisedComputationActivateSomaAfterFinishingPropagation
+	
 	#vectorisedBranchActivationLevelBatchList/vectorisedBranchActivationTimeBatchList: list of tensors for every branchIndex1 - each element is of shape [batchSize, numberOfHorizontalBranches, horizontalBranchWidth, numberOfBranchSequentialSegments], each batch sample refers to a unique target concept
 	numberOfVerticalBranches = calculateNumberOfVerticalBranches(numberOfBranches1) 	#len(vectorisedBranchActivationLevelBatchList)
 	
@@ -421,7 +572,10 @@ def calculateNeuronActivationParallel(vectorisedBranchActivationLevelBatchList,
 				deactivatePreviousSequentialSegmentOrSubbranchVectorised(vectorisedBranchActivationStateBatchSequentialSegmentCurrent, branchIndex1, sequentialSegmentIndex, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationLevelBatchSequentialSegmentPrevious, vectorisedBranchActivationTimeBatchSequentialSegmentPrevious)
 																
 			if(updateNeuronObjectActivationLevels):
-				calculateNeuronActivationParallelUpdateNeuronObjects(vectorisedBranchObjectBatch, sequentialSegmentIndex, batchNeuronsList, vectorisedBranchActivationStateBatchSequentialSegmentUpdated, vectorisedBranchActivationLevelBatchSequentialSegmentUpdated, vectorisedBranchActivationTimeBatchSequentialSegmentUpdated, vectorisedBranchActivationStateBatchSequentialSegmentCurrent)
+				if(storeDendriticTreeFlattened):
+					calculateNeuronActivationParallelUpdateFlattenedDendriticTree(branchIndex1, sequentialSegmentIndex, batchNeuronsList, vectorisedBranchActivationStateBatchSequentialSegmentUpdated, vectorisedBranchActivationLevelBatchSequentialSegmentUpdated, vectorisedBranchActivationTimeBatchSequentialSegmentUpdated, vectorisedBranchActivationStateBatchSequentialSegmentCurrent)
+				else:
+					calculateNeuronActivationParallelUpdateNeuronObjects(vectorisedBranchObjectBatch, sequentialSegmentIndex, batchNeuronsList, vectorisedBranchActivationStateBatchSequentialSegmentUpdated, vectorisedBranchActivationLevelBatchSequentialSegmentUpdated, vectorisedBranchActivationTimeBatchSequentialSegmentUpdated, vectorisedBranchActivationStateBatchSequentialSegmentCurrent)
 					
 			if(reversePropagationOrder):
 				vectorisedBranchActivationLevelBatchSequentialSegmentPrevious = vectorisedBranchActivationLevelBatchSequentialSegmentUpdated
@@ -430,7 +584,7 @@ def calculateNeuronActivationParallel(vectorisedBranchActivationLevelBatchList,
 
 			if(not vectorisedComputationActivateSomaAfterFinishingPropagation):
 				if((branchIndex1 == branchIndex1MostProximal) and (sequentialSegmentIndex == sequentialSegmentIndexMostProximal)):
-					if(calculateNeuronActivationParallelSoma(vectorisedBranchActivationLevelBatchSequentialSegmentPrevious, vectorisedBranchActivationTimeBatchSequentialSegmentPrevious, vectorisedBranchActivationStateBatchSequentialSegmentFinalNew, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchObjectBatchList, activationTime, wTarget, conceptNeuronTarget, conceptNeuronBatchIndex, batchNeuronsList, wSource, networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList)):
+					if(calculateNeuronActivationParallelSoma(vectorisedBranchActivationLevelBatchSequentialSegmentPrevious, vectorisedBranchActivationTimeBatchSequentialSegmentPrevious, vectorisedBranchActivationStateBatchSequentialSegmentFinalNew, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchObjectBatchList, activationTime, wTarget, conceptNeuronTarget, conceptNeuronBatchIndex, batchNeuronsList, wSource, networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList, somaActivationFoundNeuronSet)):
 						somaActivationFound = True		
 							
 			HFNLPpy_biologicalSimulationDraw.drawBiologicalSimulationDynamicSequentialSegmentActivation(wSource, networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList, branchIndex1, sequentialSegmentIndex, activationTime, wTarget=wTarget)			
@@ -442,15 +596,162 @@ def calculateNeuronActivationParallel(vectorisedBranchActivationLevelBatchList,
 			#vectorisedBranchActivationLevelBatchSequentialSegmentPrevious will be used by calculateSequentialSegmentsInitialActivationFromHigherBranchParallel to infer effective activation of branch (even if the sequential segment has not been formally activated)
 			#resetConnectionTargetNeuronDendriteAfterSequence:vectorisedBranchActivationStateBatchSequentialSegmentFinalNew not supported (most proximal sequential segment in dendritic tree must be active)
 	
-	if(vectorisedComputationActivateSomaAfterFinishingPropagation):
-		if(calculateNeuronActivationParallelSoma(vectorisedBranchActivationLevelBatchSequentialSegmentPrevious, vectorisedBranchActivationTimeBatchSequentialSegmentPrevious, vectorisedBranchActivationStateBatchSequentialSegmentFinalNew, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchObjectBatchList, activationTime, wTarget, conceptNeuronTarget, conceptNeuronBatchIndex, batchNeuronsList, wSource, networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList)):
-			somaActivationFound = True			
-		
-	#print("somaActivationFound = ", somaActivationFound)
+	return somaActivationFound, vectorisedBranchActivationLevelBatchSequentialSegmentPrevious, vectorisedBranchActivationTimeBatchSequentialSegmentPrevious, vectorisedBranchActivationStateBatchSequentialSegmentFinalNew
+
+def calculateNeuronActivationSparse(sparseBranchActivationBatchList, sparseBranchActivationBatchListBuffer, activationTime, wTarget, conceptNeuronTarget, conceptNeuronBatchIndex, batchNeuronsList, somaActivationFoundNeuronSet=None):
+	#sync with calculateNeuronActivationParallelBranches (vectoriseComputationSparseKernel configuration); only sequential segments with new buffer activations are computed, and subbranch activations are reduced over their parent row keys
+	#sparseBranchActivationBatchList is updated in place
+	numberOfVerticalBranches = calculateNumberOfVerticalBranches(numberOfBranches1)
+	for branchIndex1 in range(numberOfVerticalBranches):
+		keys, levels, times, flags = sparseBranchActivationBatchList[branchIndex1]
+		keysBuffer, levelsBuffer, timesBuffer, flagsBuffer = sparseBranchActivationBatchListBuffer[branchIndex1]
+
+		#new buffer activations (sync with calculateVectorisedBranchActivationNewBatchSequentialSegmentMask);
+		existingIndices, existingFound = lookupSparseBranchActivationBatchKeys(keys, keysBuffer)
+		levelsExisting = gatherSparseBranchActivationBatchValues(levels, existingIndices, existingFound, vectorisedActivationLevelOff)
+		flagsExisting = gatherSparseBranchActivationBatchValues(flags, existingIndices, existingFound, 0)
+		stateExisting = (levelsExisting == vectorisedActivationLevelOn)	#sync with calculateSequentialSegmentActivationStateVectorisedMemory
+		newMask = np.logical_and(calculateSequentialSegmentActivationStateSparseBuffer(levelsBuffer), np.logical_not(stateExisting))
+		keysNew = keysBuffer[newMask]
+		flagsNewBuffer = flagsBuffer[newMask]
+		flagsNewMemory = flagsExisting[newMask]	#current flag is derived from memory, not from buffer
+
+		#initialise sequential segments activation from higher branch;
+		if(branchIndex1 == numberOfVerticalBranches-1):
+			#highest branch in dendritic tree (initialise activation to true)
+			statePrior = np.ones(keysNew.shape[0], dtype=bool)
+			timePrior = np.full(keysNew.shape[0], minimumActivationTime, dtype=np.float32)
+		else:
+			keysPrevious, levelsPrevious, timesPrevious, flagsPrevious = sparseBranchActivationBatchList[branchIndex1+1]
+			numberOfHorizontalBranchesPrevious, horizontalBranchWidthPrevious = calculateNumberOfHorizontalBranches(branchIndex1+1, numberOfBranches2)
+			keysPreviousParent = keysPrevious // horizontalBranchWidthPrevious
+			statePrior, timePrior = calculateSequentialSegmentsInitialActivationFromHigherBranchSparse(keysNew, keysPreviousParent, levelsPrevious, timesPrevious, horizontalBranchWidthPrevious)
+
+		#apply previous subbranch activation level/time tests (note if firstInputInSequence, then sequential segment will still activate);
+		firstInputInSequence = (flagsNewBuffer == vectorisedActivationTimeFlagFirstInputInSequence)
+		stateCurrent = np.logical_or(statePrior, firstInputInSequence)
+		stateCurrent = np.logical_and(stateCurrent, np.logical_or(verifySequentialActivationTimeSparse(activationTime, timePrior), firstInputInSequence))
+		levelsCurrent = stateCurrent.astype(np.float32)
+		timesCurrent = np.where(stateCurrent, activationTime, minimumActivationTime).astype(np.float32)
+		sparseBranchActivationBatchList[branchIndex1] = updateSparseBranchActivationBatch(sparseBranchActivationBatchList[branchIndex1], keysNew, levelsCurrent, timesCurrent, flagsNewMemory)
+
+		if(resetConnectionTargetNeuronDendriteDuringActivation):
+			if(branchIndex1 < numberOfVerticalBranches-1):
+				#sync with deactivatePreviousSequentialSegmentOrSubbranchVectorised; deactivate subbranches of newly activated sequential segments (no change to last activation times)
+				deactivatedMask = np.isin(keysPreviousParent, keysNew[stateCurrent])
+				levelsPrevious = np.where(deactivatedMask, vectorisedActivationLevelOff, levelsPrevious).astype(np.float32)
+				sparseBranchActivationBatchList[branchIndex1+1] = (keysPrevious, levelsPrevious, timesPrevious, flagsPrevious)
+
+	#soma activation (most proximal sequential segment row key = batchIndex);
+	batchSize = len(batchNeuronsList)
+	keysSoma, levelsSoma, timesSoma, flagsSoma = sparseBranchActivationBatchList[branchIndex1MostProximal]
+	vectorisedSomaActivationLevelBatch = np.zeros([batchSize, 1, 1, 1], dtype=np.float32)
+	vectorisedSomaActivationTimeBatch = np.zeros([batchSize, 1, 1, 1], dtype=np.float32)
+	vectorisedSomaActivationLevelBatch[keysSoma, 0, 0, 0] = levelsSoma
+	vectorisedSomaActivationTimeBatch[keysSoma, 0, 0, 0] = timesSoma
+	return calculateNeuronActivationParallelSoma(None, None, None, [tf.constant(vectorisedSomaActivationLevelBatch)], [tf.constant(vectorisedSomaActivationTimeBatch)], None, None, activationTime, wTarget, conceptNeuronTarget, conceptNeuronBatchIndex, batchNeuronsList, somaActivationFoundNeuronSet=somaActivationFoundNeuronSet)
+
+def calculateSequentialSegmentsInitialActivationFromHigherBranchSparse(keys, keysPreviousParent, levelsPrevious, timesPrevious, horizontalBranchWidthPrevious):
+	#sync with calculateSequentialSegmentsInitialActivationFromHigherBranchParallel; segment sum/max of subbranch activations over their parent row keys (absent subbranches have activation level/time 0)
+	parentKeys, parentIndices, numberOfSubbranches = np.unique(keysPreviousParent, return_inverse=True, return_counts=True)
+	parentIndices = parentIndices.reshape(-1)
+	levelsSummed = np.bincount(parentIndices, weights=levelsPrevious, minlength=parentKeys.shape[0])
+	timesMax = np.full(parentKeys.shape[0], -np.inf)
+	np.maximum.at(timesMax, parentIndices, timesPrevious)
+	timesMax = np.where(numberOfSubbranches < horizontalBranchWidthPrevious, np.maximum(timesMax, 0), timesMax)
+	indices, found = lookupSparseBranchActivationBatchKeys(parentKeys, keys)
+	levelsSummedPrior = gatherSparseBranchActivationBatchValues(levelsSummed, indices, found, 0)
+	timePrior = gatherSparseBranchActivationBatchValues(timesMax, indices, found, 0)
+	statePrior = (levelsSummedPrior >= numberOfHorizontalSubBranchesRequiredForActivation)
+	return statePrior, timePrior
+
+def calculateSequentialSegmentActivationStateSparseBuffer(levelsBuffer):
+	#sync with calculateSequentialSegmentActivationStateVectorisedBuffer
+	if(weightedSequentialSegmentInputs):
+		if(performSummationOfSequentialSegmentInputs):
+			stateBuffer = (levelsBuffer >= sequentialSegmentMinActivationLevel)
+		else:
+			stateBuffer = (levelsBuffer > vectorisedActivationLevelOff)
+	else:
+		stateBuffer = (levelsBuffer >= vectorisedActivationLevelOn)
+	return stateBuffer
+
+def verifySequentialActivationTimeSparse(activationTime, timePrior):
+	#sync with verifySequentialActivationTimeVectorised
+	if(algorithmTimingWorkaround1):
+		sequentiality = (activationTime >= timePrior)
+	else:
+		sequentiality = (activationTime > timePrior)
+	if(verifyPropagationTime):
+		propagate = (activationTime <= timePrior + activationPropagationTimeMax)
+	else:
+		propagate = np.ones(timePrior.shape, dtype=bool)
+	return np.logical_and(sequentiality, propagate)
+
+def calculateNeuronActivationParallelCompiled(vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer, activationTime):
+	#execute calculateNeuronActivationParallelBranches as a traced graph on padded batch tensors (vectorisedBranchActivation*BatchList are updated in place)
+	numberOfVerticalBranches = calculateNumberOfVerticalBranches(numberOfBranches1)
+	batchSize = vectorisedBranchActivationLevelBatchList[0].shape[0]
+	batchSizePadded = calculateCompiledBatchSize(batchSize)
+	#compiled kernels are reused by propagation steps of equal batchSizePadded (least recently used batchSizePadded is evicted when vectoriseComputationCompiledKernelCacheSize is exceeded)
+	if(batchSizePadded in compiledNeuronActivationParallelKernelDict):
+		compiledNeuronActivationParallelKernelDict.move_to_end(batchSizePadded)
+	else:
+		if(len(compiledNeuronActivationParallelKernelDict) >= vectoriseComputationCompiledKernelCacheSize):
+			compiledNeuronActivationParallelKernelDict.popitem(last=False)
+		compiledNeuronActivationParallelKernelDict[batchSizePadded] = createNeuronActivationParallelCompiledKernel(vectorisedBranchActivationLevelBatchList, batchSizePadded)
+	compiledKernel, vectorisedBranchActivationLevelBatchListPadded, vectorisedBranchActivationTimeBatchListPadded, vectorisedBranchActivationFlagBatchListPadded = compiledNeuronActivationParallelKernelDict[batchSizePadded]
 	
-	HFNLPpy_biologicalSimulationDraw.drawBiologicalSimulationDynamicNeuronActivation(wSource, networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList, activationTime, wTarget=wTarget)
-						
-	return somaActivationFound
+	vectorisedBranchActivationLevelBatchListBufferPadded = []
+	vectorisedBranchActivationTimeBatchListBufferPadded = []
+	vectorisedBranchActivationFlagBatchListBufferPadded = []
+	for branchIndex1 in range(numberOfVerticalBranches):
+		vectorisedBranchActivationLevelBatchListPadded[branchIndex1].assign(padBatch(vectorisedBranchActivationLevelBatchList[branchIndex1], batchSizePadded))
+		vectorisedBranchActivationTimeBatchListPadded[branchIndex1].assign(padBatch(vectorisedBranchActivationTimeBatchList[branchIndex1], batchSizePadded))
+		vectorisedBranchActivationFlagBatchListPadded[branchIndex1].assign(padBatch(vectorisedBranchActivationFlagBatchList[branchIndex1], batchSizePadded))
+		vectorisedBranchActivationLevelBatchListBufferPadded.append(padBatch(vectorisedBranchActivationLevelBatchListBuffer[branchIndex1], batchSizePadded))
+		vectorisedBranchActivationTimeBatchListBufferPadded.append(padBatch(vectorisedBranchActivationTimeBatchListBuffer[branchIndex1], batchSizePadded))
+		vectorisedBranchActivationFlagBatchListBufferPadded.append(padBatch(vectorisedBranchActivationFlagBatchListBuffer[branchIndex1], batchSizePadded))
+
+	vectorisedBranchActivationLevelBatchSequentialSegmentPrevious, vectorisedBranchActivationTimeBatchSequentialSegmentPrevious, vectorisedBranchActivationStateBatchSequentialSegmentFinalNew = compiledKernel(vectorisedBranchActivationLevelBatchListBufferPadded, vectorisedBranchActivationTimeBatchListBufferPadded, vectorisedBranchActivationFlagBatchListBufferPadded, tf.constant(activationTime, dtype=tf.float32))	#activationTime is a tensor argument (avoid retracing for every activationTime)
+
+	for branchIndex1 in range(numberOfVerticalBranches):
+		vectorisedBranchActivationLevelBatchList[branchIndex1].assign(vectorisedBranchActivationLevelBatchListPadded[branchIndex1][0:batchSize])
+		vectorisedBranchActivationTimeBatchList[branchIndex1].assign(vectorisedBranchActivationTimeBatchListPadded[branchIndex1][0:batchSize])
+		vectorisedBranchActivationFlagBatchList[branchIndex1].assign(vectorisedBranchActivationFlagBatchListPadded[branchIndex1][0:batchSize])
+	if(vectorisedBranchActivationLevelBatchSequentialSegmentPrevious is not None):
+		vectorisedBranchActivationLevelBatchSequentialSegmentPrevious = vectorisedBranchActivationLevelBatchSequentialSegmentPrevious[0:batchSize]
+		vectorisedBranchActivationTimeBatchSequentialSegmentPrevious = vectorisedBranchActivationTimeBatchSequentialSegmentPrevious[0:batchSize]
+	if(vectorisedBranchActivationStateBatchSequentialSegmentFinalNew is not None):
+		vectorisedBranchActivationStateBatchSequentialSegmentFinalNew = vectorisedBranchActivationStateBatchSequentialSegmentFinalNew[0:batchSize]
+	return vectorisedBranchActivationLevelBatchSequentialSegmentPrevious, vectorisedBranchActivationTimeBatchSequentialSegmentPrevious, vectorisedBranchActivationStateBatchSequentialSegmentFinalNew
+
+def createNeuronActivationParallelCompiledKernel(vectorisedBranchActivationLevelBatchList, batchSizePadded):
+	#padded batch tf.Variables are created outside of the traced function (tf.function does not support variable creation on every call)
+	vectorisedBranchActivationLevelBatchListPadded = []
+	vectorisedBranchActivationTimeBatchListPadded = []
+	vectorisedBranchActivationFlagBatchListPadded = []
+	for vectorisedBranchActivationLevelBatch in vectorisedBranchActivationLevelBatchList:
+		batchShapePadded = [batchSizePadded] + list(vectorisedBranchActivationLevelBatch.shape[1:])
+		vectorisedBranchActivationLevelBatchListPadded.append(tf.Variable(tf.zeros(batchShapePadded)))
+		vectorisedBranchActivationTimeBatchListPadded.append(tf.Variable(tf.zeros(batchShapePadded)))
+		vectorisedBranchActivationFlagBatchListPadded.append(tf.Variable(tf.zeros(batchShapePadded)))
+	def calculateNeuronActivationParallelKernel(vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer, activationTime):
+		_, vectorisedBranchActivationLevelBatchSequentialSegmentPrevious, vectorisedBranchActivationTimeBatchSequentialSegmentPrevious, vectorisedBranchActivationStateBatchSequentialSegmentFinalNew = calculateNeuronActivationParallelBranches(vectorisedBranchActivationLevelBatchListPadded, vectorisedBranchActivationTimeBatchListPadded, vectorisedBranchActivationFlagBatchListPadded, vectorisedBranchActivationLevelBatchListBuffer, vectorisedBranchActivationTimeBatchListBuffer, vectorisedBranchActivationFlagBatchListBuffer, None, activationTime, None, None, None, None)
+		return vectorisedBranchActivationLevelBatchSequentialSegmentPrevious, vectorisedBranchActivationTimeBatchSequentialSegmentPrevious, vectorisedBranchActivationStateBatchSequentialSegmentFinalNew
+	compiledKernel = tf.function(calculateNeuronActivationParallelKernel, jit_compile=vectoriseComputationCompiledXLA)
+	return compiledKernel, vectorisedBranchActivationLevelBatchListPadded, vectorisedBranchActivationTimeBatchListPadded, vectorisedBranchActivationFlagBatchListPadded
+
+def calculateCompiledBatchSize(batchSize):
+	batchSizePadded = vectoriseComputationCompiledBatchSizeMin
+	while(batchSizePadded < batchSize):
+		batchSizePadded = batchSizePadded*2
+	return batchSizePadded
+
+def padBatch(vectorisedBranchActivationBatch, batchSizePadded):
+	#pad batch dimension with zeros (padded batch rows are independent of batch rows, and are discarded)
+	batchPaddings = [[0, batchSizePadded-vectorisedBranchActivationBatch.shape[0]]] + [[0, 0]]*(len(vectorisedBranchActivationBatch.shape)-1)
+	return tf.pad(vectorisedBranchActivationBatch, batchPaddings)
 
 def calculateNeuronActivationParallelUpdateNeuronObjects(vectorisedBranchObjectBatch, sequentialSegmentIndex, batchNeuronsList, vectorisedBranchActivationStateBatchSequentialSegmentUpdated, vectorisedBranchActivationLevelBatchSequentialSegmentUpdated, vectorisedBranchActivationTimeBatchSequentialSegmentUpdated, vectorisedBranchActivationStateBatchSequentialSegmentNew):
 	vectorisedBranchObjectBatchSequentialSegment = vectorisedBranchObjectBatch[:, :, :, sequentialSegmentIndex]	#requires recordVectorisedBranchObjectList
@@ -464,6 +765,9 @@ def calculateNeuronActivationParallelUpdateNeuronObjects(vectorisedBranchObjectB
 				activationTimeSeg = vectorisedBranchActivationTimeBatchSequentialSegmentUpdated[batchIndex, horizontalBranchIndex, branchIndex2].numpy()
 				activationStateNew = vectorisedBranchActivationStateBatchSequentialSegmentNew[batchIndex, horizontalBranchIndex, branchIndex2].numpy()
 				sequentialSegment.activationLevel = activationLevel
+				if(resetDendriticTreeActivationIncremental):
+					if(activationLevel or activationState):
+						recordDendriticBranchActivation(sequentialSegment.branch)
 				if(activationStateNew):
 					sequentialSegment.activationTime = activationTimeSeg
 					#print("activate sequential segment: batchNeuron = ", batchNeuron.nodeName, ", branchIndex1 = ", branchIndex1, ", horizontalBranchIndex = ", horizontalBranchIndex, ", branchIndex2 = ", branchIndex2, ", sequentialSegmentIndex = ", sequentialSegmentIndex)
@@ -490,7 +794,50 @@ def calculateNeuronActivationParallelUpdateNeuronObjects(vectorisedBranchObjectB
 				#	print("activate branch: batchNeuron = ", batchNeuron.nodeName, ", branchIndex1 = ", branchIndex1, ", horizontalBranchIndex = ", horizontalBranchIndex, ", branchIndex2 = ", branchIndex2, ", sequentialSegmentIndex = ", sequentialSegmentIndex)
 							
 
-def calculateNeuronActivationParallelSoma(vectorisedBranchActivationLevelBatchSequentialSegmentPrevious, vectorisedBranchActivationTimeBatchSequentialSegmentPrevious, vectorisedBranchActivationStateBatchSequentialSegmentFinalNew, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchObjectBatchList, activationTime, wTarget, conceptNeuronTarget, conceptNeuronBatchIndex, batchNeuronsList, wSource=None, networkConceptNodeDict=None, sentenceIndex=None, sentenceConceptNodeList=None):
+def calculateNeuronActivationParallelUpdateFlattenedDendriticTree(branchIndex1, sequentialSegmentIndex, batchNeuronsList, vectorisedBranchActivationStateBatchSequentialSegmentUpdated, vectorisedBranchActivationLevelBatchSequentialSegmentUpdated, vectorisedBranchActivationTimeBatchSequentialSegmentUpdated, vectorisedBranchActivationStateBatchSequentialSegmentNew):
+	#sync with calculateNeuronActivationParallelUpdateNeuronObjects	#storeDendriticTreeFlattened: branchIndex1 activations of each batch neuron are assigned to its flattened dendritic tree arrays (vectorised layout views); dendritic tree objects are only accessed for new/active sequential segments
+	vectorisedBranchActivationStateBatchSequentialSegmentUpdated = np.asarray(vectorisedBranchActivationStateBatchSequentialSegmentUpdated)
+	vectorisedBranchActivationLevelBatchSequentialSegmentUpdated = np.asarray(vectorisedBranchActivationLevelBatchSequentialSegmentUpdated)
+	vectorisedBranchActivationTimeBatchSequentialSegmentUpdated = np.asarray(vectorisedBranchActivationTimeBatchSequentialSegmentUpdated)
+	vectorisedBranchActivationStateBatchSequentialSegmentNew = np.asarray(vectorisedBranchActivationStateBatchSequentialSegmentNew)
+	for batchIndex, batchNeuron in enumerate(batchNeuronsList):
+		flattenedDendriticTree = getFlattenedDendriticTree(batchNeuron)
+		activationState = vectorisedBranchActivationStateBatchSequentialSegmentUpdated[batchIndex]
+		activationLevel = vectorisedBranchActivationLevelBatchSequentialSegmentUpdated[batchIndex]
+		activationStateNew = vectorisedBranchActivationStateBatchSequentialSegmentNew[batchIndex]
+		getFlattenedDendriticTreeBranchIndex1(flattenedDendriticTree.sequentialSegmentActivationLevel, branchIndex1, True)[:, :, sequentialSegmentIndex] = activationLevel
+		sequentialSegmentActivationTime = getFlattenedDendriticTreeBranchIndex1(flattenedDendriticTree.sequentialSegmentActivationTime, branchIndex1, True)[:, :, sequentialSegmentIndex]
+		sequentialSegmentActivationTime[activationStateNew != 0] = vectorisedBranchActivationTimeBatchSequentialSegmentUpdated[batchIndex][activationStateNew != 0]
+		if(sequentialSegmentIndex == sequentialSegmentIndexMostProximal):
+			#update branch object parameters;
+			if(storeBranchActivationState):
+				getFlattenedDendriticTreeBranchIndex1(flattenedDendriticTree.branchActivationLevel, branchIndex1, False)[:, :] = activationState
+			else:
+				getFlattenedDendriticTreeBranchIndex1(flattenedDendriticTree.branchActivationLevel, branchIndex1, False)[:, :] = activationLevel
+		branchIndexOffset = calculateBranchIndexOffset(branchIndex1)
+		_, horizontalBranchWidth = calculateNumberOfHorizontalBranches(branchIndex1, numberOfBranches2)
+		if(resetDendriticTreeActivationIncremental):
+			for horizontalBranchIndex, branchIndex2 in np.argwhere(np.logical_or(activationLevel != 0, activationState != 0)):
+				recordDendriticBranchActivation(flattenedDendriticTree.branchList[branchIndexOffset + horizontalBranchIndex*horizontalBranchWidth + branchIndex2])
+		for horizontalBranchIndex, branchIndex2 in np.argwhere(activationStateNew != 0):
+			dendriticBranch = flattenedDendriticTree.branchList[branchIndexOffset + horizontalBranchIndex*horizontalBranchWidth + branchIndex2]
+			sequentialSegment = dendriticBranch.sequentialSegments[sequentialSegmentIndex]
+			if(resetConnectionTargetNeuronDendriteDuringActivation):
+				deactivatePreviousSequentialSegmentOrSubbranch(sequentialSegment)
+			if(drawBiologicalSimulationDynamicHighlightNewActivations):
+				sequentialSegment.activationStateNew = True
+			if(overwriteSequentialSegmentsAfterPropagatingSignal):
+				if(not ((branchIndex1 == branchIndex1MostProximal) and (sequentialSegmentIndex == sequentialSegmentIndexMostProximal))):	#never freeze most proximal sequential segment in tree
+					sequentialSegment.frozen = True
+				for subbranch in dendriticBranch.subbranches:
+					previousSequentialSegment = subbranch.sequentialSegments[sequentialSegmentIndexMostProximal]
+					previousSequentialSegment.frozen = False
+		if(drawBiologicalSimulationDynamicHighlightNewActivations):
+			if(sequentialSegmentIndex == sequentialSegmentIndexMostProximal):
+				for horizontalBranchIndex, branchIndex2 in np.ndindex(activationStateNew.shape):
+					flattenedDendriticTree.branchList[branchIndexOffset + horizontalBranchIndex*horizontalBranchWidth + branchIndex2].activationStateNew = bool(activationStateNew[horizontalBranchIndex, branchIndex2])
+
+def calculateNeuronActivationParallelSoma(vectorisedBranchActivationLevelBatchSequentialSegmentPrevious, vectorisedBranchActivationTimeBatchSequentialSegmentPrevious, vectorisedBranchActivationStateBatchSequentialSegmentFinalNew, vectorisedBranchActivationLevelBatchList, vectorisedBranchActivationTimeBatchList, vectorisedBranchActivationFlagBatchList, vectorisedBranchObjectBatchList, activationTime, wTarget, conceptNeuronTarget, conceptNeuronBatchIndex, batchNeuronsList, wSource=None, networkConceptNodeDict=None, sentenceIndex=None, sentenceConceptNodeList=None, somaActivationFoundNeuronSet=None):
 	somaActivationFound = False
 	
 	if(reversePropagationOrder):
@@ -508,7 +855,7 @@ def calculateNeuronActivationParallelSoma(vectorisedBranchActivationLevelBatchSe
 	
 	batchSize = vectorisedBranchActivationLevelBatchSequentialSegmentFinal.shape[0]	#or #batchSize = vectorisedBranchObjectBatchList[0].shape[0]
 	for batchIndex in range(batchSize):
-		if(updateNeuronObjectActivationLevels):
+		if(updateNeuronObjectActivationLevels and recordVectorisedBranchObjectList):
 			vectorisedBranchObjectBatchSequentialSegment = vectorisedBranchObjectBatchList[0][batchIndex, 0, 0, 0]	#branchIndex1Arbitrary = 0	#indexArbitrary = 0	#get any (first) sequential segment object in batchIndex neuron
 			batchNeuron = vectorisedBranchObjectBatchSequentialSegment.conceptNode
 		else:
@@ -521,6 +868,9 @@ def calculateNeuronActivationParallelSoma(vectorisedBranchActivationLevelBatchSe
 		
 		if(applySomaActivation(batchNeuron, conceptNeuronTarget, somaActivationFoundCurrent, deactivateConnectionTargetIfSomaActivationNotFound)):
 			somaActivationFound = True
+		if(somaActivationFoundNeuronSet is not None):	#vectoriseComputationBatchSentences: record soma activations of all batch neurons (multiple conceptNeuronTarget)
+			if(somaActivationFoundCurrent):
+				somaActivationFoundNeuronSet.add(batchNeuron)
 			
 	return somaActivationFound
 			
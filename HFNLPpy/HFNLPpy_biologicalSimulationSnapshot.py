@@ -0,0 +1,401 @@
+"""HFNLPpy_biologicalSimulationSnapshot.py
+
+# Author:
+Richard Bruce Baxter - Copyright (c) 2022 Baxter AI (baxterai.com)
+
+# License:
+MIT License
+
+# Installation:
+see HFNLPpy_main.py
+
+# Usage:
+see HFNLPpy_main.py
+
+# Description:
+HFNLP Biological Simulation Snapshot - save/load trained network (networkConceptNodeDict and dendritic trees) to/from binary file
+
+- snapshot is a numpy npz archive of flat arrays (no pickled objects)
+- concept neurons are referenced by integer node id (index in networkConceptNodeDict insertion order)
+- sequential segments are referenced by integer segment id; dendritic trees are complete numberOfBranches2-ary trees, so branch id = branchIndexOffset(branchIndex1) + horizontalBranchIndex*horizontalBranchWidth + branchIndex2, and segment id = branch id*numberOfBranchSequentialSegments + sequentialSegmentIndex
+- loadNetworkSnapshot generates concept neurons without dendritic trees (deferDendriticTreeAllocation); dendritic trees are only allocated for neurons with snapshot inputs, and inputs/connections are restored in bulk (grouped by target sequential segment; connection store columns are appended directly if useHopfieldConnectionStore); mergeNetworkSnapshot matches inputs/connections one at a time
+- transient activation state (activation levels/times, frozen flags, vectorised tensors) is not stored; it is always reset after each trained sentence
+- mergeNetworkSnapshot merges a snapshot into an existing network (e.g. partial networks of dataset shards): concept neurons are united by name, sequential segment inputs are concatenated per segment, and duplicate synapses (same segment and source neuron) are discarded; if !preventGenerationOfDuplicateConnections, each snapshot synapse is matched with at most one existing synapse of the same segment and source neuron (a segment receives max(existing, snapshot) synapses per source neuron)
+- compareNetworkSnapshots compares two snapshot archives array by array (exact); e.g. networks trained on the same sentences by different propagation engines/backends (HFNLPpy_benchmark:benchmarkPropagationBackendSnapshot)
+
+"""
+
+import numpy as np
+
+from HFNLPpy_hopfieldNodeClass import *
+from HFNLPpy_hopfieldConnectionClass import *
+from HFNLPpy_biologicalSimulationGlobalDefs import *
+from HFNLPpy_biologicalSimulationNode import *
+import HFNLPpy_biologicalSimulationGenerate
+if(useHopfieldConnectionStore):
+	import HFNLPpy_hopfieldConnectionStore
+
+snapshotFormatVersion = 1
+
+printVerbose = False
+
+
+def saveNetworkSnapshot(networkConceptNodeDict, fileName):
+
+	conceptNodeList = list(networkConceptNodeDict.values())
+	numberOfNodes = len(conceptNodeList)
+	conceptNodeIdDict = {}
+	for nodeId, conceptNode in enumerate(conceptNodeList):
+		conceptNodeIdDict[conceptNode.nodeName] = nodeId
+
+	#concept neurons;
+	nodeNameList = []
+	nodeWordVectorList = []
+	nodeGraphTypeList = []
+	nodeActivationTimeList = []
+	nodeWList = []
+	nodeSentenceIndexList = []
+	for conceptNode in conceptNodeList:
+		nodeNameList.append(conceptNode.nodeName)
+		nodeWordVectorList.append(conceptNode.wordVector)
+		nodeGraphTypeList.append(conceptNode.graphNodeType)
+		nodeActivationTimeList.append(conceptNode.activationTime)
+		nodeWList.append(conceptNode.w)
+		nodeSentenceIndexList.append(conceptNode.sentenceIndex)
+	if(numberOfNodes > 0):
+		nodeWordVectorArray = np.stack(nodeWordVectorList).astype(np.float32)
+	else:
+		nodeWordVectorArray = np.zeros((0, 0), dtype=np.float32)
+
+	#sequential segment inputs (synapses); stored in sequentialSegment.inputs insertion order
+	inputIdDict = {}	#key: id(SequentialSegmentInput)
+	inputTargetNodeIdList = []
+	inputSegmentIdList = []
+	inputSourceNodeIdList = []
+	inputFirstInputInSequenceList = []
+	for nodeId, conceptNode in enumerate(conceptNodeList):
+		dendriticBranchList = []
+		if(conceptNode.dendriticTree is not None):	#lazyDendriticTreeAllocation: neurons without synapses do not have a dendritic tree
+			collectDendriticBranches(conceptNode.dendriticTree, dendriticBranchList)
+		for dendriticBranch in dendriticBranchList:
+			for sequentialSegment in dendriticBranch.sequentialSegments:
+				segmentId = calculateSequentialSegmentId(dendriticBranch.branchIndex1, dendriticBranch.horizontalBranchIndex, dendriticBranch.branchIndex2, sequentialSegment.sequentialSegmentIndex)
+				for sequentialSegmentInput in sequentialSegment.inputs.values():
+					inputIdDict[id(sequentialSegmentInput)] = len(inputTargetNodeIdList)
+					inputTargetNodeIdList.append(nodeId)
+					inputSegmentIdList.append(segmentId)
+					inputSourceNodeIdList.append(conceptNodeIdDict[sequentialSegmentInput.nodeSource.nodeName])
+					inputFirstInputInSequenceList.append(sequentialSegmentInput.firstInputInSequence)
+
+	#connections; stored in conceptNode.targetConnectionDict insertion order (preserves propagation order after load)
+	connectionSourceNodeIdList = []
+	connectionTargetNodeIdList = []
+	connectionInputIdList = []
+	connectionWeightList = []
+	connectionActivationTimeList = []
+	connectionSpatioTemporalIndexList = []
+	for nodeId, conceptNode in enumerate(conceptNodeList):
+		for targetConnectionConceptName, connectionList in conceptNode.targetConnectionDict.items():
+			for connection in connectionList:
+				connectionSourceNodeIdList.append(nodeId)
+				connectionTargetNodeIdList.append(conceptNodeIdDict[connection.nodeTarget.nodeName])
+				inputId = -1
+				if(connection.biologicalSimulation):
+					if(connection.nodeTargetSequentialSegmentInput is not None):
+						inputId = inputIdDict[id(connection.nodeTargetSequentialSegmentInput)]
+				connectionInputIdList.append(inputId)
+				connectionWeightList.append(connection.weight)
+				connectionActivationTimeList.append(connection.activationTime)
+				connectionSpatioTemporalIndexList.append(connection.spatioTemporalIndex)
+
+	np.savez(fileName,
+		snapshotFormatVersion=np.array(snapshotFormatVersion),
+		numberOfBranches1=np.array(numberOfBranches1),
+		numberOfBranches2=np.array(numberOfBranches2),
+		numberOfBranchSequentialSegments=np.array(numberOfBranchSequentialSegments),
+		preventGenerationOfDuplicateConnections=np.array(preventGenerationOfDuplicateConnections),
+		nodeName=np.array(nodeNameList, dtype=np.str_),
+		nodeWordVector=nodeWordVectorArray,
+		nodeGraphType=np.array(nodeGraphTypeList, dtype=np.int64),
+		nodeActivationTime=np.array(nodeActivationTimeList, dtype=np.int64),
+		nodeW=np.array(nodeWList, dtype=np.int64),
+		nodeSentenceIndex=np.array(nodeSentenceIndexList, dtype=np.int64),
+		inputTargetNodeId=np.array(inputTargetNodeIdList, dtype=np.int64),
+		inputSegmentId=np.array(inputSegmentIdList, dtype=np.int64),
+		inputSourceNodeId=np.array(inputSourceNodeIdList, dtype=np.int64),
+		inputFirstInputInSequence=np.array(inputFirstInputInSequenceList, dtype=bool),
+		connectionSourceNodeId=np.array(connectionSourceNodeIdList, dtype=np.int64),
+		connectionTargetNodeId=np.array(connectionTargetNodeIdList, dtype=np.int64),
+		connectionInputId=np.array(connectionInputIdList, dtype=np.int64),
+		connectionWeight=np.array(connectionWeightList, dtype=np.float64),
+		connectionActivationTime=np.array(connectionActivationTimeList, dtype=np.int64),
+		connectionSpatioTemporalIndex=np.array(connectionSpatioTemporalIndexList, dtype=np.int64))
+
+	print("saveNetworkSnapshot: numberOfNodes = ", numberOfNodes, ", numberOfInputs = ", len(inputTargetNodeIdList), ", numberOfConnections = ", len(connectionSourceNodeIdList))
+
+def mergeNetworkSnapshot(networkConceptNodeDict, fileName):
+	return loadNetworkSnapshot(networkConceptNodeDict, fileName, mergeNetwork=True)
+
+def loadNetworkSnapshot(networkConceptNodeDict, fileName, mergeNetwork=False):
+
+	snapshot = np.load(fileName, allow_pickle=False)
+	verifySnapshotDendriticStructure(snapshot)
+
+	#convert arrays to lists (python iteration over numpy scalars is slow);
+	nodeNameList = snapshot['nodeName'].tolist()
+	nodeWordVectorArray = snapshot['nodeWordVector']
+	nodeGraphTypeList = snapshot['nodeGraphType'].tolist()
+	nodeActivationTimeList = snapshot['nodeActivationTime'].tolist()
+	nodeWList = snapshot['nodeW'].tolist()
+	nodeSentenceIndexList = snapshot['nodeSentenceIndex'].tolist()
+
+	#concept neurons;
+	conceptNodeList = []
+	numberOfNewNodes = 0
+	for nodeId, nodeName in enumerate(nodeNameList):
+		if(nodeName in networkConceptNodeDict):
+			if(mergeNetwork):
+				conceptNode = networkConceptNodeDict[nodeName]	#concept neuron is united with existing network neuron
+			else:
+				print("loadNetworkSnapshot error: nodeName already in networkConceptNodeDict; ", nodeName)
+				exit()
+		else:
+			networkIndex = len(networkConceptNodeDict)
+			wordVector = nodeWordVectorArray[nodeId]
+			if(useWordVectorTable):
+				wordVector = HFNLPpy_wordVectorTable.addWordVector(wordVector)	#word vector table row index
+			conceptNode = HopfieldNode(networkIndex, nodeName, wordVector, nodeGraphTypeList[nodeId], nodeActivationTimeList[nodeId], True, nodeWList[nodeId], nodeSentenceIndexList[nodeId], deferDendriticTreeAllocation=True)	#dendritic trees are only allocated for neurons with snapshot inputs (inputTargetNodeId)
+			networkConceptNodeDict[nodeName] = conceptNode
+			if(storeConnectionsByConceptNodeId):
+				internConceptNode(conceptNode)
+			numberOfNewNodes += 1
+		conceptNodeList.append(conceptNode)
+
+	if(mergeNetwork):
+		sequentialSegmentInputList, sequentialSegmentInputDuplicateList = mergeSequentialSegmentInputs(snapshot, conceptNodeList)
+		mergeConnections(snapshot, conceptNodeList, sequentialSegmentInputList, sequentialSegmentInputDuplicateList)
+	else:
+		sequentialSegmentInputList, sequentialSegmentInputKeyArray = restoreSequentialSegmentInputs(snapshot, conceptNodeList)
+		restoreConnections(snapshot, conceptNodeList, sequentialSegmentInputList, sequentialSegmentInputKeyArray)
+
+	print("loadNetworkSnapshot: numberOfNodes = ", len(conceptNodeList), ", numberOfInputs = ", len(sequentialSegmentInputList), ", numberOfConnections = ", len(snapshot['connectionSourceNodeId']))
+	if(mergeNetwork):
+		print("mergeNetworkSnapshot: numberOfNewNodes = ", numberOfNewNodes, ", numberOfDuplicateInputs = ", sequentialSegmentInputDuplicateList.count(True))
+
+	return conceptNodeList
+
+def restoreSequentialSegmentInputs(snapshot, conceptNodeList):
+	#bulk restore of snapshot inputs into neurons generated by loadNetworkSnapshot (empty dendritic trees); inputs are grouped by target sequential segment, such that each dendritic tree is allocated and each sequential segment is resolved once
+	#returns sequentialSegmentInputList (index: inputId) and sequentialSegmentInputKeyArray (index: inputId; key in sequentialSegment.inputs if !preventGenerationOfDuplicateConnections, else -1)
+	inputTargetNodeIdArray = snapshot['inputTargetNodeId']
+	inputSegmentIdArray = snapshot['inputSegmentId']
+	inputSourceNodeIdList = snapshot['inputSourceNodeId'].tolist()
+	inputFirstInputInSequenceList = snapshot['inputFirstInputInSequence'].tolist()
+	numberOfInputs = len(inputTargetNodeIdArray)
+	sequentialSegmentInputList = [None]*numberOfInputs
+	sequentialSegmentInputKeyArray = np.full(numberOfInputs, -1, dtype=np.int64)
+
+	inputOrder = np.lexsort((inputSegmentIdArray, inputTargetNodeIdArray))	#stable; preserves sequentialSegment.inputs insertion order
+	segmentStart = np.ones(numberOfInputs, dtype=bool)
+	if(numberOfInputs > 0):
+		segmentStart[1:] = np.logical_or(np.diff(inputTargetNodeIdArray[inputOrder]) != 0, np.diff(inputSegmentIdArray[inputOrder]) != 0)
+	segmentStartIndices = np.flatnonzero(segmentStart)
+	segmentEndIndices = np.append(segmentStartIndices[1:], numberOfInputs)
+	segmentInputIndex = np.arange(numberOfInputs) - np.repeat(segmentStartIndices, segmentEndIndices-segmentStartIndices) + 1	#calculateNewSequentialSegmentInputIndex (inputs of each segment are generated in order)
+	if(not preventGenerationOfDuplicateConnections):
+		sequentialSegmentInputKeyArray[inputOrder] = segmentInputIndex
+
+	inputOrderList = inputOrder.tolist()
+	segmentInputIndexList = segmentInputIndex.tolist()
+	for segmentStartIndex, segmentEndIndex in zip(segmentStartIndices.tolist(), segmentEndIndices.tolist()):
+		firstInputId = inputOrderList[segmentStartIndex]
+		conceptNode = conceptNodeList[int(inputTargetNodeIdArray[firstInputId])]
+		initialiseDendriticTree(conceptNode)
+		sequentialSegment = getSequentialSegmentOfSequentialSegmentId(conceptNode, int(inputSegmentIdArray[firstInputId]))
+		inputs = sequentialSegment.inputs
+		for inputOrderIndex in range(segmentStartIndex, segmentEndIndex):
+			inputId = inputOrderList[inputOrderIndex]
+			sequentialSegmentInputIndex = segmentInputIndexList[inputOrderIndex]
+			nodeSource = conceptNodeList[inputSourceNodeIdList[inputId]]
+			sequentialSegmentInput = SequentialSegmentInput(conceptNode, sequentialSegment, sequentialSegmentInputIndex, nodeSource)
+			sequentialSegmentInput.firstInputInSequence = inputFirstInputInSequenceList[inputId]
+			if(preventGenerationOfDuplicateConnections):
+				inputs[getConnectionKey(nodeSource)] = sequentialSegmentInput
+			else:
+				inputs[sequentialSegmentInputIndex] = sequentialSegmentInput
+				if(indexSequentialSegmentInputsBySourceNode):
+					addSequentialSegmentInputSourceIndex(sequentialSegment, sequentialSegmentInputIndex, nodeSource)
+			sequentialSegmentInputList[inputId] = sequentialSegmentInput
+
+	return sequentialSegmentInputList, sequentialSegmentInputKeyArray
+
+def restoreConnections(snapshot, conceptNodeList, sequentialSegmentInputList, sequentialSegmentInputKeyArray):
+	#bulk restore of snapshot connections (sync with HFNLPpy_hopfieldOperations:addConnectionToNode, biologicalSimulation); saved activationTime/spatioTemporalIndex attributes are restored unchanged
+	connectionSourceNodeIdArray = snapshot['connectionSourceNodeId']
+	connectionTargetNodeIdArray = snapshot['connectionTargetNodeId']
+	connectionInputIdArray = snapshot['connectionInputId']
+	if(useHopfieldConnectionStore):
+		networkIndexArray = np.array([conceptNode.networkIndex for conceptNode in conceptNodeList], dtype=np.int64)
+		connectionHasInput = connectionInputIdArray >= 0
+		connectionSegmentIdArray = np.full(len(connectionInputIdArray), -1, dtype=np.int64)
+		connectionSegmentIdArray[connectionHasInput] = snapshot['inputSegmentId'][connectionInputIdArray[connectionHasInput]]
+		connectionSequentialSegmentInputKeyArray = np.full(len(connectionInputIdArray), -1, dtype=np.int64)
+		connectionSequentialSegmentInputKeyArray[connectionHasInput] = sequentialSegmentInputKeyArray[connectionInputIdArray[connectionHasInput]]
+		HFNLPpy_hopfieldConnectionStore.networkConnectionStore.addConnections(networkIndexArray[connectionSourceNodeIdArray], networkIndexArray[connectionTargetNodeIdArray], connectionSegmentIdArray, connectionSequentialSegmentInputKeyArray, snapshot['connectionWeight'], snapshot['connectionActivationTime'], snapshot['connectionSpatioTemporalIndex'], biologicalSimulation=True)
+	else:
+		connectionKeyList = [getConnectionKey(conceptNode) for conceptNode in conceptNodeList]
+		connectionWeightList = snapshot['connectionWeight'].tolist()
+		connectionActivationTimeList = snapshot['connectionActivationTime'].tolist()
+		connectionSpatioTemporalIndexList = snapshot['connectionSpatioTemporalIndex'].tolist()
+		for connectionIndex, (sourceNodeId, targetNodeId, inputId) in enumerate(zip(connectionSourceNodeIdArray.tolist(), connectionTargetNodeIdArray.tolist(), connectionInputIdArray.tolist())):
+			nodeSource = conceptNodeList[sourceNodeId]
+			nodeTarget = conceptNodeList[targetNodeId]
+			connection = HopfieldConnection(nodeSource, nodeTarget, connectionActivationTimeList[connectionIndex], connectionSpatioTemporalIndexList[connectionIndex], False, True)
+			if(inputId >= 0):
+				connection.nodeTargetSequentialSegmentInput = sequentialSegmentInputList[inputId]
+			connection.weight = connectionWeightList[connectionIndex]
+			nodeTargetConnectionKey = connectionKeyList[targetNodeId]
+			nodeSourceConnectionKey = connectionKeyList[sourceNodeId]
+			if(nodeTargetConnectionKey in nodeSource.targetConnectionDict):
+				nodeSource.targetConnectionDict[nodeTargetConnectionKey].append(connection)
+			else:
+				nodeSource.targetConnectionDict[nodeTargetConnectionKey] = [connection]
+			if(nodeSourceConnectionKey in nodeTarget.sourceConnectionDict):
+				nodeTarget.sourceConnectionDict[nodeSourceConnectionKey].append(connection)
+			else:
+				nodeTarget.sourceConnectionDict[nodeSourceConnectionKey] = [connection]
+
+def mergeSequentialSegmentInputs(snapshot, conceptNodeList):
+	#mergeNetwork: snapshot inputs are matched with existing network inputs one at a time
+	inputTargetNodeIdList = snapshot['inputTargetNodeId'].tolist()
+	inputSegmentIdList = snapshot['inputSegmentId'].tolist()
+	inputSourceNodeIdList = snapshot['inputSourceNodeId'].tolist()
+	inputFirstInputInSequenceList = snapshot['inputFirstInputInSequence'].tolist()
+	dendriticBranchListList = [None]*len(conceptNodeList)	#dendritic branches indexed by branch id, generated on demand
+	sequentialSegmentInputList = []
+	sequentialSegmentInputDuplicateList = []	#input already exists in network (synapse and its connection are not regenerated)
+	sequentialSegmentInputExistingDict = {}	#!preventGenerationOfDuplicateConnections: key: (nodeId, segmentId), value: dict of existing network inputs of segment not yet matched by a snapshot input (key: source connection key, value: list of inputs)
+	for inputId in range(len(inputTargetNodeIdList)):
+		nodeId = inputTargetNodeIdList[inputId]
+		conceptNode = conceptNodeList[nodeId]
+		if(dendriticBranchListList[nodeId] is None):
+			initialiseDendriticTree(conceptNode)
+			dendriticBranchListList[nodeId] = createDendriticBranchIdList(conceptNode)
+		sequentialSegment = getSequentialSegmentById(dendriticBranchListList[nodeId], inputSegmentIdList[inputId])
+		nodeSource = conceptNodeList[inputSourceNodeIdList[inputId]]
+		if(preventGenerationOfDuplicateConnections):
+			foundSequentialSegmentInput, sequentialSegmentInput = findSequentialSegmentInputBySourceNode(sequentialSegment, nodeSource)
+		else:
+			foundSequentialSegmentInput, sequentialSegmentInput = matchExistingSequentialSegmentInput(sequentialSegmentInputExistingDict, (nodeId, inputSegmentIdList[inputId]), sequentialSegment, nodeSource)
+		if(foundSequentialSegmentInput):
+			if(inputFirstInputInSequenceList[inputId]):
+				sequentialSegmentInput.firstInputInSequence = True	#sync with HFNLPpy_biologicalSimulationGenerate:addPredictiveSequenceToNeuron (existing input)
+		else:
+			sequentialSegmentInput = addSequentialSegmentInput(conceptNode, sequentialSegment, nodeSource)
+			sequentialSegmentInput.firstInputInSequence = inputFirstInputInSequenceList[inputId]
+		sequentialSegmentInputList.append(sequentialSegmentInput)
+		sequentialSegmentInputDuplicateList.append(foundSequentialSegmentInput)
+	return sequentialSegmentInputList, sequentialSegmentInputDuplicateList
+
+def mergeConnections(snapshot, conceptNodeList, sequentialSegmentInputList, sequentialSegmentInputDuplicateList):
+	connectionSourceNodeIdList = snapshot['connectionSourceNodeId'].tolist()
+	connectionTargetNodeIdList = snapshot['connectionTargetNodeId'].tolist()
+	connectionInputIdList = snapshot['connectionInputId'].tolist()
+	connectionWeightList = snapshot['connectionWeight'].tolist()
+	connectionActivationTimeList = snapshot['connectionActivationTime'].tolist()
+	connectionSpatioTemporalIndexList = snapshot['connectionSpatioTemporalIndex'].tolist()
+	for connectionIndex in range(len(connectionSourceNodeIdList)):
+		nodeSource = conceptNodeList[connectionSourceNodeIdList[connectionIndex]]
+		nodeTarget = conceptNodeList[connectionTargetNodeIdList[connectionIndex]]
+		inputId = connectionInputIdList[connectionIndex]
+		nodeTargetSequentialSegmentInput = None
+		duplicateConnection = False
+		if(inputId >= 0):
+			nodeTargetSequentialSegmentInput = sequentialSegmentInputList[inputId]
+			duplicateConnection = sequentialSegmentInputDuplicateList[inputId]	#synapse connection already exists in network
+		if(not duplicateConnection):
+			#note addConnectionToNode passes its activationTime/spatioTemporalIndex arguments to HopfieldConnection in swapped order; swap them here such that the saved connection attributes are restored
+			HFNLPpy_biologicalSimulationGenerate.addPredictiveSynapseToNeuron(nodeSource, nodeTarget, connectionSpatioTemporalIndexList[connectionIndex], connectionActivationTimeList[connectionIndex], biologicalPrototype=False, weight=connectionWeightList[connectionIndex], subsequenceConnection=False, contextConnection=False, contextConnectionSANIindex=0, biologicalSimulation=True, nodeTargetSequentialSegmentInput=nodeTargetSequentialSegmentInput)
+
+def matchExistingSequentialSegmentInput(sequentialSegmentInputExistingDict, segmentKey, sequentialSegment, nodeSource):
+	#mergeNetwork (!preventGenerationOfDuplicateConnections): match snapshot input with an unmatched input of the same source neuron that existed in sequentialSegment before the merge
+	if(segmentKey not in sequentialSegmentInputExistingDict):
+		sequentialSegmentInputExistingSourceDict = {}
+		for sequentialSegmentInput in sequentialSegment.inputs.values():	#segment is accessed by the merge for the first time; all inputs existed before the merge
+			sourceConnectionKey = getConnectionKey(sequentialSegmentInput.nodeSource)
+			if(sourceConnectionKey not in sequentialSegmentInputExistingSourceDict):
+				sequentialSegmentInputExistingSourceDict[sourceConnectionKey] = []
+			sequentialSegmentInputExistingSourceDict[sourceConnectionKey].append(sequentialSegmentInput)
+		sequentialSegmentInputExistingDict[segmentKey] = sequentialSegmentInputExistingSourceDict
+	foundSequentialSegmentInput = False
+	sequentialSegmentInput = None
+	sequentialSegmentInputExistingList = sequentialSegmentInputExistingDict[segmentKey].get(getConnectionKey(nodeSource))
+	if(sequentialSegmentInputExistingList):
+		foundSequentialSegmentInput = True
+		sequentialSegmentInput = sequentialSegmentInputExistingList.pop(0)	#in order of generation
+	return foundSequentialSegmentInput, sequentialSegmentInput
+
+def compareNetworkSnapshots(fileName1, fileName2):
+	#returns list of snapshot array names that differ (shape, dtype or values) between the two snapshots; training is deterministic (HFNLPnonrandomSeed), so networks trained on the same sentences with equivalent engines are identical (including synapse/connection order)
+	snapshot1 = np.load(fileName1, allow_pickle=False)
+	snapshot2 = np.load(fileName2, allow_pickle=False)
+	differingArrayNameList = []
+	for arrayName in sorted(set(snapshot1.files).union(snapshot2.files)):
+		if((arrayName not in snapshot1.files) or (arrayName not in snapshot2.files)):
+			differingArrayNameList.append(arrayName)
+		else:
+			array1 = snapshot1[arrayName]
+			array2 = snapshot2[arrayName]
+			if((array1.dtype != array2.dtype) or not np.array_equal(array1, array2, equal_nan=(array1.dtype.kind == 'f'))):	#equal_nan: nodeWordVector of concept neurons without word vectors
+				differingArrayNameList.append(arrayName)
+	return differingArrayNameList
+
+def verifySnapshotDendriticStructure(snapshot):
+	if(int(snapshot['snapshotFormatVersion']) != snapshotFormatVersion):
+		print("verifySnapshotDendriticStructure error: snapshotFormatVersion not supported; ", int(snapshot['snapshotFormatVersion']))
+		exit()
+	if((int(snapshot['numberOfBranches1']) != numberOfBranches1) or (int(snapshot['numberOfBranches2']) != numberOfBranches2) or (int(snapshot['numberOfBranchSequentialSegments']) != numberOfBranchSequentialSegments)):
+		print("verifySnapshotDendriticStructure error: snapshot dendritic structure (numberOfBranches1/numberOfBranches2/numberOfBranchSequentialSegments) does not match current configuration")
+		exit()
+	if(bool(snapshot['preventGenerationOfDuplicateConnections']) != preventGenerationOfDuplicateConnections):
+		print("verifySnapshotDendriticStructure error: snapshot preventGenerationOfDuplicateConnections does not match current configuration (sequentialSegment.inputs key type)")
+		exit()
+
+def addSequentialSegmentInput(conceptNode, sequentialSegment, nodeSource):
+	#sync with HFNLPpy_biologicalSimulationGenerate:addPredictiveSequenceToNeuron
+	newSequentialSegmentSegmentInputIndex = HFNLPpy_biologicalSimulationGenerate.calculateNewSequentialSegmentInputIndex(sequentialSegment)
+	sequentialSegmentInput = SequentialSegmentInput(conceptNode, sequentialSegment, newSequentialSegmentSegmentInputIndex, nodeSource)
+	if(preventGenerationOfDuplicateConnections):
+		sequentialSegment.inputs[getConnectionKey(nodeSource)] = sequentialSegmentInput
+	else:
+		sequentialSegment.inputs[newSequentialSegmentSegmentInputIndex] = sequentialSegmentInput
+		if(indexSequentialSegmentInputsBySourceNode):
+			addSequentialSegmentInputSourceIndex(sequentialSegment, newSequentialSegmentSegmentInputIndex, nodeSource)
+	return sequentialSegmentInput
+
+
+#dendritic branch/sequential segment ids;
+
+def collectDendriticBranches(currentBranch, dendriticBranchList):
+	dendriticBranchList.append(currentBranch)
+	for subbranch in currentBranch.subbranches:
+		collectDendriticBranches(subbranch, dendriticBranchList)
+
+def createDendriticBranchIdList(conceptNode):
+	if(storeDendriticTreeFlattened):
+		dendriticBranchIdList = getFlattenedDendriticTree(conceptNode).branchList	#dendritic tree objects are stored in heap order
+	else:
+		dendriticBranchList = []
+		collectDendriticBranches(conceptNode.dendriticTree, dendriticBranchList)
+		dendriticBranchIdList = [None]*calculateNumberOfBranches()
+		for dendriticBranch in dendriticBranchList:
+			branchId = calculateBranchId(dendriticBranch.branchIndex1, dendriticBranch.horizontalBranchIndex, dendriticBranch.branchIndex2)
+			dendriticBranchIdList[branchId] = dendriticBranch
+	return dendriticBranchIdList
+
+def getSequentialSegmentById(dendriticBranchIdList, segmentId):
+	branchId = segmentId // numberOfBranchSequentialSegments
+	sequentialSegmentIndex = segmentId % numberOfBranchSequentialSegments
+	sequentialSegment = dendriticBranchIdList[branchId].sequentialSegments[sequentialSegmentIndex]
+	return sequentialSegment
+
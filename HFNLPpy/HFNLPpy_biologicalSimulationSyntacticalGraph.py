@@ -100,7 +100,7 @@ def simulateBiologicalHFnetworkSequenceSyntacticalBranchDPAdd(networkConceptNode
 	conceptNode = sentenceConceptNodeList[w]
 	currentBranchIndex1 = 0
 	if(biologicalSimulationEncodeSyntaxInDendriticBranchStructureDirect):
-		addPredictiveSequenceToNeuronSyntacticalBranchDP(conceptNode, sentenceIndex, sentenceConceptNodeList, DPbranchHeadNode, conceptNode.dendriticTree, currentBranchIndex1)		
+		addPredictiveSequenceToNeuronSyntacticalBranchDP(conceptNode, sentenceIndex, sentenceConceptNodeList, DPbranchHeadNode, initialiseDendriticTree(conceptNode), currentBranchIndex1)		
 	else:	
 		contextConceptNodesListLocal = []	
 		if(biologicalSimulationEncodeSyntaxInDendriticBranchStructureLinearHierarchical):
@@ -112,7 +112,7 @@ def simulateBiologicalHFnetworkSequenceSyntacticalBranchDPAdd(networkConceptNode
 		expectFurtherSubbranches = True
 		if(dendriticBranchMaxW == 0):
 			expectFurtherSubbranches = False
-		HFNLPpy_biologicalSimulationGenerate.addPredictiveSequenceToNeuron(conceptNode, sentenceIndex, contextConceptNodesListLocal, conceptNode.dendriticTree, predictiveSequenceLength, dendriticBranchMaxW, currentBranchIndex1, 0, expectFurtherSubbranches)
+		HFNLPpy_biologicalSimulationGenerate.addPredictiveSequenceToNeuron(conceptNode, sentenceIndex, contextConceptNodesListLocal, initialiseDendriticTree(conceptNode), predictiveSequenceLength, dendriticBranchMaxW, currentBranchIndex1, 0, expectFurtherSubbranches)
 
 	if(debugDrawAfterAddPredictiveSequence):
 		HFNLPpy_biologicalSimulationDraw.drawBiologicalSimulationStatic(networkConceptNodeDict, sentenceIndex, sentenceConceptNodeList)	#draw for debugging
@@ -180,9 +180,11 @@ def addPredictiveSequenceToNeuronSyntacticalBranchDP(conceptNeuron, sentenceInde
 				currentSequentialSegmentInput = SequentialSegmentInput(conceptNeuron, currentSequentialSegment, newSequentialSegmentSegmentInputIndex, previousContextConceptNode)
 				#currentSequentialSegment.inputs.append(currentSequentialSegmentInput)
 				if(preventGenerationOfDuplicateConnections):
-					currentSequentialSegment.inputs[previousContextConceptNode.nodeName] = currentSequentialSegmentInput			
+					currentSequentialSegment.inputs[getConnectionKey(previousContextConceptNode)] = currentSequentialSegmentInput			
 				else:
 					currentSequentialSegment.inputs[newSequentialSegmentSegmentInputIndex] = currentSequentialSegmentInput
+					if(indexSequentialSegmentInputsBySourceNode):
+						addSequentialSegmentInputSourceIndex(currentSequentialSegment, newSequentialSegmentSegmentInputIndex, previousContextConceptNode)
 				HFNLPpy_biologicalSimulationGenerate.addPredictiveSynapseToNeuron(previousContextConceptNode, conceptNeuron, activationTime, spatioTemporalIndex, biologicalPrototype=False, weight=weight, subsequenceConnection=False, contextConnection=False, contextConnectionSANIindex=0, biologicalSimulation=True, nodeTargetSequentialSegmentInput=currentSequentialSegmentInput)
 			else:
 				currentSequentialSegmentInput = existingSequentialSegmentInput
@@ -327,9 +329,11 @@ def addPredictiveSequenceToNeuronSyntacticalBranchCP(conceptNeuron, sentenceInde
 				currentSequentialSegmentInput = SequentialSegmentInput(conceptNeuron, currentSequentialSegment, newSequentialSegmentSegmentInputIndex, previousContextConceptNode)
 				#currentSequentialSegment.inputs.append(currentSequentialSegmentInput)
 				if(preventGenerationOfDuplicateConnections):
-					currentSequentialSegment.inputs[previousContextConceptNode.nodeName] = currentSequentialSegmentInput			
+					currentSequentialSegment.inputs[getConnectionKey(previousContextConceptNode)] = currentSequentialSegmentInput			
 				else:
 					currentSequentialSegment.inputs[newSequentialSegmentSegmentInputIndex] = currentSequentialSegmentInput
+					if(indexSequentialSegmentInputsBySourceNode):
+						addSequentialSegmentInputSourceIndex(currentSequentialSegment, newSequentialSegmentSegmentInputIndex, previousContextConceptNode)
 				HFNLPpy_biologicalSimulationGenerate.addPredictiveSynapseToNeuron(previousContextConceptNode, conceptNeuron, activationTime, spatioTemporalIndex, biologicalPrototype=False, weight=weight, subsequenceConnection=False, contextConnection=False, contextConnectionSANIindex=0, biologicalSimulation=True, nodeTargetSequentialSegmentInput=currentSequentialSegmentInput)
 			else:
 				currentSequentialSegmentInput = existingSequentialSegmentInput
@@ -0,0 +1,195 @@
+"""HFNLPpy_biologicalSimulationVectorisedNumpy.py
+
+# Author:
+Richard Bruce Baxter - Copyright (c) 2022 Baxter AI (baxterai.com)
+
+# License:
+MIT License
+
+# Installation:
+see HFNLPpy_main.py
+
+# Usage:
+see HFNLPpy_main.py
+
+# Description:
+HFNLP Biological Simulation Vectorised NumPy - NumPy backend for vectorised computation (vectoriseComputationNumpy)
+
+implements the subset of the TensorFlow API used by HFNLPpy_biologicalSimulationPropagateVectorised/HFNLPpy_biologicalSimulationNode on NumPy arrays (imported as tf by HFNLPpy_biologicalSimulationGlobalDefs);
+the vectorised dendritic tree tensors are small, so TensorFlow eager per operation dispatch overhead exceeds their computation time;
+tensors and variables are Tensor arrays (numpy.ndarray with tf.Tensor/tf.Variable methods); variables are updated in place
+
+"""
+
+import builtins
+import numpy as np
+
+float32 = np.float32
+int32 = np.int32
+int64 = np.int64
+bool = np.bool_
+
+
+class Tensor(np.ndarray):
+	#tf.Tensor/tf.Variable equivalent;
+	#indexing returns a copy (tf.Tensor slice semantics) that retains a reference to the indexed tensor (parent), such that tf.Variable sliced assignment (variable[index].assign(value)) updates the parent in place
+
+	def __array_finalize__(self, obj):
+		self.parent = None
+		self.parentIndex = None
+
+	def __getitem__(self, index):
+		tensorSlice = np.array(np.asarray(self)[index]).view(Tensor)
+		tensorSlice.parent = self
+		tensorSlice.parentIndex = index
+		return tensorSlice
+
+	def numpy(self):
+		return np.array(self)[()]	#0-d tensors are returned as numpy scalars
+
+	def assign(self, value):
+		#numpy.ndarray views (np.asarray) are indexed, as ndarray subclass item assignment is implemented with the subclass __getitem__
+		if(self.parent is None):
+			np.asarray(self)[...] = value
+		else:
+			np.asarray(self.parent)[self.parentIndex] = value
+			if(self.parent.parent is not None):
+				self.parent.assign(np.asarray(self.parent))	#propagate sliced assignment to parent of parent
+		return self
+
+	def scatter_nd_update(self, indices, updates):
+		np.asarray(self)[calculateScatterIndices(indices)] = updates
+		return self
+
+
+def convertToTensor(value, dtype=None):
+	#equivalent to tf.convert_to_tensor (copy); python floats/ints are converted to float32/int32
+	if(dtype is not None):
+		tensor = np.array(value, dtype=dtype)
+	elif(isinstance(value, np.ndarray)):
+		tensor = np.array(value)
+	else:
+		tensor = np.array(value)
+		if(tensor.dtype == np.float64):
+			tensor = tensor.astype(np.float32)
+		elif(tensor.dtype == np.int64):
+			tensor = tensor.astype(np.int32)
+	return tensor.view(Tensor)
+
+def asTensor(value):
+	return np.asarray(value).view(Tensor)
+
+def calculateScatterIndices(indices):
+	#indices: [numberOfUpdates, indexDepth] -> tuple of index arrays (one per indexed dimension)
+	indices = np.asarray(indices)
+	return tuple(indices[..., indexDimension] for indexDimension in builtins.range(indices.shape[-1]))
+
+
+#tf.Variable/tf.constant;
+
+def Variable(initialValue):
+	return convertToTensor(initialValue)
+
+def constant(value, dtype=None, shape=None):
+	tensor = convertToTensor(value, dtype)
+	if(shape is not None):
+		tensor = tensor.reshape(shape)
+	return tensor
+
+def cast(x, dtype):
+	return asTensor(np.asarray(x).astype(dtype))
+
+
+#tensor generation;
+
+def zeros(shape, dtype=np.float32):
+	return asTensor(np.zeros(shape, dtype=dtype))
+
+def ones(shape, dtype=np.float32):
+	return asTensor(np.ones(shape, dtype=dtype))
+
+def range(start, limit=None, delta=1):
+	if(limit is None):
+		start, limit = (0, start)
+	return asTensor(np.arange(start, limit, delta, dtype=np.int32))
+
+
+#elementwise operations;
+
+def add(x, y):
+	return asTensor(np.add(x, y))
+
+def multiply(x, y):
+	return asTensor(np.multiply(x, y))
+
+def equal(x, y):
+	return asTensor(np.equal(x, y))
+
+def greater(x, y):
+	return asTensor(np.greater(x, y))
+
+def greater_equal(x, y):
+	return asTensor(np.greater_equal(x, y))
+
+def less_equal(x, y):
+	return asTensor(np.less_equal(x, y))
+
+def logical_and(x, y):
+	return asTensor(np.logical_and(x, y))
+
+def logical_or(x, y):
+	return asTensor(np.logical_or(x, y))
+
+def logical_not(x):
+	return asTensor(np.logical_not(x))
+
+def where(condition, x=None, y=None):
+	return asTensor(np.where(condition, convertToTensor(x), convertToTensor(y)))
+
+
+#reductions;
+
+def reduce_sum(inputTensor, axis=None):
+	return asTensor(np.sum(inputTensor, axis=axis))
+
+def reduce_max(inputTensor, axis=None):
+	return asTensor(np.max(inputTensor, axis=axis))
+
+
+#shape operations;
+
+def stack(values, axis=0):
+	if(len(values) == 0):
+		return zeros([0])	#equivalent to tf.stack([])
+	return asTensor(np.stack([np.asarray(value) for value in values], axis=axis))
+
+def concat(values, axis):
+	return asTensor(np.concatenate([np.asarray(value) for value in values], axis=axis))
+
+def reshape(tensor, shape):
+	return asTensor(np.reshape(np.asarray(tensor), shape))
+
+def squeeze(inputTensor, axis=None):
+	if(isinstance(axis, list)):
+		axis = tuple(axis)
+	return asTensor(np.squeeze(np.asarray(inputTensor), axis=axis))
+
+def expand_dims(inputTensor, axis):
+	return asTensor(np.expand_dims(np.asarray(inputTensor), axis))
+
+def tile(inputTensor, multiples):
+	return asTensor(np.tile(np.asarray(inputTensor), multiples))
+
+
+#gather/scatter;
+
+def gather(params, indices, axis=0):
+	return asTensor(np.take(np.asarray(params), np.asarray(indices), axis=axis))
+
+def gather_nd(params, indices):
+	return asTensor(np.asarray(params)[calculateScatterIndices(indices)])
+
+def tensor_scatter_nd_update(tensor, indices, updates):
+	tensorUpdated = np.array(tensor)
+	tensorUpdated[calculateScatterIndices(indices)] = updates
+	return asTensor(tensorUpdated)
@@ -65,9 +65,10 @@ def writeHopfieldGraphNode(doc, tag, text, line, conceptNode, drawGraphNetwork,
 		with tag('connections'):
 			writeHopfieldGraphNodeConnections(doc, tag, text, line, conceptNode, drawGraphNetwork, activationTime, sentenceConceptNodeList)
 		with tag('dendriticTree'):
-			currentBranchIndex1 = 0
-			currentBranchIndex2 = 0
-			writeHopfieldGraphNodeDendriticBranch(doc, tag, text, line, conceptNode, conceptNode.dendriticTree, currentBranchIndex1, currentBranchIndex2, activationTime)
+			if(conceptNode.dendriticTree is not None):	#lazyDendriticTreeAllocation: neurons without synapses do not have a dendritic tree
+				currentBranchIndex1 = 0
+				currentBranchIndex2 = 0
+				writeHopfieldGraphNodeDendriticBranch(doc, tag, text, line, conceptNode, conceptNode.dendriticTree, currentBranchIndex1, currentBranchIndex2, activationTime)
 
 def writeHopfieldGraphNodeDendriticBranch(doc, tag, text, line, conceptNode, dendriticBranch, currentBranchIndex1, currentBranchIndex2, activationTime):
 	#print("writeHopfieldGraphNodeDendriticBranch: , dendriticBranch.nodeName = ", dendriticBranch.nodeName, ", currentBranchIndex1 = ", currentBranchIndex1)
@@ -21,7 +21,13 @@ import numpy as np
 
 objectTypeConnection = 5
 
+useHopfieldConnectionStore = False	#store connections in columnar numpy arrays (HFNLPpy_hopfieldConnectionStore) rather than HopfieldConnection objects	#reduces memory usage of large networks
+storeConnectionsByConceptNodeId = False	#key connection dicts (targetConnectionDict/sourceConnectionDict/sequentialSegment.inputs) by interned integer concept node id (networkIndex) rather than nodeName	#avoids string hashing in connection lookup path (lookup path is a negligible fraction of addConnectionTargetNeuronsToBatch time at 500k vocabulary size; see HFNLPpy_benchmark:benchmarkConceptNodeLookup)
+useCompactObjectModel = False	#define HopfieldNode/HopfieldConnection/DendriticBranch/SequentialSegment/SequentialSegmentInput with __slots__ (no per instance __dict__); dendritic object names are only generated for draw/xml	#reduces memory usage of large networks
+
 class HopfieldConnection:
+	if(useCompactObjectModel):
+		__slots__ = ('nodeSource', 'nodeTarget', 'activationTime', 'activationLevel', 'spatioTemporalIndex', 'biologicalPrototype', 'weight', 'contextConnection', 'contextConnectionSANIindex', 'biologicalSimulation', 'nodeTargetSequentialSegmentInput', 'objectType')
 	def __init__(self, nodeSource, nodeTarget, activationTime, spatioTemporalIndex, biologicalPrototype, biologicalSimulation):
 		#primary vars;
 		self.nodeSource = nodeSource
@@ -44,3 +50,10 @@ class HopfieldConnection:
 			self.nodeTargetSequentialSegmentInput = None
 			self.weight = 1.0	#for weightedSequentialSegmentInputs only
 			self.objectType = objectTypeConnection
+
+def getConnectionKey(conceptNode):
+	if(storeConnectionsByConceptNodeId):
+		connectionKey = conceptNode.networkIndex
+	else:
+		connectionKey = conceptNode.nodeName
+	return connectionKey
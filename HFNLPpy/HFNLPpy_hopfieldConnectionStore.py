@@ -0,0 +1,425 @@
+"""HFNLPpy_hopfieldConnectionStore.py
+
+# Author:
+Richard Bruce Baxter - Copyright (c) 2022 Baxter AI (baxterai.com)
+
+# License:
+MIT License
+
+# Installation:
+see HFNLPpy_main.py
+
+# Usage:
+see HFNLPpy_main.py
+
+# Description:
+HFNLP Hopfield Connection Store - columnar (array backed) synapse store
+
+- replaces per connection HopfieldConnection objects and their targetConnectionDict/sourceConnectionDict list entries with growable COO numpy columns (sourceId, targetId, segmentId, weight, activationLevel, activationTime, ...)
+- concept neurons are referenced by networkIndex (dense integer id)
+- connections reference their target sequential segment input by column (segmentId, sequentialSegmentInputKey); the SequentialSegmentInput object is resolved from the target neuron dendritic tree on access (no per connection object references)
+- per node connection lookup uses a CSR index (sorted by key node, first insertion of value node, connection index) rebuilt lazily; connections added since the last rebuild are kept in a small per node tail
+- HopfieldConnectionDictView keys are nodeName (or concept node id if storeConnectionsByConceptNodeId)
+- HopfieldConnectionDictView/HopfieldConnectionView expose the dict-of-list/HopfieldConnection iteration API used by the propagation algorithms (items/keys/__contains__/__getitem__/__bool__; connection attributes), such that they run unchanged over the store
+- the connection lists (HopfieldConnectionView objects) of recently accessed nodes are cached (bounded by connectionStoreLookupCacheSize nodes), and invalidated when a connection is added to the node
+
+"""
+
+import numpy as np
+
+from HFNLPpy_biologicalSimulationGlobalDefs import preventGenerationOfDuplicateConnections
+from HFNLPpy_biologicalSimulationNode import calculateSequentialSegmentIdOfObject, getSequentialSegmentOfSequentialSegmentId
+from HFNLPpy_hopfieldConnectionClass import storeConnectionsByConceptNodeId, getConnectionKey
+
+connectionStoreInitialCapacity = 1024
+connectionStoreIndexRebuildFraction = 0.125	#rebuild CSR index once number of unindexed (tail) connections exceeds this fraction of indexed connections
+connectionStoreLookupCacheSize = 4096	#maximum number of nodes with cached connection lists (bounds python object overhead)
+
+objectTypeConnection = 5	#sync with HFNLPpy_hopfieldConnectionClass
+
+
+class HopfieldConnectionStore:
+	def __init__(self):
+		self.conceptNodeList = []	#index: networkIndex
+		self.conceptNodeIdDict = {}	#key: nodeName, value: networkIndex
+		self.numberOfConnections = 0
+		self.capacity = 0
+		#connection columns;
+		self.sourceId = None
+		self.targetId = None
+		self.segmentId = None	#-1: no nodeTargetSequentialSegmentInput
+		self.sequentialSegmentInputKey = None	#key of nodeTargetSequentialSegmentInput in sequentialSegment.inputs (-1: keyed by connection key of source node; preventGenerationOfDuplicateConnections)
+		self.weight = None
+		self.activationLevel = None
+		self.activationTime = None
+		self.spatioTemporalIndex = None
+		self.biologicalPrototype = None
+		self.biologicalSimulation = None
+		self.contextConnection = None
+		self.contextConnectionSANIindex = None
+		self.allocateColumns(connectionStoreInitialCapacity)
+		#indices;
+		self.targetConnectionIndex = ConnectionStoreIndex(self, True)	#key: sourceId, value: targetId
+		self.sourceConnectionIndex = ConnectionStoreIndex(self, False)	#key: targetId, value: sourceId
+
+	def allocateColumns(self, capacity):
+		self.sourceId = resizeColumn(self.sourceId, capacity, np.int32)
+		self.targetId = resizeColumn(self.targetId, capacity, np.int32)
+		self.segmentId = resizeColumn(self.segmentId, capacity, np.int32)
+		self.sequentialSegmentInputKey = resizeColumn(self.sequentialSegmentInputKey, capacity, np.int32)
+		self.weight = resizeColumn(self.weight, capacity, np.float32)
+		self.activationLevel = resizeColumn(self.activationLevel, capacity, bool)
+		self.activationTime = resizeColumn(self.activationTime, capacity, np.int32)
+		self.spatioTemporalIndex = resizeColumn(self.spatioTemporalIndex, capacity, np.int32)
+		self.biologicalPrototype = resizeColumn(self.biologicalPrototype, capacity, bool)
+		self.biologicalSimulation = resizeColumn(self.biologicalSimulation, capacity, bool)
+		self.contextConnection = resizeColumn(self.contextConnection, capacity, bool)
+		self.contextConnectionSANIindex = resizeColumn(self.contextConnectionSANIindex, capacity, np.int32)
+		self.capacity = capacity
+
+	def registerConceptNode(self, conceptNode):
+		networkIndex = conceptNode.networkIndex
+		if(networkIndex >= len(self.conceptNodeList)):
+			self.conceptNodeList.extend([None]*(networkIndex+1-len(self.conceptNodeList)))
+		self.conceptNodeList[networkIndex] = conceptNode
+		self.conceptNodeIdDict[conceptNode.nodeName] = networkIndex
+
+	def addConnection(self, nodeSource, nodeTarget, activationTime, spatioTemporalIndex, biologicalPrototype, weight, contextConnection, contextConnectionSANIindex, biologicalSimulation, nodeTargetSequentialSegmentInput):
+		if(self.numberOfConnections == self.capacity):
+			self.allocateColumns(self.capacity*2)
+		connectionIndex = self.numberOfConnections
+		segmentId = -1
+		sequentialSegmentInputKey = -1
+		if(nodeTargetSequentialSegmentInput is not None):
+			segmentId = calculateSequentialSegmentIdOfObject(nodeTargetSequentialSegmentInput.sequentialSegment)
+			sequentialSegmentInputKey = calculateSequentialSegmentInputKey(nodeTargetSequentialSegmentInput)
+		self.sourceId[connectionIndex] = nodeSource.networkIndex
+		self.targetId[connectionIndex] = nodeTarget.networkIndex
+		self.segmentId[connectionIndex] = segmentId
+		self.sequentialSegmentInputKey[connectionIndex] = sequentialSegmentInputKey
+		self.weight[connectionIndex] = weight
+		self.activationLevel[connectionIndex] = False
+		self.activationTime[connectionIndex] = activationTime
+		self.spatioTemporalIndex[connectionIndex] = spatioTemporalIndex
+		self.biologicalPrototype[connectionIndex] = biologicalPrototype
+		self.biologicalSimulation[connectionIndex] = biologicalSimulation
+		self.contextConnection[connectionIndex] = contextConnection
+		self.contextConnectionSANIindex[connectionIndex] = contextConnectionSANIindex
+		self.numberOfConnections += 1
+		self.targetConnectionIndex.addConnection(nodeSource.networkIndex, connectionIndex)
+		self.sourceConnectionIndex.addConnection(nodeTarget.networkIndex, connectionIndex)
+		return HopfieldConnectionView(self, connectionIndex)
+
+	def addConnections(self, sourceIdArray, targetIdArray, segmentIdArray, sequentialSegmentInputKeyArray, weightArray, activationTimeArray, spatioTemporalIndexArray, biologicalSimulation):
+		#bulk addConnection (e.g. HFNLPpy_biologicalSimulationSnapshot:restoreConnections); connection columns are appended and the CSR indices are rebuilt once
+		numberOfNewConnections = len(sourceIdArray)
+		connectionIndexStart = self.numberOfConnections
+		connectionIndexEnd = connectionIndexStart + numberOfNewConnections
+		if(connectionIndexEnd > self.capacity):
+			self.allocateColumns(max(self.capacity*2, connectionIndexEnd))
+		self.sourceId[connectionIndexStart:connectionIndexEnd] = sourceIdArray
+		self.targetId[connectionIndexStart:connectionIndexEnd] = targetIdArray
+		self.segmentId[connectionIndexStart:connectionIndexEnd] = segmentIdArray
+		self.sequentialSegmentInputKey[connectionIndexStart:connectionIndexEnd] = sequentialSegmentInputKeyArray
+		self.weight[connectionIndexStart:connectionIndexEnd] = weightArray
+		self.activationLevel[connectionIndexStart:connectionIndexEnd] = False
+		self.activationTime[connectionIndexStart:connectionIndexEnd] = activationTimeArray
+		self.spatioTemporalIndex[connectionIndexStart:connectionIndexEnd] = spatioTemporalIndexArray
+		self.biologicalPrototype[connectionIndexStart:connectionIndexEnd] = False
+		self.biologicalSimulation[connectionIndexStart:connectionIndexEnd] = biologicalSimulation
+		self.contextConnection[connectionIndexStart:connectionIndexEnd] = False
+		self.contextConnectionSANIindex[connectionIndexStart:connectionIndexEnd] = 0
+		self.numberOfConnections = connectionIndexEnd
+		self.rebuildIndices()
+
+	def rebuildIndices(self):
+		#index all tail connections and discard cached connection lists (steady state memory usage)
+		for connectionStoreIndex in [self.targetConnectionIndex, self.sourceConnectionIndex]:
+			connectionStoreIndex.rebuildIndex()
+			connectionStoreIndex.lookupCache = {}
+
+	def getConceptNode(self, networkIndex):
+		return self.conceptNodeList[networkIndex]
+
+	def getNodeTargetSequentialSegmentInput(self, connectionIndex):
+		nodeTargetSequentialSegmentInput = None
+		segmentId = int(self.segmentId[connectionIndex])
+		if(segmentId >= 0):
+			sequentialSegment = getSequentialSegmentOfSequentialSegmentId(self.conceptNodeList[self.targetId[connectionIndex]], segmentId)
+			sequentialSegmentInputKey = int(self.sequentialSegmentInputKey[connectionIndex])
+			if(sequentialSegmentInputKey < 0):
+				sequentialSegmentInputKey = getConnectionKey(self.conceptNodeList[self.sourceId[connectionIndex]])
+			nodeTargetSequentialSegmentInput = sequentialSegment.inputs[sequentialSegmentInputKey]
+		return nodeTargetSequentialSegmentInput
+
+	def getColumns(self):
+		return [self.sourceId, self.targetId, self.segmentId, self.sequentialSegmentInputKey, self.weight, self.activationLevel, self.activationTime, self.spatioTemporalIndex, self.biologicalPrototype, self.biologicalSimulation, self.contextConnection, self.contextConnectionSANIindex]
+
+	def calculateMemoryUsage(self):
+		memoryUsage = 0
+		for column in self.getColumns():
+			memoryUsage += column.nbytes
+		memoryUsage += self.targetConnectionIndex.calculateMemoryUsage() + self.sourceConnectionIndex.calculateMemoryUsage()
+		return memoryUsage
+
+	def calculateMemoryUsageMinimum(self):
+		#lower bound of store design; connection columns without capacity slack, fully indexed connections (no tail, no cached connection lists)
+		bytesPerConnection = 0
+		for column in self.getColumns():
+			bytesPerConnection += column.itemsize
+		memoryUsage = self.numberOfConnections*bytesPerConnection
+		for connectionStoreIndex in [self.targetConnectionIndex, self.sourceConnectionIndex]:
+			memoryUsage += self.numberOfConnections*connectionStoreIndex.indexConnection.itemsize + (len(self.conceptNodeList)+1)*connectionStoreIndex.indexPointer.itemsize
+		return memoryUsage
+
+def calculateSequentialSegmentInputKey(sequentialSegmentInput):
+	sequentialSegmentInputKey = -1
+	if(not preventGenerationOfDuplicateConnections):
+		#inputs are keyed by sequentialSegmentInputIndex (calculateNewSequentialSegmentInputIndex: the most recently generated input has key len(inputs))
+		inputs = sequentialSegmentInput.sequentialSegment.inputs
+		if(inputs.get(len(inputs)) is sequentialSegmentInput):
+			sequentialSegmentInputKey = len(inputs)
+		elif(inputs.get(sequentialSegmentInput.sequentialSegmentInputIndex) is sequentialSegmentInput):
+			sequentialSegmentInputKey = sequentialSegmentInput.sequentialSegmentInputIndex
+		else:
+			for key, currentSequentialSegmentInput in inputs.items():
+				if(currentSequentialSegmentInput is sequentialSegmentInput):
+					sequentialSegmentInputKey = key
+	return sequentialSegmentInputKey
+
+def resizeColumn(column, capacity, dtype):
+	newColumn = np.zeros(capacity, dtype=dtype)
+	if(column is not None):
+		newColumn[0:len(column)] = column
+	return newColumn
+
+
+class ConnectionStoreIndex:
+	def __init__(self, connectionStore, sourceKey):
+		self.connectionStore = connectionStore
+		self.sourceKey = sourceKey	#True: key = sourceId (targetConnectionDict), False: key = targetId (sourceConnectionDict)
+		self.numberOfIndexedConnections = 0
+		self.indexPointer = np.zeros(1, dtype=np.int64)	#CSR row pointer (index: key id)
+		self.indexConnection = np.zeros(0, dtype=np.int32)	#connection indices sorted by (key id, first connection index of (key id, value id) pair, connection index)
+		self.tailDict = {}	#key id: list of connection indices added since last index rebuild
+		self.numberOfTailConnections = 0
+		self.lookupCache = {}	#key id: dict (value id: list of HopfieldConnectionView); invalidated when connections are added to key id
+
+	def getKeyColumn(self):
+		if(self.sourceKey):
+			return self.connectionStore.sourceId
+		else:
+			return self.connectionStore.targetId
+
+	def getValueColumn(self):
+		if(self.sourceKey):
+			return self.connectionStore.targetId
+		else:
+			return self.connectionStore.sourceId
+
+	def addConnection(self, keyId, connectionIndex):
+		if(keyId in self.tailDict):
+			self.tailDict[keyId].append(connectionIndex)
+		else:
+			self.tailDict[keyId] = [connectionIndex]
+		self.numberOfTailConnections += 1
+		if(keyId in self.lookupCache):
+			del self.lookupCache[keyId]
+		if(self.numberOfTailConnections > max(connectionStoreInitialCapacity, self.numberOfIndexedConnections*connectionStoreIndexRebuildFraction)):
+			self.rebuildIndex()
+
+	def rebuildIndex(self):
+		numberOfConnections = self.connectionStore.numberOfConnections
+		keyColumn = self.getKeyColumn()[0:numberOfConnections]
+		valueColumn = self.getValueColumn()[0:numberOfConnections]
+		connectionIndices = np.arange(numberOfConnections, dtype=np.int64)
+		#calculate first connection index of each (key id, value id) pair (preserves dict insertion order of value nodes);
+		pairOrder = np.lexsort((connectionIndices, valueColumn, keyColumn))
+		pairKey = keyColumn[pairOrder]
+		pairValue = valueColumn[pairOrder]
+		pairStart = np.ones(numberOfConnections, dtype=bool)
+		if(numberOfConnections > 0):
+			pairStart[1:] = np.logical_or(pairKey[1:] != pairKey[:-1], pairValue[1:] != pairValue[:-1])
+		pairStartIndices = np.flatnonzero(pairStart)
+		pairLengths = np.diff(np.append(pairStartIndices, numberOfConnections))
+		pairFirstConnectionIndex = np.empty(numberOfConnections, dtype=np.int64)
+		pairFirstConnectionIndex[pairOrder] = np.repeat(pairOrder[pairStartIndices], pairLengths)
+		indexOrder = np.lexsort((connectionIndices, pairFirstConnectionIndex, keyColumn))
+		self.indexConnection = indexOrder.astype(np.int32)
+		numberOfKeys = len(self.connectionStore.conceptNodeList)
+		self.indexPointer = np.zeros(numberOfKeys+1, dtype=np.int64)
+		self.indexPointer[1:] = np.cumsum(np.bincount(keyColumn, minlength=numberOfKeys))
+		self.numberOfIndexedConnections = numberOfConnections
+		self.tailDict = {}
+		self.numberOfTailConnections = 0
+		#lookupCache remains valid (connection indices are not modified by index rebuild)
+
+	def getConnectionIndices(self, keyId):
+		#returns connection indices of key id, grouped by value id (in order of first connection of each value id)
+		connectionIndices = self.indexConnection[0:0]
+		if(keyId+1 < len(self.indexPointer)):
+			connectionIndices = self.indexConnection[self.indexPointer[keyId]:self.indexPointer[keyId+1]]
+		if(keyId in self.tailDict):
+			connectionIndices = np.concatenate([connectionIndices, np.array(self.tailDict[keyId], dtype=np.int32)])
+			valueIds = self.getValueColumn()[connectionIndices]
+			_, valueFirstIndices, valueInverseIndices = np.unique(valueIds, return_index=True, return_inverse=True)
+			connectionIndices = connectionIndices[np.argsort(valueFirstIndices[valueInverseIndices.reshape(-1)], kind='stable')]
+		return connectionIndices
+
+	def getConnectionListDict(self, keyId):
+		#returns dict (value id: list of HopfieldConnectionView)
+		if(keyId in self.lookupCache):
+			connectionListDict = self.lookupCache[keyId]
+		else:
+			connectionListDict = {}
+			connectionIndices = self.getConnectionIndices(keyId)
+			if(len(connectionIndices) > 0):
+				valueIds = self.getValueColumn()[connectionIndices]
+				valueStartIndices = np.flatnonzero(np.concatenate([[True], valueIds[1:] != valueIds[:-1]]))
+				valueEndIndices = np.append(valueStartIndices[1:], len(connectionIndices))
+				connectionIndices = connectionIndices.tolist()
+				for valueId, valueStartIndex, valueEndIndex in zip(valueIds[valueStartIndices].tolist(), valueStartIndices.tolist(), valueEndIndices.tolist()):
+					connectionListDict[valueId] = [HopfieldConnectionView(self.connectionStore, connectionIndex) for connectionIndex in connectionIndices[valueStartIndex:valueEndIndex]]
+			if(len(self.lookupCache) >= connectionStoreLookupCacheSize):
+				self.lookupCache = {}
+			self.lookupCache[keyId] = connectionListDict
+		return connectionListDict
+
+	def calculateMemoryUsage(self):
+		memoryUsage = self.indexPointer.nbytes + self.indexConnection.nbytes + self.numberOfTailConnections*8
+		return memoryUsage
+
+
+class HopfieldConnectionDictView:
+	def __init__(self, connectionStore, conceptNode, sourceKey):
+		self.connectionStore = connectionStore
+		self.conceptNode = conceptNode
+		self.sourceKey = sourceKey	#True: targetConnectionDict, False: sourceConnectionDict
+
+	def getConnectionListDict(self):
+		if(self.sourceKey):
+			connectionStoreIndex = self.connectionStore.targetConnectionIndex
+		else:
+			connectionStoreIndex = self.connectionStore.sourceConnectionIndex
+		return connectionStoreIndex.getConnectionListDict(self.conceptNode.networkIndex)
+
+	def getConnectionKey(self, valueId):
+		if(storeConnectionsByConceptNodeId):
+			connectionKey = valueId
+		else:
+			connectionKey = self.connectionStore.conceptNodeList[valueId].nodeName
+		return connectionKey
+
+	def getValueId(self, connectionKey):
+		valueId = None
+		if(storeConnectionsByConceptNodeId):
+			valueId = connectionKey
+		elif(connectionKey in self.connectionStore.conceptNodeIdDict):
+			valueId = self.connectionStore.conceptNodeIdDict[connectionKey]
+		return valueId
+
+	def items(self):
+		for valueId, connectionList in self.getConnectionListDict().items():
+			yield self.getConnectionKey(valueId), connectionList
+
+	def keys(self):
+		for valueId in self.getConnectionListDict().keys():
+			yield self.getConnectionKey(valueId)
+
+	def values(self):
+		return self.getConnectionListDict().values()
+
+	def __iter__(self):
+		return self.keys()
+
+	def __len__(self):
+		return len(self.getConnectionListDict())
+
+	def __bool__(self):
+		return len(self.getConnectionListDict()) > 0
+
+	def __contains__(self, connectionKey):
+		found = False
+		valueId = self.getValueId(connectionKey)
+		if(valueId is not None):
+			if(valueId in self.getConnectionListDict()):
+				found = True
+		return found
+
+	def __getitem__(self, connectionKey):
+		if(connectionKey not in self):
+			raise KeyError(connectionKey)
+		return self.getConnectionListDict()[self.getValueId(connectionKey)]
+
+
+class HopfieldConnectionView:
+	__slots__ = ('connectionStore', 'connectionIndex')
+	objectType = objectTypeConnection
+	def __init__(self, connectionStore, connectionIndex):
+		self.connectionStore = connectionStore
+		self.connectionIndex = connectionIndex
+
+	def __eq__(self, other):
+		return isinstance(other, HopfieldConnectionView) and (other.connectionStore is self.connectionStore) and (other.connectionIndex == self.connectionIndex)
+
+	def __hash__(self):
+		return hash((id(self.connectionStore), self.connectionIndex))
+
+	@property
+	def nodeSource(self):
+		return self.connectionStore.conceptNodeList[self.connectionStore.sourceId[self.connectionIndex]]
+
+	@property
+	def nodeTarget(self):
+		return self.connectionStore.conceptNodeList[self.connectionStore.targetId[self.connectionIndex]]
+
+	@property
+	def nodeTargetSequentialSegmentInput(self):
+		return self.connectionStore.getNodeTargetSequentialSegmentInput(self.connectionIndex)
+
+	@property
+	def activationLevel(self):
+		return bool(self.connectionStore.activationLevel[self.connectionIndex])
+
+	@activationLevel.setter
+	def activationLevel(self, value):
+		self.connectionStore.activationLevel[self.connectionIndex] = value
+
+	@property
+	def activationTime(self):
+		return int(self.connectionStore.activationTime[self.connectionIndex])
+
+	@activationTime.setter
+	def activationTime(self, value):
+		self.connectionStore.activationTime[self.connectionIndex] = value
+
+	@property
+	def spatioTemporalIndex(self):
+		return int(self.connectionStore.spatioTemporalIndex[self.connectionIndex])
+
+	@property
+	def weight(self):
+		return float(self.connectionStore.weight[self.connectionIndex])
+
+	@weight.setter
+	def weight(self, value):
+		self.connectionStore.weight[self.connectionIndex] = value
+
+	@property
+	def biologicalPrototype(self):
+		return bool(self.connectionStore.biologicalPrototype[self.connectionIndex])
+
+	@property
+	def biologicalSimulation(self):
+		return bool(self.connectionStore.biologicalSimulation[self.connectionIndex])
+
+	@property
+	def contextConnection(self):
+		return bool(self.connectionStore.contextConnection[self.connectionIndex])
+
+	@property
+	def contextConnectionSANIindex(self):
+		return int(self.connectionStore.contextConnectionSANIindex[self.connectionIndex])
+
+
+networkConnectionStore = HopfieldConnectionStore()
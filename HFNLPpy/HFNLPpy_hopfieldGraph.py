@@ -24,20 +24,42 @@ HFNLP Hopfield Graph - generate hopfield graph/network based on textual input
 import numpy as np
 import spacy
 spacyWordVectorGenerator = spacy.load('en_core_web_md')	#spacy.load('en_core_web_lg')
+tokeniseSentencesPipeline = False	#optional	#tokenise (lemmatise/vectorise) sentences ahead of graph construction in a bounded producer/consumer queue (spacy nlp.pipe); biological simulation does not wait on spacy
+if(tokeniseSentencesPipeline):
+	import threading
+	import queue
+	import collections
+	tokeniseSentencesPipelineNumberOfProcesses = 2	#spacy nlp.pipe n_process	#>1: tokenise in spacy worker processes (required for tokenisation to overlap graph construction; a single process producer thread shares the GIL with graph construction)
+	tokeniseSentencesPipelineBatchSize = 64	#spacy nlp.pipe batch_size
+	tokeniseSentencesPipelineQueueSize = 256	#maximum number of tokenised sentences buffered ahead of graph construction
 from HFNLPpy_hopfieldNodeClass import *
 from HFNLPpy_hopfieldConnectionClass import *
 import HFNLPpy_hopfieldOperations
+if(useWordVectorTable):
+	HFNLPpy_wordVectorTable.initialiseWordVectorTable(spacyWordVectorGenerator)
 
 printVerbose = False
 
 biologicalPrototype = False	#add contextual connections to emulate primary connection spatiotemporal index restriction (visualise biological connections without simulation)
 biologicalSimulation = True	#simulate sequential activation of dendritic input 
 useDependencyParseTree = False
+trainSentencesBatch = False	#initialise (dependent var)
+predictSentencesBatch = False	#initialise (dependent var)
+predictSentenceIndex = -1	#prediction contexts are not trained sentences
 
 if(biologicalSimulation):
 	from HFNLPpy_biologicalSimulationNode import biologicalSimulationEncodeSyntaxInDendriticBranchStructure
 	from HFNLPpy_biologicalSimulationNode import seedHFnetworkSubsequence
 	from HFNLPpy_biologicalSimulationNode import HFNLPnonrandomSeed
+	from HFNLPpy_biologicalSimulationNode import vectoriseComputationBatchSentences
+	from HFNLPpy_biologicalSimulationNode import vectoriseComputationCurrentDendriticInput
+	if(vectoriseComputationBatchSentences or vectoriseComputationCurrentDendriticInput):
+		from HFNLPpy_biologicalSimulationNode import batchSizeDefault
+	if(vectoriseComputationBatchSentences):
+		trainSentencesBatch = True	#train independent sentences in parallel
+		from HFNLPpy_biologicalSimulationNode import vectoriseComputationBatchSentencesSizeMax
+	if(vectoriseComputationCurrentDendriticInput):
+		predictSentencesBatch = True	#predict independent contexts in parallel
 	if(biologicalSimulationEncodeSyntaxInDendriticBranchStructure):
 		useDependencyParseTree = True
 	else:
@@ -46,6 +68,7 @@ if(biologicalSimulation):
 		import HFNLPpy_biologicalSimulationSyntacticalGraph
 	else:
 		import HFNLPpy_biologicalSimulation
+	import HFNLPpy_biologicalSimulationSnapshot
 else:
 	useDependencyParseTree = True
 		
@@ -67,6 +90,12 @@ if(useDependencyParseTree):
 	else:
 		identifySyntacticalDependencyRelations = True	#mandatory 	#standard hopfield NLP graph requires words are connected (no intermediary constituency parse tree syntax nodes) 
 
+tokeniseSentencesCache = False	#optional	#persistent cache of tokenised sentences keyed by sentence content hash (HFNLPpy_tokenCache); reused across epochs and runs (spacy is only executed for uncached sentences)
+if(useDependencyParseTree):
+	tokeniseSentencesCache = False	#mandatory	#SPNLPpy_syntacticalGraph.generateSyntacticalGraphSentence requires spacy tokens
+if(tokeniseSentencesCache):
+	import HFNLPpy_tokenCache
+
 drawHopfieldGraph = False
 if(drawHopfieldGraph):
 	drawHopfieldGraphPlot = True
@@ -77,12 +106,13 @@ if(drawHopfieldGraph):
 	drawHopfieldGraphNetwork = True	#default: True	#draw graph for entire network (not just sentence)
 	if(drawHopfieldGraphNetwork):
 		import HFNLPpy_hopfieldGraphDraw as ATNLPtf_hopfieldGraphDrawNetwork
+	trainSentencesBatch = False	#mandatory	#hopfield graph is drawn after every sentence
 	
 networkConceptNodeDict = {}
 networkSize = 0
 
 def generateHopfieldGraphNetwork(articles):
-	numberOfSentences = len(articles)
+	#articles: list of sentences, or sentence iterator (e.g. ANNtf2_loadDataset.loadDatasetType4Stream; sentences are consumed lazily)
 	
 	if(HFNLPnonrandomSeed):
 		np.random.seed(0)
@@ -91,15 +121,104 @@ def generateHopfieldGraphNetwork(articles):
 		#print("random.randint(0,9) = ", random.randint(0,9))
 
 	if(seedHFnetworkSubsequence):
-		HFNLPpy_biologicalSimulation.verifySeedSentenceIsReplicant(articles, numberOfSentences)
+		if(isinstance(articles, list)):
+			HFNLPpy_biologicalSimulation.verifySeedSentenceIsReplicant(articles, len(articles))
+		else:
+			print("generateHopfieldGraphNetwork warning: verifySeedSentenceIsReplicant not supported for sentence iterator (dataset stream)")
 
-	for sentenceIndex, sentence in enumerate(articles):
-		generateHopfieldGraphSentenceString(sentenceIndex, sentence, numberOfSentences)	
+	if(trainSentencesBatch):
+		generateHopfieldGraphNetworkBatch(articles)
+	else:
+		for sentenceIndex, (sentence, tokenisedSentence, lastSentence) in enumerate(getSentencesLookahead(tokeniseSentences(articles))):
+			numberOfSentences = calculateNumberOfSentences(sentenceIndex, lastSentence)
+			generateHopfieldGraphSentenceString(sentenceIndex, sentence, numberOfSentences, tokenisedSentence)	
+
+	if(tokeniseSentencesCache):
+		HFNLPpy_tokenCache.saveTokenCache()
+
+#trainSentencesBatch: group consecutive independent sentences (disjoint sentence/connection target neurons, without repeated concepts) and train each group in parallel (at most vectoriseComputationBatchSentencesSizeMax sentences);
+def generateHopfieldGraphNetworkBatch(articles):
+	sentenceIndexBatchList = []
+	sentenceConceptNodeListBatchList = []
+	batchConnectionKeySet = set()
+	numberOfSentences = 0
+	
+	for sentenceIndex, (sentence, tokenisedSentence, lastSentence) in enumerate(getSentencesLookahead(tokeniseSentences(articles))):
+		numberOfSentences = calculateNumberOfSentences(sentenceIndex, lastSentence)
+		print("\n\ngenerateHopfieldGraphSentenceString: sentenceIndex = ", sentenceIndex, "; ", sentence)
 
-def generateHopfieldGraphSentenceString(sentenceIndex, sentence, numberOfSentences):
+		sentenceLength = len(tokenisedSentence)
+		print("sentenceLength = ", sentenceLength)
+	
+		if(sentenceLength > 1):
+			sentenceIndependent, sentenceConnectionKeySet = getHopfieldGraphSentenceConnectionKeySet(tokenisedSentence)
+			if(seedHFnetworkSubsequence):
+				if(sentenceIndex == numberOfSentences-1):
+					sentenceIndependent = False	#seed sentence
+			if(sentenceIndependent):
+				if(not batchConnectionKeySet.isdisjoint(sentenceConnectionKeySet) or (len(batchConnectionKeySet)+len(sentenceConnectionKeySet) > batchSizeDefault) or (len(sentenceIndexBatchList) >= vectoriseComputationBatchSentencesSizeMax)):
+					generateHopfieldGraphSentenceBatch(sentenceIndexBatchList, sentenceConceptNodeListBatchList, batchConnectionKeySet, numberOfSentences)	#sentence batch nodes must be trained before sentence nodes are declared (conceptNode.w/sentenceIndex)
+				sentenceConceptNodeList = generateHopfieldGraphSentenceNodes(sentenceIndex, tokenisedSentence)
+				sentenceIndexBatchList.append(sentenceIndex)
+				sentenceConceptNodeListBatchList.append(sentenceConceptNodeList)
+				batchConnectionKeySet.update(sentenceConnectionKeySet)
+				for conceptNode in sentenceConceptNodeList:
+					batchConnectionKeySet.add(getConnectionKey(conceptNode))	#new concept nodes
+			else:
+				generateHopfieldGraphSentenceBatch(sentenceIndexBatchList, sentenceConceptNodeListBatchList, batchConnectionKeySet, numberOfSentences)
+				generateHopfieldGraphSentence(sentenceIndex, tokenisedSentence, numberOfSentences)
+				
+	generateHopfieldGraphSentenceBatch(sentenceIndexBatchList, sentenceConceptNodeListBatchList, batchConnectionKeySet, numberOfSentences)
+
+def getSentencesLookahead(sentenceIterator):
+	#generator; yields (sentence, tokenisedSentence, lastSentence)	#lookahead of one sentence (number of sentences in iterator is unknown)
+	sentencePrevious = None
+	for sentenceTokenised in sentenceIterator:
+		if(sentencePrevious is not None):
+			yield sentencePrevious + (False,)
+		sentencePrevious = sentenceTokenised
+	if(sentencePrevious is not None):
+		yield sentencePrevious + (True,)
+
+def calculateNumberOfSentences(sentenceIndex, lastSentence):
+	#numberOfSentences is only used to identify the last sentence (sentenceIndex == numberOfSentences-1); for !lastSentence it is a lower bound
+	if(lastSentence):
+		numberOfSentences = sentenceIndex+1
+	else:
+		numberOfSentences = sentenceIndex+2
+	return numberOfSentences
+
+def getHopfieldGraphSentenceConnectionKeySet(tokenisedSentence):
+	#connection keys of existing sentence concept nodes and their connection targets (neurons accessed by sentence propagation)
+	sentenceIndependent = True
+	sentenceConnectionKeySet = set()
+	nodeNameSet = set()
+	for w, token in enumerate(tokenisedSentence):
+		word = getTokenWord(token)
+		lemma = getTokenLemma(token)
+		nodeName = generateHopfieldGraphNodeName(word, lemma)
+		if(nodeName in nodeNameSet):
+			sentenceIndependent = False	#repeated concepts; sentence propagation depends on its own dendritic synapse generation
+		nodeNameSet.add(nodeName)
+		if(graphNodeExists(nodeName)):
+			conceptNode = getGraphNode(nodeName)
+			sentenceConnectionKeySet.add(getConnectionKey(conceptNode))
+			sentenceConnectionKeySet.update(conceptNode.targetConnectionDict.keys())
+	return sentenceIndependent, sentenceConnectionKeySet
+
+def generateHopfieldGraphSentenceBatch(sentenceIndexBatchList, sentenceConceptNodeListBatchList, batchConnectionKeySet, numberOfSentences):
+	if(len(sentenceIndexBatchList) > 0):
+		print("HFNLPpy_biologicalSimulation.trainBiologicalHFnetworkBatch: sentenceIndexBatchList = ", sentenceIndexBatchList)
+		HFNLPpy_biologicalSimulation.trainBiologicalHFnetworkBatch(networkConceptNodeDict, sentenceIndexBatchList, sentenceConceptNodeListBatchList, numberOfSentences)
+	sentenceIndexBatchList.clear()
+	sentenceConceptNodeListBatchList.clear()
+	batchConnectionKeySet.clear()
+
+def generateHopfieldGraphSentenceString(sentenceIndex, sentence, numberOfSentences, tokenisedSentence=None):
 	print("\n\ngenerateHopfieldGraphSentenceString: sentenceIndex = ", sentenceIndex, "; ", sentence)
 
-	tokenisedSentence = tokeniseSentence(sentence)
+	if(tokenisedSentence is None):
+		tokenisedSentence = tokeniseSentence(sentence)
 	sentenceLength = len(tokenisedSentence)
 	print("sentenceLength = ", sentenceLength)
 	
@@ -116,7 +235,6 @@ def generateHopfieldGraphSentence(sentenceIndex, tokenisedSentence, numberOfSent
 		if(drawHopfieldGraphNetwork):
 			ATNLPtf_hopfieldGraphDrawNetwork.clearHopfieldGraph()
 			
-	sentenceConceptNodeList = []
 	sentenceLength = len(tokenisedSentence)
 		
 	SPgraphHeadNode = None
@@ -126,28 +244,7 @@ def generateHopfieldGraphSentence(sentenceIndex, tokenisedSentence, numberOfSent
 		sentenceLeafNodeList, _, SPgraphHeadNode = SPNLPpy_syntacticalGraph.generateSyntacticalGraphSentence(sentenceIndex, tokenisedSentence, performIntermediarySyntacticalTransformation, generateSyntacticalGraphNetwork, identifySyntacticalDependencyRelations)
 
 	#declare graph nodes;	
-	for w, token in enumerate(tokenisedSentence):	
-
-		word = getTokenWord(token)
-		lemma = getTokenLemma(token)
-		nodeName = generateHopfieldGraphNodeName(word, lemma)	
-		if(graphNodeExists(nodeName)):
-			conceptNode = getGraphNode(nodeName)
-			#set sentence artificial vars (for sentence graph only, do not generalise to network graph);
-			conceptNode.w = w
-			conceptNode.sentenceIndex = sentenceIndex
-		else:
-			#primary vars;
-			wordVector = getTokenWordVector(token)	#numpy word vector
-			#posTag = getTokenPOStag(token)	#not used
-			activationTime = calculateActivationTime(sentenceIndex)
-			nodeGraphType = graphNodeTypeConcept
-			networkIndex = getNetworkIndex()
-			conceptNode = HopfieldNode(networkIndex, nodeName, wordVector, nodeGraphType, activationTime, biologicalSimulation, w, sentenceIndex)
-			addNodeToGraph(conceptNode)
-			if(printVerbose):
-				print("create new conceptNode; ", conceptNode.nodeName)
-		sentenceConceptNodeList.append(conceptNode)
+	sentenceConceptNodeList = generateHopfieldGraphSentenceNodes(sentenceIndex, tokenisedSentence)
 						
 	if(biologicalSimulation):
 		trainSentence = True
@@ -197,6 +294,35 @@ def generateHopfieldGraphSentence(sentenceIndex, tokenisedSentence, numberOfSent
 
 
 
+def generateHopfieldGraphSentenceNodes(sentenceIndex, tokenisedSentence):
+	sentenceConceptNodeList = []
+	for w, token in enumerate(tokenisedSentence):	
+
+		word = getTokenWord(token)
+		lemma = getTokenLemma(token)
+		nodeName = generateHopfieldGraphNodeName(word, lemma)	
+		if(graphNodeExists(nodeName)):
+			conceptNode = getGraphNode(nodeName)
+			#set sentence artificial vars (for sentence graph only, do not generalise to network graph);
+			conceptNode.w = w
+			conceptNode.sentenceIndex = sentenceIndex
+		else:
+			#primary vars;
+			if(useWordVectorTable):
+				wordVector = getTokenWordVectorIndex(token)	#word vector table row index
+			else:
+				wordVector = getTokenWordVector(token)	#numpy word vector
+			#posTag = getTokenPOStag(token)	#not used
+			activationTime = calculateActivationTime(sentenceIndex)
+			nodeGraphType = graphNodeTypeConcept
+			networkIndex = getNetworkIndex()
+			conceptNode = HopfieldNode(networkIndex, nodeName, wordVector, nodeGraphType, activationTime, biologicalSimulation, w, sentenceIndex)
+			addNodeToGraph(conceptNode)
+			if(printVerbose):
+				print("create new conceptNode; ", conceptNode.nodeName)
+		sentenceConceptNodeList.append(conceptNode)
+	return sentenceConceptNodeList
+
 #if(useDependencyParseTree):
 	
 def connectHopfieldGraphSentenceSyntacticalBranchDP(sentenceConceptNodeList, DPgovernorNode, spatioTemporalIndex, activationTime):
@@ -245,15 +371,121 @@ def addNodeToGraph(conceptNode):
 		#print("addNodeToGraph: conceptNode.nodeName = ", conceptNode.nodeName)
 		networkConceptNodeDict[conceptNode.nodeName] = conceptNode
 		networkSize = networkSize + 1
+		if(storeConnectionsByConceptNodeId):
+			internConceptNode(conceptNode)
 	else:
 		print("addNodeToGraph error: conceptNode.nodeName already in networkConceptNodeDict")
 		exit()
 		
+def saveHopfieldGraphNetwork(fileName):
+	if(biologicalSimulation):
+		HFNLPpy_biologicalSimulationSnapshot.saveNetworkSnapshot(networkConceptNodeDict, fileName)
+	else:
+		print("saveHopfieldGraphNetwork error: snapshot requires biologicalSimulation")
+		exit()
+
+def loadHopfieldGraphNetwork(fileName):
+	global networkSize
+	if(biologicalSimulation):
+		HFNLPpy_biologicalSimulationSnapshot.loadNetworkSnapshot(networkConceptNodeDict, fileName)
+		networkSize = len(networkConceptNodeDict)
+	else:
+		print("loadHopfieldGraphNetwork error: snapshot requires biologicalSimulation")
+		exit()
+
+def mergeHopfieldGraphNetwork(fileName):
+	global networkSize
+	if(biologicalSimulation):
+		HFNLPpy_biologicalSimulationSnapshot.mergeNetworkSnapshot(networkConceptNodeDict, fileName)
+		networkSize = len(networkConceptNodeDict)
+	else:
+		print("mergeHopfieldGraphNetwork error: snapshot requires biologicalSimulation")
+		exit()
+
+#prediction (inference); contextSentence: string (tokenised as per training sentences); returns list of (nodeName, somaActivationFound, numberOfConnections) for up to topK candidate next concepts (empty if the last context concept is not found in network)
+
+def predictHopfieldGraphNetwork(contextSentence, topK):
+	predictionCandidateList = []
+	if(biologicalSimulation and not useDependencyParseTree):
+		contextConceptNodeList = getHopfieldGraphContextNodes(tokeniseSentence(contextSentence))
+		if(isHopfieldGraphContextPredictable(contextConceptNodeList)):
+			predictionCandidateList = HFNLPpy_biologicalSimulation.predictBiologicalHFnetwork(networkConceptNodeDict, predictSentenceIndex, contextConceptNodeList, topK)
+	else:
+		print("predictHopfieldGraphNetwork error: prediction requires biologicalSimulation and !useDependencyParseTree")
+		exit()
+	return predictionCandidateList
+
+#predictSentencesBatch: group consecutive independent contexts (disjoint context/connection target neurons) and predict each group in a single vectorised propagation;
+def predictHopfieldGraphNetworkBatch(contextSentenceList, topK):
+	predictionCandidateListList = []
+	if(biologicalSimulation and not useDependencyParseTree):
+		contextIndexBatchList = []
+		contextConceptNodeListBatchList = []
+		batchConnectionKeySet = set()
+		predictionCandidateListList = [[] for _ in range(len(contextSentenceList))]
+		for contextIndex, contextSentence in enumerate(contextSentenceList):
+			contextConceptNodeList = getHopfieldGraphContextNodes(tokeniseSentence(contextSentence))
+			if(isHopfieldGraphContextPredictable(contextConceptNodeList)):
+				if(predictSentencesBatch):
+					contextConnectionKeySet = getHopfieldGraphContextConnectionKeySet(contextConceptNodeList)
+					if(not batchConnectionKeySet.isdisjoint(contextConnectionKeySet) or (len(batchConnectionKeySet)+len(contextConnectionKeySet) > batchSizeDefault)):
+						predictHopfieldGraphContextBatch(contextIndexBatchList, contextConceptNodeListBatchList, batchConnectionKeySet, topK, predictionCandidateListList)
+					contextIndexBatchList.append(contextIndex)
+					contextConceptNodeListBatchList.append(contextConceptNodeList)
+					batchConnectionKeySet.update(contextConnectionKeySet)
+				else:
+					predictionCandidateListList[contextIndex] = HFNLPpy_biologicalSimulation.predictBiologicalHFnetwork(networkConceptNodeDict, predictSentenceIndex, contextConceptNodeList, topK)
+		predictHopfieldGraphContextBatch(contextIndexBatchList, contextConceptNodeListBatchList, batchConnectionKeySet, topK, predictionCandidateListList)
+	else:
+		print("predictHopfieldGraphNetworkBatch error: prediction requires biologicalSimulation and !useDependencyParseTree")
+		exit()
+	return predictionCandidateListList
+
+def predictHopfieldGraphContextBatch(contextIndexBatchList, contextConceptNodeListBatchList, batchConnectionKeySet, topK, predictionCandidateListList):
+	if(len(contextIndexBatchList) > 0):
+		predictionCandidateListBatchList = HFNLPpy_biologicalSimulation.predictBiologicalHFnetworkBatch(networkConceptNodeDict, [predictSentenceIndex]*len(contextIndexBatchList), contextConceptNodeListBatchList, topK)
+		for contextIndex, predictionCandidateList in zip(contextIndexBatchList, predictionCandidateListBatchList):
+			predictionCandidateListList[contextIndex] = predictionCandidateList
+	contextIndexBatchList.clear()
+	contextConceptNodeListBatchList.clear()
+	batchConnectionKeySet.clear()
+
+def getHopfieldGraphContextNodes(tokenisedSentence):
+	#existing concept nodes of context (prediction does not declare new concept nodes or modify sentence artificial vars); context concepts not found in network are None (context positions are preserved)
+	contextConceptNodeList = []
+	for w, token in enumerate(tokenisedSentence):
+		word = getTokenWord(token)
+		lemma = getTokenLemma(token)
+		nodeName = generateHopfieldGraphNodeName(word, lemma)
+		if(graphNodeExists(nodeName)):
+			contextConceptNodeList.append(getGraphNode(nodeName))
+		else:
+			print("getHopfieldGraphContextNodes warning: context concept not found in network (not propagated); ", nodeName)
+			contextConceptNodeList.append(None)
+	return contextConceptNodeList
+
+def isHopfieldGraphContextPredictable(contextConceptNodeList):
+	#prediction candidates are the connection targets of the last context concept
+	result = False
+	if(len(contextConceptNodeList) > 0):
+		if(contextConceptNodeList[-1] is not None):
+			result = True
+	return result
+
+def getHopfieldGraphContextConnectionKeySet(contextConceptNodeList):
+	#connection keys of context concept nodes and their connection targets (neurons accessed by context propagation)
+	contextConnectionKeySet = set()
+	for conceptNode in contextConceptNodeList:
+		if(conceptNode is not None):
+			contextConnectionKeySet.add(getConnectionKey(conceptNode))
+			contextConnectionKeySet.update(conceptNode.targetConnectionDict.keys())
+	return contextConnectionKeySet
+		
 def connectionExists(nodeSource, nodeTarget):
 	result = False
-	if(nodeTarget.nodeName in nodeSource.targetConnectionDict):
+	if(getConnectionKey(nodeTarget) in nodeSource.targetConnectionDict):
 		result = True
-		#connectionList = nodeSource.targetConnectionDict[nodeTarget.nodeName]
+		#connectionList = nodeSource.targetConnectionDict[getConnectionKey(nodeTarget)]
 		#for connection in connectionList:
 		#	if(connection
 	return result
@@ -265,9 +497,65 @@ def connectionExists(nodeSource, nodeTarget):
 #tokenisation:
 
 def tokeniseSentence(sentence):
-	tokenList = spacyWordVectorGenerator(sentence)
+	if(tokeniseSentencesCache):
+		tokenList = HFNLPpy_tokenCache.getTokenisedSentence(sentence)
+		if(tokenList is None):
+			tokenList = spacyWordVectorGenerator(sentence)
+			HFNLPpy_tokenCache.addTokenisedSentence(sentence, tokenList)
+	else:
+		tokenList = spacyWordVectorGenerator(sentence)
 	return tokenList
 
+def tokeniseSentences(articles):
+	#generator; yields (sentence, tokenisedSentence) in order of articles	#articles: list of sentences or sentence iterator
+	if(tokeniseSentencesPipeline):
+		tokenisedSentenceQueue = queue.Queue(maxsize=tokeniseSentencesPipelineQueueSize)
+		tokeniseSentencesThread = threading.Thread(target=tokeniseSentencesProducer, args=(articles, tokenisedSentenceQueue), daemon=True)
+		tokeniseSentencesThread.start()
+		sentenceTokenised = tokenisedSentenceQueue.get()
+		while(sentenceTokenised is not None):
+			if(isinstance(sentenceTokenised, BaseException)):
+				tokeniseSentencesThread.join()
+				raise sentenceTokenised	#producer exception (spacy/articles iterator/token cache); re-raised in consumer thread
+			yield sentenceTokenised
+			sentenceTokenised = tokenisedSentenceQueue.get()
+		tokeniseSentencesThread.join()
+	else:
+		for sentence in articles:
+			yield (sentence, tokeniseSentence(sentence))
+
+def tokeniseSentencesProducer(articles, tokenisedSentenceQueue):
+	#tokenisedSentenceQueue.put blocks while queue is full (bounded read ahead)	#queue items: (sentence, tokenList), followed by None (end of articles) or a producer exception
+	try:
+		if(tokeniseSentencesCache):
+			sentenceDeque = collections.deque()	#sentences read ahead of spacy pipe output; (sentence, tokenList) - tokenList is None for uncached sentences
+			for tokenList in spacyWordVectorGenerator.pipe(getUncachedSentences(articles, sentenceDeque, tokenisedSentenceQueue), n_process=tokeniseSentencesPipelineNumberOfProcesses, batch_size=tokeniseSentencesPipelineBatchSize):
+				putCachedSentences(sentenceDeque, tokenisedSentenceQueue)
+				sentence, _ = sentenceDeque.popleft()
+				HFNLPpy_tokenCache.addTokenisedSentence(sentence, tokenList)
+				tokenisedSentenceQueue.put((sentence, tokenList))
+			putCachedSentences(sentenceDeque, tokenisedSentenceQueue)
+		else:
+			for tokenList in spacyWordVectorGenerator.pipe(articles, n_process=tokeniseSentencesPipelineNumberOfProcesses, batch_size=tokeniseSentencesPipelineBatchSize):
+				tokenisedSentenceQueue.put((tokenList.text, tokenList))	#spacy tokenisation is non-destructive (doc.text == sentence)
+		tokenisedSentenceQueue.put(None)	#end of articles
+	except BaseException as producerException:
+		tokenisedSentenceQueue.put(producerException)
+
+def getUncachedSentences(articles, sentenceDeque, tokenisedSentenceQueue):
+	#generator; yields uncached sentences to spacy pipe; cached sentences are put on tokenisedSentenceQueue once all preceding uncached sentences have been tokenised
+	for sentence in articles:
+		tokenList = HFNLPpy_tokenCache.getTokenisedSentence(sentence)
+		sentenceDeque.append((sentence, tokenList))
+		if(tokenList is None):
+			yield sentence
+		else:
+			putCachedSentences(sentenceDeque, tokenisedSentenceQueue)
+
+def putCachedSentences(sentenceDeque, tokenisedSentenceQueue):
+	while((len(sentenceDeque) > 0) and (sentenceDeque[0][1] is not None)):
+		tokenisedSentenceQueue.put(sentenceDeque.popleft())
+
 def getTokenWord(token):
 	word = token.text
 	return word
@@ -282,6 +570,10 @@ def getTokenWordVector(token):
 	wordVector = token.vector	#cpu: type numpy
 	return wordVector
 
+def getTokenWordVectorIndex(token):
+	wordVectorIndex = HFNLPpy_wordVectorTable.getWordVectorIndex(token.text)	#spacy vectors attr ORTH
+	return wordVectorIndex
+
 def getTokenPOStag(token):
 	#nlp in context prediction only (not certain)
 	posTag = token.pos_
@@ -24,6 +24,12 @@ os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 import numpy as np
 
 from HFNLPpy_biologicalSimulationNode import biologicalSimulationNodePropertiesInitialisation
+from HFNLPpy_hopfieldConnectionClass import useHopfieldConnectionStore, storeConnectionsByConceptNodeId, useCompactObjectModel
+if(useHopfieldConnectionStore):
+	import HFNLPpy_hopfieldConnectionStore
+from HFNLPpy_wordVectorTable import useWordVectorTable
+if(useWordVectorTable):
+	import HFNLPpy_wordVectorTable
 
 	
 storeConceptNodesByLemma = True	#else store by word (morphology included)
@@ -36,11 +42,22 @@ graphNodeTypeStart = 5	#start of sequence - used by biologicalImplementationReus
 nodeNameStart = "SEQUENCESTARTNODE"
 
 class HopfieldNode:
-	def __init__(self, networkIndex, nodeName, wordVector, nodeGraphType, activationTime, biologicalSimulation, w, sentenceIndex):
+	if(useCompactObjectModel):
+		__slots__ = ('networkIndex', 'nodeName', 'wordVectorIndex', 'graphNodeType', 'activationLevel', 'activationTime', 'w', 'sentenceIndex', 'sourceConnectionDict', 'targetConnectionDict', 
+		#biologicalSimulation vars (biologicalSimulationNodePropertiesInitialisation);
+		'objectType', 'activationTimeWord', 'currentBranchIndexNeuron', 'currentSequentialSegmentIndexNeuron', 'currentSequentialSegmentInputIndexNeuron', 'dendriticTree', 
+		'vectorisedBranchActivationLevelList', 'vectorisedBranchActivationTimeList', 'vectorisedBranchActivationFlagList', 'vectorisedBranchObjectList', 
+		'vectorisedBranchActivationLevelListBuffer', 'vectorisedBranchActivationTimeListBuffer', 'vectorisedBranchActivationFlagListBuffer')
+		if(not useWordVectorTable):
+			__slots__ = __slots__ + ('wordVector',)
+	def __init__(self, networkIndex, nodeName, wordVector, nodeGraphType, activationTime, biologicalSimulation, w, sentenceIndex, deferDendriticTreeAllocation=False):
 		#primary vars;
 		self.networkIndex = networkIndex
 		self.nodeName = str(nodeName)
-		self.wordVector = wordVector	#numpy array
+		if(useWordVectorTable):
+			self.wordVectorIndex = wordVector	#word vector table row index
+		else:
+			self.wordVector = wordVector	#numpy array
 		#self.posTag = posTag	#nlp in context prediction only (not certain)
 		self.graphNodeType = nodeGraphType
 		self.activationLevel = False	#currently only used by drawBiologicalSimulationDynamic
@@ -51,15 +68,43 @@ class HopfieldNode:
 		self.sentenceIndex = sentenceIndex
 		
 		#connection vars;
-		self.sourceConnectionDict = {}
-		self.targetConnectionDict = {}
+		if(useHopfieldConnectionStore):
+			HFNLPpy_hopfieldConnectionStore.networkConnectionStore.registerConceptNode(self)
+			self.sourceConnectionDict = HFNLPpy_hopfieldConnectionStore.HopfieldConnectionDictView(HFNLPpy_hopfieldConnectionStore.networkConnectionStore, self, False)
+			self.targetConnectionDict = HFNLPpy_hopfieldConnectionStore.HopfieldConnectionDictView(HFNLPpy_hopfieldConnectionStore.networkConnectionStore, self, True)
+		else:
+			self.sourceConnectionDict = {}
+			self.targetConnectionDict = {}
 		#self.sourceConnectionList = []
 		#self.targetConnectionList = []
 
 		if(biologicalSimulation):
-			biologicalSimulationNodePropertiesInitialisation(self)
+			biologicalSimulationNodePropertiesInitialisation(self, deferDendriticTreeAllocation)
+
+	if(useWordVectorTable):
+		@property
+		def wordVector(self):
+			#read only view of shared word vector table row
+			return HFNLPpy_wordVectorTable.getWordVector(self.wordVectorIndex)
 
 								
+#concept node id interning (storeConnectionsByConceptNodeId);
+conceptNodeIdList = []	#index: concept node id (networkIndex)	#name to id: networkConceptNodeDict[nodeName].networkIndex
+
+def internConceptNode(conceptNode):
+	if(conceptNode.networkIndex != len(conceptNodeIdList)):
+		print("internConceptNode error: conceptNode.networkIndex != len(conceptNodeIdList)")
+		exit()
+	conceptNodeIdList.append(conceptNode)
+
+def getConceptNodeLookup(networkConceptNodeDict):
+	#returns container indexed by connection key
+	if(storeConnectionsByConceptNodeId):
+		conceptNodeLookup = conceptNodeIdList
+	else:
+		conceptNodeLookup = networkConceptNodeDict
+	return conceptNodeLookup
+
 #last access time	
 def calculateActivationTime(sentenceIndex):
 	activationTime = sentenceIndex
@@ -22,25 +22,37 @@ Contains shared HFNLP operations on HFNLPpy_hopfieldNodeClass/HFNLPpy_hopfieldCo
 import numpy as np
 from HFNLPpy_hopfieldNodeClass import *
 from HFNLPpy_hopfieldConnectionClass import *
+if(useHopfieldConnectionStore):
+	import HFNLPpy_hopfieldConnectionStore
 
 
 def addConnectionToNode(nodeSource, nodeTarget, activationTime, spatioTemporalIndex, biologicalPrototype=False, weight=1.0, subsequenceConnection=False, contextConnection=False, contextConnectionSANIindex=0, biologicalSimulation=False, nodeTargetSequentialSegmentInput=None):
-	connection = HopfieldConnection(nodeSource, nodeTarget, spatioTemporalIndex, activationTime, biologicalPrototype, biologicalSimulation)
-	#nodeSource.targetConnectionList.append(connection)
-	#nodeTarget.sourceConnectionList.append(connection)
-	#print("addConnectionToNode: nodeTarget.nodeName = ", nodeTarget.nodeName)
-	#print("addConnectionToNode: nodeSource.nodeName = ", nodeSource.nodeName)
-	createConnectionKeyIfNonExistant(nodeSource.targetConnectionDict, nodeTarget.nodeName)
-	createConnectionKeyIfNonExistant(nodeTarget.sourceConnectionDict, nodeSource.nodeName)
-	nodeSource.targetConnectionDict[nodeTarget.nodeName].append(connection)
-	nodeTarget.sourceConnectionDict[nodeSource.nodeName].append(connection)
-	#connection.subsequenceConnection = subsequenceConnection
-	if(biologicalPrototype):
-		connection.biologicalPrototype = biologicalPrototype
-		connection.weight = weight
-		connection.contextConnection = contextConnection
-		connection.contextConnectionSANIindex = contextConnectionSANIindex
-	if(biologicalSimulation):
-		connection.biologicalSimulation = biologicalSimulation
-		connection.nodeTargetSequentialSegmentInput = nodeTargetSequentialSegmentInput
-		connection.weight = weight
+	if(useHopfieldConnectionStore):
+		#note activationTime/spatioTemporalIndex are passed in same order as HopfieldConnection below
+		if(not biologicalPrototype):
+			contextConnection = False
+			contextConnectionSANIindex = 0
+		connection = HFNLPpy_hopfieldConnectionStore.networkConnectionStore.addConnection(nodeSource, nodeTarget, spatioTemporalIndex, activationTime, biologicalPrototype, weight, contextConnection, contextConnectionSANIindex, biologicalSimulation, nodeTargetSequentialSegmentInput)
+	else:
+		connection = HopfieldConnection(nodeSource, nodeTarget, spatioTemporalIndex, activationTime, biologicalPrototype, biologicalSimulation)
+		#nodeSource.targetConnectionList.append(connection)
+		#nodeTarget.sourceConnectionList.append(connection)
+		#print("addConnectionToNode: nodeTarget.nodeName = ", nodeTarget.nodeName)
+		#print("addConnectionToNode: nodeSource.nodeName = ", nodeSource.nodeName)
+		nodeTargetConnectionKey = getConnectionKey(nodeTarget)
+		nodeSourceConnectionKey = getConnectionKey(nodeSource)
+		createConnectionKeyIfNonExistant(nodeSource.targetConnectionDict, nodeTargetConnectionKey)
+		createConnectionKeyIfNonExistant(nodeTarget.sourceConnectionDict, nodeSourceConnectionKey)
+		nodeSource.targetConnectionDict[nodeTargetConnectionKey].append(connection)
+		nodeTarget.sourceConnectionDict[nodeSourceConnectionKey].append(connection)
+		#connection.subsequenceConnection = subsequenceConnection
+		if(biologicalPrototype):
+			connection.biologicalPrototype = biologicalPrototype
+			connection.weight = weight
+			connection.contextConnection = contextConnection
+			connection.contextConnectionSANIindex = contextConnectionSANIindex
+		if(biologicalSimulation):
+			connection.biologicalSimulation = biologicalSimulation
+			connection.nodeTargetSequentialSegmentInput = nodeTargetSequentialSegmentInput
+			connection.weight = weight
+	return connection
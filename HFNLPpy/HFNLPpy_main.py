@@ -9,7 +9,7 @@ MIT License
 # Installation:
 conda create -n anntf2 python=3.7
 source activate anntf2
-conda install -c tensorflow tensorflow=2.3 [required for HFNLPpy_biologicalSimulationPropagateVectorised]
+conda install -c tensorflow tensorflow=2.3 [required for HFNLPpy_biologicalSimulationPropagateVectorised (!vectoriseComputationNumpy)]
 conda install nltk
 conda install spacy
 python3 -m spacy download en_core_web_md
@@ -32,7 +32,6 @@ os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 from nltk.tokenize import word_tokenize
 from collections import Counter, defaultdict
 
-import tensorflow as tf
 import numpy as np
 
 import sys
@@ -51,6 +50,7 @@ debugUseSmallSequentialInputDataset = True
 
 
 NLPsequentialInputTypeTokeniseWords = False	#perform spacy tokenization later in pipeline
+streamDataset = False	#optional	#wikiXmlDataset: stream sentences from dataset file (ANNtf2_loadDataset.loadDatasetType4Stream) into HFNLPpy_hopfieldGraph.generateHopfieldGraphNetwork; memory is bounded irrespective of dataset size
 
 NLPsequentialInputTypeMinWordVectors = True
 NLPsequentialInputTypeMaxWordVectors = True
@@ -60,12 +60,24 @@ NLPsequentialInputTypeTrainWordVectors = False
 wordVectorLibraryNumDimensions = 300	#https://spacy.io/models/en#en_core_web_md (300 dimensions)
 
 trainMultipleFiles = False	#can set to true for production (after testing algorithm)
+fileIndexFirst = 0
+fileIndexLast = 0	#index of last dataset file (dataset4FileNameXstart + fileIndex + xmlDatasetFileNameEnd)
+trainShards = False	#optional	#trainMultipleFiles: train subsets (shards) of dataset files in parallel worker processes; each worker generates a partial network (saved as snapshot) and the partial networks are merged into networkConceptNodeDict (HFNLPpy_biologicalSimulationSnapshot.mergeNetworkSnapshot)	#requires biologicalSimulation
+if(trainShards):
+	import multiprocessing
+	numberOfShardsMax = 4	#maximum number of worker processes (each worker initialises tensorflow/spacy and holds a partial network in memory)
+	numberOfShards = min(multiprocessing.cpu_count(), numberOfShardsMax)	#number of worker processes
+	shardSnapshotFileNameStart = "hopfieldGraphNetworkShard"
+	shardSnapshotFileNameEnd = ".npz"
 numEpochs = 1
 if(numEpochs > 1):
 	randomiseFileIndexParse = True
 else:
 	randomiseFileIndexParse = False
 
+loadHopfieldGraphNetworkSnapshot = False	#resume training from binary snapshot of trained network (networkConceptNodeDict and dendritic trees; see HFNLPpy_biologicalSimulationSnapshot)
+saveHopfieldGraphNetworkSnapshot = False	#save binary snapshot of trained network after training
+hopfieldGraphNetworkSnapshotFileName = "hopfieldGraphNetworkSnapshot.npz"
 	
 #code from ANNtf;
 dataset = "wikiXmlDataset"
@@ -111,7 +123,10 @@ def loadDataset(fileIndex, textualDatasetLoadPerformProcessing=True):
 		numberOfFeaturesPerWord = None
 		paddingTagIndex = None
 	elif(dataset == "wikiXmlDataset"):
-		articles = ANNtf2_loadDataset.loadDatasetType4(datasetType4FileName, limitSentenceLengths, limitSentenceLengthsSize, NLPsequentialInputTypeTrainWordVectors, NLPsequentialInputTypeTokeniseWords)
+		if(streamDataset and not textualDatasetLoadPerformProcessing):
+			articles = ANNtf2_loadDataset.loadDatasetType4Stream(datasetType4FileName, limitSentenceLengths, limitSentenceLengthsSize, NLPsequentialInputTypeTrainWordVectors, NLPsequentialInputTypeTokeniseWords)	#sentence iterator (flattened)
+		else:
+			articles = ANNtf2_loadDataset.loadDatasetType4(datasetType4FileName, limitSentenceLengths, limitSentenceLengthsSize, NLPsequentialInputTypeTrainWordVectors, NLPsequentialInputTypeTokeniseWords)
 		if(textualDatasetLoadPerformProcessing):
 			numberOfFeaturesPerWord, paddingTagIndex, datasetNumFeatures, datasetNumClasses, datasetNumExamples, train_x, train_y, test_x, test_y = ANNtf2_loadDataset.convertArticlesTreeToSentencesWordVectors(articles, limitSentenceLengthsSize)
 
@@ -136,33 +151,70 @@ def trainSequentialInput(trainMultipleFiles=False):
 	else:
 		minFileIndex = 0
 		maxFileIndex = 0
-	
-	for e in range(numEpochs):
 
-		print("epoch e = ", e)
+	if(loadHopfieldGraphNetworkSnapshot):
+		HFNLPpy_hopfieldGraph.loadHopfieldGraphNetwork(hopfieldGraphNetworkSnapshotFileName)
 	
-		#fileIndex = 0
-		#trainMultipleFiles code;
-		if(randomiseFileIndexParse):
-			fileIndexShuffledArray = ANNtf2_loadDataset.generateRandomisedIndexArray(fileIndexFirst, fileIndexLast)
-		for f in range(minFileIndex, maxFileIndex+1):
+	if(trainMultipleFiles and trainShards):
+		trainShardedInput(minFileIndex, maxFileIndex)
+	else:
+		for e in range(numEpochs):
+
+			print("epoch e = ", e)
+
+			#fileIndex = 0
+			#trainMultipleFiles code;
 			if(randomiseFileIndexParse):
-				fileIndex = fileIndexShuffledArray[f]
-			else:
-				fileIndex = f
+				fileIndexShuffledArray = ANNtf2_loadDataset.generateRandomisedIndexArray(fileIndexFirst, fileIndexLast)
+			for f in range(minFileIndex, maxFileIndex+1):
+				if(randomiseFileIndexParse):
+					fileIndex = fileIndexShuffledArray[f]
+				else:
+					fileIndex = f
 
-			#NLP specific code;
-							
-			articles = loadDataset(fileIndex, textualDatasetLoadPerformProcessing=False)	#do not perform processing of textual dataset during load (word vector extraction)
-								
-			#print("articles = ", articles)
-			#print("listDimensions(articles) = ", listDimensions(articles))
+				#NLP specific code;
 
+				articles = loadDataset(fileIndex, textualDatasetLoadPerformProcessing=False)	#do not perform processing of textual dataset during load (word vector extraction)
+
+				#print("articles = ", articles)
+				#print("listDimensions(articles) = ", listDimensions(articles))
+
+				processingSimple(articles)
+
+	if(saveHopfieldGraphNetworkSnapshot):
+		HFNLPpy_hopfieldGraph.saveHopfieldGraphNetwork(hopfieldGraphNetworkSnapshotFileName)
+					
+
+#trainShards: each worker process trains a partial network from its dataset files; partial networks are merged in shard order (worker networks are independent; synapses generated by a shard do not influence training of other shards)
+def trainShardedInput(minFileIndex, maxFileIndex):
+	fileIndexList = list(range(minFileIndex, maxFileIndex+1))
+	shardFileIndexListList = []
+	for shardIndex in range(min(numberOfShards, len(fileIndexList))):
+		shardFileIndexListList.append(fileIndexList[shardIndex::numberOfShards])
+	print("trainShardedInput: numberOfFiles = ", len(fileIndexList), ", numberOfShards = ", len(shardFileIndexListList))
+	multiprocessingContext = multiprocessing.get_context("spawn")	#workers initialise tensorflow/spacy independently (not forked)
+	with multiprocessingContext.Pool(processes=len(shardFileIndexListList)) as pool:
+		shardSnapshotFileNameList = pool.starmap(trainShard, enumerate(shardFileIndexListList))
+	for shardSnapshotFileName in shardSnapshotFileNameList:
+		HFNLPpy_hopfieldGraph.mergeHopfieldGraphNetwork(shardSnapshotFileName)
+		os.remove(shardSnapshotFileName)
+
+def trainShard(shardIndex, shardFileIndexList):
+	#worker process;
+	for e in range(numEpochs):
+		print("trainShard: shardIndex = ", shardIndex, ", epoch e = ", e)
+		fileIndexList = list(shardFileIndexList)
+		if(randomiseFileIndexParse):
+			random.shuffle(fileIndexList)
+		for fileIndex in fileIndexList:
+			articles = loadDataset(fileIndex, textualDatasetLoadPerformProcessing=False)
 			processingSimple(articles)
+	shardSnapshotFileName = shardSnapshotFileNameStart + str(shardIndex).zfill(4) + shardSnapshotFileNameEnd
+	HFNLPpy_hopfieldGraph.saveHopfieldGraphNetwork(shardSnapshotFileName)
+	return shardSnapshotFileName
 					
-						
 def processingSimple(articles):
-	if(NLPsequentialInputTypeMaxWordVectors):
+	if(NLPsequentialInputTypeMaxWordVectors and not streamDataset):
 		#flatten any higher level abstractions defined in NLPsequentialInputTypeMax down to word vector lists (sentences);
 		articles = ANNtf2_loadDataset.flattenNestedListToSentences(articles)
 
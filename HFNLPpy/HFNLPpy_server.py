@@ -0,0 +1,294 @@
+"""HFNLPpy_server.py
+
+# Author:
+Richard Bruce Baxter - Copyright (c) 2022 Baxter AI (baxterai.com)
+
+# License:
+MIT License
+
+# Installation:
+see HFNLPpy_main.py
+
+# Usage:
+python3 HFNLPpy_server.py (requires trained network snapshot; see HFNLPpy_main.py:saveHopfieldGraphNetworkSnapshot)
+python3 HFNLPpy_server.py selfTest (loopback self test; starts server on serverSelfTestPort and queries it with predictClient/metricsClient)
+
+# Description:
+HFNLP Server - local asyncio HTTP inference server (next concept prediction; HFNLPpy_hopfieldGraph.predictHopfieldGraphNetworkBatch)
+
+- POST /predict {"context": contextSentence, "topK": topK} -> {"predictions": [{"concept", "somaActivation", "numberOfConnections"}]}
+- GET /metrics -> number of requests/batches, p50/p99 latency (ms), p50/p99/max batch size
+- concurrent queries received within serverBatchLatencyWindow are micro-batched into a single prediction batch (independent contexts are propagated together by HFNLPpy_biologicalSimulationPropagateVectorised.calculateNeuronActivationParallel)
+- predictions are executed sequentially (one batch at a time) in an executor thread; the event loop continues to accept queries
+- server binds to loopback only (serverHost); predictClient/metricsClient provide a loopback client
+- prediction configuration is validated on server startup (predictHopfieldGraphNetworkBatch requires biologicalSimulation and !useDependencyParseTree); prediction errors are returned to their queries (500) and do not stop the server
+
+"""
+
+import asyncio
+import json
+import time
+import sys
+import threading
+import collections
+import urllib.request
+import urllib.error
+import numpy as np
+
+import HFNLPpy_hopfieldGraph
+
+serverHost = "127.0.0.1"	#local only
+serverPort = 8080
+serverSnapshotFileName = "hopfieldGraphNetworkSnapshot.npz"	#HFNLPpy_main:hopfieldGraphNetworkSnapshotFileName
+serverBatchLatencyWindow = 0.005	#seconds	#maximum time a query waits for concurrent queries before its batch is executed
+serverBatchSizeMax = 64	#maximum number of queries per batch
+serverTopKDefault = 5
+serverRequestBodySizeMax = 65536	#bytes
+serverMetricsWindowSize = 10000	#number of recent latency/batch size samples used to calculate percentiles
+serverSelfTestPort = 8081
+serverSelfTestStartupTimeout = 60.0	#seconds
+serverSelfTestContextSentenceList = ["the cat sat on", "the dog ran to the", "a"]	#context concepts not found in network are not propagated
+
+printVerbose = False
+
+#server state;
+predictQueryQueue = None	#asyncio.Queue of [contextSentence, topK, future, requestTime]
+latencySampleDeque = collections.deque(maxlen=serverMetricsWindowSize)	#seconds
+batchSizeSampleDeque = collections.deque(maxlen=serverMetricsWindowSize)
+numberOfRequests = 0
+numberOfBatches = 0
+
+
+def runServer(snapshotFileName=serverSnapshotFileName, host=serverHost, port=serverPort):
+	validateServerConfiguration()
+	HFNLPpy_hopfieldGraph.loadHopfieldGraphNetwork(snapshotFileName)
+	asyncio.run(serveHopfieldGraphNetwork(host, port))
+
+def validateServerConfiguration():
+	#predictHopfieldGraphNetworkBatch exits on an unsupported configuration; reject it before the server accepts queries
+	if(not (HFNLPpy_hopfieldGraph.biologicalSimulation and not HFNLPpy_hopfieldGraph.useDependencyParseTree)):
+		print("validateServerConfiguration error: prediction requires HFNLPpy_hopfieldGraph:biologicalSimulation and !useDependencyParseTree")
+		exit()
+
+async def serveHopfieldGraphNetwork(host, port, serverStartedEvent=None, serverStopEvent=None):
+	global predictQueryQueue
+	predictQueryQueue = asyncio.Queue()
+	predictBatchTask = asyncio.ensure_future(predictBatchLoop())
+	server = await asyncio.start_server(handleConnection, host, port)
+	print("serveHopfieldGraphNetwork: listening on http://" + host + ":" + str(port))
+	if(serverStartedEvent is not None):
+		serverStartedEvent.set()
+	try:
+		async with server:
+			if(serverStopEvent is None):
+				await server.serve_forever()
+			else:
+				await serverStopEvent.wait()
+	finally:
+		predictBatchTask.cancel()
+
+async def predictBatchLoop():
+	while(True):
+		predictQueryList = [await predictQueryQueue.get()]
+		if(predictQueryQueue.qsize()+1 < serverBatchSizeMax):
+			await asyncio.sleep(serverBatchLatencyWindow)	#collect concurrent queries
+		while((not predictQueryQueue.empty()) and (len(predictQueryList) < serverBatchSizeMax)):
+			predictQueryList.append(predictQueryQueue.get_nowait())
+		await predictBatch(predictQueryList)
+
+async def predictBatch(predictQueryList):
+	global numberOfBatches
+	loop = asyncio.get_running_loop()
+	contextSentenceList = [predictQuery[0] for predictQuery in predictQueryList]
+	topK = max([predictQuery[1] for predictQuery in predictQueryList])
+	if(printVerbose):
+		print("predictBatch: batchSize = ", len(predictQueryList))
+	try:
+		predictionCandidateListList = await loop.run_in_executor(None, HFNLPpy_hopfieldGraph.predictHopfieldGraphNetworkBatch, contextSentenceList, topK)
+		for (contextSentence, topKQuery, future, requestTime), predictionCandidateList in zip(predictQueryList, predictionCandidateListList):
+			if(not future.done()):
+				future.set_result(predictionCandidateList[0:topKQuery])
+	except (Exception, SystemExit) as error:
+		#SystemExit: prediction error exit() raised in the executor thread must not stop the event loop
+		if(isinstance(error, SystemExit)):
+			error = RuntimeError("prediction failed (see server log)")
+		for (contextSentence, topKQuery, future, requestTime) in predictQueryList:
+			if(not future.done()):
+				future.set_exception(error)
+	finally:
+		for (contextSentence, topKQuery, future, requestTime) in predictQueryList:
+			if(not future.done()):
+				future.cancel()	#batch cancelled (server shutdown)
+		numberOfBatches += 1
+		batchSizeSampleDeque.append(len(predictQueryList))
+
+async def predict(contextSentence, topK):
+	global numberOfRequests
+	requestTime = time.perf_counter()
+	future = asyncio.get_running_loop().create_future()
+	await predictQueryQueue.put([contextSentence, topK, future, requestTime])
+	predictionCandidateList = await future
+	numberOfRequests += 1
+	latencySampleDeque.append(time.perf_counter()-requestTime)
+	return predictionCandidateList
+
+def getServerMetrics():
+	metrics = {}
+	metrics["numberOfRequests"] = numberOfRequests
+	metrics["numberOfBatches"] = numberOfBatches
+	metrics["latencyP50"] = calculatePercentile(latencySampleDeque, 50)*1000.0	#ms
+	metrics["latencyP99"] = calculatePercentile(latencySampleDeque, 99)*1000.0	#ms
+	metrics["batchSizeP50"] = calculatePercentile(batchSizeSampleDeque, 50)
+	metrics["batchSizeP99"] = calculatePercentile(batchSizeSampleDeque, 99)
+	metrics["batchSizeMax"] = float(max(batchSizeSampleDeque, default=0))
+	return metrics
+
+def calculatePercentile(sampleDeque, percentile):
+	result = 0.0
+	if(len(sampleDeque) > 0):
+		result = float(np.percentile(np.array(sampleDeque), percentile))
+	return result
+
+
+#HTTP;
+
+async def handleConnection(reader, writer):
+	try:
+		method, path, body = await readRequest(reader)
+		if((method == "POST") and (path == "/predict")):
+			status, response = await handlePredictRequest(body)
+		elif((method == "GET") and (path == "/metrics")):
+			status, response = 200, getServerMetrics()
+		else:
+			status, response = 404, {"error": "not found"}
+	except (ValueError, KeyError, TypeError) as error:
+		status, response = 400, {"error": str(error)}
+	except Exception as error:
+		status, response = 500, {"error": str(error)}
+	await writeResponse(writer, status, response)
+
+async def readRequest(reader):
+	requestLine = (await reader.readline()).decode("latin-1").split()
+	if(len(requestLine) < 2):
+		raise ValueError("invalid request line")
+	method, path = requestLine[0], requestLine[1]
+	contentLength = 0
+	headerLine = (await reader.readline()).decode("latin-1").strip()
+	while(headerLine != ""):
+		headerName, _, headerValue = headerLine.partition(":")
+		if(headerName.strip().lower() == "content-length"):
+			contentLength = int(headerValue.strip())
+		headerLine = (await reader.readline()).decode("latin-1").strip()
+	if(contentLength > serverRequestBodySizeMax):
+		raise ValueError("request body too large")
+	body = b""
+	if(contentLength > 0):
+		body = await reader.readexactly(contentLength)
+	return method, path, body
+
+async def handlePredictRequest(body):
+	request = json.loads(body.decode("utf-8"))
+	contextSentence = request["context"]
+	topK = int(request.get("topK", serverTopKDefault))
+	if(not isinstance(contextSentence, str)):
+		raise TypeError("context must be a string")
+	if(topK < 1):
+		raise ValueError("topK must be >= 1")
+	predictionCandidateList = await predict(contextSentence, topK)
+	predictions = []
+	for nodeName, somaActivationFound, numberOfConnections in predictionCandidateList:
+		predictions.append({"concept": nodeName, "somaActivation": bool(somaActivationFound), "numberOfConnections": int(numberOfConnections)})
+	return 200, {"predictions": predictions}
+
+async def writeResponse(writer, status, response):
+	responseBody = json.dumps(response).encode("utf-8")
+	statusText = {200: "OK", 400: "Bad Request", 404: "Not Found", 500: "Internal Server Error"}[status]
+	responseHeader = "HTTP/1.1 " + str(status) + " " + statusText + "\r\nContent-Type: application/json\r\nContent-Length: " + str(len(responseBody)) + "\r\nConnection: close\r\n\r\n"
+	writer.write(responseHeader.encode("latin-1") + responseBody)
+	try:
+		await writer.drain()
+	finally:
+		writer.close()
+
+
+#loopback client;
+
+def predictClient(contextSentence, topK=serverTopKDefault, host=serverHost, port=serverPort):
+	requestBody = json.dumps({"context": contextSentence, "topK": topK}).encode("utf-8")
+	request = urllib.request.Request("http://" + host + ":" + str(port) + "/predict", data=requestBody, headers={"Content-Type": "application/json"}, method="POST")
+	with urllib.request.urlopen(request) as response:
+		predictions = json.loads(response.read().decode("utf-8"))["predictions"]
+	return predictions
+
+def metricsClient(host=serverHost, port=serverPort):
+	with urllib.request.urlopen("http://" + host + ":" + str(port) + "/metrics") as response:
+		metrics = json.loads(response.read().decode("utf-8"))
+	return metrics
+
+
+
+#loopback self test;
+
+def runServerSelfTest(snapshotFileName=serverSnapshotFileName, host=serverHost, port=serverSelfTestPort):
+	#starts the server in a background thread and queries it through the loopback client; returns True if all checks pass
+	validateServerConfiguration()
+	HFNLPpy_hopfieldGraph.loadHopfieldGraphNetwork(snapshotFileName)
+	serverLoop = asyncio.new_event_loop()
+	serverStartedEvent = threading.Event()
+	serverStopEvent = asyncio.Event()
+	def serveHopfieldGraphNetworkThread():
+		asyncio.set_event_loop(serverLoop)
+		serverLoop.run_until_complete(serveHopfieldGraphNetwork(host, port, serverStartedEvent, serverStopEvent))
+	serverThread = threading.Thread(target=serveHopfieldGraphNetworkThread, daemon=True)
+	serverThread.start()
+	if(not serverStartedEvent.wait(serverSelfTestStartupTimeout)):
+		print("runServerSelfTest error: server did not start")
+		exit()
+	selfTestPassed = True
+	try:
+		#concurrent queries (micro-batched) must return the same predictions as sequential queries;
+		predictionsSequentialList = [predictClient(contextSentence, serverTopKDefault, host, port) for contextSentence in serverSelfTestContextSentenceList]
+		predictionsConcurrentList = [None]*len(serverSelfTestContextSentenceList)
+		def predictClientThread(contextIndex):
+			predictionsConcurrentList[contextIndex] = predictClient(serverSelfTestContextSentenceList[contextIndex], serverTopKDefault, host, port)
+		clientThreadList = [threading.Thread(target=predictClientThread, args=(contextIndex,)) for contextIndex in range(len(serverSelfTestContextSentenceList))]
+		for clientThread in clientThreadList:
+			clientThread.start()
+		for clientThread in clientThreadList:
+			clientThread.join()
+		for contextSentence, predictionsSequential, predictionsConcurrent in zip(serverSelfTestContextSentenceList, predictionsSequentialList, predictionsConcurrentList):
+			print("runServerSelfTest: context = ", contextSentence, ", predictions = ", [prediction["concept"] for prediction in predictionsSequential])
+			if((predictionsConcurrent != predictionsSequential) or (len(predictionsSequential) > serverTopKDefault)):
+				print("runServerSelfTest error: concurrent predictions differ from sequential predictions; context = ", contextSentence)
+				selfTestPassed = False
+		#invalid queries are rejected (400);
+		for requestBody in [{"context": serverSelfTestContextSentenceList[0], "topK": 0}, {"topK": serverTopKDefault}, {"context": 1}]:
+			if(postRequestStatus(requestBody, host, port) != 400):
+				print("runServerSelfTest error: invalid query not rejected; ", requestBody)
+				selfTestPassed = False
+		metrics = metricsClient(host, port)
+		print("runServerSelfTest: metrics = ", metrics)
+		if(metrics["numberOfRequests"] != 2*len(serverSelfTestContextSentenceList)):
+			print("runServerSelfTest error: numberOfRequests = ", metrics["numberOfRequests"])
+			selfTestPassed = False
+	finally:
+		serverLoop.call_soon_threadsafe(serverStopEvent.set)
+		serverThread.join()
+	print("runServerSelfTest: passed = ", selfTestPassed)
+	return selfTestPassed
+
+def postRequestStatus(requestBody, host=serverHost, port=serverPort):
+	request = urllib.request.Request("http://" + host + ":" + str(port) + "/predict", data=json.dumps(requestBody).encode("utf-8"), headers={"Content-Type": "application/json"}, method="POST")
+	try:
+		with urllib.request.urlopen(request) as response:
+			status = response.status
+	except urllib.error.HTTPError as error:
+		status = error.code
+	return status
+
+
+if __name__ == "__main__":
+	if((len(sys.argv) > 1) and (sys.argv[1] == "selfTest")):
+		runServerSelfTest()
+	else:
+		runServer()
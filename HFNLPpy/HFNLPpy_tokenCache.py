@@ -0,0 +1,230 @@
+"""HFNLPpy_tokenCache.py
+
+# Author:
+Richard Bruce Baxter - Copyright (c) 2022 Baxter AI (baxterai.com)
+
+# License:
+MIT License
+
+# Installation:
+see HFNLPpy_main.py
+
+# Usage:
+see HFNLPpy_main.py
+
+# Description:
+HFNLP Token Cache - persistent cache of tokenised sentences keyed by sentence content hash (reused across epochs and runs; spacy is only executed for uncached sentences)
+
+- cache is a folder of shards (one shard is appended per saveTokenCache call; saved shards are never rewritten); each shard is a folder of numpy npy arrays (no pickled objects), loaded with mmap_mode='r'
+- a shard is written to a temporary folder (unique per process) and renamed once complete (an interrupted save never leaves a partial shard); the shard index is chosen at rename time (if another process has saved a shard with the same index, the next index is tried), such that concurrent writers append distinct shards
+- per token: word, lemma, POS tag (string table indices), word vector index (word vector table rows are unique per word); string table and word vector table indices are local to each shard (each shard stores all strings/word vectors referenced by its sentences), and are remapped to the global (in memory) tables on load
+- concept node names are not cached; they are derived from cached word/lemma (generateHopfieldGraphNodeName depends on configuration)
+
+"""
+
+import os
+import errno
+import hashlib
+import numpy as np
+
+tokenCacheFolderName = "tokenCache"
+tokenCacheShardFolderNamePrefix = "shard"
+tokenCacheShardFolderNameTemp = "shardTemp"	#shard is renamed to tokenCacheShardFolderNamePrefix + shardIndex once all arrays are written
+tokenCacheFormatVersion = 3
+
+tokenCacheArrayNames = ["sentenceHash", "sentenceTokenOffset", "tokenStringIndex", "tokenVectorIndex", "strings", "wordVectors"]
+tokenStringIndexWord = 0
+tokenStringIndexLemma = 1
+tokenStringIndexPOS = 2
+numberOfTokenStringIndices = 3
+
+printVerbose = False
+
+
+class CachedToken():
+	#provides the spacy token attributes accessed by HFNLPpy_hopfieldGraph (getTokenWord/getTokenLemma/getTokenWordVector/getTokenPOStag)	#dependency parse is not cached (HFNLPpy_hopfieldGraph bypasses the cache for useDependencyParseTree)
+	__slots__ = ["i", "text", "lemma_", "pos_", "vectorIndex"]
+	def __init__(self, i, text, lemma_, pos_, vectorIndex):
+		self.i = i
+		self.text = text
+		self.lemma_ = lemma_
+		self.pos_ = pos_
+		self.vectorIndex = vectorIndex
+	@property
+	def vector(self):
+		return getWordVector(self.vectorIndex)
+
+
+#cache state;
+tokenCacheLoaded = False
+tokenCacheShardArraysList = []	#memory-mapped arrays of saved cache shards (index: shard index), and their string/word vector table index remaps (shard local to global)
+sentenceHashIndexDict = {}	#key: sentence hash, value: (shard index, sentence index in shard)
+stringList = []	#global string table (saved and new)
+stringIndexDict = {}	#key: string, value: global string table index
+wordVectorList = []	#global word vector table (saved and new); value: (shard index, word vector index in shard) if saved, else word vector
+wordVectorIndexDict = {}	#key: word, value: global word vector table index
+newSentenceDict = {}	#key: sentence hash, value: list of token records [stringIndices, vectorIndex] (global indices)
+
+def getSentenceHash(sentence):
+	return hashlib.sha1(sentence.encode("utf-8")).hexdigest()
+
+def getTokenCacheShardFolderName(shardIndex):
+	return os.path.join(tokenCacheFolderName, tokenCacheShardFolderNamePrefix + str(shardIndex).zfill(6))
+
+def loadTokenCache():
+	#load saved shards not yet loaded (including shards saved by other processes)
+	global tokenCacheLoaded
+	tokenCacheLoaded = True
+	shardIndex = len(tokenCacheShardArraysList)
+	while(os.path.isdir(getTokenCacheShardFolderName(shardIndex))):
+		loadTokenCacheShard(shardIndex)
+		shardIndex += 1
+	if(printVerbose):
+		print("loadTokenCache: numberOfShards = ", len(tokenCacheShardArraysList), ", numberOfSentences = ", len(sentenceHashIndexDict))
+
+def loadTokenCacheShard(shardIndex):
+	shardFolderName = getTokenCacheShardFolderName(shardIndex)
+	formatVersion = int(np.load(os.path.join(shardFolderName, "formatVersion.npy")))
+	if(formatVersion != tokenCacheFormatVersion):
+		print("loadTokenCacheShard error: formatVersion != tokenCacheFormatVersion; formatVersion = ", formatVersion, ", shardFolderName = ", shardFolderName)
+		exit()
+	shardArrays = {}
+	for arrayName in tokenCacheArrayNames:
+		shardArrays[arrayName] = np.load(os.path.join(shardFolderName, arrayName + ".npy"), mmap_mode='r')
+	#remap shard local string table indices;
+	shardStrings = shardArrays["strings"].tolist()
+	stringIndexRemap = np.zeros(len(shardStrings), dtype=np.int64)
+	for shardStringIndex, string in enumerate(shardStrings):
+		stringIndexRemap[shardStringIndex] = getStringIndex(string)
+	#remap shard local word vector table indices (word vector table rows are unique per word; saved rows replace new rows of the same word);
+	wordVectorIndexRemap = np.zeros(shardArrays["wordVectors"].shape[0], dtype=np.int64)
+	for wordShardStringIndex, shardVectorIndex in zip(shardArrays["tokenStringIndex"][:, tokenStringIndexWord].tolist(), shardArrays["tokenVectorIndex"].tolist()):
+		word = shardStrings[wordShardStringIndex]
+		if(word in wordVectorIndexDict):
+			vectorIndex = wordVectorIndexDict[word]
+			if(not isinstance(wordVectorList[vectorIndex], tuple)):
+				wordVectorList[vectorIndex] = (shardIndex, shardVectorIndex)
+		else:
+			vectorIndex = len(wordVectorList)
+			wordVectorIndexDict[word] = vectorIndex
+			wordVectorList.append((shardIndex, shardVectorIndex))
+		wordVectorIndexRemap[shardVectorIndex] = vectorIndex
+	shardArrays["stringIndexRemap"] = stringIndexRemap
+	shardArrays["wordVectorIndexRemap"] = wordVectorIndexRemap
+	tokenCacheShardArraysList.append(shardArrays)
+	for sentenceIndex, sentenceHash in enumerate(shardArrays["sentenceHash"].tolist()):
+		sentenceHash = sentenceHash.decode("ascii")
+		if(sentenceHash not in sentenceHashIndexDict):	#concurrent writers may save the same sentence
+			sentenceHashIndexDict[sentenceHash] = (shardIndex, sentenceIndex)
+
+def getTokenisedSentence(sentence):
+	if(not tokenCacheLoaded):
+		loadTokenCache()
+	tokenList = None
+	sentenceHash = getSentenceHash(sentence)
+	if(sentenceHash in newSentenceDict):
+		tokenList = []
+		for i, (stringIndices, vectorIndex) in enumerate(newSentenceDict[sentenceHash]):
+			tokenList.append(createCachedToken(i, stringIndices, vectorIndex))
+	elif(sentenceHash in sentenceHashIndexDict):
+		shardIndex, sentenceIndex = sentenceHashIndexDict[sentenceHash]
+		shardArrays = tokenCacheShardArraysList[shardIndex]
+		tokenOffsetStart = int(shardArrays["sentenceTokenOffset"][sentenceIndex])
+		tokenOffsetEnd = int(shardArrays["sentenceTokenOffset"][sentenceIndex+1])
+		tokenStringIndex = shardArrays["stringIndexRemap"][shardArrays["tokenStringIndex"][tokenOffsetStart:tokenOffsetEnd]].tolist()
+		tokenVectorIndex = shardArrays["wordVectorIndexRemap"][shardArrays["tokenVectorIndex"][tokenOffsetStart:tokenOffsetEnd]].tolist()
+		tokenList = []
+		for i in range(tokenOffsetEnd-tokenOffsetStart):
+			tokenList.append(createCachedToken(i, tokenStringIndex[i], tokenVectorIndex[i]))
+	return tokenList
+
+def createCachedToken(i, stringIndices, vectorIndex):
+	return CachedToken(i, getString(stringIndices[tokenStringIndexWord]), getString(stringIndices[tokenStringIndexLemma]), getString(stringIndices[tokenStringIndexPOS]), vectorIndex)
+
+def addTokenisedSentence(sentence, tokenList):
+	#tokenList: spacy tokens
+	if(not tokenCacheLoaded):
+		loadTokenCache()
+	sentenceHash = getSentenceHash(sentence)
+	if(not ((sentenceHash in newSentenceDict) or (sentenceHash in sentenceHashIndexDict))):
+		tokenRecordList = []
+		for token in tokenList:
+			stringIndices = [getStringIndex(token.text), getStringIndex(token.lemma_), getStringIndex(token.pos_)]
+			tokenRecordList.append([stringIndices, getWordVectorIndex(token.text, token.vector)])
+		newSentenceDict[sentenceHash] = tokenRecordList
+
+def getStringIndex(string):
+	if(string not in stringIndexDict):
+		stringIndexDict[string] = len(stringList)
+		stringList.append(string)
+	return stringIndexDict[string]
+
+def getString(stringIndex):
+	return stringList[stringIndex]
+
+def getWordVectorIndex(word, wordVector):
+	if(word not in wordVectorIndexDict):
+		wordVectorIndexDict[word] = len(wordVectorList)
+		wordVectorList.append(np.array(wordVector, dtype=np.float32))
+	return wordVectorIndexDict[word]
+
+def getWordVector(vectorIndex):
+	wordVector = wordVectorList[vectorIndex]
+	if(isinstance(wordVector, tuple)):
+		shardIndex, shardVectorIndex = wordVector
+		wordVector = np.array(tokenCacheShardArraysList[shardIndex]["wordVectors"][shardVectorIndex])	#copy (do not reference memory-mapped file from network)
+	return wordVector
+
+def saveTokenCache():
+	#append new sentences to the cache as a new shard (saved shards are not rewritten)
+	global newSentenceDict
+	if(len(newSentenceDict) > 0):
+		sentenceHashList = []
+		sentenceTokenLengthList = []
+		tokenStringIndexList = []
+		tokenVectorIndexList = []
+		for sentenceHash, tokenRecordList in newSentenceDict.items():
+			sentenceHashList.append(sentenceHash)
+			sentenceTokenLengthList.append(len(tokenRecordList))
+			for stringIndices, vectorIndex in tokenRecordList:
+				tokenStringIndexList.append(stringIndices)
+				tokenVectorIndexList.append(vectorIndex)
+		#convert global string/word vector table indices to shard local indices (shard stores all strings/word vectors referenced by its sentences);
+		shardStringIndices, tokenStringIndex = np.unique(np.array(tokenStringIndexList, dtype=np.int64), return_inverse=True)
+		shardVectorIndices, tokenVectorIndex = np.unique(np.array(tokenVectorIndexList, dtype=np.int64), return_inverse=True)
+		newArrays = {}
+		newArrays["sentenceHash"] = np.array(sentenceHashList, dtype="S40")
+		newArrays["sentenceTokenOffset"] = np.cumsum(np.array([0] + sentenceTokenLengthList, dtype=np.int64))
+		newArrays["tokenStringIndex"] = tokenStringIndex.astype(np.int32).reshape(-1, numberOfTokenStringIndices)
+		newArrays["tokenVectorIndex"] = tokenVectorIndex.astype(np.int32).reshape(-1)
+		newArrays["strings"] = np.array([stringList[stringIndex] for stringIndex in shardStringIndices.tolist()], dtype=np.str_)
+		if(len(shardVectorIndices) > 0):
+			newArrays["wordVectors"] = np.stack([getWordVector(vectorIndex) for vectorIndex in shardVectorIndices.tolist()])
+		else:
+			newArrays["wordVectors"] = np.zeros((0, 0), dtype=np.float32)
+		shardFolderNameTemp = os.path.join(tokenCacheFolderName, tokenCacheShardFolderNameTemp + str(os.getpid()))
+		os.makedirs(shardFolderNameTemp, exist_ok=True)
+		for arrayName in tokenCacheArrayNames:
+			np.save(os.path.join(shardFolderNameTemp, arrayName + ".npy"), newArrays[arrayName])
+		np.save(os.path.join(shardFolderNameTemp, "formatVersion.npy"), np.array(tokenCacheFormatVersion))
+		shardIndex = renameTokenCacheShard(shardFolderNameTemp)
+		print("saveTokenCache: shardIndex = ", shardIndex, ", numberOfSentences = ", newArrays["sentenceHash"].shape[0], ", numberOfTokens = ", newArrays["tokenVectorIndex"].shape[0])
+
+		#register saved shard (and shards saved by other processes since the cache was loaded);
+		newSentenceDict = {}
+		loadTokenCache()
+
+def renameTokenCacheShard(shardFolderNameTemp):
+	#atomic (shard becomes visible once complete); the shard index is chosen at rename time: shards are never empty, so renaming onto a shard saved by another process fails (ENOTEMPTY/EEXIST) and the next shard index is tried
+	shardIndex = len(tokenCacheShardArraysList)
+	shardRenamed = False
+	while(not shardRenamed):
+		try:
+			os.rename(shardFolderNameTemp, getTokenCacheShardFolderName(shardIndex))
+			shardRenamed = True
+		except OSError as error:
+			if(error.errno in (errno.ENOTEMPTY, errno.EEXIST)):
+				shardIndex += 1
+			else:
+				raise
+	return shardIndex
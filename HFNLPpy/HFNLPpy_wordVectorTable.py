@@ -0,0 +1,111 @@
+"""HFNLPpy_wordVectorTable.py
+
+# Author:
+Richard Bruce Baxter - Copyright (c) 2022 Baxter AI (baxterai.com)
+
+# License:
+MIT License
+
+# Installation:
+see HFNLPpy_main.py
+
+# Usage:
+see HFNLPpy_main.py
+
+# Description:
+HFNLP Word Vector Table - shared contiguous word vector matrix [vocabularySize, wordVectorNumDimensions] (float32); concept nodes store a word vector table row index rather than a word vector copy
+
+- base rows are the spacy vocab vectors (spacy Vectors.data; referenced not copied), optionally memory-mapped from an npy export
+- word vector table row lookups are by word (spacy vectors attr ORTH: token.vector == vocab vector of token.text); out of vocabulary words reference wordVectorTableRowOOV (zero vector)
+- a word references the row of its first spacy token (equivalent to spacy(word)[0].vector); words that the spacy tokenizer splits (e.g. "don't", "cannot", hyphenated words) reference the row of their first token even if the word itself has a vocab vector
+- the spacy tokenizer (not the spacy pipeline) is executed once per unique word; rows are cached by word
+- additional rows may be appended for word vectors not derived from the spacy vocab (e.g. HFNLPpy_biologicalSimulationSnapshot loaded networks)
+
+"""
+
+import os
+import numpy as np
+
+useWordVectorTable = False	#optional	#concept nodes store word vector table row index (HopfieldNode.wordVector is derived from wordVectorTable)
+wordVectorTableMemoryMap = False	#optional	#memory-map base rows from npy export of spacy vocab vectors (shared across processes via page cache)
+wordVectorTableFileName = "wordVectorTable.npy"
+
+wordVectorTableRowOOV = -1	#out of vocabulary
+
+#table state;
+wordVectorTable = None	#base rows [numberOfBaseRows, wordVectorNumDimensions]
+wordVectorTableVocab = None	#spacy vocab (key to row lookup)
+wordVectorTableTokenizer = None	#spacy tokenizer (out of vocabulary word lookup)
+wordVectorTableAdditionalList = []	#additional rows (index: row - numberOfBaseRows)
+wordVectorIndexDict = {}	#key: word, value: word vector table row index of first spacy token of word
+
+def initialiseWordVectorTable(spacyWordVectorGenerator):
+	#spacyWordVectorGenerator: spacy Language (eg spacy.load('en_core_web_md')); table is shared by all callers (first spacyWordVectorGenerator initialises table)
+	global wordVectorTable, wordVectorTableVocab, wordVectorTableTokenizer
+	if(wordVectorTable is None):
+		spacyVocab = spacyWordVectorGenerator.vocab
+		wordVectorTableVocab = spacyVocab
+		wordVectorTableTokenizer = spacyWordVectorGenerator.tokenizer
+		if(wordVectorTableMemoryMap):
+			if(not os.path.isfile(wordVectorTableFileName)):
+				np.save(wordVectorTableFileName, np.asarray(spacyVocab.vectors.data, dtype=np.float32))
+			wordVectorTable = np.load(wordVectorTableFileName, mmap_mode='r')
+			if(wordVectorTable.shape != spacyVocab.vectors.data.shape):
+				print("initialiseWordVectorTable error: wordVectorTable.shape != spacyVocab.vectors.data.shape; delete ", wordVectorTableFileName)
+				exit()
+		else:
+			wordVectorTable = np.asarray(spacyVocab.vectors.data, dtype=np.float32)
+
+def getNumberOfWordVectorDimensions():
+	return wordVectorTable.shape[1]
+
+def getWordVectorIndex(word):
+	wordVectorIndex = int(getWordVectorIndices([word])[0])
+	return wordVectorIndex
+
+def getWordVectorIndices(wordList):
+	#returns numpy array of word vector table row indices (wordVectorTableRowOOV for out of vocabulary words)
+	wordVectorIndices = np.empty((len(wordList)), dtype=np.int64)
+	for wordIndex, word in enumerate(wordList):
+		if(word not in wordVectorIndexDict):
+			wordVectorIndexDict[word] = lookupWordVectorIndex(word)
+		wordVectorIndices[wordIndex] = wordVectorIndexDict[word]
+	return wordVectorIndices
+
+def lookupWordVectorIndex(word):
+	wordVectorIndex = wordVectorTableRowOOV
+	tokenList = wordVectorTableTokenizer(word)	#tokenizer only (spacy pipeline is not executed)
+	if(len(tokenList) > 0):
+		wordVectorIndex = int(wordVectorTableVocab.vectors.find(key=wordVectorTableVocab.strings[tokenList[0].text]))
+	return wordVectorIndex
+
+def clearWordVectorIndexCache():
+	wordVectorIndexDict.clear()
+
+def addWordVector(wordVector):
+	#returns word vector table row index of an additional row
+	wordVectorIndex = wordVectorTable.shape[0] + len(wordVectorTableAdditionalList)
+	wordVectorTableAdditionalList.append(np.array(wordVector, dtype=np.float32))
+	return wordVectorIndex
+
+def getWordVector(wordVectorIndex):
+	#returns read only view of word vector table row (do not modify)
+	numberOfBaseRows = wordVectorTable.shape[0]
+	if(wordVectorIndex == wordVectorTableRowOOV):
+		wordVector = np.zeros((getNumberOfWordVectorDimensions()), dtype=np.float32)
+	elif(wordVectorIndex < numberOfBaseRows):
+		wordVector = wordVectorTable[wordVectorIndex]
+	else:
+		wordVector = wordVectorTableAdditionalList[wordVectorIndex-numberOfBaseRows]
+	return wordVector
+
+def getWordVectors(wordVectorIndices):
+	#wordVectorIndices: numpy array (any shape) of base row indices or wordVectorTableRowOOV; returns numpy array [wordVectorIndices.shape, wordVectorNumDimensions] (single gather)
+	wordVectorIndicesOOV = (wordVectorIndices == wordVectorTableRowOOV)
+	if(wordVectorTable.shape[0] == 0):
+		wordVectors = np.zeros(wordVectorIndices.shape + (getNumberOfWordVectorDimensions(),), dtype=np.float32)
+	else:
+		wordVectors = wordVectorTable[np.where(wordVectorIndicesOOV, 0, wordVectorIndices)]
+		if(np.any(wordVectorIndicesOOV)):
+			wordVectors[wordVectorIndicesOOV] = 0.0
+	return wordVectors